@@ -0,0 +1,7 @@
+"""Synthetic Label Studio payloads shared by the benchmarks."""
+
+from label_studio_sdk._extensions.fake_label_studio import synthetic_task
+
+
+def make_task(i):
+    return synthetic_task(i)
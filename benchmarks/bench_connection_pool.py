@@ -0,0 +1,86 @@
+"""Throughput of LabelStudio with different connection pool settings.
+
+Starts a local HTTP/1.1 server that answers `GET api/projects/{id}/` after a fixed latency
+and hammers it from a thread pool, once per pool configuration.
+
+    python benchmarks/bench_connection_pool.py --threads 64 --requests 2000 --latency 0.005
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from label_studio_sdk.client import LabelStudio
+
+
+def make_handler(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        connections = set()
+        lock = threading.Lock()
+
+        def setup(self):
+            super().setup()
+            with self.lock:
+                self.connections.add(self.client_address)
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps({"id": 1, "title": "benchmark"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(base_url, handler, threads, requests, **client_kwargs):
+    handler.connections.clear()
+    ls = LabelStudio(api_key="benchmark", base_url=base_url, **client_kwargs)
+    ls.projects.get(id=1)  # warm up
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: ls.projects.get(id=1), range(requests)))
+    elapsed = time.perf_counter() - started
+    return requests / elapsed, len(handler.connections)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.005, help="server latency per request, seconds")
+    args = parser.parse_args()
+
+    handler = make_handler(args.latency)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    configs = {
+        "default (httpx limits)": {},
+        "max_connections_per_host=8": {"max_connections_per_host": 8},
+        f"max_connections_per_host={args.threads}": {"max_connections_per_host": args.threads},
+        f"max_connections_per_host={args.threads}, keepalive_expiry=30": {
+            "max_connections_per_host": args.threads,
+            "keepalive_expiry": 30,
+        },
+    }
+    print(f"{args.threads} threads, {args.requests} requests, {args.latency * 1000:.1f} ms server latency")
+    for name, kwargs in configs.items():
+        rps, connections = run(base_url, handler, args.threads, args.requests, **kwargs)
+        print(f"{name:<50} {rps:>9.1f} req/s {connections:>6} TCP connections opened")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
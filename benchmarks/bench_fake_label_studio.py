@@ -0,0 +1,98 @@
+"""Tasks per second for listing, importing and exporting tasks against a fake Label Studio.
+
+Runs the SDK against `FakeLabelStudio`, in memory or as a local HTTP server with `--http`, with `--latency`
+seconds added to every request to emulate the network round trip. `--offset-cost` adds that many seconds per page
+skipped to `api/tasks/`, like an OFFSET scan on the server, which keyset pagination doesn't pay:
+
+    python benchmarks/bench_fake_label_studio.py --tasks 20000 --page-size 500 --latency 0.02
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+
+import httpx
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio, synthetic_task
+from label_studio_sdk.client import LabelStudio
+
+
+@contextmanager
+def client_for(fake, http):
+    if http:
+        with fake.serve() as base_url:
+            yield LabelStudio(api_key="benchmark", base_url=base_url)
+    else:
+        yield LabelStudio(
+            api_key="benchmark", base_url="http://benchmark", httpx_client=httpx.Client(transport=fake.transport())
+        )
+
+
+def timed(name, count, fn):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<22} {count / elapsed:>12.0f} tasks/s  ({elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--import-batch", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--offset-cost", type=float, default=0.0, help="seconds per page skipped by `page`")
+    parser.add_argument("--prefetch", type=int, default=2, help="pages fetched ahead by tasks.list(prefetch=...)")
+    parser.add_argument("--parallel", type=int, default=8, help="pages fetched at once by tasks.list(parallel=...)")
+    parser.add_argument("--http", action="store_true", help="serve the fake over a local socket")
+    args = parser.parse_args()
+
+    def latency(request):
+        if not request.url.path.endswith("api/tasks/"):
+            return args.latency
+        return args.latency + args.offset_cost * (int(request.url.params.get("page", 1)) - 1)
+
+    fake = FakeLabelStudio(tasks=args.tasks, latency=latency)
+    fake.add_project(2)
+    payload = [{"data": task["data"]} for task in map(synthetic_task, range(args.tasks))]
+    print(f"{args.tasks} tasks, {args.page_size} per page, {args.latency * 1000:.0f}ms latency")
+
+    with client_for(fake, args.http) as ls:
+        timed("tasks.list", args.tasks, lambda: sum(1 for _ in ls.tasks.list(project=1, page_size=args.page_size)))
+        timed(
+            f"tasks.list prefetch={args.prefetch}",
+            args.tasks,
+            lambda: sum(1 for _ in ls.tasks.list(project=1, page_size=args.page_size, prefetch=args.prefetch)),
+        )
+        timed(
+            f"tasks.list parallel={args.parallel}",
+            args.tasks,
+            lambda: sum(1 for _ in ls.tasks.list(project=1, page_size=args.page_size, parallel=args.parallel)),
+        )
+        timed(
+            "tasks.list keyset",
+            args.tasks,
+            lambda: sum(1 for _ in ls.tasks.list(project=1, page_size=args.page_size, keyset=True)),
+        )
+        timed(
+            "tasks.list adaptive",
+            args.tasks,
+            lambda: sum(1 for _ in ls.tasks.list(project=1, page_size=args.page_size, adaptive=True)),
+        )
+        timed("tasks.stream", args.tasks, lambda: sum(1 for _ in ls.tasks.stream(project=1, page_size=args.page_size)))
+
+        def import_tasks():
+            for i in range(0, len(payload), args.import_batch):
+                ls.projects.import_tasks(id=2, request=payload[i : i + args.import_batch])
+
+        timed("import_tasks", args.tasks, import_tasks)
+
+        def export_download():
+            export = ls.projects.exports.create(id_=1)
+            ls.projects.exports.download(id=1, export_pk=str(export.id))
+
+        timed("export download", args.tasks, export_download)
+
+
+if __name__ == "__main__":
+    main()
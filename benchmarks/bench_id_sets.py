@@ -0,0 +1,67 @@
+"""Memory and time of set algebra on task ids: Python lists and sets against sorted int64 arrays.
+
+Every run collects the ids of all the tasks page by page, samples a tenth of them and takes the difference, like
+assigning tasks by sampling does. "sets" uses lists and `set(tasks) - set(sample)`, "arrays" uses
+`label_studio_sdk._extensions.id_sets`:
+
+    python benchmarks/bench_id_sets.py --tasks 1000000 10000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from label_studio_sdk._extensions import id_sets
+
+PAGE_SIZE = 1000
+
+
+def pages(total):
+    for start in range(1, total + 1, PAGE_SIZE):
+        yield list(range(start, min(start + PAGE_SIZE, total + 1)))
+
+
+def with_sets(total):
+    tasks = []
+    for page in pages(total):
+        tasks += page
+    sample = random.sample(tasks, total // 10)
+    return len(set(tasks) - set(sample))
+
+
+def with_arrays(total):
+    buffer = id_sets.IdBuffer()
+    for page in pages(total):
+        buffer.extend(page)
+    tasks = buffer.ids()
+    return len(id_sets.difference(tasks, id_sets.sample(tasks, total // 10)))
+
+
+METHODS = {"sets": with_sets, "arrays": with_arrays}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000000, 10000000])
+    args = parser.parse_args()
+
+    print("seconds / peak MB")
+    print(f"{'':<10}" + "".join(f"{total:>20}" for total in args.tasks))
+    cells = {method: [] for method in METHODS}
+    for total in args.tasks:
+        for method, run in METHODS.items():
+            tracemalloc.start()
+            started = time.perf_counter()
+            left = run(total)
+            seconds = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            assert left == total - total // 10
+            cells[method].append(f"{seconds:.2f}s / {peak:.0f}")
+    for method, row in cells.items():
+        print(f"{method:<10}" + "".join(f"{cell:>20}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
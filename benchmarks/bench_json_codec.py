@@ -0,0 +1,62 @@
+"""Encoding and decoding speed of the JSON codecs on task payloads.
+
+Measures `import_tasks` request bodies (encode) and task list pages (decode) for each codec,
+then a full `projects.import_tasks` call against an in-memory transport.
+
+    python benchmarks/bench_json_codec.py --tasks 20000
+"""
+
+import argparse
+import time
+
+import httpx
+
+from label_studio_sdk.client import LabelStudio
+from label_studio_sdk.core.json_codec import JSON_CODECS
+
+from _data import make_task
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    args = parser.parse_args()
+
+    tasks = [make_task(i) for i in range(args.tasks)]
+    page = {"tasks": tasks, "total": len(tasks)}
+    size = len(JSON_CODECS["json"]().dumps(page)) / 1024 / 1024
+    print(f"{args.tasks} tasks, {size:.1f} MB")
+    print(f"{'codec':<8} {'encode MB/s':>12} {'decode MB/s':>12} {'import_tasks s':>15}")
+    for name, codec_class in JSON_CODECS.items():
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+        encoded = codec.dumps(page)
+        encode = timed(lambda: codec.dumps(page))
+        decode = timed(lambda: codec.loads(encoded))
+
+        ls = LabelStudio(
+            api_key="benchmark",
+            base_url="http://benchmark",
+            httpx_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(201, json={"task_count": args.tasks}))
+            ),
+            json_codec=codec,
+        )
+        import_tasks = timed(lambda: ls.projects.import_tasks(id=1, request=tasks), repeat=1)
+        print(f"{name:<8} {size / encode:>12.0f} {size / decode:>12.0f} {import_tasks:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""jsonable_encoder throughput on import payloads, against the previous recursive implementation.
+
+Three payloads: plain JSON tasks (the fast path), tasks with a datetime in every task (the iterative
+encoder) and a single deeply nested structure.
+
+    python benchmarks/bench_jsonable_encoder.py --tasks 20000 --depth 5000
+"""
+
+import argparse
+import dataclasses
+import datetime as dt
+import time
+from enum import Enum
+from pathlib import PurePath
+from types import GeneratorType
+
+from label_studio_sdk.core.datetime_utils import serialize_datetime
+from label_studio_sdk.core.jsonable_encoder import encoders_by_class_tuples, jsonable_encoder
+from label_studio_sdk.core.pydantic_utilities import pydantic_v1
+
+from _data import make_task
+
+
+def recursive_jsonable_encoder(obj, custom_encoder=None):
+    # jsonable_encoder before the fast path and the iterative encoder
+    custom_encoder = custom_encoder or {}
+    if custom_encoder:
+        if type(obj) in custom_encoder:
+            return custom_encoder[type(obj)](obj)
+        for encoder_type, encoder_instance in custom_encoder.items():
+            if isinstance(obj, encoder_type):
+                return encoder_instance(obj)
+    if isinstance(obj, pydantic_v1.BaseModel):
+        encoder = getattr(obj.__config__, "json_encoders", {})
+        if custom_encoder:
+            encoder.update(custom_encoder)
+        obj_dict = obj.dict(by_alias=True)
+        if "__root__" in obj_dict:
+            obj_dict = obj_dict["__root__"]
+        return recursive_jsonable_encoder(obj_dict, custom_encoder=encoder)
+    if dataclasses.is_dataclass(obj):
+        return recursive_jsonable_encoder(dataclasses.asdict(obj), custom_encoder=custom_encoder)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (str, int, float, type(None))):
+        return obj
+    if isinstance(obj, dt.datetime):
+        return serialize_datetime(obj)
+    if isinstance(obj, dt.date):
+        return str(obj)
+    if isinstance(obj, dict):
+        encoded_dict = {}
+        allowed_keys = set(obj.keys())
+        for key, value in obj.items():
+            if key in allowed_keys:
+                encoded_key = recursive_jsonable_encoder(key, custom_encoder=custom_encoder)
+                encoded_dict[encoded_key] = recursive_jsonable_encoder(value, custom_encoder=custom_encoder)
+        return encoded_dict
+    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
+        return [recursive_jsonable_encoder(item, custom_encoder=custom_encoder) for item in obj]
+    if type(obj) in pydantic_v1.json.ENCODERS_BY_TYPE:
+        return pydantic_v1.json.ENCODERS_BY_TYPE[type(obj)](obj)
+    for encoder, classes_tuple in encoders_by_class_tuples.items():
+        if isinstance(obj, classes_tuple):
+            return encoder(obj)
+    return recursive_jsonable_encoder(dict(obj), custom_encoder=custom_encoder)
+
+
+def measure(encode, payload):
+    started = time.perf_counter()
+    try:
+        encode(payload)
+    except RecursionError:
+        return "RecursionError"
+    return f"{time.perf_counter() - started:.3f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--depth", type=int, default=5000)
+    args = parser.parse_args()
+
+    native = [make_task(i) for i in range(args.tasks)]
+    with_datetimes = [dict(task, created_at=dt.datetime(2024, 1, 15, 9, 30)) for task in native]
+    deep = {"value": 1}
+    for _ in range(args.depth):
+        deep = {"child": [deep]}
+
+    payloads = [
+        (f"{args.tasks} JSON-native tasks", native),
+        (f"{args.tasks} tasks with datetimes", with_datetimes),
+        (f"nested {args.depth} levels deep", deep),
+    ]
+    print(f"{'payload':<32} {'recursive':>15} {'jsonable_encoder':>17}")
+    for name, payload in payloads:
+        print(f"{name:<32} {measure(recursive_jsonable_encoder, payload):>15} {measure(jsonable_encoder, payload):>17}")
+
+
+if __name__ == "__main__":
+    main()
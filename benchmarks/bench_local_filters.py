@@ -0,0 +1,68 @@
+"""Time of matching Data Manager filters on tasks held locally.
+
+The filters keep the annotated tasks with "cat" in their text, updated after a date. "dataframe" filters a
+DataFrame of the tasks with vectorized masks, "tasks" filters a list of task dicts:
+
+    python benchmarks/bench_local_filters.py --tasks 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from label_studio_sdk._extensions.local_filters import compile_filters
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+
+FILTERS = Filters.create(
+    Filters.AND,
+    [
+        Filters.item(Column.total_annotations, Operator.GREATER, Type.Number, Filters.value(0)),
+        Filters.item(Column.data("text"), Operator.CONTAINS, Type.String, Filters.value("cat")),
+        Filters.item(Column.updated_at, Operator.GREATER_OR_EQUAL, Type.Datetime, Filters.value("2024-01-05")),
+    ],
+)
+
+
+def frame(total):
+    rng = np.random.default_rng(0)
+    updated_at = pd.Series(pd.date_range("2024-01-01", periods=total, freq="s", tz="UTC"))
+    return pd.DataFrame(
+        {
+            "id": np.arange(1, total + 1),
+            "total_annotations": rng.integers(0, 4, total),
+            "updated_at": updated_at.dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "data.text": rng.choice(["a black cat", "a dog", "a bird"], total),
+        }
+    )
+
+
+def tasks(tasks_frame):
+    return [
+        {"id": task_id, "total_annotations": annotations, "updated_at": updated_at, "data": {"text": text}}
+        for task_id, annotations, updated_at, text in tasks_frame.itertuples(index=False)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100000, 1000000])
+    args = parser.parse_args()
+
+    filters = compile_filters(FILTERS)
+    print("seconds")
+    print(f"{'':<12}" + "".join(f"{total:>12}" for total in args.tasks))
+    cells = {"dataframe": [], "tasks": []}
+    for total in args.tasks:
+        tasks_frame = frame(total)
+        for method, data in (("dataframe", tasks_frame), ("tasks", tasks(tasks_frame))):
+            started = time.perf_counter()
+            filters.filter(data)
+            cells[method].append(f"{time.perf_counter() - started:.2f}s")
+    for method, row in cells.items():
+        print(f"{method:<12}" + "".join(f"{cell:>12}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Peak memory of one pass over all the tasks of a project, measured with tracemalloc.
+
+Iterating over a pager holds the first page, the page being consumed and the page being fetched. `drain()` holds
+about one page, whatever the number of tasks:
+
+    python benchmarks/bench_pager_memory.py --tasks 5000 20000 --page-size 500
+"""
+
+import argparse
+import tracemalloc
+
+import httpx
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.client import LabelStudio
+
+MODES = {
+    "iter": lambda pager: iter(pager),
+    "drain": lambda pager: pager.drain(),
+}
+OPTIONS = {
+    "list": {},
+    "keyset": {"keyset": True},
+    "parallel=4": {"parallel": 4},
+}
+
+
+def peak_memory(ls, page_size, options, mode):
+    # warm up the pages cached by the fake, so that only the SDK allocations are traced
+    for _ in ls.tasks.list(project=1, page_size=page_size, **options):
+        pass
+    tracemalloc.start()
+    try:
+        for _ in MODES[mode](ls.tasks.list(project=1, page_size=page_size, **options)):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[5000, 20000])
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"peak MB, {args.page_size} tasks per page")
+    print(f"{'':<18}" + "".join(f"{total:>12}" for total in args.tasks))
+    for name, options in OPTIONS.items():
+        for mode in MODES:
+            peaks = []
+            for total in args.tasks:
+                fake = FakeLabelStudio(tasks=total)
+                ls = LabelStudio(
+                    api_key="benchmark",
+                    base_url="http://benchmark",
+                    httpx_client=httpx.Client(transport=fake.transport()),
+                )
+                peaks.append(peak_memory(ls, args.page_size, options, mode))
+            print(f"{name + ' ' + mode:<18}" + "".join(f"{peak / 1e6:>12.1f}" for peak in peaks))
+
+
+if __name__ == "__main__":
+    main()
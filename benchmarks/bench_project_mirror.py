@@ -0,0 +1,61 @@
+"""Time of reading all the tasks of a project from the API and from a local mirror.
+
+"list" pages through `tasks.list(fields="all")` on every run, "refresh" is a refresh of an up-to-date mirror, and
+"mirror" reads the tasks from the SQLite file. `--latency` adds a delay to every request of the fake server:
+
+    python benchmarks/bench_project_mirror.py --tasks 5000 20000 --latency 0.05
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+
+import httpx
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio, synthetic_task
+from label_studio_sdk._extensions.project_mirror import ProjectMirror
+from label_studio_sdk.client import LabelStudio
+
+
+def task(task_id, project):
+    # the tasks of a project are updated at different times
+    updated_at = datetime.datetime(2024, 1, 15, tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=task_id)
+    return {**synthetic_task(task_id, project), "updated_at": updated_at.isoformat()}
+
+
+METHODS = {
+    "list": lambda ls, mirror: sum(1 for _ in ls.tasks.list(project=1, page_size=1000)),
+    "refresh": lambda ls, mirror: mirror.refresh(),
+    "mirror": lambda ls, mirror: sum(1 for _ in mirror.tasks()),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[5000, 20000])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(f"seconds, {args.latency * 1000:.0f} ms per request")
+    print(f"{'':<10}" + "".join(f"{total:>12}" for total in args.tasks))
+    cells = {method: [] for method in METHODS}
+    with tempfile.TemporaryDirectory() as directory:
+        for total in args.tasks:
+            fake = FakeLabelStudio(tasks=total, latency=args.latency, make_task=task)
+            ls = LabelStudio(
+                api_key="benchmark", base_url="http://benchmark", httpx_client=httpx.Client(transport=fake.transport())
+            )
+            with ProjectMirror(ls, project=1, path=os.path.join(directory, f"{total}.sqlite")) as mirror:
+                mirror.refresh()
+                for method, run in METHODS.items():
+                    started = time.perf_counter()
+                    run(ls, mirror)
+                    cells[method].append(f"{time.perf_counter() - started:.2f}s")
+    for method, row in cells.items():
+        print(f"{method:<10}" + "".join(f"{cell:>12}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Objects per second for each response_mode when listing tasks.
+
+Parses synthetic `fields=all` task pages (annotations and predictions included) served by an
+in-memory httpx transport, so only the SDK side is measured.
+
+    python benchmarks/bench_response_mode.py --tasks 20000 --page-size 500
+"""
+
+import argparse
+import time
+
+import httpx
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.client import LabelStudio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    transport = FakeLabelStudio(tasks=args.tasks).transport()
+    print(f"{args.tasks} tasks, {args.page_size} per page")
+    for mode in ("model", "construct", "raw"):
+        ls = LabelStudio(
+            api_key="benchmark",
+            base_url="http://benchmark",
+            httpx_client=httpx.Client(transport=transport),
+            response_mode=mode,
+        )
+        started = time.perf_counter()
+        count = sum(1 for _ in ls.tasks.list(project=1, page_size=args.page_size))
+        elapsed = time.perf_counter() - started
+        print(f"{mode:<10} {count / elapsed:>12.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
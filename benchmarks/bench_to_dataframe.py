@@ -0,0 +1,74 @@
+"""Peak memory and time of building a DataFrame of all the tasks of a project.
+
+"records" is the usual approach: a list of dicts built from the pager, then `DataFrame.from_records`. "to_dataframe"
+drains the pager into column buffers:
+
+    python benchmarks/bench_to_dataframe.py --tasks 5000 20000 --page-size 500
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import httpx
+import pandas as pd
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.client import LabelStudio
+
+
+def records(pager):
+    rows = []
+    for task in pager:
+        row = {
+            "id": task.id,
+            "annotation_count": len(task.annotations or []),
+            "prediction_count": len(task.predictions or []),
+        }
+        row.update({f"data.{key}": value for key, value in (task.data or {}).items()})
+        rows.append(row)
+    return pd.DataFrame.from_records(rows)
+
+
+METHODS = {
+    "records": records,
+    "to_dataframe": lambda pager: pager.to_dataframe(),
+}
+
+
+def measure(ls, page_size, method):
+    # warm up the pages cached by the fake, so that only the SDK is timed and traced
+    METHODS[method](ls.tasks.list(project=1, page_size=page_size))
+    started = time.perf_counter()
+    METHODS[method](ls.tasks.list(project=1, page_size=page_size))
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    try:
+        METHODS[method](ls.tasks.list(project=1, page_size=page_size))
+        return tracemalloc.get_traced_memory()[1], seconds
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[5000, 20000])
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"peak MB / seconds, {args.page_size} tasks per page")
+    print(f"{'':<14}" + "".join(f"{total:>18}" for total in args.tasks))
+    for method in METHODS:
+        cells = []
+        for total in args.tasks:
+            fake = FakeLabelStudio(tasks=total)
+            ls = LabelStudio(
+                api_key="benchmark", base_url="http://benchmark", httpx_client=httpx.Client(transport=fake.transport())
+            )
+            peak, seconds = measure(ls, args.page_size, method)
+            cells.append(f"{peak / 1e6:.1f} / {seconds:.2f}s")
+        print(f"{method:<14}" + "".join(f"{cell:>18}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import time
-import json
 from datetime import datetime, timedelta, timezone
 import numpy as np
 import rasterio
@@ -39,22 +38,22 @@ def poll_for_completed_tasks_new(
     ls: LabelStudio, project_id: int, freq_sec: int
 ) -> list:
     """
-    Every n seconds, yield all tasks that have been updated since the last poll.
+    Yield every task annotated, each time it is updated.
     Uses label_studio_sdk >= 1.0.0
     """
-    while True:
-        print("polling")
-        last_poll_time = datetime.now(timezone.utc) - timedelta(seconds=freq_sec)
-        filters = _filter_tasks(last_poll_time)
-        tasks = ls.tasks.list(
-            project=project_id,
-            query=json.dumps({"filters": filters}),
-            # can't use fields='all' because of maybe-nonexistent task fields
-            fields="all",
-            # fields=['image', 'annotations'],
-        )
-        yield from tasks
-        time.sleep(freq_seconds)
+    # task has at least one annotation
+    filters = Filters.create(
+        "and",
+        [Filters.item(Column.total_annotations, Operator.GREATER_OR_EQUAL, Type.Number, Filters.value(1))],
+    )
+    # tasks.watch() tracks the last `updated_at` seen, so no task is missed or yielded twice between polls,
+    # and waits up to a minute between polls while no task changes
+    yield from ls.tasks.watch(
+        project=project_id,
+        since=datetime.now(timezone.utc) - timedelta(seconds=freq_sec),
+        query={"filters": filters},
+        interval=freq_sec,
+    )
 
 
 def poll_for_completed_tasks_old(project: Project, freq_seconds: int) -> list:
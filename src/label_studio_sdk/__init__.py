@@ -1,162 +1,345 @@
 # This file was auto-generated by Fern from our API Definition.
 
-from .types import (
-    Annotation,
-    AnnotationFilterOptions,
-    AnnotationLastAction,
-    AnnotationsDmField,
-    AnnotationsDmFieldLastAction,
-    AzureBlobExportStorage,
-    AzureBlobExportStorageStatus,
-    AzureBlobImportStorage,
-    AzureBlobImportStorageStatus,
-    BaseTask,
-    BaseTaskFileUpload,
-    BaseTaskUpdatedBy,
-    BaseUser,
-    Comment,
-    CommentCreatedBy,
-    ConvertedFormat,
-    ConvertedFormatStatus,
-    DataManagerTaskSerializer,
-    DataManagerTaskSerializerAnnotatorsItem,
-    DataManagerTaskSerializerDraftsItem,
-    DataManagerTaskSerializerPredictionsItem,
-    Export,
-    ExportConvert,
-    ExportCreate,
-    ExportCreateStatus,
-    ExportStatus,
-    FileUpload,
-    Filter,
-    FilterGroup,
-    GcsExportStorage,
-    GcsExportStorageStatus,
-    GcsImportStorage,
-    GcsImportStorageStatus,
-    InferenceRun,
-    InferenceRunCreatedBy,
-    InferenceRunOrganization,
-    InferenceRunProjectSubset,
-    InferenceRunStatus,
-    LocalFilesExportStorage,
-    LocalFilesExportStorageStatus,
-    LocalFilesImportStorage,
-    LocalFilesImportStorageStatus,
-    MlBackend,
-    MlBackendAuthMethod,
-    MlBackendState,
-    ModelProviderConnection,
-    ModelProviderConnectionCreatedBy,
-    ModelProviderConnectionOrganization,
-    ModelProviderConnectionProvider,
-    ModelProviderConnectionScope,
-    Prediction,
-    Project,
-    ProjectImport,
-    ProjectImportStatus,
-    ProjectLabelConfig,
-    ProjectSampling,
-    ProjectSkipQueue,
-    Prompt,
-    PromptCreatedBy,
-    PromptOrganization,
-    PromptVersion,
-    PromptVersionCreatedBy,
-    PromptVersionOrganization,
-    PromptVersionProvider,
-    RedisExportStorage,
-    RedisExportStorageStatus,
-    RedisImportStorage,
-    RedisImportStorageStatus,
-    S3ExportStorage,
-    S3ExportStorageStatus,
-    S3ImportStorage,
-    S3ImportStorageStatus,
-    S3SExportStorage,
-    S3SImportStorage,
-    S3SImportStorageStatus,
-    SerializationOption,
-    SerializationOptions,
-    Task,
-    TaskAnnotatorsItem,
-    TaskFilterOptions,
-    UserSimple,
-    View,
-    Webhook,
-    WebhookActionsItem,
-    WebhookSerializerForUpdate,
-    WebhookSerializerForUpdateActionsItem,
-    Workspace,
-)
-from .errors import BadRequestError, InternalServerError
-from . import (
-    actions,
-    annotations,
-    comments,
-    export_storage,
-    files,
-    import_storage,
-    ml,
-    model_providers,
-    predictions,
-    projects,
-    prompts,
-    tasks,
-    users,
-    views,
-    webhooks,
-    workspaces,
-)
-from ._legacy import Client
-from .actions import (
-    ActionsCreateRequestFilters,
-    ActionsCreateRequestFiltersConjunction,
-    ActionsCreateRequestFiltersItemsItem,
-    ActionsCreateRequestFiltersItemsItemFilter,
-    ActionsCreateRequestFiltersItemsItemOperator,
-    ActionsCreateRequestFiltersItemsItemValue,
-    ActionsCreateRequestId,
-    ActionsCreateRequestOrderingItem,
-    ActionsCreateRequestSelectedItems,
-    ActionsCreateRequestSelectedItemsExcluded,
-    ActionsCreateRequestSelectedItemsIncluded,
-)
-from .environment import LabelStudioEnvironment
-from .export_storage import ExportStorageListTypesResponseItem
-from .import_storage import ImportStorageListTypesResponseItem
-from .ml import (
-    MlCreateRequestAuthMethod,
-    MlCreateResponse,
-    MlCreateResponseAuthMethod,
-    MlUpdateRequestAuthMethod,
-    MlUpdateResponse,
-    MlUpdateResponseAuthMethod,
-)
-from .projects import ProjectsCreateResponse, ProjectsImportTasksResponse, ProjectsListResponse, ProjectsUpdateResponse
-from .prompts import PromptsBatchPredictionsResponse
-from .tasks import TasksListRequestFields, TasksListResponse
-from .users import UsersGetTokenResponse, UsersResetTokenResponse
-from .version import __version__
-from .views import (
-    ViewsCreateRequestData,
-    ViewsCreateRequestDataFilters,
-    ViewsCreateRequestDataFiltersConjunction,
-    ViewsCreateRequestDataFiltersItemsItem,
-    ViewsCreateRequestDataFiltersItemsItemFilter,
-    ViewsCreateRequestDataFiltersItemsItemOperator,
-    ViewsCreateRequestDataFiltersItemsItemValue,
-    ViewsCreateRequestDataOrderingItem,
-    ViewsUpdateRequestData,
-    ViewsUpdateRequestDataFilters,
-    ViewsUpdateRequestDataFiltersConjunction,
-    ViewsUpdateRequestDataFiltersItemsItem,
-    ViewsUpdateRequestDataFiltersItemsItemFilter,
-    ViewsUpdateRequestDataFiltersItemsItemOperator,
-    ViewsUpdateRequestDataFiltersItemsItemValue,
-    ViewsUpdateRequestDataOrderingItem,
-)
-from .webhooks import WebhooksUpdateRequestActionsItem
+# isort: skip_file
+
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from .types import (
+        Annotation,
+        AnnotationFilterOptions,
+        AnnotationLastAction,
+        AnnotationsDmField,
+        AnnotationsDmFieldLastAction,
+        AzureBlobExportStorage,
+        AzureBlobExportStorageStatus,
+        AzureBlobImportStorage,
+        AzureBlobImportStorageStatus,
+        BaseTask,
+        BaseTaskFileUpload,
+        BaseTaskUpdatedBy,
+        BaseUser,
+        Comment,
+        CommentCreatedBy,
+        ConvertedFormat,
+        ConvertedFormatStatus,
+        DataManagerTaskSerializer,
+        DataManagerTaskSerializerAnnotatorsItem,
+        DataManagerTaskSerializerDraftsItem,
+        DataManagerTaskSerializerPredictionsItem,
+        Export,
+        ExportConvert,
+        ExportCreate,
+        ExportCreateStatus,
+        ExportStatus,
+        FileUpload,
+        Filter,
+        FilterGroup,
+        GcsExportStorage,
+        GcsExportStorageStatus,
+        GcsImportStorage,
+        GcsImportStorageStatus,
+        InferenceRun,
+        InferenceRunCreatedBy,
+        InferenceRunOrganization,
+        InferenceRunProjectSubset,
+        InferenceRunStatus,
+        LocalFilesExportStorage,
+        LocalFilesExportStorageStatus,
+        LocalFilesImportStorage,
+        LocalFilesImportStorageStatus,
+        MlBackend,
+        MlBackendAuthMethod,
+        MlBackendState,
+        ModelProviderConnection,
+        ModelProviderConnectionCreatedBy,
+        ModelProviderConnectionOrganization,
+        ModelProviderConnectionProvider,
+        ModelProviderConnectionScope,
+        Prediction,
+        Project,
+        ProjectImport,
+        ProjectImportStatus,
+        ProjectLabelConfig,
+        ProjectSampling,
+        ProjectSkipQueue,
+        Prompt,
+        PromptCreatedBy,
+        PromptOrganization,
+        PromptVersion,
+        PromptVersionCreatedBy,
+        PromptVersionOrganization,
+        PromptVersionProvider,
+        RedisExportStorage,
+        RedisExportStorageStatus,
+        RedisImportStorage,
+        RedisImportStorageStatus,
+        S3ExportStorage,
+        S3ExportStorageStatus,
+        S3ImportStorage,
+        S3ImportStorageStatus,
+        S3SExportStorage,
+        S3SImportStorage,
+        S3SImportStorageStatus,
+        SerializationOption,
+        SerializationOptions,
+        Task,
+        TaskAnnotatorsItem,
+        TaskFilterOptions,
+        UserSimple,
+        View,
+        Webhook,
+        WebhookActionsItem,
+        WebhookSerializerForUpdate,
+        WebhookSerializerForUpdateActionsItem,
+        Workspace,
+    )
+    from .errors import BadRequestError, InternalServerError, NotFoundError
+    from . import (
+        actions,
+        annotations,
+        comments,
+        export_storage,
+        files,
+        import_storage,
+        ml,
+        model_providers,
+        predictions,
+        projects,
+        prompts,
+        tasks,
+        users,
+        views,
+        webhooks,
+        workspaces,
+    )
+    from ._legacy import Client
+    from .actions import (
+        ActionsCreateRequestFilters,
+        ActionsCreateRequestFiltersConjunction,
+        ActionsCreateRequestFiltersItemsItem,
+        ActionsCreateRequestFiltersItemsItemFilter,
+        ActionsCreateRequestFiltersItemsItemOperator,
+        ActionsCreateRequestFiltersItemsItemValue,
+        ActionsCreateRequestId,
+        ActionsCreateRequestOrderingItem,
+        ActionsCreateRequestSelectedItems,
+        ActionsCreateRequestSelectedItemsExcluded,
+        ActionsCreateRequestSelectedItemsIncluded,
+    )
+    from .environment import LabelStudioEnvironment
+    from .export_storage import ExportStorageListTypesResponseItem
+    from .import_storage import ImportStorageListTypesResponseItem
+    from .ml import (
+        MlCreateRequestAuthMethod,
+        MlCreateResponse,
+        MlCreateResponseAuthMethod,
+        MlUpdateRequestAuthMethod,
+        MlUpdateResponse,
+        MlUpdateResponseAuthMethod,
+    )
+    from .projects import (
+        ProjectsCreateResponse,
+        ProjectsImportTasksResponse,
+        ProjectsListResponse,
+        ProjectsUpdateResponse,
+    )
+    from .prompts import PromptsBatchPredictionsResponse
+    from .tasks import TasksListRequestFields, TasksListResponse
+    from .users import UsersGetTokenResponse, UsersResetTokenResponse
+    from .version import __version__
+    from .views import (
+        ViewsCreateRequestData,
+        ViewsCreateRequestDataFilters,
+        ViewsCreateRequestDataFiltersConjunction,
+        ViewsCreateRequestDataFiltersItemsItem,
+        ViewsCreateRequestDataFiltersItemsItemFilter,
+        ViewsCreateRequestDataFiltersItemsItemOperator,
+        ViewsCreateRequestDataFiltersItemsItemValue,
+        ViewsCreateRequestDataOrderingItem,
+        ViewsUpdateRequestData,
+        ViewsUpdateRequestDataFilters,
+        ViewsUpdateRequestDataFiltersConjunction,
+        ViewsUpdateRequestDataFiltersItemsItem,
+        ViewsUpdateRequestDataFiltersItemsItemFilter,
+        ViewsUpdateRequestDataFiltersItemsItemOperator,
+        ViewsUpdateRequestDataFiltersItemsItemValue,
+        ViewsUpdateRequestDataOrderingItem,
+    )
+    from .webhooks import WebhooksUpdateRequestActionsItem
+_dynamic_imports: typing.Dict[str, str] = {
+    "ActionsCreateRequestFilters": ".actions",
+    "ActionsCreateRequestFiltersConjunction": ".actions",
+    "ActionsCreateRequestFiltersItemsItem": ".actions",
+    "ActionsCreateRequestFiltersItemsItemFilter": ".actions",
+    "ActionsCreateRequestFiltersItemsItemOperator": ".actions",
+    "ActionsCreateRequestFiltersItemsItemValue": ".actions",
+    "ActionsCreateRequestId": ".actions",
+    "ActionsCreateRequestOrderingItem": ".actions",
+    "ActionsCreateRequestSelectedItems": ".actions",
+    "ActionsCreateRequestSelectedItemsExcluded": ".actions",
+    "ActionsCreateRequestSelectedItemsIncluded": ".actions",
+    "Annotation": ".types",
+    "AnnotationFilterOptions": ".types",
+    "AnnotationLastAction": ".types",
+    "AnnotationsDmField": ".types",
+    "AnnotationsDmFieldLastAction": ".types",
+    "AzureBlobExportStorage": ".types",
+    "AzureBlobExportStorageStatus": ".types",
+    "AzureBlobImportStorage": ".types",
+    "AzureBlobImportStorageStatus": ".types",
+    "BadRequestError": ".errors",
+    "BaseTask": ".types",
+    "BaseTaskFileUpload": ".types",
+    "BaseTaskUpdatedBy": ".types",
+    "BaseUser": ".types",
+    "Client": "._legacy",
+    "Comment": ".types",
+    "CommentCreatedBy": ".types",
+    "ConvertedFormat": ".types",
+    "ConvertedFormatStatus": ".types",
+    "DataManagerTaskSerializer": ".types",
+    "DataManagerTaskSerializerAnnotatorsItem": ".types",
+    "DataManagerTaskSerializerDraftsItem": ".types",
+    "DataManagerTaskSerializerPredictionsItem": ".types",
+    "Export": ".types",
+    "ExportConvert": ".types",
+    "ExportCreate": ".types",
+    "ExportCreateStatus": ".types",
+    "ExportStatus": ".types",
+    "ExportStorageListTypesResponseItem": ".export_storage",
+    "FileUpload": ".types",
+    "Filter": ".types",
+    "FilterGroup": ".types",
+    "GcsExportStorage": ".types",
+    "GcsExportStorageStatus": ".types",
+    "GcsImportStorage": ".types",
+    "GcsImportStorageStatus": ".types",
+    "ImportStorageListTypesResponseItem": ".import_storage",
+    "InferenceRun": ".types",
+    "InferenceRunCreatedBy": ".types",
+    "InferenceRunOrganization": ".types",
+    "InferenceRunProjectSubset": ".types",
+    "InferenceRunStatus": ".types",
+    "InternalServerError": ".errors",
+    "LabelStudioEnvironment": ".environment",
+    "LocalFilesExportStorage": ".types",
+    "LocalFilesExportStorageStatus": ".types",
+    "LocalFilesImportStorage": ".types",
+    "LocalFilesImportStorageStatus": ".types",
+    "MlBackend": ".types",
+    "MlBackendAuthMethod": ".types",
+    "MlBackendState": ".types",
+    "MlCreateRequestAuthMethod": ".ml",
+    "MlCreateResponse": ".ml",
+    "MlCreateResponseAuthMethod": ".ml",
+    "MlUpdateRequestAuthMethod": ".ml",
+    "MlUpdateResponse": ".ml",
+    "MlUpdateResponseAuthMethod": ".ml",
+    "ModelProviderConnection": ".types",
+    "ModelProviderConnectionCreatedBy": ".types",
+    "ModelProviderConnectionOrganization": ".types",
+    "ModelProviderConnectionProvider": ".types",
+    "ModelProviderConnectionScope": ".types",
+    "NotFoundError": ".errors",
+    "Prediction": ".types",
+    "Project": ".types",
+    "ProjectImport": ".types",
+    "ProjectImportStatus": ".types",
+    "ProjectLabelConfig": ".types",
+    "ProjectSampling": ".types",
+    "ProjectSkipQueue": ".types",
+    "ProjectsCreateResponse": ".projects",
+    "ProjectsImportTasksResponse": ".projects",
+    "ProjectsListResponse": ".projects",
+    "ProjectsUpdateResponse": ".projects",
+    "Prompt": ".types",
+    "PromptCreatedBy": ".types",
+    "PromptOrganization": ".types",
+    "PromptVersion": ".types",
+    "PromptVersionCreatedBy": ".types",
+    "PromptVersionOrganization": ".types",
+    "PromptVersionProvider": ".types",
+    "PromptsBatchPredictionsResponse": ".prompts",
+    "RedisExportStorage": ".types",
+    "RedisExportStorageStatus": ".types",
+    "RedisImportStorage": ".types",
+    "RedisImportStorageStatus": ".types",
+    "S3ExportStorage": ".types",
+    "S3ExportStorageStatus": ".types",
+    "S3ImportStorage": ".types",
+    "S3ImportStorageStatus": ".types",
+    "S3SExportStorage": ".types",
+    "S3SImportStorage": ".types",
+    "S3SImportStorageStatus": ".types",
+    "SerializationOption": ".types",
+    "SerializationOptions": ".types",
+    "Task": ".types",
+    "TaskAnnotatorsItem": ".types",
+    "TaskFilterOptions": ".types",
+    "TasksListRequestFields": ".tasks",
+    "TasksListResponse": ".tasks",
+    "UserSimple": ".types",
+    "UsersGetTokenResponse": ".users",
+    "UsersResetTokenResponse": ".users",
+    "View": ".types",
+    "ViewsCreateRequestData": ".views",
+    "ViewsCreateRequestDataFilters": ".views",
+    "ViewsCreateRequestDataFiltersConjunction": ".views",
+    "ViewsCreateRequestDataFiltersItemsItem": ".views",
+    "ViewsCreateRequestDataFiltersItemsItemFilter": ".views",
+    "ViewsCreateRequestDataFiltersItemsItemOperator": ".views",
+    "ViewsCreateRequestDataFiltersItemsItemValue": ".views",
+    "ViewsCreateRequestDataOrderingItem": ".views",
+    "ViewsUpdateRequestData": ".views",
+    "ViewsUpdateRequestDataFilters": ".views",
+    "ViewsUpdateRequestDataFiltersConjunction": ".views",
+    "ViewsUpdateRequestDataFiltersItemsItem": ".views",
+    "ViewsUpdateRequestDataFiltersItemsItemFilter": ".views",
+    "ViewsUpdateRequestDataFiltersItemsItemOperator": ".views",
+    "ViewsUpdateRequestDataFiltersItemsItemValue": ".views",
+    "ViewsUpdateRequestDataOrderingItem": ".views",
+    "Webhook": ".types",
+    "WebhookActionsItem": ".types",
+    "WebhookSerializerForUpdate": ".types",
+    "WebhookSerializerForUpdateActionsItem": ".types",
+    "WebhooksUpdateRequestActionsItem": ".webhooks",
+    "Workspace": ".types",
+    "__version__": ".version",
+    "actions": ".actions",
+    "annotations": ".annotations",
+    "comments": ".comments",
+    "export_storage": ".export_storage",
+    "files": ".files",
+    "import_storage": ".import_storage",
+    "ml": ".ml",
+    "model_providers": ".model_providers",
+    "predictions": ".predictions",
+    "projects": ".projects",
+    "prompts": ".prompts",
+    "tasks": ".tasks",
+    "users": ".users",
+    "views": ".views",
+    "webhooks": ".webhooks",
+    "workspaces": ".workspaces",
+}
+
+
+def __getattr__(attr_name: str) -> typing.Any:
+    # names are imported on first access, so that `import label_studio_sdk` stays cheap
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
+    module = import_module(module_name, __package__)
+    value = module if module_name == f".{attr_name}" else getattr(module, attr_name)
+    globals()[attr_name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_dynamic_imports))
+
 
 __all__ = [
     "ActionsCreateRequestFilters",
@@ -232,6 +415,7 @@ __all__ = [
     "ModelProviderConnectionOrganization",
     "ModelProviderConnectionProvider",
     "ModelProviderConnectionScope",
+    "NotFoundError",
     "Prediction",
     "Project",
     "ProjectImport",
@@ -0,0 +1,249 @@
+import collections
+import dataclasses
+import typing
+
+from label_studio_sdk._extensions.checkpoint import Checkpoint, Checkpointer
+from label_studio_sdk._extensions.pager_ext import drain_items
+from label_studio_sdk.core.api_error import ApiError
+
+# Page sizing for long scans: every page reports its size in bytes and its latency, and the next page is sized
+# toward the targets. With page numbers, page N starts at (N - 1) * page_size, so the next size must divide the
+# number of tasks fetched so far: it only doubles when that number is a multiple of the doubled size, and shrinks to
+# the largest divisor of it within the targets.
+
+T = typing.TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class PageStats:
+    page: int
+    page_size: int
+    tasks: int
+    bytes: int
+    seconds: float
+
+
+# the items of a page, the size of the response in bytes, the time it took in seconds and the total reported
+FetchedPage = typing.Tuple[typing.List[T], int, float, typing.Optional[int]]
+
+
+class PageSizer:
+    """
+    Chooses the size of the next page from the last one, toward a target response size and latency.
+
+    Parameters
+    ----------
+    page_size : int
+        The size of the first page.
+
+    min_page_size : int
+        The smallest page size.
+
+    max_page_size : int
+        The largest page size, keep it below the limit of the server if it has one.
+
+    target_bytes : int
+        The response size to aim for, in bytes.
+
+    target_seconds : float
+        The page latency to aim for, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        page_size: int = 100,
+        min_page_size: int = 10,
+        max_page_size: int = 1000,
+        target_bytes: int = 4_000_000,
+        target_seconds: float = 1.0,
+    ) -> None:
+        if not 1 <= min_page_size <= page_size <= max_page_size:
+            raise ValueError(
+                "page sizes must be 1 <= min_page_size <= page_size <= max_page_size"
+            )
+        self.page_size = page_size
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_bytes = target_bytes
+        self.target_seconds = target_seconds
+        self.history: typing.Deque[PageStats] = collections.deque(maxlen=1000)
+
+    def ideal_page_size(self, stats: PageStats) -> int:
+        """The number of tasks that would have met both targets at the cost per task of the page."""
+        if not stats.tasks:
+            return self.page_size
+        by_bytes = self.target_bytes * stats.tasks / max(stats.bytes, 1)
+        by_latency = self.target_seconds * stats.tasks / max(stats.seconds, 1e-6)
+        return max(
+            self.min_page_size, min(self.max_page_size, int(min(by_bytes, by_latency)))
+        )
+
+    def record(self, stats: PageStats, offset: int) -> int:
+        """Record a page and return the size of the next one, which must divide `offset` to keep page numbers."""
+        self.history.append(stats)
+        ideal = self.ideal_page_size(stats)
+        size = self.page_size
+        if ideal < size:
+            size = self._shrink(ideal, offset)
+        # grow one step at a time, the latency of small pages overestimates the cost per task
+        if size == self.page_size and size * 2 <= ideal and offset % (size * 2) == 0:
+            size *= 2
+        self.page_size = size
+        return size
+
+    def _shrink(self, ideal: int, offset: int) -> int:
+        # the largest divisor of offset that meets the targets, or else the smallest one above them, the current
+        # page size divides offset
+        for size in range(ideal, self.min_page_size - 1, -1):
+            if offset % size == 0:
+                return size
+        return next(
+            size for size in range(ideal + 1, self.page_size + 1) if offset % size == 0
+        )
+
+
+class _AdaptivePagerBase(typing.Generic[T]):
+    def __init__(
+        self,
+        *,
+        sizer: PageSizer,
+        page: int = 1,
+        checkpointer: typing.Optional[Checkpointer] = None,
+    ) -> None:
+        self.sizer = sizer
+        self.next_page = page
+        self.offset = (page - 1) * sizer.page_size
+        self.total: typing.Optional[int] = None
+        self.checkpointer = checkpointer
+
+    def checkpoint(self) -> typing.Optional[Checkpoint]:
+        """Where to resume the iteration: the first page that wasn't fully processed. None without a checkpointer."""
+        return self.checkpointer.checkpoint if self.checkpointer is not None else None
+
+    def _position(self, items: typing.List[T]) -> typing.Dict[str, typing.Any]:
+        # the page is recorded before it is yielded, the next page and its size are known
+        return {"page": self.next_page, "page_size": self.sizer.page_size}
+
+    @property
+    def page_sizes(self) -> typing.List[int]:
+        """The sizes of the pages fetched so far, the last 1000 of them."""
+        return [stats.page_size for stats in self.sizer.history]
+
+    def _done(self) -> bool:
+        return self.total is not None and self.offset >= self.total
+
+    def _record(self, page: int, fetched: FetchedPage) -> None:
+        items, nbytes, seconds, total = fetched
+        page_size = self.sizer.page_size
+        if total is not None:
+            self.total = total
+            if len(items) < page_size and self.offset + len(items) < total:
+                raise RuntimeError(
+                    f"The server returned {len(items)} tasks for a page of {page_size}, "
+                    f"pass a max_page_size of {len(items)} or less"
+                )
+        self.offset += page_size
+        size = self.sizer.record(
+            PageStats(
+                page=page,
+                page_size=page_size,
+                tasks=len(items),
+                bytes=nbytes,
+                seconds=seconds,
+            ),
+            self.offset,
+        )
+        self.next_page = self.offset // size + 1
+
+
+class AdaptivePager(_AdaptivePagerBase[T]):
+    """
+    Iterates over all the tasks of a list, sizing each page with a `PageSizer`.
+    `page_sizes` and `sizer.history` report the sizes chosen so far.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[int, int], FetchedPage],
+        sizer: PageSizer,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(sizer=sizer, **kwargs)
+        self._fetch_page = fetch_page
+
+    def __iter__(self) -> typing.Iterator[T]:
+        for items in self._checkpointed_pages():
+            yield from items
+
+    def drain(self) -> typing.Iterator[T]:
+        """Iterate over the items once, releasing every item when it is yielded to hold about one page in memory."""
+        return drain_items(self._checkpointed_pages())
+
+    def _checkpointed_pages(self) -> typing.Iterator[typing.List[T]]:
+        if self.checkpointer is None:
+            return self.iter_pages()
+        return self.checkpointer.track(self.iter_pages(), self._position)
+
+    def iter_pages(self) -> typing.Iterator[typing.List[T]]:
+        while not self._done():
+            page = self.next_page
+            try:
+                fetched = self._fetch_page(page, self.sizer.page_size)
+            except ApiError as exc:
+                # the end of the pagination is reported with 404
+                if exc.status_code == 404:
+                    return
+                raise
+            if not fetched[0]:
+                return
+            self._record(page, fetched)
+            yield fetched[0]
+
+
+class AsyncAdaptivePager(_AdaptivePagerBase[T]):
+    """
+    Iterates over all the tasks of a list, sizing each page with a `PageSizer`.
+    `page_sizes` and `sizer.history` report the sizes chosen so far.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[int, int], typing.Awaitable[FetchedPage]],
+        sizer: PageSizer,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(sizer=sizer, **kwargs)
+        self._fetch_page = fetch_page
+
+    async def __aiter__(self) -> typing.AsyncIterator[T]:
+        async for items in self._checkpointed_pages():
+            for item in items:
+                yield item
+
+    async def drain(self) -> typing.AsyncIterator[T]:
+        """Iterate over the items once, releasing every item when it is yielded to hold about one page in memory."""
+        async for items in self._checkpointed_pages():
+            for item in drain_items([items]):
+                yield item
+
+    def _checkpointed_pages(self) -> typing.AsyncIterator[typing.List[T]]:
+        if self.checkpointer is None:
+            return self.iter_pages()
+        return self.checkpointer.atrack(self.iter_pages(), self._position)
+
+    async def iter_pages(self) -> typing.AsyncIterator[typing.List[T]]:
+        while not self._done():
+            page = self.next_page
+            try:
+                fetched = await self._fetch_page(page, self.sizer.page_size)
+            except ApiError as exc:
+                if exc.status_code == 404:
+                    return
+                raise
+            if not fetched[0]:
+                return
+            self._record(page, fetched)
+            yield fetched[0]
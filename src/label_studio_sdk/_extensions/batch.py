@@ -0,0 +1,386 @@
+import asyncio
+import dataclasses
+import functools
+import inspect
+import random
+import threading
+import time
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import httpx
+
+from label_studio_sdk.core.http_client import (
+    INITIAL_RETRY_DELAY_SECONDS,
+    MAX_RETRY_DELAY_SECONDS,
+)
+
+# Run many independent API calls (e.g. `predictions.create` for every task) with a cap on concurrency.
+# Every call gets a BatchResult holding either its return value or its exception, one failure never stops the batch.
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """The outcome of one call of a batch, `index` is the position of the call in submission order."""
+
+    index: int
+    value: typing.Any = None
+    exception: typing.Optional[Exception] = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+@dataclasses.dataclass
+class BatchProgress:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    # since the batch started
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        """The calls completed per second."""
+        return self.completed / self.seconds if self.seconds else 0.0
+
+
+def _accepts_request_options(fn: typing.Callable[..., typing.Any]) -> bool:
+    try:
+        return "request_options" in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _with_max_retries(
+    fn: typing.Callable[..., typing.Any],
+    kwargs: typing.Dict[str, typing.Any],
+    max_retries: int,
+) -> typing.Dict[str, typing.Any]:
+    # 429 and 5xx responses are retried by the http client, which honors Retry-After and reports to the rate limiter
+    if not max_retries or not _accepts_request_options(fn):
+        return kwargs
+    request_options = dict(kwargs.get("request_options") or {})
+    request_options.setdefault("max_retries", max_retries)
+    return {**kwargs, "request_options": request_options}
+
+
+def _retry_delay(retries: int) -> float:
+    return min(
+        INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS
+    ) * (1 - 0.25 * random.random())
+
+
+class _BatchState:
+    def __init__(
+        self,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]],
+        on_result: typing.Optional[typing.Callable[[BatchResult], None]] = None,
+        keep_results: bool = True,
+    ) -> None:
+        self.progress = BatchProgress()
+        self.results: typing.Dict[int, BatchResult] = {}
+        self._on_progress = on_progress
+        self._on_result = on_result
+        self._keep_results = keep_results
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def submitted(self) -> int:
+        with self._lock:
+            index = self.progress.submitted
+            self.progress.submitted += 1
+            return index
+
+    def completed(self, result: BatchResult) -> None:
+        with self._lock:
+            if self._keep_results:
+                self.results[result.index] = result
+            self.progress.completed += 1
+            if not result.ok:
+                self.progress.failed += 1
+            self.progress.seconds = time.perf_counter() - self._started
+            progress = dataclasses.replace(self.progress)
+        if self._on_result is not None:
+            self._on_result(result)
+        if self._on_progress is not None:
+            self._on_progress(progress)
+
+    def sorted_results(self) -> typing.List[BatchResult]:
+        with self._lock:
+            return [self.results[index] for index in sorted(self.results)]
+
+
+def _check_limits(concurrency: int, max_pending: typing.Optional[int]) -> int:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    if max_pending is None:
+        return 2 * concurrency
+    if max_pending < concurrency:
+        raise ValueError(
+            f"max_pending must be at least concurrency ({concurrency}), got {max_pending}"
+        )
+    return max_pending
+
+
+class BatchExecutor:
+    """
+    Runs calls of the sync client in a thread pool.
+
+    `submit()` blocks while `max_pending` calls are queued or running, so that a large input is consumed
+    at the pace of the server instead of being scheduled all at once. With `keep_results=False`, the results
+    are only passed to `on_result`, so that the memory doesn't grow with the number of calls.
+
+    Examples
+    --------
+    with client.batch(concurrency=16) as batch:
+        for task in tasks:
+            batch.submit(client.predictions.create, task=task.id, result=[...], model_version="v1")
+    failed = [result for result in batch.results if not result.ok]
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 8,
+        max_pending: typing.Optional[int] = None,
+        max_retries: int = 2,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+        on_result: typing.Optional[typing.Callable[[BatchResult], None]] = None,
+        keep_results: bool = True,
+    ) -> None:
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._slots = threading.BoundedSemaphore(
+            _check_limits(concurrency, max_pending)
+        )
+        self._state = _BatchState(on_progress, on_result, keep_results)
+        self._pool = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="label-studio-batch"
+        )
+        # the calls queued or running
+        self._futures: typing.Set[Future] = set()
+
+    def __enter__(self) -> "BatchExecutor":
+        return self
+
+    def __exit__(self, exc_type: typing.Any, exc: typing.Any, tb: typing.Any) -> None:
+        if exc_type is not None:
+            for future in list(self._futures):
+                future.cancel()
+        self._pool.shutdown(wait=True)
+
+    @property
+    def progress(self) -> BatchProgress:
+        return dataclasses.replace(self._state.progress)
+
+    @property
+    def results(self) -> typing.List[BatchResult]:
+        """The results of the completed calls, in submission order."""
+        return self._state.sorted_results()
+
+    def submit(
+        self,
+        fn: typing.Callable[..., typing.Any],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> int:
+        """Schedule `fn(*args, **kwargs)` and return its index in `results`."""
+        self._slots.acquire()
+        index = self._state.submitted()
+        try:
+            future = self._pool.submit(
+                self._run,
+                index,
+                fn,
+                args,
+                _with_max_retries(fn, kwargs, self.max_retries),
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        self._futures.add(future)
+        future.add_done_callback(self._done)
+        return index
+
+    def _done(self, future: Future) -> None:
+        self._futures.discard(future)
+        self._slots.release()
+
+    def map(
+        self,
+        fn: typing.Callable[..., typing.Any],
+        items: typing.Iterable[typing.Dict[str, typing.Any]],
+    ) -> typing.List[BatchResult]:
+        """Call `fn(**item)` for every item and wait for all of them."""
+        for item in items:
+            self.submit(fn, **item)
+        return self.wait()
+
+    def wait(self) -> typing.List[BatchResult]:
+        """Wait for the calls submitted so far and return all the results."""
+        for future in list(self._futures):
+            if not future.cancelled():
+                future.exception()
+        return self.results
+
+    def _run(
+        self,
+        index: int,
+        fn: typing.Callable[..., typing.Any],
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                result = BatchResult(
+                    index=index, value=fn(*args, **kwargs), attempts=attempts
+                )
+                break
+            except httpx.TransportError as exc:
+                # connection errors and timeouts are not retried by the http client
+                if attempts > self.max_retries:
+                    result = BatchResult(index=index, exception=exc, attempts=attempts)
+                    break
+                time.sleep(_retry_delay(attempts - 1))
+            except Exception as exc:
+                result = BatchResult(index=index, exception=exc, attempts=attempts)
+                break
+        self._state.completed(result)
+
+
+class AsyncBatchExecutor:
+    """
+    Runs coroutines of the async client as tasks, at most `concurrency` of them at a time.
+
+    `await submit()` waits while `max_pending` calls are scheduled, so that a large input is consumed
+    at the pace of the server instead of being scheduled all at once. With `keep_results=False`, the results
+    are only passed to `on_result`, so that the memory doesn't grow with the number of calls.
+
+    Examples
+    --------
+    async with client.batch(concurrency=16) as batch:
+        for task in tasks:
+            await batch.submit(client.predictions.create, task=task.id, result=[...], model_version="v1")
+    failed = [result for result in batch.results if not result.ok]
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 8,
+        max_pending: typing.Optional[int] = None,
+        max_retries: int = 2,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+        on_result: typing.Optional[typing.Callable[[BatchResult], None]] = None,
+        keep_results: bool = True,
+    ) -> None:
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._max_pending = _check_limits(concurrency, max_pending)
+        self._state = _BatchState(on_progress, on_result, keep_results)
+        # the calls scheduled or running
+        self._tasks: typing.Set["asyncio.Task[None]"] = set()
+        # created on first use, asyncio primitives are bound to the running loop on python 3.8 and 3.9
+        self._slots: typing.Optional[asyncio.Semaphore] = None
+        self._running: typing.Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncBatchExecutor":
+        return self
+
+    async def __aexit__(
+        self, exc_type: typing.Any, exc: typing.Any, tb: typing.Any
+    ) -> None:
+        if exc_type is not None:
+            for task in list(self._tasks):
+                task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    @property
+    def progress(self) -> BatchProgress:
+        return dataclasses.replace(self._state.progress)
+
+    @property
+    def results(self) -> typing.List[BatchResult]:
+        """The results of the completed calls, in submission order."""
+        return self._state.sorted_results()
+
+    async def submit(
+        self,
+        fn: typing.Callable[..., typing.Awaitable[typing.Any]],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> int:
+        """Schedule `await fn(*args, **kwargs)` and return its index in `results`."""
+        if self._slots is None or self._running is None:
+            self._slots = asyncio.Semaphore(self._max_pending)
+            self._running = asyncio.Semaphore(self.concurrency)
+        await self._slots.acquire()
+        index = self._state.submitted()
+        task = asyncio.ensure_future(
+            self._run(index, fn, args, _with_max_retries(fn, kwargs, self.max_retries))
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(functools.partial(_release, self._slots))
+        return index
+
+    async def map(
+        self,
+        fn: typing.Callable[..., typing.Awaitable[typing.Any]],
+        items: typing.Union[
+            typing.Iterable[typing.Dict[str, typing.Any]],
+            typing.AsyncIterable[typing.Dict[str, typing.Any]],
+        ],
+    ) -> typing.List[BatchResult]:
+        """Call `await fn(**item)` for every item and wait for all of them."""
+        if isinstance(items, typing.AsyncIterable):
+            async for item in items:
+                await self.submit(fn, **item)
+        else:
+            for item in items:
+                await self.submit(fn, **item)
+        return await self.wait()
+
+    async def wait(self) -> typing.List[BatchResult]:
+        """Wait for the calls submitted so far and return all the results."""
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        return self.results
+
+    async def _run(
+        self,
+        index: int,
+        fn: typing.Callable[..., typing.Awaitable[typing.Any]],
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        assert self._running is not None
+        attempts = 0
+        async with self._running:
+            while True:
+                attempts += 1
+                try:
+                    result = BatchResult(
+                        index=index, value=await fn(*args, **kwargs), attempts=attempts
+                    )
+                    break
+                except httpx.TransportError as exc:
+                    # connection errors and timeouts are not retried by the http client
+                    if attempts > self.max_retries:
+                        result = BatchResult(
+                            index=index, exception=exc, attempts=attempts
+                        )
+                        break
+                    await asyncio.sleep(_retry_delay(attempts - 1))
+                except Exception as exc:
+                    result = BatchResult(index=index, exception=exc, attempts=attempts)
+                    break
+        self._state.completed(result)
+
+
+def _release(semaphore: asyncio.Semaphore, _: typing.Any) -> None:
+    semaphore.release()
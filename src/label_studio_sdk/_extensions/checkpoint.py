@@ -0,0 +1,168 @@
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import typing
+
+# Checkpoints of task scans: the position after the last page that was fully processed, and a hash of the list
+# parameters so that a scan isn't resumed with another query. Resuming processes the interrupted page again,
+# every task is processed at least once. Chunked Data Manager actions use the same checkpoints, with a chunk
+# for a page.
+
+PAGE = "page"
+KEYSET = "keyset"
+ADAPTIVE = "adaptive"
+CHUNKS = "chunks"
+
+P = typing.TypeVar("P")
+
+# not part of the key: the position, and what doesn't change the tasks that are listed
+_POSITION_PARAMS = ("page", "page_size", "after_id", "request_options")
+
+
+def params_key(params: typing.Dict[str, typing.Any]) -> str:
+    """A hash of the parameters of `tasks.list()` that select the tasks."""
+    selection = {
+        name: value
+        for name, value in params.items()
+        if name not in _POSITION_PARAMS and value is not None
+    }
+    encoded = json.dumps(selection, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+@dataclasses.dataclass(frozen=True)
+class Checkpoint:
+    """
+    Where a scan of tasks stopped: the next page to fetch, or the last task id in keyset mode.
+    `to_token()` and `from_token()` convert it to and from a string.
+    """
+
+    mode: str
+    key: str
+    page: typing.Optional[int] = None
+    page_size: typing.Optional[int] = None
+    last_id: typing.Optional[int] = None
+
+    def to_token(self) -> str:
+        return json.dumps(
+            {
+                field.name: getattr(self, field.name)
+                for field in dataclasses.fields(self)
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_token(cls, token: typing.Union[str, "Checkpoint"]) -> "Checkpoint":
+        if isinstance(token, Checkpoint):
+            return token
+        try:
+            return cls(**json.loads(token))
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid checkpoint token: {token!r}") from exc
+
+    def check(self, mode: str, key: str) -> "Checkpoint":
+        """Raise ValueError unless the checkpoint was made by a scan in `mode` with the same parameters."""
+        if self.mode != mode:
+            raise ValueError(
+                f"The checkpoint was made in {self.mode} mode, it can't resume a scan in {mode} mode"
+            )
+        if self.key != key:
+            raise ValueError("The checkpoint was made with other list parameters")
+        return self
+
+
+class CheckpointStore(typing.Protocol):
+    def save(self, checkpoint: Checkpoint) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class FileCheckpoint:
+    """
+    Persists the checkpoint of a scan to a local file, replaced atomically after every page.
+    The file is removed when the scan completes, so that the next scan starts from the beginning.
+
+    Examples
+    --------
+    checkpoint = FileCheckpoint("nightly-scan.json")
+    for task in client.tasks.list(project=1, resume_from=checkpoint.load(), checkpoint=checkpoint):
+        process(task)
+    """
+
+    def __init__(self, path: typing.Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+
+    def load(self) -> typing.Optional[Checkpoint]:
+        try:
+            with open(self.path) as f:
+                return Checkpoint.from_token(f.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(checkpoint.to_token())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class Checkpointer:
+    """
+    Tracks the position of a pager: `track()` wraps its pages and moves the checkpoint past a page once the caller
+    asks for the next one, saving it to the store if there is one. The store is cleared when the pages run out.
+    Loops that aren't over pages call `page_done()` and `completed()` themselves.
+    """
+
+    def __init__(
+        self, checkpoint: Checkpoint, store: typing.Optional[CheckpointStore] = None
+    ) -> None:
+        self.checkpoint = checkpoint
+        self.store = store
+
+    def page_done(self, position: typing.Dict[str, typing.Any]) -> None:
+        """Move the checkpoint to `position`, the checkpoint fields after a page, and save it."""
+        self.checkpoint = dataclasses.replace(self.checkpoint, **position)
+        if self.store is not None:
+            self.store.save(self.checkpoint)
+
+    def completed(self) -> None:
+        """Clear the store once there is nothing left to resume."""
+        if self.store is not None:
+            self.store.clear()
+
+    def track(
+        self,
+        pages: typing.Iterable[P],
+        position: typing.Callable[[P], typing.Dict[str, typing.Any]],
+    ) -> typing.Iterator[P]:
+        """`position` returns the checkpoint fields after a page, it's called before the page is processed."""
+        for page in pages:
+            after = position(page)
+            yield page
+            self.page_done(after)
+        self.completed()
+
+    async def atrack(
+        self,
+        pages: typing.AsyncIterable[P],
+        position: typing.Callable[[P], typing.Dict[str, typing.Any]],
+    ) -> typing.AsyncIterator[P]:
+        async for page in pages:
+            after = position(page)
+            yield page
+            self.page_done(after)
+        self.completed()
@@ -0,0 +1,147 @@
+import dataclasses
+import itertools
+import threading
+import time
+import typing
+
+from label_studio_sdk._extensions.batch import BatchResult
+from label_studio_sdk._extensions.checkpoint import (
+    CHUNKS,
+    Checkpoint,
+    Checkpointer,
+    CheckpointStore,
+    params_key,
+)
+
+# Data Manager actions on a selection of task ids, split into chunks so that no request carries the whole selection.
+# The chunks run concurrently and complete out of order: the checkpoint only moves past a chunk once all the chunks
+# before it finished, so resuming runs again the chunks that finished after the first failure.
+
+
+@dataclasses.dataclass
+class ChunkedActionResult:
+    """The outcome of `actions.run_chunked()`: the chunks that ran, the items the server processed and the time taken."""
+
+    chunks: int = 0
+    processed_items: int = 0
+    # the responses of the action, in chunk order
+    responses: typing.List[typing.Any] = dataclasses.field(default_factory=list)
+    seconds: float = 0.0
+
+    def add(self, response: typing.Any) -> None:
+        self.chunks += 1
+        self.responses.append(response)
+        if isinstance(response, dict) and isinstance(
+            response.get("processed_items"), int
+        ):
+            self.processed_items += response["processed_items"]
+
+
+class ChunkedActionError(Exception):
+    """
+    A chunk of `actions.run_chunked()` failed after its retries, the exception is the cause. `checkpoint` resumes
+    the action after the chunks that finished before the failed one, and `result` holds what they returned.
+    """
+
+    def __init__(
+        self, chunk: int, checkpoint: Checkpoint, result: ChunkedActionResult
+    ) -> None:
+        super().__init__(
+            f"Chunk {chunk} of the action failed, pass the checkpoint as resume_from to continue"
+        )
+        self.chunk = chunk
+        self.checkpoint = checkpoint
+        self.result = result
+
+
+def chunked(ids: typing.Iterable[int], size: int) -> typing.Iterator[typing.List[int]]:
+    """Split `ids` into lists of `size` ids, the last one can be shorter."""
+    iterator = iter(ids)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ChunkTracker:
+    """
+    Tracks the chunks of an action: `chunks()` skips the chunks of the checkpoint and stops after a failure, and
+    `on_result()` is the `on_result` of the batch that runs them, submitted in the order of `chunks()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        action: typing.Dict[str, typing.Any],
+        chunk_size: int,
+        resume_from: typing.Union[Checkpoint, str, None] = None,
+        store: typing.Optional[CheckpointStore] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        key = params_key(action)
+        if resume_from is None:
+            start = Checkpoint(mode=CHUNKS, key=key, page=0, page_size=chunk_size)
+        else:
+            start = Checkpoint.from_token(resume_from).check(CHUNKS, key)
+            if start.page_size != chunk_size:
+                raise ValueError(
+                    f"The checkpoint was made with chunk_size={start.page_size}, got {chunk_size}"
+                )
+        self.checkpointer = Checkpointer(start, store)
+        self.result = ChunkedActionResult()
+        self.chunk_size = chunk_size
+        self._first = start.page
+        # the last id of the chunks submitted and not passed by the checkpoint yet, and the responses of those done
+        self._last_ids: typing.Dict[int, int] = {}
+        self._done: typing.Dict[int, typing.Any] = {}
+        self._failed: typing.Optional[typing.Tuple[int, BaseException]] = None
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def chunks(self, ids: typing.Iterable[int]) -> typing.Iterator[typing.List[int]]:
+        start = self.checkpointer.checkpoint
+        skipped = 0
+        for index, chunk in enumerate(chunked(ids, self.chunk_size)):
+            if index < self._first:
+                # the ids of the skipped chunks are only checked by the last one
+                if index == self._first - 1 and chunk[-1] != start.last_id:
+                    raise ValueError("The checkpoint was made with other ids")
+                skipped += 1
+                continue
+            with self._lock:
+                if self._failed is not None:
+                    return
+                self._last_ids[index] = chunk[-1]
+            yield chunk
+        if skipped < self._first:
+            raise ValueError("The checkpoint was made with other ids")
+
+    def on_result(self, result: BatchResult) -> None:
+        index = self._first + result.index
+        with self._lock:
+            if not result.ok:
+                if self._failed is None or index < self._failed[0]:
+                    self._failed = (index, result.exception)
+                return
+            self._done[index] = result.value
+            position = self.checkpointer.checkpoint.page
+            last_id = None
+            while position in self._done:
+                self.result.add(self._done.pop(position))
+                last_id = self._last_ids.pop(position)
+                position += 1
+            if last_id is not None:
+                self.checkpointer.page_done({"page": position, "last_id": last_id})
+
+    def finish(self) -> ChunkedActionResult:
+        """The result of the action, or ChunkedActionError if a chunk failed."""
+        self.result.seconds = time.perf_counter() - self._started
+        if self._failed is not None:
+            chunk, exception = self._failed
+            raise ChunkedActionError(
+                chunk, self.checkpointer.checkpoint, self.result
+            ) from exception
+        self.checkpointer.completed()
+        return self.result
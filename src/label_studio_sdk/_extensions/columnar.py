@@ -0,0 +1,145 @@
+import json
+import typing
+
+# Columnar materialization of tasks: every task is appended straight into one list per column instead of a dict
+# per task, and the pages are drained as they are read, so the tasks and a copy of them as records are never held
+# at the same time. The lists are converted to the columns of a DataFrame or an Arrow table at the end, one at a
+# time, releasing every list once it is converted.
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+DATA_PREFIX = "data."
+
+
+def _get(task: typing.Any, name: str) -> typing.Any:
+    # tasks are models, or dicts with `response_mode="raw"`
+    return task.get(name) if isinstance(task, dict) else getattr(task, name, None)
+
+
+def _count(task: typing.Any, items: str, total: str) -> typing.Optional[int]:
+    listed = _get(task, items)
+    return len(listed) if listed is not None else _get(task, total)
+
+
+class TaskColumns:
+    """
+    Column buffers for tasks: `id`, `annotation_count`, `prediction_count`, the task attributes listed in `fields`
+    and one `data.<key>` column per key of the task data. Tasks without a data key get None.
+
+    Parameters
+    ----------
+    fields : typing.Sequence[str]
+        Other task attributes to add as columns, e.g. `["created_at", "is_labeled"]`.
+
+    data : bool
+        Whether to add the `data.<key>` columns.
+    """
+
+    def __init__(self, fields: typing.Sequence[str] = (), data: bool = True) -> None:
+        self.data = data
+        self.rows = 0
+        self.columns: typing.Dict[str, typing.List[typing.Any]] = {
+            "id": [],
+            "annotation_count": [],
+            "prediction_count": [],
+        }
+        self.fields = [
+            name for name in dict.fromkeys(fields) if name not in self.columns
+        ]
+        for name in self.fields:
+            self.columns[name] = []
+
+    def append(self, task: typing.Any) -> None:
+        columns = self.columns
+        columns["id"].append(_get(task, "id"))
+        columns["annotation_count"].append(
+            _count(task, "annotations", "total_annotations")
+        )
+        columns["prediction_count"].append(
+            _count(task, "predictions", "total_predictions")
+        )
+        for name in self.fields:
+            columns[name].append(_get(task, name))
+        if not self.data:
+            self.rows += 1
+            return
+        row = self.rows
+        for key, value in (_get(task, "data") or {}).items():
+            column = columns.get(DATA_PREFIX + key)
+            if column is None:
+                column = columns[DATA_PREFIX + key] = [None] * row
+            column.append(value)
+        self.rows = row + 1
+        # the data keys that this task doesn't have
+        for column in columns.values():
+            if len(column) == row:
+                column.append(None)
+
+    def extend(self, tasks: typing.Iterable[typing.Any]) -> "TaskColumns":
+        for task in tasks:
+            self.append(task)
+        return self
+
+    def _pop_columns(
+        self,
+    ) -> typing.Iterator[typing.Tuple[str, typing.List[typing.Any]]]:
+        # hand over the lists one by one so that each is released once converted
+        columns, self.columns, self.rows = self.columns, {}, 0
+        while columns:
+            name = next(iter(columns))
+            yield name, columns.pop(name)
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """A DataFrame of the columns, the buffers are emptied."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                name: pd.Series(values, name=name)
+                for name, values in self._pop_columns()
+            },
+            copy=False,
+        )
+
+    def to_arrow(self) -> "pa.Table":
+        """An Arrow table of the columns, the buffers are emptied. Requires pyarrow."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is not installed. Please install pyarrow to use to_arrow()."
+            )
+
+        arrays = {}
+        for name, values in self._pop_columns():
+            try:
+                arrays[name] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # values of mixed types, e.g. a data key holding both text and objects, are stored as JSON
+                arrays[name] = pa.array(
+                    [
+                        None if value is None else json.dumps(value, default=str)
+                        for value in values
+                    ]
+                )
+        return pa.table(arrays)
+
+
+def tasks_to_dataframe(
+    tasks: typing.Iterable[typing.Any],
+    fields: typing.Sequence[str] = (),
+    data: bool = True,
+) -> "pd.DataFrame":
+    """A DataFrame of tasks with the columns of `TaskColumns`. Pass `pager.drain()` to release the tasks as they go."""
+    return TaskColumns(fields, data).extend(tasks).to_dataframe()
+
+
+def tasks_to_arrow(
+    tasks: typing.Iterable[typing.Any],
+    fields: typing.Sequence[str] = (),
+    data: bool = True,
+) -> "pa.Table":
+    """An Arrow table of tasks with the columns of `TaskColumns`. Requires pyarrow."""
+    return TaskColumns(fields, data).extend(tasks).to_arrow()
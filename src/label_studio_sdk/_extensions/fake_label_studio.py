@@ -0,0 +1,697 @@
+import asyncio
+import datetime
+import itertools
+import json
+import re
+import threading
+import time
+import typing
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from label_studio_sdk._extensions.local_filters import compile_filters, parse_datetime
+
+# An in-memory stand-in for the Label Studio endpoints the SDK uses the most, to test and benchmark
+# pagination, imports, exports and actions without a server:
+#
+#     fake = FakeLabelStudio(tasks=10_000, latency=0.005)
+#     client = LabelStudio(api_key="fake", httpx_client=httpx.Client(transport=fake.transport()))
+#
+# `async_transport()` is the equivalent for AsyncLabelStudio, `serve()` runs it as a local HTTP server.
+
+DEFAULT_PAGE_SIZE = 100
+SYNTHETIC_TIMESTAMP = "2024-01-15T09:30:00Z"
+
+Handler = typing.Callable[..., httpx.Response]
+
+
+def synthetic_task(task_id: int, project: int = 1) -> typing.Dict[str, typing.Any]:
+    """A task as returned with `fields=all`: one annotation and one prediction with three rectangles each."""
+    result = [
+        {
+            "id": f"r{task_id}-{j}",
+            "type": "rectanglelabels",
+            "from_name": "label",
+            "to_name": "image",
+            "value": {
+                "x": 10.5,
+                "y": 20.25,
+                "width": 30.0,
+                "height": 40.0,
+                "rectanglelabels": ["cat"],
+            },
+        }
+        for j in range(3)
+    ]
+    return {
+        "id": task_id,
+        "data": {
+            "image": f"s3://bucket/images/{task_id}.jpg",
+            "meta": {"source": "synthetic"},
+        },
+        "annotations": [
+            {
+                "id": task_id * 10,
+                "result": result,
+                "completed_by": 1,
+                "created_at": SYNTHETIC_TIMESTAMP,
+                "task": task_id,
+            }
+        ],
+        "predictions": [
+            {
+                "id": task_id * 10,
+                "result": result,
+                "score": 0.9,
+                "model_version": "v1",
+                "task": task_id,
+            }
+        ],
+        "created_at": SYNTHETIC_TIMESTAMP,
+        "updated_at": SYNTHETIC_TIMESTAMP,
+        "is_labeled": True,
+        "total_annotations": 1,
+        "cancelled_annotations": 0,
+        "total_predictions": 1,
+        "project": project,
+    }
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+
+
+def _json_response(status_code: int, body: typing.Any) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        content=json.dumps(body, separators=(",", ":")).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def _not_found() -> httpx.Response:
+    return _json_response(404, {"detail": "Not found."})
+
+
+def _task_value(task: typing.Dict[str, typing.Any], field: str) -> typing.Any:
+    # "filter:tasks:data.text" -> task["data"]["text"]
+    value: typing.Any = task
+    for key in field.split(":")[-1].split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _order_key(value: typing.Any) -> typing.Any:
+    # datetimes are ordered as such, whatever their format
+    return (parse_datetime(value) or value) if isinstance(value, str) else value
+
+
+def _apply_query(
+    tasks: typing.List[typing.Dict[str, typing.Any]],
+    query: typing.Dict[str, typing.Any],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    if query.get("filters"):
+        tasks = compile_filters(query["filters"]).filter(tasks)
+    selected = query.get("selectedItems")
+    if selected:
+        if selected.get("all"):
+            excluded = set(selected.get("excluded") or [])
+            tasks = [task for task in tasks if task["id"] not in excluded]
+        else:
+            included = set(selected.get("included") or [])
+            tasks = [task for task in tasks if task["id"] in included]
+    for order in reversed(query.get("ordering") or []):
+        field = order.lstrip("-")
+        tasks = sorted(
+            tasks,
+            key=lambda task: _order_key(_task_value(task, field)),
+            reverse=order.startswith("-"),
+        )
+    return tasks
+
+
+class FakeLabelStudio:
+    """
+    Serves:
+
+    - `GET api/projects/`, `GET api/projects/{id}/`
+    - `GET api/tasks/` with page, page_size, project, fields, include and query (filters, ordering, selected
+      items), answering 404 past the last page like Label Studio does
+    - `POST api/tasks/`, `GET/PATCH/DELETE api/tasks/{id}/`, `GET api/predictions/`
+    - `POST api/projects/{id}/import`, synchronous or asynchronous with `GET api/projects/{id}/imports/{pk}/`
+    - `GET/POST api/projects/{id}/exports/`, `GET exports/{pk}`, `GET exports/{pk}/download`, `GET export`
+    - `POST api/dm/actions/`, which deletes tasks, annotations or predictions and records the other actions
+
+    Parameters
+    ----------
+    tasks : int
+        The number of synthetic tasks created in project 1.
+
+    latency : typing.Union[float, typing.Callable[[httpx.Request], float]]
+        Seconds added to every request, or a function of the request returning them.
+
+    async_import : bool
+        Answer imports with an import id whose status is polled, like Label Studio with async imports enabled.
+
+    pending_polls : int
+        The number of status polls that report an async import or an export as in progress before it completes.
+
+    make_task : typing.Callable[[int, int], typing.Dict[str, typing.Any]]
+        Builds the synthetic task with the given id in the given project.
+    """
+
+    def __init__(
+        self,
+        *,
+        tasks: int = 0,
+        latency: typing.Union[float, typing.Callable[[httpx.Request], float]] = 0.0,
+        async_import: bool = False,
+        pending_polls: int = 0,
+        make_task: typing.Callable[
+            [int, int], typing.Dict[str, typing.Any]
+        ] = synthetic_task,
+    ) -> None:
+        self.latency = latency
+        self.async_import = async_import
+        self.pending_polls = pending_polls
+        self.make_task = make_task
+        self.projects: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        self.tasks: typing.Dict[int, typing.List[typing.Dict[str, typing.Any]]] = {}
+        self.imports: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        self.exports: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        self.actions: typing.List[typing.Dict[str, typing.Any]] = []
+        self.requests: typing.List[httpx.Request] = []
+        self.record_requests = False
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        # encoded pages of `api/tasks/`, dropped whenever the tasks change
+        self._pages: typing.Dict[typing.Tuple[typing.Any, ...], bytes] = {}
+        self._routes: typing.List[typing.Tuple[str, typing.Pattern[str], Handler]] = [
+            ("GET", re.compile(r"api/projects/"), self._list_projects),
+            ("GET", re.compile(r"api/projects/(\d+)/"), self._get_project),
+            ("POST", re.compile(r"api/projects/(\d+)/import"), self._import_tasks),
+            ("GET", re.compile(r"api/projects/(\d+)/imports/(\d+)/"), self._get_import),
+            ("GET", re.compile(r"api/projects/(\d+)/exports/"), self._list_exports),
+            ("POST", re.compile(r"api/projects/(\d+)/exports/"), self._create_export),
+            ("GET", re.compile(r"api/projects/(\d+)/exports/(\d+)"), self._get_export),
+            (
+                "GET",
+                re.compile(r"api/projects/(\d+)/exports/(\d+)/download"),
+                self._download_export,
+            ),
+            ("GET", re.compile(r"api/projects/(\d+)/export"), self._export),
+            ("GET", re.compile(r"api/tasks/"), self._list_tasks),
+            ("POST", re.compile(r"api/tasks/"), self._create_task),
+            ("GET", re.compile(r"api/tasks/(\d+)/"), self._get_task),
+            ("PATCH", re.compile(r"api/tasks/(\d+)/"), self._update_task),
+            ("DELETE", re.compile(r"api/tasks/(\d+)/"), self._delete_task),
+            ("GET", re.compile(r"api/predictions/"), self._list_predictions),
+            ("POST", re.compile(r"api/dm/actions/"), self._run_action),
+        ]
+        self.add_project(1, tasks=tasks)
+
+    def add_project(
+        self, project_id: int, *, tasks: int = 0, title: typing.Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self.projects[project_id] = {
+                "id": project_id,
+                "title": title or f"Project {project_id}",
+            }
+            self.tasks.setdefault(project_id, []).extend(
+                self.make_task(next(self._ids), project_id) for _ in range(tasks)
+            )
+            self._pages.clear()
+
+    # transports
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request without the injected latency."""
+        path = request.url.path.lstrip("/")
+        with self._lock:
+            if self.record_requests:
+                self.requests.append(request)
+            for method, pattern, handler in self._routes:
+                match = pattern.fullmatch(path)
+                if match is not None and method == request.method:
+                    return handler(request, *(int(group) for group in match.groups()))
+        return _not_found()
+
+    def _delay(self, request: httpx.Request) -> float:
+        return self.latency(request) if callable(self.latency) else self.latency
+
+    def _handle_sync(self, request: httpx.Request) -> httpx.Response:
+        delay = self._delay(request)
+        if delay > 0:
+            time.sleep(delay)
+        return self.handle(request)
+
+    async def _handle_async(self, request: httpx.Request) -> httpx.Response:
+        delay = self._delay(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.handle(request)
+
+    def transport(self) -> httpx.MockTransport:
+        """A transport for `httpx.Client`, the latency blocks the calling thread."""
+        return httpx.MockTransport(self._handle_sync)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """A transport for `httpx.AsyncClient`, the latency is awaited."""
+        return httpx.MockTransport(self._handle_async)
+
+    @contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> typing.Iterator[str]:
+        """Run the fake as a local HTTP/1.1 server in a background thread and yield its base url."""
+        server = ThreadingHTTPServer(
+            (host, port), _make_request_handler(self._handle_sync)
+        )
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    # helpers
+
+    def _project_tasks(
+        self, project_id: int
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        return self.tasks.setdefault(project_id, [])
+
+    def _all_tasks(self) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        return itertools.chain.from_iterable(self.tasks.values())
+
+    def _find_task(self, task_id: int) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        return next((task for task in self._all_tasks() if task["id"] == task_id), None)
+
+    def _tasks_changed(self) -> None:
+        self._pages.clear()
+
+    # projects
+
+    def _project_body(self, project_id: int) -> typing.Dict[str, typing.Any]:
+        tasks = self._project_tasks(project_id)
+        return {
+            **self.projects[project_id],
+            "task_number": len(tasks),
+            "total_annotations_number": sum(
+                task.get("total_annotations", 0) for task in tasks
+            ),
+            "total_predictions_number": sum(
+                task.get("total_predictions", 0) for task in tasks
+            ),
+            "created_at": SYNTHETIC_TIMESTAMP,
+        }
+
+    def _list_projects(self, request: httpx.Request) -> httpx.Response:
+        results = [
+            self._project_body(project_id) for project_id in sorted(self.projects)
+        ]
+        return _json_response(
+            200,
+            {"count": len(results), "next": None, "previous": None, "results": results},
+        )
+
+    def _get_project(self, request: httpx.Request, project_id: int) -> httpx.Response:
+        if project_id not in self.projects:
+            return _not_found()
+        return _json_response(200, self._project_body(project_id))
+
+    # tasks
+
+    def _list_tasks(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        page = int(params.get("page", 1))
+        page_size = int(params.get("page_size", DEFAULT_PAGE_SIZE))
+        key = (
+            params.get("project"),
+            page,
+            page_size,
+            params.get("fields"),
+            params.get("include"),
+            params.get("query"),
+        )
+        content = self._pages.get(key)
+        if content is None:
+            tasks = self._query_tasks(params)
+            if page < 1 or (page - 1) * page_size >= max(len(tasks), 1):
+                return _json_response(404, {"detail": "Invalid page."})
+            page_tasks = [
+                self._task_fields(task, params.get("fields"), params.get("include"))
+                for task in tasks[(page - 1) * page_size : page * page_size]
+            ]
+            content = json.dumps(
+                {
+                    "tasks": page_tasks,
+                    "total": len(tasks),
+                    "total_annotations": sum(
+                        task.get("total_annotations", 0) for task in tasks
+                    ),
+                    "total_predictions": sum(
+                        task.get("total_predictions", 0) for task in tasks
+                    ),
+                },
+                separators=(",", ":"),
+            ).encode()
+            self._pages[key] = content
+        return httpx.Response(
+            200, content=content, headers={"Content-Type": "application/json"}
+        )
+
+    def _query_tasks(
+        self, params: httpx.QueryParams
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        project = params.get("project")
+        tasks = (
+            self._project_tasks(int(project))
+            if project is not None
+            else list(self._all_tasks())
+        )
+        query = params.get("query")
+        if query:
+            tasks = _apply_query(tasks, json.loads(query))
+        return tasks
+
+    @staticmethod
+    def _task_fields(
+        task: typing.Dict[str, typing.Any],
+        fields: typing.Optional[str],
+        include: typing.Optional[str],
+    ) -> typing.Dict[str, typing.Any]:
+        if include:
+            names = include.split(",")
+            return {name: task[name] for name in names if name in task}
+        if fields != "all":
+            return {
+                key: value
+                for key, value in task.items()
+                if key not in ("annotations", "predictions")
+            }
+        return task
+
+    def _create_task(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        task = self._new_task(body, body.get("project", 1))
+        return _json_response(201, task)
+
+    def _new_task(
+        self, body: typing.Dict[str, typing.Any], project_id: int
+    ) -> typing.Dict[str, typing.Any]:
+        task_id = next(self._ids)
+        annotations = [
+            {
+                "id": task_id * 10 + i,
+                "task": task_id,
+                "created_at": _now(),
+                **annotation,
+            }
+            for i, annotation in enumerate(body.get("annotations") or [])
+        ]
+        predictions = [
+            {"id": task_id * 10 + i, "task": task_id, **prediction}
+            for i, prediction in enumerate(body.get("predictions") or [])
+        ]
+        now = _now()
+        task = {
+            "id": task_id,
+            "data": body.get("data", {}),
+            "meta": body.get("meta", {}),
+            "annotations": annotations,
+            "predictions": predictions,
+            "created_at": now,
+            "updated_at": now,
+            "is_labeled": bool(annotations),
+            "total_annotations": len(annotations),
+            "cancelled_annotations": 0,
+            "total_predictions": len(predictions),
+            "project": project_id,
+        }
+        self._project_tasks(project_id).append(task)
+        self._tasks_changed()
+        return task
+
+    def _get_task(self, request: httpx.Request, task_id: int) -> httpx.Response:
+        task = self._find_task(task_id)
+        return _json_response(200, task) if task is not None else _not_found()
+
+    def _update_task(self, request: httpx.Request, task_id: int) -> httpx.Response:
+        task = self._find_task(task_id)
+        if task is None:
+            return _not_found()
+        task.update(
+            {
+                key: value
+                for key, value in json.loads(request.content).items()
+                if key != "id"
+            }
+        )
+        task["updated_at"] = _now()
+        self._tasks_changed()
+        return _json_response(200, task)
+
+    def _delete_task(self, request: httpx.Request, task_id: int) -> httpx.Response:
+        for tasks in self.tasks.values():
+            for index, task in enumerate(tasks):
+                if task["id"] == task_id:
+                    del tasks[index]
+                    self._tasks_changed()
+                    return httpx.Response(204)
+        return _not_found()
+
+    def _list_predictions(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        project = params.get("project")
+        tasks = (
+            self._project_tasks(int(project))
+            if project is not None
+            else list(self._all_tasks())
+        )
+        task_id = params.get("task")
+        if task_id is not None:
+            tasks = [task for task in tasks if task["id"] == int(task_id)]
+        return _json_response(
+            200,
+            [
+                prediction
+                for task in tasks
+                for prediction in task.get("predictions", [])
+            ],
+        )
+
+    # imports
+
+    def _import_tasks(self, request: httpx.Request, project_id: int) -> httpx.Response:
+        if project_id not in self.projects:
+            return _not_found()
+        started = time.perf_counter()
+        body = json.loads(request.content)
+        tasks = [
+            self._new_task(item if "data" in item else {"data": item}, project_id)
+            for item in body
+        ]
+        result = {
+            "task_count": len(tasks),
+            "annotation_count": sum(task["total_annotations"] for task in tasks),
+            "predictions_count": sum(task["total_predictions"] for task in tasks),
+            "duration": time.perf_counter() - started,
+            "file_upload_ids": [],
+            "could_be_tasks_list": False,
+            "found_formats": [],
+            "data_columns": [],
+        }
+        if request.url.params.get("return_task_ids") in ("true", "True", "1"):
+            result["task_ids"] = [task["id"] for task in tasks]
+        if not self.async_import:
+            return _json_response(201, result)
+        import_id = next(self._ids)
+        self.imports[import_id] = {
+            "id": import_id,
+            "project": project_id,
+            "status": "created",
+            "created_at": _now(),
+            "polls": 0,
+            **result,
+        }
+        return _json_response(201, {"import": import_id})
+
+    def _get_import(
+        self, request: httpx.Request, project_id: int, import_id: int
+    ) -> httpx.Response:
+        project_import = self.imports.get(import_id)
+        if project_import is None or project_import["project"] != project_id:
+            return _not_found()
+        return _json_response(200, self._poll(project_import))
+
+    def _poll(self, job: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        job["polls"] += 1
+        if job["polls"] > self.pending_polls:
+            if job["status"] != "completed":
+                job["status"] = "completed"
+                job["finished_at"] = _now()
+        else:
+            job["status"] = "in_progress"
+        return {
+            key: value
+            for key, value in job.items()
+            if not key.startswith("_") and key != "polls"
+        }
+
+    # exports
+
+    def _export_body(
+        self, export: typing.Dict[str, typing.Any]
+    ) -> typing.Dict[str, typing.Any]:
+        return {
+            key: value
+            for key, value in export.items()
+            if not key.startswith("_") and key != "polls"
+        }
+
+    def _list_exports(self, request: httpx.Request, project_id: int) -> httpx.Response:
+        exports = [
+            export
+            for export in self.exports.values()
+            if export["_project"] == project_id
+        ]
+        return _json_response(200, [self._export_body(export) for export in exports])
+
+    def _create_export(self, request: httpx.Request, project_id: int) -> httpx.Response:
+        if project_id not in self.projects:
+            return _not_found()
+        body = json.loads(request.content) if request.content else {}
+        tasks = self._project_tasks(project_id)
+        export_id = next(self._ids)
+        self.exports[export_id] = {
+            "id": export_id,
+            "title": body.get("title") or f"Export {export_id}",
+            "status": "created",
+            "created_at": _now(),
+            "counters": {
+                "task_number": len(tasks),
+                "annotation_count": sum(
+                    task.get("total_annotations", 0) for task in tasks
+                ),
+            },
+            "converted_formats": [],
+            "polls": 0,
+            "_project": project_id,
+            # the snapshot is taken when the export is created
+            "_content": json.dumps(tasks, separators=(",", ":")).encode(),
+        }
+        if not self.pending_polls:
+            self.exports[export_id]["status"] = "completed"
+        return _json_response(201, self._export_body(self.exports[export_id]))
+
+    def _get_export(
+        self, request: httpx.Request, project_id: int, export_id: int
+    ) -> httpx.Response:
+        export = self.exports.get(export_id)
+        if export is None or export["_project"] != project_id:
+            return _not_found()
+        return _json_response(200, self._poll(export))
+
+    def _download_export(
+        self, request: httpx.Request, project_id: int, export_id: int
+    ) -> httpx.Response:
+        export = self.exports.get(export_id)
+        if export is None or export["_project"] != project_id:
+            return _not_found()
+        if export["status"] != "completed":
+            return _json_response(400, {"detail": "Export is not completed."})
+        return httpx.Response(
+            200,
+            content=export["_content"],
+            headers={
+                "Content-Type": "application/json",
+                "Content-Disposition": f"attachment; filename=project-{project_id}-export-{export_id}.json",
+            },
+        )
+
+    def _export(self, request: httpx.Request, project_id: int) -> httpx.Response:
+        if project_id not in self.projects:
+            return _not_found()
+        tasks = self._project_tasks(project_id)
+        ids = request.url.params.get_list("ids[]")
+        if ids:
+            selected = {int(task_id) for task_id in ids}
+            tasks = [task for task in tasks if task["id"] in selected]
+        return _json_response(200, tasks)
+
+    # data manager actions
+
+    def _run_action(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        action = params.get("id")
+        project_id = int(params.get("project", 1))
+        body = json.loads(request.content) if request.content else {}
+        tasks = _apply_query(self._project_tasks(project_id), body)
+        self.actions.append(
+            {
+                "id": action,
+                "project": project_id,
+                "task_ids": [task["id"] for task in tasks],
+            }
+        )
+        if action == "delete_tasks":
+            deleted = {task["id"] for task in tasks}
+            self.tasks[project_id] = [
+                task
+                for task in self._project_tasks(project_id)
+                if task["id"] not in deleted
+            ]
+        elif action in ("delete_tasks_annotations", "delete_tasks_predictions"):
+            key = (
+                "annotations" if action == "delete_tasks_annotations" else "predictions"
+            )
+            for task in tasks:
+                task[key] = []
+                task[f"total_{key}"] = 0
+                if key == "annotations":
+                    task["is_labeled"] = False
+        self._tasks_changed()
+        return _json_response(
+            200, {"processed_items": len(tasks), "detail": f"Action {action} done"}
+        )
+
+
+def _make_request_handler(
+    handle: typing.Callable[[httpx.Request], httpx.Response],
+) -> typing.Type[BaseHTTPRequestHandler]:
+    class RequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _respond(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://{self.headers.get('Host', 'localhost')}{self.path}",
+                headers=dict(self.headers.items()),
+                content=self.rfile.read(length) if length else b"",
+            )
+            response = handle(request)
+            content = response.read()
+            self.send_response(response.status_code)
+            for name, value in response.headers.items():
+                if name.lower() not in ("content-length", "transfer-encoding"):
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _respond
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+    return RequestHandler
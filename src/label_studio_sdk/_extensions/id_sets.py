@@ -0,0 +1,81 @@
+import typing
+
+import numpy as np
+
+# Sets of task ids held as sorted int64 NumPy arrays: 8 bytes an id, where a list of Python ints takes about 36 and a
+# set about 60. The set operations search one sorted array in the other, the ids are never boxed as Python ints.
+
+IdArray = np.ndarray
+
+
+class IdBuffer:
+    """
+    Collects task ids into an int64 array that doubles its capacity when it's full, e.g. the ids of the pages of an
+    id-only scan. `ids()` returns them as a sorted id set.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._ids = np.empty(max(capacity, 1), dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, ids: typing.Union[typing.Iterable[int], IdArray]) -> None:
+        if not isinstance(ids, np.ndarray):
+            ids = np.fromiter(ids, dtype=np.int64)
+        end = self._size + len(ids)
+        if end > len(self._ids):
+            grown = np.empty(max(end, 2 * len(self._ids)), dtype=np.int64)
+            grown[: self._size] = self._ids[: self._size]
+            self._ids = grown
+        self._ids[self._size : end] = ids
+        self._size = end
+
+    def ids(self) -> IdArray:
+        """The ids collected, sorted and without duplicates."""
+        return id_set(self._ids[: self._size])
+
+
+def _is_id_set(ids: IdArray) -> bool:
+    return bool(np.all(ids[1:] > ids[:-1]))
+
+
+def id_set(ids: typing.Union[typing.Iterable[int], IdArray]) -> IdArray:
+    """A sorted int64 array of the distinct `ids`, ids already sorted by an id-ordered scan are only copied."""
+    if not isinstance(ids, np.ndarray):
+        ids = np.fromiter(ids, dtype=np.int64)
+    ids = ids.astype(np.int64, copy=True)
+    return ids if _is_id_set(ids) else np.unique(ids)
+
+
+def contains(ids: IdArray, values: IdArray) -> np.ndarray:
+    """The boolean mask of the `values` that are in the id set `ids`."""
+    if not len(ids):
+        return np.zeros(len(values), dtype=bool)
+    positions = np.searchsorted(ids, values)
+    np.minimum(positions, len(ids) - 1, out=positions)
+    return ids[positions] == values
+
+
+def difference(ids: IdArray, other: IdArray) -> IdArray:
+    """The ids of `ids` that aren't in `other`, both id sets, e.g. the tasks not assigned yet."""
+    return ids[~contains(other, ids)]
+
+
+def intersection(ids: IdArray, other: IdArray) -> IdArray:
+    """The ids in both id sets."""
+    if len(ids) > len(other):
+        ids, other = other, ids
+    return ids[contains(other, ids)]
+
+
+def sample(
+    ids: IdArray, size: int, *, rng: typing.Union[np.random.Generator, int, None] = None
+) -> IdArray:
+    """`size` distinct ids drawn at random from the id set `ids`, returned as an id set."""
+    if size > len(ids):
+        raise ValueError(f"Can't sample {size} ids out of {len(ids)}")
+    positions = np.random.default_rng(rng).choice(len(ids), size=size, replace=False)
+    positions.sort()
+    return ids[positions]
@@ -0,0 +1,170 @@
+import json
+import typing
+
+from label_studio_sdk._extensions.checkpoint import Checkpoint, Checkpointer
+from label_studio_sdk._extensions.pager_ext import drain_items
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+
+# Keyset pagination of tasks: every page is the first page of the tasks with `id > last_seen_id` ordered by id,
+# so the cost of a page doesn't grow with the depth of the scan, and tasks created or deleted during the scan
+# neither shift the pages (duplicates or gaps) nor end it early.
+
+T = typing.TypeVar("T")
+
+QueryType = typing.Union[str, typing.Dict[str, typing.Any], None]
+
+
+def _task_id(task: typing.Any) -> int:
+    return task["id"] if isinstance(task, dict) else task.id
+
+
+def keyset_query(query: QueryType, after_id: typing.Optional[int]) -> str:
+    """
+    The `query` of `tasks.list()` restricted to the tasks with an id greater than `after_id`, ordered by id.
+    The filters of `query` are kept, they must be combined with "and".
+    """
+    query = dict(json.loads(query) if isinstance(query, str) else query or {})
+    ordering = query.get("ordering") or []
+    if any(order != Column.id for order in ordering):
+        raise ValueError(
+            f"Keyset pagination orders the tasks by id, got ordering {ordering}"
+        )
+    query["ordering"] = [Column.id]
+    filters = query.get("filters") or {}
+    items = list(filters.get("items") or [])
+    if filters.get("conjunction", Filters.AND) != Filters.AND and len(items) > 1:
+        raise ValueError('Keyset pagination requires filters combined with "and"')
+    if after_id is not None:
+        items.append(
+            Filters.item(
+                Column.id, Operator.GREATER, Type.Number, Filters.value(after_id)
+            )
+        )
+    query["filters"] = Filters.create(Filters.AND, items)
+    return json.dumps(query)
+
+
+def _end_of_pages(exc: ApiError) -> bool:
+    # an empty result can be reported with 404 like the end of the pagination
+    return exc.status_code == 404
+
+
+class _KeysetPagerBase(typing.Generic[T]):
+    def __init__(
+        self,
+        *,
+        query: QueryType = None,
+        after_id: typing.Optional[int] = None,
+        checkpointer: typing.Optional[Checkpointer] = None,
+    ) -> None:
+        # fail before the first request if the query can't be paged by id
+        keyset_query(query, after_id)
+        self.query = query
+        self.last_id = after_id
+        self.checkpointer = checkpointer
+
+    def checkpoint(self) -> typing.Optional[Checkpoint]:
+        """Where to resume the iteration: after the last page that was fully processed. None without a checkpointer."""
+        return self.checkpointer.checkpoint if self.checkpointer is not None else None
+
+    @staticmethod
+    def _position(items: typing.List[T]) -> typing.Dict[str, typing.Any]:
+        return {"last_id": _task_id(items[-1])}
+
+    def _page_last_id(self, items: typing.List[T]) -> int:
+        last_id = _task_id(items[-1])
+        if self.last_id is not None and last_id <= self.last_id:
+            raise RuntimeError(
+                f"The server ignored the keyset filter, task {last_id} was returned after task {self.last_id}"
+            )
+        return last_id
+
+
+class KeysetPager(_KeysetPagerBase[T]):
+    """
+    Iterates over tasks by id, requesting the tasks after the last one seen until none is left.
+    `last_id` is the id of the last task of the pages processed so far, pass it as `after_id` to resume.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[str], typing.List[T]],
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fetch_page = fetch_page
+
+    def __iter__(self) -> typing.Iterator[T]:
+        for items in self._checkpointed_pages():
+            yield from items
+
+    def drain(self) -> typing.Iterator[T]:
+        """Iterate over the items once, releasing every item when it is yielded to hold about one page in memory."""
+        return drain_items(self._checkpointed_pages())
+
+    def _checkpointed_pages(self) -> typing.Iterator[typing.List[T]]:
+        if self.checkpointer is None:
+            return self.iter_pages()
+        return self.checkpointer.track(self.iter_pages(), self._position)
+
+    def iter_pages(self) -> typing.Iterator[typing.List[T]]:
+        while True:
+            try:
+                items = self._fetch_page(keyset_query(self.query, self.last_id))
+            except ApiError as exc:
+                if _end_of_pages(exc):
+                    return
+                raise
+            if not items:
+                return
+            last_id = self._page_last_id(items)
+            yield items
+            self.last_id = last_id
+
+
+class AsyncKeysetPager(_KeysetPagerBase[T]):
+    """
+    Iterates over tasks by id, requesting the tasks after the last one seen until none is left.
+    `last_id` is the id of the last task of the pages processed so far, pass it as `after_id` to resume.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[str], typing.Awaitable[typing.List[T]]],
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fetch_page = fetch_page
+
+    async def __aiter__(self) -> typing.AsyncIterator[T]:
+        async for items in self._checkpointed_pages():
+            for item in items:
+                yield item
+
+    async def drain(self) -> typing.AsyncIterator[T]:
+        """Iterate over the items once, releasing every item when it is yielded to hold about one page in memory."""
+        async for items in self._checkpointed_pages():
+            for item in drain_items([items]):
+                yield item
+
+    def _checkpointed_pages(self) -> typing.AsyncIterator[typing.List[T]]:
+        if self.checkpointer is None:
+            return self.iter_pages()
+        return self.checkpointer.atrack(self.iter_pages(), self._position)
+
+    async def iter_pages(self) -> typing.AsyncIterator[typing.List[T]]:
+        while True:
+            try:
+                items = await self._fetch_page(keyset_query(self.query, self.last_id))
+            except ApiError as exc:
+                if _end_of_pages(exc):
+                    return
+                raise
+            if not items:
+                return
+            last_id = self._page_last_id(items)
+            yield items
+            self.last_id = last_id
@@ -0,0 +1,435 @@
+import datetime
+import json
+import operator
+import re
+import typing
+
+from label_studio_sdk.data_manager import Filters, Operator, Type
+
+# Data Manager filters evaluated on tasks held locally. A filter is compiled once: the column of every item is
+# resolved to a path into the task, and the value to compare with is converted to the item type, so matching a task
+# is a few calls without parsing. DataFrames of tasks are filtered with one vectorized mask per item instead: one
+# column per filter column, e.g. `data.text`, or the columns of `pager.to_dataframe()`, whose `annotation_count` and
+# `prediction_count` stand for `total_annotations` and `total_predictions`.
+#
+# The semantics follow the server: values are compared as the type of the item (numbers stored as strings in the
+# task data are compared as numbers), strings are matched case-insensitively by `contains`, ranges include their
+# bounds, and a task without a value, or with a value that can't be converted, only matches `empty` and `not_equal`.
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+FilterType = typing.Union[str, typing.Dict[str, typing.Any]]
+
+_FRACTION = re.compile(r"\.(\d+)")
+_UTC_ISO = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d+)?Z")
+
+# the operators that match a task without a value
+_MISSING_MATCHES = (Operator.NOT_EQUAL,)
+
+# the columns of `pager.to_dataframe()` named after other filter columns
+_DATAFRAME_COLUMNS = {
+    "total_annotations": "annotation_count",
+    "total_predictions": "prediction_count",
+}
+
+_COMPARISONS: typing.Dict[str, typing.Callable[[typing.Any, typing.Any], bool]] = {
+    Operator.EQUAL: operator.eq,
+    Operator.GREATER: operator.gt,
+    Operator.GREATER_OR_EQUAL: operator.ge,
+    Operator.LESS: operator.lt,
+    Operator.LESS_OR_EQUAL: operator.le,
+}
+
+
+def parse_datetime(value: typing.Any) -> typing.Optional[datetime.datetime]:
+    """A datetime from a datetime or an ISO 8601 string, in UTC when it has no time zone, None if it isn't one."""
+    if isinstance(value, str):
+        text = value.strip().replace("Z", "+00:00")
+        try:
+            value = datetime.datetime.fromisoformat(text)
+        except ValueError:
+            # fromisoformat() before Python 3.11 only reads 3 or 6 digits of fraction
+            text = _FRACTION.sub(
+                lambda match: "." + match.group(1)[:6].ljust(6, "0"), text, count=1
+            )
+            try:
+                value = datetime.datetime.fromisoformat(text)
+            except ValueError:
+                return None
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    if not isinstance(value, datetime.datetime):
+        return None
+    return (
+        value
+        if value.tzinfo is not None
+        else value.replace(tzinfo=datetime.timezone.utc)
+    )
+
+
+def _number(value: typing.Any) -> typing.Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _boolean(value: typing.Any) -> typing.Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return {"true": True, "false": False, "1": True, "0": False}.get(
+            value.strip().lower()
+        )
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return None
+
+
+def _string(value: typing.Any) -> typing.Optional[str]:
+    if value is None:
+        return None
+    return (
+        value
+        if isinstance(value, str)
+        else json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+    )
+
+
+_CONVERTERS: typing.Dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    Type.Number: _number,
+    Type.Datetime: parse_datetime,
+    Type.Boolean: _boolean,
+}
+
+
+def _is_empty(value: typing.Any) -> bool:
+    return (
+        value is None or value == "" or (isinstance(value, (list, dict)) and not value)
+    )
+
+
+def _field(name: str) -> str:
+    # "filter:tasks:data.text" -> "data.text"
+    return name.split(":")[-1]
+
+
+def _filters(filters: FilterType) -> typing.Dict[str, typing.Any]:
+    # `Filters.create()`, or a query with its filters, as a dict or JSON
+    if isinstance(filters, str):
+        filters = json.loads(filters)
+    if "filters" in filters and "items" not in filters:
+        filters = filters["filters"] or {}
+    return filters
+
+
+class FilterItem:
+    """An item of `Filters.create()`, with its value converted to the type of the item."""
+
+    def __init__(self, item: typing.Dict[str, typing.Any]) -> None:
+        self.field = _field(item["filter"])
+        self.path = self.field.split(".")
+        self.operator = item["operator"]
+        self.type = item.get("type") or Type.String
+        self.convert = _CONVERTERS.get(
+            self.type, _string if self.type != Type.List else lambda value: value
+        )
+        expected = item.get("value")
+        if self.operator in (Operator.IN, Operator.NOT_IN):
+            self.expected: typing.Any = (
+                self.convert(expected["min"]),
+                self.convert(expected["max"]),
+            )
+            if None in self.expected:
+                raise ValueError(
+                    f"Invalid {self.type} range for {self.field}: {expected}"
+                )
+        elif self.operator in (Operator.IN_LIST, Operator.NOT_IN_LIST):
+            self.expected = [self.convert(value) for value in expected]
+        elif self.operator == Operator.EMPTY:
+            self.expected = _boolean(expected)
+        elif self.operator in (Operator.CONTAINS, Operator.NOT_CONTAINS):
+            self.expected = str(expected).lower()
+        elif self.operator == Operator.REGEX:
+            self.expected = re.compile(str(expected))
+        elif self.operator in (*_COMPARISONS, Operator.NOT_EQUAL):
+            self.expected = self.convert(expected)
+        else:
+            raise ValueError(f"Unsupported filter operator: {self.operator}")
+        self.missing = self.operator in _MISSING_MATCHES
+        self.test = self._test()
+
+    def value(self, task: typing.Any) -> typing.Any:
+        """The value of the column in a task, a model or a dict."""
+        value = (
+            task.get(self.path[0])
+            if isinstance(task, dict)
+            else getattr(task, self.path[0], None)
+        )
+        for key in self.path[1:]:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    def matches_value(self, value: typing.Any) -> bool:
+        if self.operator == Operator.EMPTY:
+            return _is_empty(value) == self.expected
+        if isinstance(value, list) and self.type == Type.List:
+            return self._matches_list(value)
+        if value is not None:
+            value = self.convert(value)
+        if value is None:
+            return self.missing
+        return self.test(value)
+
+    def _test(self) -> typing.Callable[[typing.Any], bool]:
+        # the comparison of a converted value, chosen once
+        expected = self.expected
+        if self.operator in _COMPARISONS:
+            compare = _COMPARISONS[self.operator]
+            return (
+                (lambda value: compare(value, expected))
+                if expected is not None
+                else (lambda value: False)
+            )
+        if self.operator == Operator.NOT_EQUAL:
+            return lambda value: value != expected
+        if self.operator == Operator.IN:
+            return lambda value: expected[0] <= value <= expected[1]
+        if self.operator == Operator.NOT_IN:
+            return lambda value: not expected[0] <= value <= expected[1]
+        if self.operator == Operator.IN_LIST:
+            return lambda value: value in expected
+        if self.operator == Operator.NOT_IN_LIST:
+            return lambda value: value not in expected
+        if self.operator == Operator.CONTAINS:
+            return lambda value: expected in str(value).lower()
+        if self.operator == Operator.NOT_CONTAINS:
+            return lambda value: expected not in str(value).lower()
+        if self.operator == Operator.REGEX:
+            return lambda value: expected.search(str(value)) is not None
+        # empty is tested before the value is converted
+        return bool
+
+    def _matches_list(self, values: typing.List[typing.Any]) -> bool:
+        # list columns, e.g. annotators, match when one of their values does
+        if self.operator in (Operator.CONTAINS, Operator.EQUAL, Operator.IN_LIST):
+            return any(self._element_matches(value) for value in values)
+        if self.operator in (
+            Operator.NOT_CONTAINS,
+            Operator.NOT_EQUAL,
+            Operator.NOT_IN_LIST,
+        ):
+            return not any(self._element_matches(value) for value in values)
+        raise ValueError(f"Unsupported operator for a list: {self.operator}")
+
+    def _element_matches(self, value: typing.Any) -> bool:
+        if self.operator in (Operator.IN_LIST, Operator.NOT_IN_LIST):
+            return value in self.expected
+        if self.operator in (Operator.EQUAL, Operator.NOT_EQUAL):
+            return value == self.expected
+        return self.expected in str(value).lower()
+
+    def matches(self, task: typing.Any) -> bool:
+        return self.matches_value(self.value(task))
+
+    def column(self, frame: "pd.DataFrame") -> "pd.Series":
+        if self.field in frame.columns:
+            return frame[self.field]
+        if _DATAFRAME_COLUMNS.get(self.field) in frame.columns:
+            return frame[_DATAFRAME_COLUMNS[self.field]]
+        raise ValueError(f"The DataFrame has no {self.field!r} column to filter on")
+
+    def mask(self, frame: "pd.DataFrame") -> "pd.Series":
+        """Whether each row of a DataFrame of tasks matches, with a vectorized operation when possible."""
+        return self.series_mask(self.column(frame))
+
+    def series_mask(self, series: "pd.Series") -> "pd.Series":
+        import pandas as pd
+
+        strings = pd.api.types.is_string_dtype(series) and series.dtype != object
+        if self.type == Type.List or self.operator in (Operator.EMPTY, Operator.REGEX):
+            return _objects(series).map(self.matches_value).astype(bool)
+        expected = self.expected
+        if self.type == Type.Number:
+            values = pd.to_numeric(series, errors="coerce")
+        elif self.type == Type.Datetime and strings:
+            # datetimes in UTC all in the same ISO 8601 format are ordered like their text, that is compared
+            # without parsing them when the value compared with has no more precision
+            digits = _utc_digits(series)
+            expected = _utc_text(self.expected, digits) if digits is not None else None
+            values = series if expected is not None else _to_datetime(series)
+            expected = expected if expected is not None else self.expected
+        elif self.type == Type.Datetime and pd.api.types.is_datetime64_any_dtype(
+            series
+        ):
+            values = _to_datetime(series)
+        elif self.type in (Type.String, Type.Unknown) and strings:
+            values = series
+        else:
+            values = _objects(series).map(self.convert)
+        present = values.notna()
+        if self.operator in _COMPARISONS:
+            if expected is None:
+                return pd.Series(False, index=series.index)
+            return _COMPARISONS[self.operator](values, expected) & present
+        if self.operator == Operator.NOT_EQUAL:
+            return ~((values == expected) & present)
+        if self.operator in (Operator.IN, Operator.NOT_IN):
+            between = values.between(*expected) & present
+            return between if self.operator == Operator.IN else ~between & present
+        if self.operator in (Operator.IN_LIST, Operator.NOT_IN_LIST):
+            listed = values.isin(expected) & present
+            return listed if self.operator == Operator.IN_LIST else ~listed & present
+        contains = values.astype("string").str.contains(
+            expected, case=False, regex=False
+        )
+        contains = contains.fillna(False).astype(bool) & present
+        return contains if self.operator == Operator.CONTAINS else ~contains & present
+
+
+def _utc_digits(series: "pd.Series") -> typing.Optional[int]:
+    """The digits of fraction of datetimes all in UTC in the same ISO 8601 format, e.g. 2024-01-15T09:30:00.123Z."""
+    present = series.dropna()
+    if present.empty or not _UTC_ISO.fullmatch(present.iat[0]):
+        return None
+    lengths = present.str.len()
+    if not (lengths == lengths.iat[0]).all() or not present.str.endswith("Z").all():
+        return None
+    return max(int(lengths.iat[0]) - 21, 0)
+
+
+def _utc_text(value: typing.Any, digits: int) -> typing.Any:
+    """A datetime, or the datetimes of a range or a list, as text in the format of `_utc_digits()`, None if
+    the format can't hold one of them."""
+    if isinstance(value, (tuple, list)):
+        texts = [_utc_text(item, digits) for item in value]
+        return None if any(text is None for text in texts) else type(value)(texts)
+    if value is None:
+        return None
+    value = value.astimezone(datetime.timezone.utc)
+    fraction = f"{value.microsecond:06d}"
+    if digits > 6 or int(fraction[digits:] or 0) or value.year < 1000:
+        return None
+    return (
+        value.strftime("%Y-%m-%dT%H:%M:%S")
+        + ("." + fraction[:digits] if digits else "")
+        + "Z"
+    )
+
+
+def _objects(series: "pd.Series") -> "pd.Series":
+    # missing values are NaN in DataFrames, e.g. the keys missing from the data of some tasks
+    return series.astype(object).where(series.notna(), None)
+
+
+def _to_datetime(series: "pd.Series") -> "pd.Series":
+    import pandas as pd
+
+    if int(pd.__version__.split(".")[0]) >= 2:
+        return pd.to_datetime(series, utc=True, errors="coerce", format="ISO8601")
+    return pd.to_datetime(series, utc=True, errors="coerce")
+
+
+def _cost(item: FilterItem) -> int:
+    # numbers are compared in C, strings and datetimes per value
+    if item.type == Type.Number:
+        return 0
+    if item.type in (Type.Boolean, Type.String, Type.Unknown) and item.operator not in (
+        Operator.EMPTY,
+        Operator.REGEX,
+    ):
+        return 1
+    if item.type == Type.Datetime:
+        return 2
+    return 3
+
+
+class CompiledFilters:
+    """
+    Data Manager filters compiled to match tasks held locally, e.g. from a snapshot or `ProjectMirror`, as the
+    server does for `tasks.list(query=...)`.
+
+    Examples
+    --------
+    from label_studio_sdk.data_manager import Filters, Column, Operator, Type
+
+    filters = compile_filters(Filters.create(Filters.AND, [
+        Filters.item(Column.total_annotations, Operator.GREATER, Type.Number, Filters.value(0)),
+        Filters.item(Column.data("text"), Operator.CONTAINS, Type.String, Filters.value("cat")),
+    ]))
+    annotated_cats = filters.filter(tasks)
+    """
+
+    def __init__(self, filters: FilterType) -> None:
+        filters = _filters(filters)
+        self.conjunction = filters.get("conjunction") or Filters.AND
+        if self.conjunction not in (Filters.AND, Filters.OR):
+            raise ValueError(f"Unsupported filter conjunction: {self.conjunction}")
+        self.items = [FilterItem(item) for item in filters.get("items") or []]
+        # the cheapest items are evaluated first, they decide most tasks without the others
+        self._ordered = sorted(self.items, key=_cost)
+
+    def __call__(self, task: typing.Any) -> bool:
+        """Whether a task, a model or a dict, matches the filters."""
+        if self.conjunction == Filters.AND:
+            for item in self._ordered:
+                if not item.matches(task):
+                    return False
+            return True
+        for item in self._ordered:
+            if item.matches(task):
+                return True
+        return not self.items
+
+    def mask(self, frame: "pd.DataFrame") -> "pd.Series":
+        """Whether each row of a DataFrame of tasks matches the filters, the columns are named like the fields."""
+        import numpy as np
+        import pandas as pd
+
+        columns = [item.column(frame) for item in self.items]
+        if not self.items:
+            return pd.Series(True, index=frame.index)
+        # every item is only evaluated on the rows that the previous ones didn't decide, the cheapest items first
+        conjunction = self.conjunction == Filters.AND
+        undecided = np.arange(len(frame))
+        for item, column in sorted(
+            zip(self.items, columns), key=lambda pair: _cost(pair[0])
+        ):
+            if not len(undecided):
+                break
+            matched = item.series_mask(column.iloc[undecided]).to_numpy(dtype=bool)
+            undecided = undecided[matched] if conjunction else undecided[~matched]
+        result = (
+            np.zeros(len(frame), dtype=bool)
+            if conjunction
+            else np.ones(len(frame), dtype=bool)
+        )
+        result[undecided] = conjunction
+        return pd.Series(result, index=frame.index)
+
+    @typing.overload
+    def filter(self, tasks: "pd.DataFrame") -> "pd.DataFrame": ...
+
+    @typing.overload
+    def filter(self, tasks: typing.Iterable[typing.Any]) -> typing.List[typing.Any]: ...
+
+    def filter(self, tasks: typing.Any) -> typing.Any:
+        """The tasks matching the filters: the rows of a DataFrame, or a list of the tasks of an iterable."""
+        if hasattr(tasks, "columns") and hasattr(tasks, "loc"):
+            return tasks[self.mask(tasks)]
+        return [task for task in tasks if self(task)]
+
+
+def compile_filters(filters: FilterType) -> CompiledFilters:
+    """Compile `Filters.create(...)`, or a query with filters, to match tasks held locally."""
+    return CompiledFilters(filters)
+
+
+def filter_tasks(filters: FilterType, tasks: typing.Any) -> typing.Any:
+    """The tasks of a list or the rows of a DataFrame matching `Filters.create(...)`, see `CompiledFilters`."""
+    return compile_filters(filters).filter(tasks)
@@ -1,49 +1,342 @@
+import asyncio
+import itertools
+import queue
+import threading
 import typing
-from label_studio_sdk.core.pagination import SyncPager, AsyncPager, T
+from label_studio_sdk.core.pagination import (
+    SyncPager,
+    AsyncPager,
+    SyncPage,
+    AsyncPage,
+    T,
+)
+from label_studio_sdk.core.pydantic_utilities import pydantic_v1
 from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk._extensions.checkpoint import Checkpoint, Checkpointer
+from label_studio_sdk._extensions.columnar import TaskColumns
 
 # This is a custom extension of the autogenerated SyncPager and AsyncPager classes
 # that works with the Label Studio SDK's default pagination behavior
 # that throws 404 errors at the end of the pagination.
+#
+# With `prefetch=k`, the next pages are fetched in a background thread (sync) or task (async)
+# while the caller processes the current one, at most k pages ahead of it.
+#
+# `drain()` iterates over the items once, removing each item from its page when it is yielded, so that
+# a long scan holds about one page of items however long it runs, the first page included.
+#
+# With a `checkpointer`, the pager reports the next page to fetch after every page the caller is done with,
+# and `checkpoint()` returns it to resume the scan later.
+#
+# `to_dataframe()` and `to_arrow()` drain the pager into column buffers, see `TaskColumns`.
+#
+# `total` is the number of items reported with the first page, if any. Without it, a `counter` counts them
+# with one request the first time the total is read.
+
+_END = object()
+
+
+class _Failure:
+    # an exception raised while fetching a page, re-raised in the caller
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def drain_items(
+    pages: typing.Iterable[typing.Optional[typing.List[T]]],
+) -> typing.Iterator[T]:
+    """Yield the items of every page, emptying the page lists as it goes."""
+    for items in pages:
+        if not items:
+            continue
+        items.reverse()
+        while items:
+            yield items.pop()
+
+
+def _check_prefetch(prefetch: int) -> int:
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be 0 or more, got {prefetch}")
+    return prefetch
+
+
+def _has_next_page(page: typing.Any) -> bool:
+    return page.has_next and page.get_next is not None
+
+
+def _is_last_page(page: typing.Any) -> bool:
+    return page is None or page.items is None or len(page.items) == 0
+
+
+def _next_page_numbers(
+    checkpointer: Checkpointer,
+) -> typing.Callable[[typing.Any], typing.Dict[str, int]]:
+    # the pages of a pager follow each other from the page of its checkpoint
+    numbers = itertools.count((checkpointer.checkpoint.page or 1) + 1)
+    return lambda page: {"page": next(numbers)}
 
 
 class SyncPagerExt(SyncPager, typing.Generic[T]):
+    prefetch: int = 0
+    checkpointer: typing.Optional[Checkpointer] = None
+    counter: typing.Optional[typing.Callable[[], int]] = None
+    _total: typing.Optional[int] = pydantic_v1.PrivateAttr(default=None)
+
+    class Config:
+        arbitrary_types_allowed = True
 
     @classmethod
-    def from_sync_pager(cls, sync_pager: SyncPager) -> 'SyncPagerExt':
-        return cls(
+    def from_sync_pager(
+        cls,
+        sync_pager: SyncPager,
+        prefetch: int = 0,
+        checkpointer: typing.Optional[Checkpointer] = None,
+        counter: typing.Optional[typing.Callable[[], int]] = None,
+        total: typing.Optional[int] = None,
+    ) -> 'SyncPagerExt':
+        pager = cls(
             get_next=sync_pager.get_next,
             has_next=sync_pager.has_next,
-            items=sync_pager.items
+            items=sync_pager.items,
+            prefetch=_check_prefetch(prefetch),
+            checkpointer=checkpointer,
+            counter=counter,
         )
+        pager._total = total
+        return pager
+
+    @property
+    def total(self) -> typing.Optional[int]:
+        """The number of items of the whole list, as reported with the first page or counted once. None without either."""
+        if self._total is None and self.counter is not None:
+            self._total = self.counter()
+        return self._total
 
     def __iter__(self) -> typing.Iterator[T]:  # type: ignore
-        # Extends the iterator to catch 404 errors at the end of the pagination
+        for page in self._checkpointed_pages():
+            if page.items is not None:
+                yield from page.items
+
+    def drain(self) -> typing.Iterator[T]:
+        """
+        Iterate over the items like `for item in pager` does, but release every item once it is yielded, so that
+        one pass over millions of tasks holds about one page in memory. The pager is empty afterwards.
+        """
+        return drain_items(page.items for page in self._checkpointed_pages())
+
+    def to_dataframe(
+        self, fields: typing.Sequence[str] = (), data: bool = True
+    ) -> typing.Any:
+        """
+        Drain the tasks into a pandas DataFrame with the columns `id`, `annotation_count`, `prediction_count`,
+        the task attributes listed in `fields` and `data.<key>` for every key of the task data.
+        """
+        return TaskColumns(fields, data).extend(self.drain()).to_dataframe()
+
+    def to_arrow(
+        self, fields: typing.Sequence[str] = (), data: bool = True
+    ) -> typing.Any:
+        """Drain the tasks into a pyarrow Table with the columns of `to_dataframe()`. Requires pyarrow."""
+        return TaskColumns(fields, data).extend(self.drain()).to_arrow()
+
+    def checkpoint(self) -> typing.Optional[Checkpoint]:
+        """Where to resume the iteration: the first page that wasn't fully processed. None without a checkpointer."""
+        return self.checkpointer.checkpoint if self.checkpointer is not None else None
+
+    def _checkpointed_pages(self) -> typing.Iterator[SyncPage[T]]:
+        if self.checkpointer is None:
+            return self._pages()
+        return self.checkpointer.track(
+            self._pages(), _next_page_numbers(self.checkpointer)
+        )
+
+    def _pages(self) -> typing.Iterator[SyncPage[T]]:
+        # Extends the iteration to catch 404 errors at the end of the pagination
         try:
-            for item in super().__iter__():
-                yield item
+            yield from self.iter_pages()
         except ApiError as exc:
             if exc.status_code == 404:
                 return
             raise
 
+    def iter_pages(self) -> typing.Iterator[SyncPage[T]]:
+        if not self.prefetch:
+            yield from super().iter_pages()
+            return
+
+        pages: "queue.Queue[typing.Any]" = queue.Queue()
+        # one slot per page fetched ahead of the caller
+        slots = threading.Semaphore(self.prefetch)
+        stopped = threading.Event()
+
+        def fetch_pages() -> None:
+            page: typing.Any = self
+            try:
+                while True:
+                    pages.put(page)
+                    if not _has_next_page(page):
+                        break
+                    slots.acquire()
+                    if stopped.is_set():
+                        return
+                    page = page.get_next()
+                    if _is_last_page(page):
+                        break
+            except BaseException as exc:
+                pages.put(_Failure(exc))
+                return
+            pages.put(_END)
+
+        threading.Thread(
+            target=fetch_pages, name="label-studio-prefetch", daemon=True
+        ).start()
+        try:
+            first = True
+            while True:
+                page = pages.get()
+                if page is _END:
+                    return
+                if isinstance(page, _Failure):
+                    raise page.exc
+                if not first:
+                    slots.release()
+                first = False
+                yield page
+        finally:
+            # let the thread exit if the caller stopped early, a request in flight is completed and dropped
+            stopped.set()
+            slots.release()
+
 
 class AsyncPagerExt(AsyncPager, typing.Generic[T]):
+    prefetch: int = 0
+    checkpointer: typing.Optional[Checkpointer] = None
+    counter: typing.Optional[typing.Callable[[], typing.Awaitable[int]]] = None
+    _total: typing.Optional[int] = pydantic_v1.PrivateAttr(default=None)
+
+    class Config:
+        arbitrary_types_allowed = True
 
     @classmethod
-    async def from_async_pager(cls, async_pager: AsyncPager) -> 'AsyncPagerExt':
-        return cls(
+    async def from_async_pager(
+        cls,
+        async_pager: AsyncPager,
+        prefetch: int = 0,
+        checkpointer: typing.Optional[Checkpointer] = None,
+        counter: typing.Optional[typing.Callable[[], typing.Awaitable[int]]] = None,
+        total: typing.Optional[int] = None,
+    ) -> 'AsyncPagerExt':
+        pager = cls(
             get_next=async_pager.get_next,
             has_next=async_pager.has_next,
-            items=async_pager.items
+            items=async_pager.items,
+            prefetch=_check_prefetch(prefetch),
+            checkpointer=checkpointer,
+            counter=counter,
         )
+        pager._total = total
+        return pager
+
+    async def get_total(self) -> typing.Optional[int]:
+        """The number of items of the whole list, as reported with the first page or counted once. None without either."""
+        if self._total is None and self.counter is not None:
+            self._total = await self.counter()
+        return self._total
 
     async def __aiter__(self) -> typing.AsyncIterator[T]:  # type: ignore
-        # Extends the iterator to catch 404 errors at the end of the pagination
-        try:
-            async for item in super().__aiter__():
+        async for page in self._checkpointed_pages():
+            if page.items is not None:
+                for item in page.items:
+                    yield item
+
+    async def drain(self) -> typing.AsyncIterator[T]:
+        """
+        Iterate over the items like `async for item in pager` does, but release every item once it is yielded,
+        so that one pass over millions of tasks holds about one page in memory. The pager is empty afterwards.
+        """
+        async for page in self._checkpointed_pages():
+            for item in drain_items([page.items]):
                 yield item
+
+    async def to_dataframe(
+        self, fields: typing.Sequence[str] = (), data: bool = True
+    ) -> typing.Any:
+        """
+        Drain the tasks into a pandas DataFrame with the columns `id`, `annotation_count`, `prediction_count`,
+        the task attributes listed in `fields` and `data.<key>` for every key of the task data.
+        """
+        return (await self._columns(fields, data)).to_dataframe()
+
+    async def to_arrow(
+        self, fields: typing.Sequence[str] = (), data: bool = True
+    ) -> typing.Any:
+        """Drain the tasks into a pyarrow Table with the columns of `to_dataframe()`. Requires pyarrow."""
+        return (await self._columns(fields, data)).to_arrow()
+
+    async def _columns(self, fields: typing.Sequence[str], data: bool) -> TaskColumns:
+        columns = TaskColumns(fields, data)
+        async for item in self.drain():
+            columns.append(item)
+        return columns
+
+    def checkpoint(self) -> typing.Optional[Checkpoint]:
+        """Where to resume the iteration: the first page that wasn't fully processed. None without a checkpointer."""
+        return self.checkpointer.checkpoint if self.checkpointer is not None else None
+
+    def _checkpointed_pages(self) -> typing.AsyncIterator[AsyncPage[T]]:
+        if self.checkpointer is None:
+            return self._pages()
+        return self.checkpointer.atrack(
+            self._pages(), _next_page_numbers(self.checkpointer)
+        )
+
+    async def _pages(self) -> typing.AsyncIterator[AsyncPage[T]]:
+        # Extends the iteration to catch 404 errors at the end of the pagination
+        try:
+            async for page in self.iter_pages():
+                yield page
         except ApiError as exc:
             if exc.status_code == 404:
                 return
             raise
+
+    async def iter_pages(self) -> typing.AsyncIterator[AsyncPage[T]]:
+        if not self.prefetch:
+            async for page in super().iter_pages():
+                yield page
+            return
+
+        pages: "asyncio.Queue[typing.Any]" = asyncio.Queue()
+        slots = asyncio.Semaphore(self.prefetch)
+
+        async def fetch_pages() -> None:
+            page: typing.Any = self
+            try:
+                while True:
+                    pages.put_nowait(page)
+                    if not _has_next_page(page):
+                        break
+                    await slots.acquire()
+                    page = await page.get_next()
+                    if _is_last_page(page):
+                        break
+            except Exception as exc:
+                pages.put_nowait(_Failure(exc))
+                return
+            pages.put_nowait(_END)
+
+        producer = asyncio.ensure_future(fetch_pages())
+        try:
+            first = True
+            while True:
+                page = await pages.get()
+                if page is _END:
+                    return
+                if isinstance(page, _Failure):
+                    raise page.exc
+                if not first:
+                    slots.release()
+                first = False
+                yield page
+        finally:
+            producer.cancel()
@@ -0,0 +1,208 @@
+import asyncio
+import collections
+import itertools
+import math
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import httpx
+
+from label_studio_sdk._extensions.batch import _retry_delay
+from label_studio_sdk._extensions.pager_ext import drain_items
+from label_studio_sdk.core.api_error import ApiError
+
+# Fetches the pages of a list endpoint concurrently once the first page told how many items there are.
+# Page N+1 doesn't depend on page N, so all the remaining page numbers are requested at once by `parallel` workers,
+# with at most twice as many pages fetched or held ahead of the caller.
+
+T = typing.TypeVar("T")
+
+
+def _check_parallel(parallel: int) -> int:
+    if parallel < 1:
+        raise ValueError(f"parallel must be at least 1, got {parallel}")
+    return parallel
+
+
+def _last_page(
+    first_page: int,
+    first_items: typing.Sized,
+    total: typing.Optional[int],
+    page_size: typing.Optional[int],
+) -> int:
+    """The number of the last page, from the total reported with the first page."""
+    if not total or not len(first_items):
+        return first_page
+    # without an explicit page size, the first page has the size used by the server
+    page_size = page_size or len(first_items)
+    return max(first_page, math.ceil(total / page_size))
+
+
+class _ParallelPagerBase(typing.Generic[T]):
+    def __init__(
+        self,
+        *,
+        first_page: int,
+        first_items: typing.List[T],
+        total: typing.Optional[int],
+        page_size: typing.Optional[int],
+        parallel: int,
+        ordered: bool = True,
+        max_retries: int = 2,
+    ) -> None:
+        self.first_page = first_page
+        self.items = first_items
+        self.total = total
+        self.last_page = _last_page(first_page, first_items, total, page_size)
+        self.parallel = _check_parallel(parallel)
+        self.ordered = ordered
+        self.max_retries = max_retries
+        self._window = 2 * parallel
+
+    def _remaining_pages(self) -> typing.Iterator[int]:
+        return iter(range(self.first_page + 1, self.last_page + 1))
+
+
+class ParallelPager(_ParallelPagerBase[T]):
+    """
+    Iterates over all the items of a paginated list, fetching the pages after the first one in a thread pool.
+
+    Pages are yielded in order unless `ordered=False`, then as soon as they are fetched. A page that fails with
+    a connection error or a timeout is retried `max_retries` times, a page that no longer exists (404) is empty.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[int], typing.List[T]],
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fetch_page = fetch_page
+
+    def __iter__(self) -> typing.Iterator[T]:
+        for items in self.iter_pages():
+            yield from items
+
+    def drain(self) -> typing.Iterator[T]:
+        """Iterate over the items once, releasing every item when it is yielded to hold about one page in memory."""
+        return drain_items(self.iter_pages())
+
+    def _fetch(self, page: int) -> typing.List[T]:
+        retries = 0
+        while True:
+            try:
+                return self._fetch_page(page)
+            except ApiError as exc:
+                if exc.status_code == 404:
+                    return []
+                raise
+            except httpx.TransportError:
+                if retries >= self.max_retries:
+                    raise
+                time.sleep(_retry_delay(retries))
+                retries += 1
+
+    def iter_pages(self) -> typing.Iterator[typing.List[T]]:
+        """The items of every page, in page order unless `ordered=False`."""
+        yield self.items
+        pages = self._remaining_pages()
+        pending: typing.Deque["Future[typing.List[T]]"] = collections.deque()
+        pool = ThreadPoolExecutor(
+            max_workers=self.parallel, thread_name_prefix="label-studio-pages"
+        )
+
+        def schedule() -> None:
+            for page in itertools.islice(pages, self._window - len(pending)):
+                pending.append(pool.submit(self._fetch, page))
+
+        try:
+            schedule()
+            while pending:
+                if self.ordered:
+                    future = pending.popleft()
+                else:
+                    future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                    pending.remove(future)
+                items = future.result()
+                schedule()
+                yield items
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+
+class AsyncParallelPager(_ParallelPagerBase[T]):
+    """
+    Iterates over all the items of a paginated list, fetching the pages after the first one concurrently.
+
+    Pages are yielded in order unless `ordered=False`, then as soon as they are fetched. A page that fails with
+    a connection error or a timeout is retried `max_retries` times, a page that no longer exists (404) is empty.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[int], typing.Awaitable[typing.List[T]]],
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fetch_page = fetch_page
+
+    async def __aiter__(self) -> typing.AsyncIterator[T]:
+        async for items in self.iter_pages():
+            for item in items:
+                yield item
+
+    async def drain(self) -> typing.AsyncIterator[T]:
+        """Iterate over the items once, releasing every item when it is yielded to hold about one page in memory."""
+        async for items in self.iter_pages():
+            for item in drain_items([items]):
+                yield item
+
+    async def _fetch(self, page: int, running: asyncio.Semaphore) -> typing.List[T]:
+        retries = 0
+        async with running:
+            while True:
+                try:
+                    return await self._fetch_page(page)
+                except ApiError as exc:
+                    if exc.status_code == 404:
+                        return []
+                    raise
+                except httpx.TransportError:
+                    if retries >= self.max_retries:
+                        raise
+                    await asyncio.sleep(_retry_delay(retries))
+                    retries += 1
+
+    async def iter_pages(self) -> typing.AsyncIterator[typing.List[T]]:
+        """The items of every page, in page order unless `ordered=False`."""
+        yield self.items
+        pages = self._remaining_pages()
+        pending: typing.Deque["asyncio.Future[typing.List[T]]"] = collections.deque()
+        running = asyncio.Semaphore(self.parallel)
+
+        def schedule() -> None:
+            for page in itertools.islice(pages, self._window - len(pending)):
+                pending.append(asyncio.ensure_future(self._fetch(page, running)))
+
+        try:
+            schedule()
+            while pending:
+                if self.ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    future = next(iter(done))
+                    pending.remove(future)
+                items = await future
+                schedule()
+                yield items
+        finally:
+            for future in pending:
+                future.cancel()
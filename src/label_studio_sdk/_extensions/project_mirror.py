@@ -0,0 +1,527 @@
+import json
+import sqlite3
+import typing
+
+from label_studio_sdk._extensions import id_sets
+from label_studio_sdk._extensions.task_watch import timestamp
+
+if typing.TYPE_CHECKING:
+    from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+
+# A local copy of the tasks of a project, with their annotations and predictions, in a SQLite file. The tasks are
+# fetched in `updated_at` order with `tasks.watch()`, and the watermark is saved with every page in the same
+# transaction: an interrupted refresh continues from the last page saved, and the next refresh only fetches the
+# tasks updated since. Deleted tasks don't change the watermark, they are found by comparing the ids of the project
+# with the ids mirrored: when the mirror has more tasks than the project, on a full refresh, and every `prune_every`
+# refreshes, since the tasks created since the last refresh can hide as many deleted ones from the count.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS tasks (id INTEGER PRIMARY KEY, updated_at TEXT, json TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS tasks_updated_at ON tasks (updated_at);
+CREATE TABLE IF NOT EXISTS annotations (
+    id INTEGER PRIMARY KEY, task INTEGER NOT NULL, completed_by INTEGER, updated_at TEXT, json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS annotations_task ON annotations (task);
+CREATE INDEX IF NOT EXISTS annotations_completed_by ON annotations (completed_by);
+CREATE TABLE IF NOT EXISTS predictions (
+    id INTEGER PRIMARY KEY, task INTEGER NOT NULL, model_version TEXT, json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS predictions_task ON predictions (task);
+CREATE TABLE IF NOT EXISTS labels (task INTEGER NOT NULL, annotation INTEGER NOT NULL, label TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS labels_label ON labels (label, task);
+CREATE INDEX IF NOT EXISTS labels_task ON labels (task);
+"""
+
+# the first watermark, before any task
+_EPOCH = "1970-01-01T00:00:00Z"
+
+# the task ids of a query, below the SQLite limit of variables
+_CHUNK_SIZE = 500
+
+Row = typing.Dict[str, typing.Any]
+
+
+def _user_id(user: typing.Any) -> typing.Optional[int]:
+    # completed_by is an id, or the user with fields="all" on some versions
+    return user.get("id") if isinstance(user, dict) else user
+
+
+# the value keys of the label and choice tags, the other tags name theirs after the type of the region,
+# e.g. "rectanglelabels", while free text such as the "text" of a textarea isn't a label
+_LABEL_KEYS = ("labels", "choices", "taxonomy")
+
+
+def _labels(annotation: Row) -> typing.Set[str]:
+    """The labels and choices of the regions of an annotation."""
+    labels: typing.Set[str] = set()
+    for region in annotation.get("result") or []:
+        for key, value in (region.get("value") or {}).items():
+            if key not in _LABEL_KEYS and key != region.get("type"):
+                continue
+            if not isinstance(value, list):
+                continue
+            for label in value:
+                # a taxonomy choice is the path of labels to it
+                if isinstance(label, list):
+                    labels.update(item for item in label if isinstance(item, str))
+                elif isinstance(label, str):
+                    labels.add(label)
+    return labels
+
+
+def _placeholders(values: typing.Sized) -> str:
+    return ",".join("?" * len(values))
+
+
+def _id_chunks(
+    ids: typing.Optional[typing.Iterable[int]],
+) -> typing.Iterator[typing.Optional[typing.List[int]]]:
+    # the ids of a query in id order, split into chunks of ids queried one after the other, or None for all the tasks
+    if ids is None:
+        yield None
+        return
+    ids = id_sets.id_set(ids).tolist()
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        yield ids[start : start + _CHUNK_SIZE]
+
+
+class _ProjectMirrorBase:
+    def __init__(
+        self,
+        *,
+        project: int,
+        path: str,
+        page_size: int = 1000,
+        prune_every: typing.Optional[int] = 10,
+    ) -> None:
+        if prune_every is not None and prune_every < 1:
+            raise ValueError(f"prune_every must be at least 1, got {prune_every}")
+        self.project = project
+        self.path = path
+        self.page_size = page_size
+        self.prune_every = prune_every
+        self.db = sqlite3.connect(path)
+        self.db.executescript(_SCHEMA)
+        mirrored = self._meta("project")
+        if mirrored is not None and int(mirrored) != project:
+            self.db.close()
+            raise ValueError(f"{path} is a mirror of project {mirrored}, not {project}")
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('project', ?)", (str(project),)
+            )
+
+    def __enter__(self: typing.Any) -> typing.Any:
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _meta(self, key: str) -> typing.Optional[str]:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    @property
+    def watermark(self) -> typing.Optional[str]:
+        """The `updated_at` of the last task mirrored, None before the first refresh."""
+        return self._meta("watermark")
+
+    def _at_watermark(self) -> typing.List[int]:
+        # the tasks already mirrored at the watermark aren't fetched again
+        return [
+            task_id
+            for (task_id,) in self.db.execute(
+                "SELECT id FROM tasks WHERE updated_at = ?", (self.watermark,)
+            )
+        ]
+
+    def _reset(self) -> None:
+        with self.db:
+            for table in ("tasks", "annotations", "predictions", "labels"):
+                self.db.execute(f"DELETE FROM {table}")
+            self.db.execute("DELETE FROM meta WHERE key = 'watermark'")
+
+    def _save(self, tasks: typing.List[Row], watermark: typing.Optional[str]) -> None:
+        # a page of tasks replaces their previous version, with the watermark, in one transaction
+        with self.db:
+            self._delete([task["id"] for task in tasks])
+            for task in tasks:
+                task = dict(task)
+                annotations = task.pop("annotations", None) or []
+                predictions = task.pop("predictions", None) or []
+                updated_at = task.get("updated_at")
+                self.db.execute(
+                    "INSERT INTO tasks VALUES (?, ?, ?)",
+                    (
+                        task["id"],
+                        timestamp(updated_at) if updated_at else None,
+                        json.dumps(task),
+                    ),
+                )
+                self.db.executemany(
+                    "INSERT INTO annotations VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            annotation["id"],
+                            task["id"],
+                            _user_id(annotation.get("completed_by")),
+                            annotation.get("updated_at"),
+                            json.dumps(annotation),
+                        )
+                        for annotation in annotations
+                    ],
+                )
+                self.db.executemany(
+                    "INSERT INTO labels VALUES (?, ?, ?)",
+                    [
+                        (task["id"], annotation["id"], label)
+                        for annotation in annotations
+                        for label in sorted(_labels(annotation))
+                    ],
+                )
+                self.db.executemany(
+                    "INSERT INTO predictions VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            prediction["id"],
+                            task["id"],
+                            prediction.get("model_version"),
+                            json.dumps(prediction),
+                        )
+                        for prediction in predictions
+                    ],
+                )
+            if watermark is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('watermark', ?)", (watermark,)
+                )
+
+    def _delete(self, ids: typing.Sequence[int]) -> None:
+        for start in range(0, len(ids), _CHUNK_SIZE):
+            chunk = ids[start : start + _CHUNK_SIZE]
+            self.db.execute(
+                f"DELETE FROM tasks WHERE id IN ({_placeholders(chunk)})", chunk
+            )
+            for table in ("annotations", "predictions", "labels"):
+                self.db.execute(
+                    f"DELETE FROM {table} WHERE task IN ({_placeholders(chunk)})", chunk
+                )
+
+    def _prune_due(self, full: bool) -> bool:
+        # whether the ids are compared whatever the number of tasks, the refreshes since the last time are kept in meta
+        if full:
+            return True
+        refreshes = int(self._meta("refreshes") or 0) + 1
+        if self.prune_every is not None and refreshes >= self.prune_every:
+            return True
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('refreshes', ?)", (str(refreshes),)
+            )
+        return False
+
+    def _prune(self, ids: id_sets.IdArray) -> int:
+        """Delete the tasks that aren't in the id set `ids` anymore."""
+        mirrored = id_sets.id_set(
+            task_id
+            for (task_id,) in self.db.execute("SELECT id FROM tasks ORDER BY id")
+        )
+        deleted = id_sets.difference(mirrored, ids).tolist()
+        with self.db:
+            self._delete(deleted)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('refreshes', '0')")
+        return len(deleted)
+
+    def _where(
+        self,
+        *,
+        ids: typing.Optional[typing.List[int]] = None,
+        updated_since: typing.Any = None,
+        annotator: typing.Optional[int] = None,
+        label: typing.Optional[str] = None,
+    ) -> typing.Tuple[str, typing.List[typing.Any]]:
+        conditions = []
+        params: typing.List[typing.Any] = []
+        if ids is not None:
+            conditions.append(f"id IN ({_placeholders(ids)})")
+            params.extend(ids)
+        if updated_since is not None:
+            conditions.append("updated_at >= ?")
+            params.append(timestamp(updated_since))
+        if annotator is not None:
+            conditions.append(
+                "id IN (SELECT task FROM annotations WHERE completed_by = ?)"
+            )
+            params.append(annotator)
+        if label is not None:
+            conditions.append("id IN (SELECT task FROM labels WHERE label = ?)")
+            params.append(label)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def count(
+        self,
+        *,
+        ids: typing.Optional[typing.Iterable[int]] = None,
+        **filters: typing.Any,
+    ) -> int:
+        """The number of tasks mirrored, matching the filters of `tasks()`."""
+        count = 0
+        for chunk in _id_chunks(ids):
+            where, params = self._where(ids=chunk, **filters)
+            count += self.db.execute(
+                f"SELECT COUNT(*) FROM tasks{where}", params
+            ).fetchone()[0]
+        return count
+
+    def tasks(
+        self,
+        *,
+        ids: typing.Optional[typing.Iterable[int]] = None,
+        updated_since: typing.Any = None,
+        annotator: typing.Optional[int] = None,
+        label: typing.Optional[str] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Iterator[Row]:
+        """
+        Iterate over the tasks mirrored in id order, as returned by `tasks.list(fields="all")` in raw mode.
+
+        Parameters
+        ----------
+        ids : typing.Optional[typing.Iterable[int]]
+            Only the tasks with these ids.
+
+        updated_since : datetime or str
+            Only the tasks updated at or after this time.
+
+        annotator : typing.Optional[int]
+            Only the tasks annotated by this user id.
+
+        label : typing.Optional[str]
+            Only the tasks with an annotation with this label or choice.
+
+        limit : typing.Optional[int]
+            The maximum number of tasks.
+        """
+        for chunk in _id_chunks(ids):
+            where, params = self._where(
+                ids=chunk, updated_since=updated_since, annotator=annotator, label=label
+            )
+            sql = f"SELECT id, json FROM tasks{where} ORDER BY id"
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(limit)
+            for task in self._read_tasks(self.db.execute(sql, params)):
+                yield task
+                if limit is not None:
+                    limit -= 1
+            if limit == 0:
+                return
+
+    def _read_tasks(self, cursor: sqlite3.Cursor) -> typing.Iterator[Row]:
+        while True:
+            rows = cursor.fetchmany(_CHUNK_SIZE)
+            if not rows:
+                return
+            ids = [task_id for task_id, _ in rows]
+            annotations = self._children("annotations", ids)
+            predictions = self._children("predictions", ids)
+            for task_id, task in rows:
+                yield {
+                    **json.loads(task),
+                    "annotations": annotations.get(task_id, []),
+                    "predictions": predictions.get(task_id, []),
+                }
+
+    def _children(
+        self, table: str, ids: typing.List[int]
+    ) -> typing.Dict[int, typing.List[Row]]:
+        children: typing.Dict[int, typing.List[Row]] = {}
+        rows = self.db.execute(
+            f"SELECT task, json FROM {table} WHERE task IN ({_placeholders(ids)}) ORDER BY id",
+            ids,
+        )
+        for task_id, child in rows:
+            children.setdefault(task_id, []).append(json.loads(child))
+        return children
+
+    def get_task(self, id: int) -> typing.Optional[Row]:
+        """The task mirrored with this id, None if there is none."""
+        return next(self.tasks(ids=[id]), None)
+
+    def annotations(
+        self,
+        *,
+        task: typing.Optional[int] = None,
+        annotator: typing.Optional[int] = None,
+        label: typing.Optional[str] = None,
+    ) -> typing.Iterator[Row]:
+        """Iterate over the annotations mirrored in id order, of a task, by an annotator, or with a label."""
+        conditions = []
+        params: typing.List[typing.Any] = []
+        if task is not None:
+            conditions.append("task = ?")
+            params.append(task)
+        if annotator is not None:
+            conditions.append("completed_by = ?")
+            params.append(annotator)
+        if label is not None:
+            conditions.append("id IN (SELECT annotation FROM labels WHERE label = ?)")
+            params.append(label)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        for (annotation,) in self.db.execute(
+            f"SELECT json FROM annotations{where} ORDER BY id", params
+        ):
+            yield json.loads(annotation)
+
+    def predictions(
+        self,
+        *,
+        task: typing.Optional[int] = None,
+        model_version: typing.Optional[str] = None,
+    ) -> typing.Iterator[Row]:
+        """Iterate over the predictions mirrored in id order, of a task or a model version."""
+        conditions = []
+        params: typing.List[typing.Any] = []
+        if task is not None:
+            conditions.append("task = ?")
+            params.append(task)
+        if model_version is not None:
+            conditions.append("model_version = ?")
+            params.append(model_version)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        for (prediction,) in self.db.execute(
+            f"SELECT json FROM predictions{where} ORDER BY id", params
+        ):
+            yield json.loads(prediction)
+
+
+class ProjectMirror(_ProjectMirrorBase):
+    """
+    A local SQLite copy of the tasks of a project, with their annotations and predictions, indexed by id,
+    `updated_at`, annotator and label. `refresh()` fetches the tasks updated since the previous refresh, the
+    query helpers read the file only and return the tasks as the API does.
+
+    Examples
+    --------
+    from label_studio_sdk.client import LabelStudio
+    from label_studio_sdk._extensions.project_mirror import ProjectMirror
+
+    client = LabelStudio(api_key="YOUR_API_KEY")
+    with ProjectMirror(client, project=1, path="project-1.sqlite") as mirror:
+        mirror.refresh()
+        for task in mirror.tasks(label="cat"):
+            print(task["id"], len(task["annotations"]))
+    """
+
+    def __init__(
+        self,
+        client: "LabelStudio",
+        *,
+        project: int,
+        path: str,
+        page_size: int = 1000,
+        prune_every: typing.Optional[int] = 10,
+    ) -> None:
+        super().__init__(
+            project=project, path=path, page_size=page_size, prune_every=prune_every
+        )
+        self.client = client
+
+    def refresh(self, *, full: bool = False) -> int:
+        """
+        Fetch the tasks created or updated since the last refresh, and delete the tasks deleted from the project.
+        `full` fetches all the tasks again. Returns the number of tasks fetched.
+
+        The ids of the project are listed to find the deleted tasks when the mirror has more tasks than the
+        project, on a full refresh, and every `prune_every` refreshes, None only lists them in the first two cases.
+        """
+        if full:
+            self._reset()
+        watch = self.client.tasks.watch(
+            project=self.project,
+            since=self.watermark or _EPOCH,
+            page_size=self.page_size,
+            seen=self._at_watermark(),
+            request_options={"response_mode": "raw"},
+        )
+        fetched = 0
+        for tasks in watch.poll():
+            self._save(tasks, watch.watermark)
+            fetched += len(tasks)
+        if self._prune_due(full) or self.count() > self.client.tasks.count(
+            project=self.project
+        ):
+            self._prune(
+                self.client.tasks.list_ids(
+                    project=self.project, page_size=self.page_size
+                )
+            )
+        return fetched
+
+
+class AsyncProjectMirror(_ProjectMirrorBase):
+    """
+    A local SQLite copy of the tasks of a project, with their annotations and predictions, indexed by id,
+    `updated_at`, annotator and label. `await refresh()` fetches the tasks updated since the previous refresh, the
+    query helpers read the file only and return the tasks as the API does.
+
+    Examples
+    --------
+    from label_studio_sdk.client import AsyncLabelStudio
+    from label_studio_sdk._extensions.project_mirror import AsyncProjectMirror
+
+    client = AsyncLabelStudio(api_key="YOUR_API_KEY")
+    with AsyncProjectMirror(client, project=1, path="project-1.sqlite") as mirror:
+        await mirror.refresh()
+        for task in mirror.tasks(label="cat"):
+            print(task["id"], len(task["annotations"]))
+    """
+
+    def __init__(
+        self,
+        client: "AsyncLabelStudio",
+        *,
+        project: int,
+        path: str,
+        page_size: int = 1000,
+        prune_every: typing.Optional[int] = 10,
+    ) -> None:
+        super().__init__(
+            project=project, path=path, page_size=page_size, prune_every=prune_every
+        )
+        self.client = client
+
+    async def refresh(self, *, full: bool = False) -> int:
+        """
+        Fetch the tasks created or updated since the last refresh, and delete the tasks deleted from the project.
+        `full` fetches all the tasks again. Returns the number of tasks fetched.
+
+        The ids of the project are listed to find the deleted tasks when the mirror has more tasks than the
+        project, on a full refresh, and every `prune_every` refreshes, None only lists them in the first two cases.
+        """
+        if full:
+            self._reset()
+        watch = self.client.tasks.watch(
+            project=self.project,
+            since=self.watermark or _EPOCH,
+            page_size=self.page_size,
+            seen=self._at_watermark(),
+            request_options={"response_mode": "raw"},
+        )
+        fetched = 0
+        async for tasks in watch.poll():
+            self._save(tasks, watch.watermark)
+            fetched += len(tasks)
+        if self._prune_due(full) or self.count() > await self.client.tasks.count(
+            project=self.project
+        ):
+            self._prune(
+                await self.client.tasks.list_ids(
+                    project=self.project, page_size=self.page_size
+                )
+            )
+        return fetched
@@ -0,0 +1,64 @@
+import typing
+
+# Field projection of tasks: `tasks.list(select=["id", "data.image", "annotations.result"])` asks the server for the
+# top-level fields with `include`, and without annotations and predictions (`fields="task_only"`) unless they are
+# selected. The server may ignore `include` or return more than the nested keys asked for, so every task is also
+# trimmed to the selected paths on the client before it is parsed.
+
+# the fields of a task that are only returned with fields="all"
+_ALL_FIELDS = ("annotations", "predictions", "drafts")
+
+# the selected keys of a value, None selects the whole value
+_Tree = typing.Dict[str, typing.Optional["_Tree"]]
+
+
+def _trim(value: typing.Any, tree: typing.Optional[_Tree]) -> typing.Any:
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        # the paths into a list of objects, e.g. annotations.result, select the keys of every item
+        return [_trim(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {
+            name: _trim(value[name], subtree)
+            for name, subtree in tree.items()
+            if name in value
+        }
+    return value
+
+
+class Projection:
+    """
+    The task fields selected with dotted paths: "data.image" keeps the `image` key of the task data, and
+    "annotations.result" keeps the `result` of every annotation. The task id is always selected.
+    """
+
+    def __init__(self, select: typing.Sequence[str]) -> None:
+        if isinstance(select, str):
+            raise TypeError(f"select must be a list of field paths, got {select!r}")
+        self.select = list(select)
+        self.tree: _Tree = {}
+        for path in ["id", *self.select]:
+            parts = path.split(".")
+            if not all(parts):
+                raise ValueError(f"Invalid field path {path!r}")
+            node: typing.Optional[_Tree] = self.tree
+            for part in parts[:-1]:
+                if part in node and node[part] is None:
+                    # the whole value is already selected
+                    node = None
+                    break
+                node = typing.cast(_Tree, node.setdefault(part, {}))
+            if node is not None:
+                node[parts[-1]] = None
+
+    def params(self) -> typing.Dict[str, str]:
+        """The `include` and `fields` parameters of `tasks.list()` for the selected fields."""
+        fields = (
+            "all" if any(name in _ALL_FIELDS for name in self.tree) else "task_only"
+        )
+        return {"include": ",".join(self.tree), "fields": fields}
+
+    def apply(self, task: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """The decoded JSON of a task, trimmed to the selected fields."""
+        return _trim(task, self.tree)
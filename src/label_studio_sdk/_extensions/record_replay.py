@@ -0,0 +1,142 @@
+import base64
+import json
+import threading
+import typing
+
+import httpx
+
+# Record the responses of a real Label Studio once, then replay them in tests and benchmarks:
+#
+#     recorder = RecordingTransport(httpx.HTTPTransport())
+#     client = LabelStudio(api_key=..., base_url=..., httpx_client=httpx.Client(transport=recorder))
+#     ...
+#     recorder.save("cassette.json")
+#
+#     replay = ReplayTransport("cassette.json")
+#     client = LabelStudio(api_key="replay", base_url=..., httpx_client=httpx.Client(transport=replay))
+#
+# Request headers are not recorded, so the API key never ends up in a cassette.
+
+# dropped because the recorded body is the decoded one
+_SKIPPED_RESPONSE_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+Key = typing.Tuple[str, str, typing.Tuple[typing.Tuple[str, str], ...]]
+
+
+def _request_key(method: str, url: httpx.URL) -> Key:
+    return method, url.path, tuple(sorted(url.params.multi_items()))
+
+
+def _encode_body(content: bytes) -> typing.Dict[str, str]:
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(entry: typing.Dict[str, str]) -> bytes:
+    if "body_base64" in entry:
+        return base64.b64decode(entry["body_base64"])
+    return entry.get("body", "").encode("utf-8")
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Wraps a sync or async transport and records every request and response, see `save()`.
+    """
+
+    def __init__(
+        self, transport: typing.Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+    ) -> None:
+        self.transport = transport
+        self.interactions: typing.List[typing.Dict[str, typing.Any]] = []
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(self.transport, httpx.BaseTransport)
+        response = self.transport.handle_request(request)
+        response.read()
+        self._record(request, response)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(self.transport, httpx.AsyncBaseTransport)
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        self._record(request, response)
+        return response
+
+    def _record(self, request: httpx.Request, response: httpx.Response) -> None:
+        interaction = {
+            "request": {
+                "method": request.method,
+                "url": str(request.url),
+                **_encode_body(request.content),
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": [
+                    [name, value]
+                    for name, value in response.headers.multi_items()
+                    if name.lower() not in _SKIPPED_RESPONSE_HEADERS
+                ],
+                **_encode_body(response.content),
+            },
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def close(self) -> None:
+        if isinstance(self.transport, httpx.BaseTransport):
+            self.transport.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self.transport, httpx.AsyncBaseTransport):
+            await self.transport.aclose()
+
+    def save(self, path: str) -> None:
+        with self._lock, open(path, "w") as f:
+            json.dump({"interactions": self.interactions}, f, indent=1)
+
+
+class ReplayTransport(httpx.MockTransport):
+    """
+    Answers requests with recorded responses, for both `httpx.Client` and `httpx.AsyncClient`.
+
+    Requests are matched on their method, path and query parameters. The responses recorded for the same request
+    are served in order, the last one is repeated once they are exhausted. Unknown requests raise a LookupError.
+    """
+
+    def __init__(
+        self, cassette: typing.Union[str, typing.List[typing.Dict[str, typing.Any]]]
+    ) -> None:
+        if isinstance(cassette, str):
+            with open(cassette) as f:
+                cassette = json.load(f)["interactions"]
+        self._responses: typing.Dict[Key, typing.List[typing.Dict[str, typing.Any]]] = (
+            {}
+        )
+        for interaction in cassette:
+            request = interaction["request"]
+            key = _request_key(request["method"], httpx.URL(request["url"]))
+            self._responses.setdefault(key, []).append(interaction["response"])
+        self._served: typing.Dict[Key, int] = {}
+        self._lock = threading.Lock()
+        super().__init__(self._replay)
+
+    def _replay(self, request: httpx.Request) -> httpx.Response:
+        key = _request_key(request.method, request.url)
+        responses = self._responses.get(key)
+        if not responses:
+            raise LookupError(
+                f"No recorded response for {request.method} {request.url}"
+            )
+        with self._lock:
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        recorded = responses[min(served, len(responses) - 1)]
+        return httpx.Response(
+            recorded["status_code"],
+            headers=[tuple(header) for header in recorded["headers"]],
+            content=_decode_body(recorded),
+        )
@@ -0,0 +1,84 @@
+import json
+import typing
+
+import ijson
+
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.http_client import AsyncHttpClient, HttpClient
+from label_studio_sdk.core.request_options import RequestOptions
+
+# Incremental decoding of JSON list responses: items are yielded one by one while the body is downloaded,
+# so the peak memory is bounded by the largest item instead of the whole response.
+
+
+def iter_json_items(
+    chunks: typing.Iterable[bytes], prefix: str
+) -> typing.Iterator[typing.Any]:
+    """Yield the JSON values found under `prefix` (ijson syntax, e.g. "tasks.item") in a stream of byte chunks."""
+    events = ijson.sendable_list()
+    coro = ijson.items_coro(events, prefix, use_float=True)
+    for chunk in chunks:
+        coro.send(chunk)
+        if events:
+            yield from events
+            del events[:]
+    coro.close()
+    yield from events
+
+
+async def aiter_json_items(
+    chunks: typing.AsyncIterable[bytes], prefix: str
+) -> typing.AsyncIterator[typing.Any]:
+    events = ijson.sendable_list()
+    coro = ijson.items_coro(events, prefix, use_float=True)
+    async for chunk in chunks:
+        coro.send(chunk)
+        if events:
+            for item in events:
+                yield item
+            del events[:]
+    coro.close()
+    for item in events:
+        yield item
+
+
+def _raise_for_status(status_code: int, body: bytes) -> None:
+    try:
+        error_body = json.loads(body)
+    except ValueError:
+        error_body = body.decode(errors="replace")
+    raise ApiError(status_code=status_code, body=error_body)
+
+
+def stream_json_items(
+    http_client: HttpClient,
+    path: str,
+    *,
+    prefix: str,
+    params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    request_options: typing.Optional[RequestOptions] = None,
+) -> typing.Iterator[typing.Any]:
+    """GET `path` and yield the decoded JSON values under `prefix` as the response body arrives."""
+    with http_client.stream(
+        path, method="GET", params=params, request_options=request_options
+    ) as response:
+        if not 200 <= response.status_code < 300:
+            _raise_for_status(response.status_code, response.read())
+        yield from iter_json_items(response.iter_bytes(), prefix)
+
+
+async def astream_json_items(
+    http_client: AsyncHttpClient,
+    path: str,
+    *,
+    prefix: str,
+    params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    request_options: typing.Optional[RequestOptions] = None,
+) -> typing.AsyncIterator[typing.Any]:
+    async with http_client.stream(
+        path, method="GET", params=params, request_options=request_options
+    ) as response:
+        if not 200 <= response.status_code < 300:
+            _raise_for_status(response.status_code, await response.aread())
+        async for item in aiter_json_items(response.aiter_bytes(), prefix):
+            yield item
@@ -0,0 +1,299 @@
+import asyncio
+import datetime
+import json
+import time
+import typing
+
+from label_studio_sdk._extensions.keyset_pager import (
+    QueryType,
+    _end_of_pages,
+    _task_id,
+    keyset_query,
+)
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.data_manager import (
+    DATETIME_FORMAT,
+    Column,
+    Filters,
+    Operator,
+    Type,
+)
+
+# A change feed of tasks: every poll requests the first page of the tasks updated at or after the high watermark,
+# ordered by `updated_at`, and moves the watermark to the last task of the page until a page isn't full. The
+# watermark is inclusive, so the tasks updated at the same time as the last one are requested again and the ones
+# already yielded at that time are skipped. More tasks updated at the same time than fit in a page are paged by id.
+
+T = typing.TypeVar("T")
+
+
+def _task_updated_at(task: typing.Any) -> typing.Any:
+    return task.get("updated_at") if isinstance(task, dict) else task.updated_at
+
+
+def timestamp(value: typing.Union[datetime.datetime, str]) -> str:
+    """A datetime, or a datetime in ISO 8601, in the format of Data Manager filters in UTC (naive datetimes are UTC)."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc)
+    return value.strftime(DATETIME_FORMAT)
+
+
+def _watch_query(
+    query: QueryType,
+    operator: typing.Optional[str] = None,
+    minimum: str = "",
+    maximum: typing.Optional[str] = None,
+) -> typing.Dict[str, typing.Any]:
+    # the filters of `query` and a filter on updated_at, ordered by updated_at
+    query = dict(json.loads(query) if isinstance(query, str) else query or {})
+    filters = query.get("filters") or {}
+    items = list(filters.get("items") or [])
+    if filters.get("conjunction", Filters.AND) != Filters.AND and len(items) > 1:
+        raise ValueError('Watching tasks requires filters combined with "and"')
+    if operator is not None:
+        items.append(
+            Filters.item(
+                Column.updated_at,
+                operator,
+                Type.Datetime,
+                Filters.value(minimum, maximum),
+            )
+        )
+    query["filters"] = Filters.create(Filters.AND, items)
+    query["ordering"] = [Column.updated_at]
+    return query
+
+
+class _TaskWatchBase(typing.Generic[T]):
+    def __init__(
+        self,
+        *,
+        query: QueryType = None,
+        since: typing.Union[datetime.datetime, str, None] = None,
+        interval: float = 5.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        seen: typing.Iterable[int] = (),
+    ) -> None:
+        if not 0 <= interval <= max_interval or backoff < 1:
+            raise ValueError(
+                "intervals must be 0 <= interval <= max_interval, and backoff must be 1 or more"
+            )
+        # fail before the first request if the query can't be watched
+        _watch_query(query)
+        self.query = query
+        self.watermark: typing.Optional[str] = (
+            timestamp(since) if since is not None else None
+        )
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        # the ids of the tasks yielded that were updated at the watermark
+        self._at_watermark: typing.Set[int] = set(seen)
+        # the tasks updated at the watermark were all paged by id, request the tasks updated after it
+        self._after_watermark = False
+        self._delay = interval
+
+    def _page_query(self) -> str:
+        if self.watermark is None:
+            # the last task updated
+            return json.dumps(
+                {**_watch_query(self.query), "ordering": ["-" + Column.updated_at]}
+            )
+        operator = (
+            Operator.GREATER if self._after_watermark else Operator.GREATER_OR_EQUAL
+        )
+        return json.dumps(_watch_query(self.query, operator, self.watermark))
+
+    def _ties_query(self, last_id: typing.Optional[int]) -> str:
+        # the tasks updated at the watermark, by id
+        query = _watch_query(
+            self.query, Operator.IN, typing.cast(str, self.watermark), self.watermark
+        )
+        return keyset_query({**query, "ordering": []}, last_id)
+
+    def _start(self, items: typing.List[T]) -> None:
+        # without `since`, watch the changes after the last task updated
+        if items:
+            self.watermark = timestamp(_task_updated_at(items[0]))
+            self._after_watermark = True
+        else:
+            self.watermark = timestamp(datetime.datetime.now(datetime.timezone.utc))
+
+    def _changes(self, items: typing.List[T]) -> typing.List[T]:
+        """The tasks of a page that weren't yielded yet, moving the watermark to the last one."""
+        changed = []
+        for item in items:
+            updated_at = timestamp(_task_updated_at(item))
+            if updated_at != self.watermark:
+                self.watermark = updated_at
+                self._at_watermark = set()
+                self._after_watermark = False
+            task_id = _task_id(item)
+            if task_id not in self._at_watermark:
+                self._at_watermark.add(task_id)
+                changed.append(item)
+        return changed
+
+    def _is_tie(
+        self, items: typing.List[T], changed: typing.List[T], page_size: int
+    ) -> bool:
+        # a full page of tasks updated at the watermark that were all yielded: the page can't move forward
+        return len(items) >= page_size and not changed
+
+    def _idle(self, changed: bool) -> float:
+        """The delay before the next poll: `interval` after a change, growing while nothing changes."""
+        if changed:
+            self._delay = self.interval
+            return self.interval
+        delay = self._delay
+        self._delay = min(self._delay * self.backoff, self.max_interval)
+        return delay
+
+
+class TaskWatch(_TaskWatchBase[T]):
+    """
+    Iterates over the tasks as they change, forever: each task is yielded when it's created or updated.
+    `watermark` is the `updated_at` of the last change yielded, pass it as `since` to resume: the tasks updated at
+    that time are yielded again, unless their ids are passed as `seen`.
+
+    Polls wait `interval` seconds after a poll that found changes or the first one that found none, multiplied by
+    `backoff` after every further idle poll up to `max_interval`.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[str], typing.List[T]],
+        page_size: int,
+        sleep: typing.Callable[[float], typing.Any] = time.sleep,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fetch_page = fetch_page
+        self.page_size = page_size
+        self._sleep = sleep
+
+    def _fetch(self, query: str) -> typing.List[T]:
+        try:
+            return self._fetch_page(query)
+        except ApiError as exc:
+            if _end_of_pages(exc):
+                return []
+            raise
+
+    def __iter__(self) -> typing.Iterator[T]:
+        if self.watermark is None:
+            self._start(self._fetch(self._page_query()))
+        while True:
+            changed = False
+            for items in self.poll():
+                changed = True
+                yield from items
+            delay = self._idle(changed)
+            if delay:
+                self._sleep(delay)
+
+    def poll(self) -> typing.Iterator[typing.List[T]]:
+        """Yield the pages of the tasks changed since the watermark, until none is left."""
+        while True:
+            items = self._fetch(self._page_query())
+            changed = self._changes(items)
+            if changed:
+                yield changed
+            if self._is_tie(items, changed, self.page_size):
+                yield from self._poll_ties()
+                continue
+            if len(items) < self.page_size:
+                return
+
+    def _poll_ties(self) -> typing.Iterator[typing.List[T]]:
+        last_id = None
+        while True:
+            items = self._fetch(self._ties_query(last_id))
+            if not items:
+                break
+            last_id = _task_id(items[-1])
+            changed = [
+                item for item in items if _task_id(item) not in self._at_watermark
+            ]
+            self._at_watermark.update(_task_id(item) for item in changed)
+            if changed:
+                yield changed
+        self._after_watermark = True
+
+
+class AsyncTaskWatch(_TaskWatchBase[T]):
+    """
+    Iterates over the tasks as they change, forever: each task is yielded when it's created or updated.
+    `watermark` is the `updated_at` of the last change yielded, pass it as `since` to resume: the tasks updated at
+    that time are yielded again, unless their ids are passed as `seen`.
+
+    Polls wait `interval` seconds after a poll that found changes or the first one that found none, multiplied by
+    `backoff` after every further idle poll up to `max_interval`.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: typing.Callable[[str], typing.Awaitable[typing.List[T]]],
+        page_size: int,
+        sleep: typing.Callable[[float], typing.Awaitable[typing.Any]] = asyncio.sleep,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fetch_page = fetch_page
+        self.page_size = page_size
+        self._sleep = sleep
+
+    async def _fetch(self, query: str) -> typing.List[T]:
+        try:
+            return await self._fetch_page(query)
+        except ApiError as exc:
+            if _end_of_pages(exc):
+                return []
+            raise
+
+    async def __aiter__(self) -> typing.AsyncIterator[T]:
+        if self.watermark is None:
+            self._start(await self._fetch(self._page_query()))
+        while True:
+            changed = False
+            async for items in self.poll():
+                changed = True
+                for item in items:
+                    yield item
+            delay = self._idle(changed)
+            if delay:
+                await self._sleep(delay)
+
+    async def poll(self) -> typing.AsyncIterator[typing.List[T]]:
+        """Yield the pages of the tasks changed since the watermark, until none is left."""
+        while True:
+            items = await self._fetch(self._page_query())
+            changed = self._changes(items)
+            if changed:
+                yield changed
+            if self._is_tie(items, changed, self.page_size):
+                async for ties in self._poll_ties():
+                    yield ties
+                continue
+            if len(items) < self.page_size:
+                return
+
+    async def _poll_ties(self) -> typing.AsyncIterator[typing.List[T]]:
+        last_id = None
+        while True:
+            items = await self._fetch(self._ties_query(last_id))
+            if not items:
+                break
+            last_id = _task_id(items[-1])
+            changed = [
+                item for item in items if _task_id(item) not in self._at_watermark
+            ]
+            self._at_watermark.update(_task_id(item) for item in changed)
+            if changed:
+                yield changed
+        self._after_watermark = True
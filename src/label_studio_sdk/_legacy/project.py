@@ -1,5 +1,4 @@
-""" .. include::../docs/project.md
-"""
+""".. include::../docs/project.md"""
 
 import json
 import logging
@@ -8,10 +7,13 @@ import pathlib
 import time
 from enum import Enum, auto
 from pathlib import Path
-from random import sample, shuffle
 from typing import Optional, Union, List, Dict, Callable
 
-from label_studio_sdk._extensions.label_studio_tools.core.label_config import parse_config
+import numpy as np
+from label_studio_sdk._extensions import id_sets
+from label_studio_sdk._extensions.label_studio_tools.core.label_config import (
+    parse_config,
+)
 from label_studio_sdk._extensions.label_studio_tools.core.utils.io import get_local_path
 from requests import Response
 from requests.exceptions import HTTPError, InvalidSchema, MissingSchema
@@ -851,6 +853,51 @@ class Project(Client):
         kwargs["only_ids"] = True
         return self.get_paginated_tasks(*args, **kwargs)
 
+    def get_tasks_ids_array(
+        self,
+        filters=None,
+        ordering=None,
+        view_id=None,
+        selected_ids=None,
+        page_size: int = 1000,
+    ):
+        """Same as `label_studio_sdk.project.Project.get_tasks_ids()` but returns the IDs as a
+        sorted int64 NumPy array, filled page by page, that takes 8 bytes per task instead of a
+        list of Python ints. Use `label_studio_sdk._extensions.id_sets` to compute differences,
+        intersections and samples of these arrays.
+
+        Parameters
+        ----------
+        page_size: int
+            Task IDs per request. Default is 1000.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted task IDs without duplicates
+
+        """
+        buffer = id_sets.IdBuffer()
+        page = 1
+        data = {}
+        while not data.get("end_pagination"):
+            try:
+                data = self.get_paginated_tasks(
+                    filters=filters,
+                    ordering=ordering,
+                    view_id=view_id,
+                    selected_ids=selected_ids,
+                    only_ids=True,
+                    page=page,
+                    page_size=page_size,
+                )
+                buffer.extend(data["tasks"])
+                page += 1
+            except LabelStudioException as e:
+                logger.debug(f"Error during pagination: {e}")
+                break
+        return buffer.ids()
+
     def get_views(self):
         """Get all views related to the project
 
@@ -2075,6 +2122,7 @@ class Project(Client):
         method: AssignmentSamplingMethod = AssignmentSamplingMethod.RANDOM,
         fraction: float = 1.0,
         overlap: int = 1,
+        seed: Union[int, np.random.Generator, None] = None,
     ):
         """
         Assigning tasks to Reviewers or Annotators by assign_function with method by fraction from view_id
@@ -2092,6 +2140,9 @@ class Project(Client):
             Optional, expresses the size of dataset to be assigned
         overlap: int
             Optional, expresses the count of assignments for each task
+        seed: Union[int, np.random.Generator, None]
+            Optional, seed or NumPy generator of the sampling, for reproducible assignments.
+            The tasks are sampled with NumPy, seeding the `random` module has no effect
         Returns
         -------
         list[dict]
@@ -2106,17 +2157,17 @@ class Project(Client):
             # User objects list
             users = [user for user in project_users if user.id in users]
         final_results = []
-        # Get tasks to assign
-        tasks = self.get_tasks(view_id=view_id, only_ids=True)
+        rng = np.random.default_rng(seed)
+        # Get tasks to assign, as a sorted array of IDs
+        tasks = self.get_tasks_ids_array(view_id=view_id)
         assert len(tasks) > 0, "Tasks list is empty."
         # Choice fraction of tasks
         if fraction != 1.0:
             k = int(len(tasks) * fraction)
-            tasks = sample(tasks, k)
+            tasks = id_sets.sample(tasks, k, rng=rng)
         # prepare random list of tasks for overlap > 1
         if overlap > 1:
-            shuffle(tasks)
-            tasks = tasks * overlap
+            tasks = np.tile(rng.permutation(tasks), overlap)
         # Check how many tasks for each user
         n_tasks = max(int(len(tasks) // len(users)), 1)
         # Assign each user tasks
@@ -2129,25 +2180,25 @@ class Project(Client):
             elif n_tasks + 1 == len(tasks) and n_tasks != 1:
                 n_tasks = n_tasks + 1
             if method == AssignmentSamplingMethod.RANDOM and overlap == 1:
-                sample_tasks = sample(tasks, n_tasks)
+                sample_tasks = id_sets.sample(tasks, n_tasks, rng=rng)
             elif method == AssignmentSamplingMethod.RANDOM and overlap > 1:
                 sample_tasks = tasks[:n_tasks]
             else:
                 raise ValueError(f"Sampling method {method} is not allowed")
-            final_results.append(assign_function([user], sample_tasks))
+            final_results.append(assign_function([user], sample_tasks.tolist()))
             if overlap > 1:
                 tasks = tasks[n_tasks:]
             else:
-                tasks = list(set(tasks) - set(sample_tasks))
+                tasks = id_sets.difference(tasks, sample_tasks)
             if len(tasks) == 0:
                 break
         # check if any tasks left
         if len(tasks) > 0:
             for user in users:
-                if not tasks:
+                if len(tasks) == 0:
                     break
-                task = tasks.pop()
-                final_results.append(assign_function([user], [task]))
+                task, tasks = tasks[-1], tasks[:-1]
+                final_results.append(assign_function([user], [int(task)]))
         return final_results
 
     def assign_reviewers_by_sampling(
@@ -2157,6 +2208,7 @@ class Project(Client):
         method: AssignmentSamplingMethod = AssignmentSamplingMethod.RANDOM,
         fraction: float = 1.0,
         overlap: int = 1,
+        seed: Union[int, np.random.Generator, None] = None,
     ):
         """
         Behaves similarly like `assign_reviewers()` but instead of specify tasks_ids explicitely,
@@ -2174,6 +2226,9 @@ class Project(Client):
             Optional, expresses the size of dataset to be assigned
         overlap: int
             Optional, expresses the count of assignments for each task
+        seed: Union[int, np.random.Generator, None]
+            Optional, seed or NumPy generator of the sampling, for reproducible assignments.
+            The tasks are sampled with NumPy, seeding the `random` module has no effect
         Returns
         -------
         list[dict]
@@ -2186,6 +2241,7 @@ class Project(Client):
             method=method,
             fraction=fraction,
             overlap=overlap,
+            seed=seed,
         )
 
     def assign_annotators_by_sampling(
@@ -2195,6 +2251,7 @@ class Project(Client):
         method: AssignmentSamplingMethod = AssignmentSamplingMethod.RANDOM,
         fraction: float = 1.0,
         overlap: int = 1,
+        seed: Union[int, np.random.Generator, None] = None,
     ):
         """
         Behaves similarly like `assign_annotators()` but instead of specify tasks_ids explicitly,
@@ -2212,6 +2269,9 @@ class Project(Client):
             Optional, expresses the size of dataset to be assigned
         overlap: int
             Optional, expresses the count of assignments for each task
+        seed: Union[int, np.random.Generator, None]
+            Optional, seed or NumPy generator of the sampling, for reproducible assignments.
+            The tasks are sampled with NumPy, seeding the `random` module has no effect
         Returns
         -------
         list[dict]
@@ -2224,6 +2284,7 @@ class Project(Client):
             method=method,
             fraction=fraction,
             overlap=overlap,
+            seed=seed,
         )
 
     def export_snapshot_list(self) -> list:
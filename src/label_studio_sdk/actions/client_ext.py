@@ -0,0 +1,212 @@
+import typing
+from json.decoder import JSONDecodeError
+
+import httpx
+
+from .client import ActionsClient, AsyncActionsClient
+from .types.actions_create_request_filters import ActionsCreateRequestFilters
+from .types.actions_create_request_ordering_item import ActionsCreateRequestOrderingItem
+from label_studio_sdk._extensions.batch import (
+    AsyncBatchExecutor,
+    BatchExecutor,
+    BatchProgress,
+)
+from label_studio_sdk._extensions.checkpoint import Checkpoint, CheckpointStore
+from label_studio_sdk._extensions.chunked_actions import (
+    ChunkedActionResult,
+    ChunkTracker,
+)
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.request_options import RequestOptions
+
+
+def _action_body(**params: typing.Any) -> typing.Dict[str, typing.Any]:
+    return {name: value for name, value in params.items() if value is not None}
+
+
+def _chunk_body(
+    chunk: typing.List[int], body: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    return {**body, "selectedItems": {"all": False, "included": chunk}}
+
+
+def _action_response(response: httpx.Response) -> typing.Any:
+    # unlike create(), the response of every chunk is kept to be aggregated
+    try:
+        response_json = response.json() if response.content else None
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, body=response.text)
+    if 200 <= response.status_code < 300:
+        return response_json
+    raise ApiError(status_code=response.status_code, body=response_json)
+
+
+class ActionsClientExt(ActionsClient):
+
+    def run_chunked(
+        self,
+        *,
+        id: str,
+        project: int,
+        ids: typing.Iterable[int],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        max_retries: int = 2,
+        filters: typing.Optional[ActionsCreateRequestFilters] = None,
+        ordering: typing.Optional[
+            typing.Sequence[ActionsCreateRequestOrderingItem]
+        ] = None,
+        resume_from: typing.Union[Checkpoint, str, None] = None,
+        checkpoint: typing.Optional[CheckpointStore] = None,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params: typing.Any,
+    ) -> ChunkedActionResult:
+        """
+        Same as `create()` with `selected_items={"all": False, "included": ids}`, but the ids are split into chunks of
+        `chunk_size`, one request each, so that a selection of millions of tasks doesn't make a request too large
+        for the server. The chunks run `concurrency` at a time and are read from `ids` as they run.
+
+        429 and 5xx responses are retried `max_retries` times. If a chunk still fails, no more chunks are submitted
+        and ChunkedActionError is raised once the queued ones complete: its `checkpoint` passed as `resume_from`,
+        with the same ids, continues after the last chunk that finished in order, the chunks after it run again.
+        `checkpoint` saves it after every chunk, see `FileCheckpoint`.
+
+        Parameters
+        ----------
+        id : str
+            Data Manager action id, e.g. `delete_tasks` or `predictions_to_annotations`.
+
+        project : int
+            Project ID
+
+        ids : typing.Iterable[int]
+            The ids of the selected tasks. No request is sent when it's empty.
+
+        **params
+            Other parameters of the action, sent in the request body, e.g. `model_version`.
+
+        Returns
+        -------
+        ChunkedActionResult
+            The number of chunks, the sum of the `processed_items` of their responses, and the responses.
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+        from label_studio_sdk._extensions.checkpoint import FileCheckpoint
+
+        client = LabelStudio(api_key="YOUR_API_KEY")
+        store = FileCheckpoint("delete-tasks.json")
+        result = client.actions.run_chunked(
+            id="delete_tasks", project=1, ids=task_ids, resume_from=store.load(), checkpoint=store
+        )
+        print(result.processed_items)
+        """
+        body = _action_body(filters=filters, ordering=ordering, **params)
+        tracker = ChunkTracker(
+            action={"id": id, "project": project, **body},
+            chunk_size=chunk_size,
+            resume_from=resume_from,
+            store=checkpoint,
+        )
+        with BatchExecutor(
+            concurrency=concurrency,
+            max_retries=max_retries,
+            on_progress=on_progress,
+            on_result=tracker.on_result,
+            keep_results=False,
+        ) as batch:
+            for chunk in tracker.chunks(ids):
+                batch.submit(
+                    self._run_chunk,
+                    id,
+                    project,
+                    chunk,
+                    body,
+                    request_options=request_options,
+                )
+        return tracker.finish()
+
+    def _run_chunk(
+        self,
+        id: str,
+        project: int,
+        chunk: typing.List[int],
+        body: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Any:
+        response = self._client_wrapper.httpx_client.request(
+            "api/dm/actions/",
+            method="POST",
+            params={"id": id, "project": project},
+            json=_chunk_body(chunk, body),
+            request_options=request_options,
+        )
+        return _action_response(response)
+
+
+class AsyncActionsClientExt(AsyncActionsClient):
+
+    async def run_chunked(
+        self,
+        *,
+        id: str,
+        project: int,
+        ids: typing.Iterable[int],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        max_retries: int = 2,
+        filters: typing.Optional[ActionsCreateRequestFilters] = None,
+        ordering: typing.Optional[
+            typing.Sequence[ActionsCreateRequestOrderingItem]
+        ] = None,
+        resume_from: typing.Union[Checkpoint, str, None] = None,
+        checkpoint: typing.Optional[CheckpointStore] = None,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params: typing.Any,
+    ) -> ChunkedActionResult:
+        body = _action_body(filters=filters, ordering=ordering, **params)
+        tracker = ChunkTracker(
+            action={"id": id, "project": project, **body},
+            chunk_size=chunk_size,
+            resume_from=resume_from,
+            store=checkpoint,
+        )
+        async with AsyncBatchExecutor(
+            concurrency=concurrency,
+            max_retries=max_retries,
+            on_progress=on_progress,
+            on_result=tracker.on_result,
+            keep_results=False,
+        ) as batch:
+            for chunk in tracker.chunks(ids):
+                await batch.submit(
+                    self._run_chunk,
+                    id,
+                    project,
+                    chunk,
+                    body,
+                    request_options=request_options,
+                )
+        return tracker.finish()
+
+    async def _run_chunk(
+        self,
+        id: str,
+        project: int,
+        chunk: typing.List[int],
+        body: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Any:
+        response = await self._client_wrapper.httpx_client.request(
+            "api/dm/actions/",
+            method="POST",
+            params={"id": id, "project": project},
+            json=_chunk_body(chunk, body),
+            request_options=request_options,
+        )
+        return _action_response(response)
+
+    run_chunked.__doc__ = ActionsClientExt.run_chunked.__doc__
@@ -2,28 +2,69 @@
 
 import os
 import typing
+from importlib import import_module
 
 import httpx
 
-from .actions.client import ActionsClient, AsyncActionsClient
-from .annotations.client import AnnotationsClient, AsyncAnnotationsClient
-from .comments.client import AsyncCommentsClient, CommentsClient
 from .core.api_error import ApiError
 from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .core.instrumentation import Instrumentation
+from .core.json_codec import JsonCodec, get_json_codec
+from .core.rate_limiter import RateLimiter
+from .core.response_mode import ResponseMode
 from .environment import LabelStudioEnvironment
-from .export_storage.client import AsyncExportStorageClient, ExportStorageClient
-from .files.client import AsyncFilesClient, FilesClient
-from .import_storage.client import AsyncImportStorageClient, ImportStorageClient
-from .ml.client import AsyncMlClient, MlClient
-from .model_providers.client import AsyncModelProvidersClient, ModelProvidersClient
-from .predictions.client import AsyncPredictionsClient, PredictionsClient
-from .projects.client import AsyncProjectsClient, ProjectsClient
-from .prompts.client import AsyncPromptsClient, PromptsClient
-from .tasks.client import AsyncTasksClient, TasksClient
-from .users.client import AsyncUsersClient, UsersClient
-from .views.client import AsyncViewsClient, ViewsClient
-from .webhooks.client import AsyncWebhooksClient, WebhooksClient
-from .workspaces.client import AsyncWorkspacesClient, WorkspacesClient
+
+if typing.TYPE_CHECKING:
+    from .actions.client import ActionsClient, AsyncActionsClient
+    from .annotations.client import AnnotationsClient, AsyncAnnotationsClient
+    from .comments.client import AsyncCommentsClient, CommentsClient
+    from .export_storage.client import AsyncExportStorageClient, ExportStorageClient
+    from .files.client import AsyncFilesClient, FilesClient
+    from .import_storage.client import AsyncImportStorageClient, ImportStorageClient
+    from .ml.client import AsyncMlClient, MlClient
+    from .model_providers.client import AsyncModelProvidersClient, ModelProvidersClient
+    from .predictions.client import AsyncPredictionsClient, PredictionsClient
+    from .projects.client import AsyncProjectsClient, ProjectsClient
+    from .prompts.client import AsyncPromptsClient, PromptsClient
+    from .tasks.client import AsyncTasksClient, TasksClient
+    from .users.client import AsyncUsersClient, UsersClient
+    from .views.client import AsyncViewsClient, ViewsClient
+    from .webhooks.client import AsyncWebhooksClient, WebhooksClient
+    from .workspaces.client import AsyncWorkspacesClient, WorkspacesClient
+
+# same values as the httpx defaults
+DEFAULT_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+T_Client = typing.TypeVar("T_Client")
+
+
+class LazySubClient(typing.Generic[T_Client]):
+    """
+    A sub-client that is imported and built on first access, then cached on the client instance.
+    Only the modules of the endpoints that are actually used get imported.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+        self.attr_name = name
+
+    def __set_name__(self, owner: typing.Any, attr_name: str) -> None:
+        self.attr_name = attr_name
+
+    @typing.overload
+    def __get__(self, instance: None, owner: typing.Any = None) -> "LazySubClient[T_Client]": ...
+
+    @typing.overload
+    def __get__(self, instance: typing.Any, owner: typing.Any = None) -> T_Client: ...
+
+    def __get__(self, instance: typing.Any, owner: typing.Any = None) -> typing.Any:
+        if instance is None:
+            return self
+        client = getattr(import_module(self.module), self.name)(client_wrapper=instance._client_wrapper)
+        # stored on the instance, it shadows this descriptor from now on
+        instance.__dict__[self.attr_name] = client
+        return client
 
 
 class LabelStudioBase:
@@ -54,6 +95,30 @@ class LabelStudioBase:
     httpx_client : typing.Optional[httpx.Client]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    pool_limits : typing.Optional[httpx.Limits]
+        The connection pool limits of the default httpx client, this is irrelevant if a custom httpx client is passed in. Defaults to the httpx limits (100 connections, 20 of them kept alive).
+
+    max_connections_per_host : typing.Optional[int]
+        Caps the pool at this many connections and keeps all of them alive. The client talks to a single Label Studio host, so this is the number of concurrent connections to it. Overrides the corresponding values of `pool_limits`.
+
+    keepalive_expiry : typing.Optional[float]
+        The number of seconds an idle keep-alive connection stays in the pool. Overrides the corresponding value of `pool_limits`.
+
+    http2 : typing.Optional[bool]
+        Whether the default httpx client negotiates HTTP/2, this requires `pip install httpx[http2]` and is irrelevant if a custom httpx client is passed in.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Limits the rate and concurrency of all the requests made by this client and slows down for everyone when the server throttles. The same limiter can be shared by several clients, sync and async.
+
+    response_mode : ResponseMode
+        How responses are parsed: "model" validates them into pydantic models, "construct" builds the models without validation, "raw" returns plain dicts and lists. Can be overridden per call with `request_options={"response_mode": ...}`.
+
+    json_codec : typing.Optional[typing.Union[str, JsonCodec]]
+        The JSON library used to encode request bodies and decode responses: "json", "ujson", "orjson", "auto" (the fastest one installed) or a JsonCodec instance. By default httpx encodes and decodes with the stdlib.
+
+    instrumentation : typing.Optional[Instrumentation]
+        Receives an event when each request starts, ends and is retried, with its endpoint template, latency and byte counts. Use `MetricsAggregator` for per-endpoint percentiles. Nothing is measured by default.
+
     Examples
     --------
     from label_studio_sdk.client import LabelStudio
@@ -63,6 +128,35 @@ class LabelStudioBase:
     )
     """
 
+    annotations: LazySubClient["AnnotationsClient"] = LazySubClient(
+        "label_studio_sdk.annotations.client", "AnnotationsClient"
+    )
+    users: LazySubClient["UsersClient"] = LazySubClient("label_studio_sdk.users.client", "UsersClient")
+    actions: LazySubClient["ActionsClient"] = LazySubClient("label_studio_sdk.actions.client", "ActionsClient")
+    views: LazySubClient["ViewsClient"] = LazySubClient("label_studio_sdk.views.client", "ViewsClient")
+    files: LazySubClient["FilesClient"] = LazySubClient("label_studio_sdk.files.client", "FilesClient")
+    projects: LazySubClient["ProjectsClient"] = LazySubClient("label_studio_sdk.projects.client", "ProjectsClient")
+    ml: LazySubClient["MlClient"] = LazySubClient("label_studio_sdk.ml.client", "MlClient")
+    predictions: LazySubClient["PredictionsClient"] = LazySubClient(
+        "label_studio_sdk.predictions.client", "PredictionsClient"
+    )
+    tasks: LazySubClient["TasksClient"] = LazySubClient("label_studio_sdk.tasks.client", "TasksClient")
+    import_storage: LazySubClient["ImportStorageClient"] = LazySubClient(
+        "label_studio_sdk.import_storage.client", "ImportStorageClient"
+    )
+    export_storage: LazySubClient["ExportStorageClient"] = LazySubClient(
+        "label_studio_sdk.export_storage.client", "ExportStorageClient"
+    )
+    webhooks: LazySubClient["WebhooksClient"] = LazySubClient("label_studio_sdk.webhooks.client", "WebhooksClient")
+    prompts: LazySubClient["PromptsClient"] = LazySubClient("label_studio_sdk.prompts.client", "PromptsClient")
+    model_providers: LazySubClient["ModelProvidersClient"] = LazySubClient(
+        "label_studio_sdk.model_providers.client", "ModelProvidersClient"
+    )
+    comments: LazySubClient["CommentsClient"] = LazySubClient("label_studio_sdk.comments.client", "CommentsClient")
+    workspaces: LazySubClient["WorkspacesClient"] = LazySubClient(
+        "label_studio_sdk.workspaces.client", "WorkspacesClient"
+    )
+
     def __init__(
         self,
         *,
@@ -71,39 +165,47 @@ class LabelStudioBase:
         api_key: typing.Optional[str] = os.getenv("LABEL_STUDIO_API_KEY"),
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
-        httpx_client: typing.Optional[httpx.Client] = None
+        httpx_client: typing.Optional[httpx.Client] = None,
+        pool_limits: typing.Optional[httpx.Limits] = None,
+        max_connections_per_host: typing.Optional[int] = None,
+        keepalive_expiry: typing.Optional[float] = None,
+        http2: typing.Optional[bool] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: typing.Optional[typing.Union[str, JsonCodec]] = None,
+        instrumentation: typing.Optional[Instrumentation] = None
     ):
         _defaulted_timeout = timeout if timeout is not None else 60 if httpx_client is None else None
         if api_key is None:
             raise ApiError(
                 body="The client must be instantiated be either passing in api_key or setting LABEL_STUDIO_API_KEY"
             )
+        _limits = (
+            _get_pool_limits(
+                pool_limits=pool_limits,
+                max_connections_per_host=max_connections_per_host,
+                keepalive_expiry=keepalive_expiry,
+            )
+            if httpx_client is None
+            else None
+        )
         self._client_wrapper = SyncClientWrapper(
             base_url=_get_base_url(base_url=base_url, environment=environment),
             api_key=api_key,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.Client(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.Client(timeout=_defaulted_timeout),
+            else httpx.Client(
+                **_get_httpx_client_kwargs(
+                    timeout=_defaulted_timeout, follow_redirects=follow_redirects, limits=_limits, http2=http2
+                )
+            ),
             timeout=_defaulted_timeout,
+            limits=_limits,
+            rate_limiter=rate_limiter,
+            response_mode=response_mode,
+            json_codec=get_json_codec(json_codec),
+            instrumentation=instrumentation,
         )
-        self.annotations = AnnotationsClient(client_wrapper=self._client_wrapper)
-        self.users = UsersClient(client_wrapper=self._client_wrapper)
-        self.actions = ActionsClient(client_wrapper=self._client_wrapper)
-        self.views = ViewsClient(client_wrapper=self._client_wrapper)
-        self.files = FilesClient(client_wrapper=self._client_wrapper)
-        self.projects = ProjectsClient(client_wrapper=self._client_wrapper)
-        self.ml = MlClient(client_wrapper=self._client_wrapper)
-        self.predictions = PredictionsClient(client_wrapper=self._client_wrapper)
-        self.tasks = TasksClient(client_wrapper=self._client_wrapper)
-        self.import_storage = ImportStorageClient(client_wrapper=self._client_wrapper)
-        self.export_storage = ExportStorageClient(client_wrapper=self._client_wrapper)
-        self.webhooks = WebhooksClient(client_wrapper=self._client_wrapper)
-        self.prompts = PromptsClient(client_wrapper=self._client_wrapper)
-        self.model_providers = ModelProvidersClient(client_wrapper=self._client_wrapper)
-        self.comments = CommentsClient(client_wrapper=self._client_wrapper)
-        self.workspaces = WorkspacesClient(client_wrapper=self._client_wrapper)
 
 
 class AsyncLabelStudioBase:
@@ -134,6 +236,30 @@ class AsyncLabelStudioBase:
     httpx_client : typing.Optional[httpx.AsyncClient]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    pool_limits : typing.Optional[httpx.Limits]
+        The connection pool limits of the default httpx client, this is irrelevant if a custom httpx client is passed in. Defaults to the httpx limits (100 connections, 20 of them kept alive).
+
+    max_connections_per_host : typing.Optional[int]
+        Caps the pool at this many connections and keeps all of them alive. The client talks to a single Label Studio host, so this is the number of concurrent connections to it. Overrides the corresponding values of `pool_limits`.
+
+    keepalive_expiry : typing.Optional[float]
+        The number of seconds an idle keep-alive connection stays in the pool. Overrides the corresponding value of `pool_limits`.
+
+    http2 : typing.Optional[bool]
+        Whether the default httpx client negotiates HTTP/2, this requires `pip install httpx[http2]` and is irrelevant if a custom httpx client is passed in.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Limits the rate and concurrency of all the requests made by this client and slows down for everyone when the server throttles. The same limiter can be shared by several clients, sync and async.
+
+    response_mode : ResponseMode
+        How responses are parsed: "model" validates them into pydantic models, "construct" builds the models without validation, "raw" returns plain dicts and lists. Can be overridden per call with `request_options={"response_mode": ...}`.
+
+    json_codec : typing.Optional[typing.Union[str, JsonCodec]]
+        The JSON library used to encode request bodies and decode responses: "json", "ujson", "orjson", "auto" (the fastest one installed) or a JsonCodec instance. By default httpx encodes and decodes with the stdlib.
+
+    instrumentation : typing.Optional[Instrumentation]
+        Receives an event when each request starts, ends and is retried, with its endpoint template, latency and byte counts. Use `MetricsAggregator` for per-endpoint percentiles. Nothing is measured by default.
+
     Examples
     --------
     from label_studio_sdk.client import AsyncLabelStudio
@@ -143,6 +269,45 @@ class AsyncLabelStudioBase:
     )
     """
 
+    annotations: LazySubClient["AsyncAnnotationsClient"] = LazySubClient(
+        "label_studio_sdk.annotations.client", "AsyncAnnotationsClient"
+    )
+    users: LazySubClient["AsyncUsersClient"] = LazySubClient("label_studio_sdk.users.client", "AsyncUsersClient")
+    actions: LazySubClient["AsyncActionsClient"] = LazySubClient(
+        "label_studio_sdk.actions.client", "AsyncActionsClient"
+    )
+    views: LazySubClient["AsyncViewsClient"] = LazySubClient("label_studio_sdk.views.client", "AsyncViewsClient")
+    files: LazySubClient["AsyncFilesClient"] = LazySubClient("label_studio_sdk.files.client", "AsyncFilesClient")
+    projects: LazySubClient["AsyncProjectsClient"] = LazySubClient(
+        "label_studio_sdk.projects.client", "AsyncProjectsClient"
+    )
+    ml: LazySubClient["AsyncMlClient"] = LazySubClient("label_studio_sdk.ml.client", "AsyncMlClient")
+    predictions: LazySubClient["AsyncPredictionsClient"] = LazySubClient(
+        "label_studio_sdk.predictions.client", "AsyncPredictionsClient"
+    )
+    tasks: LazySubClient["AsyncTasksClient"] = LazySubClient("label_studio_sdk.tasks.client", "AsyncTasksClient")
+    import_storage: LazySubClient["AsyncImportStorageClient"] = LazySubClient(
+        "label_studio_sdk.import_storage.client", "AsyncImportStorageClient"
+    )
+    export_storage: LazySubClient["AsyncExportStorageClient"] = LazySubClient(
+        "label_studio_sdk.export_storage.client", "AsyncExportStorageClient"
+    )
+    webhooks: LazySubClient["AsyncWebhooksClient"] = LazySubClient(
+        "label_studio_sdk.webhooks.client", "AsyncWebhooksClient"
+    )
+    prompts: LazySubClient["AsyncPromptsClient"] = LazySubClient(
+        "label_studio_sdk.prompts.client", "AsyncPromptsClient"
+    )
+    model_providers: LazySubClient["AsyncModelProvidersClient"] = LazySubClient(
+        "label_studio_sdk.model_providers.client", "AsyncModelProvidersClient"
+    )
+    comments: LazySubClient["AsyncCommentsClient"] = LazySubClient(
+        "label_studio_sdk.comments.client", "AsyncCommentsClient"
+    )
+    workspaces: LazySubClient["AsyncWorkspacesClient"] = LazySubClient(
+        "label_studio_sdk.workspaces.client", "AsyncWorkspacesClient"
+    )
+
     def __init__(
         self,
         *,
@@ -151,39 +316,47 @@ class AsyncLabelStudioBase:
         api_key: typing.Optional[str] = os.getenv("LABEL_STUDIO_API_KEY"),
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
-        httpx_client: typing.Optional[httpx.AsyncClient] = None
+        httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        pool_limits: typing.Optional[httpx.Limits] = None,
+        max_connections_per_host: typing.Optional[int] = None,
+        keepalive_expiry: typing.Optional[float] = None,
+        http2: typing.Optional[bool] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: typing.Optional[typing.Union[str, JsonCodec]] = None,
+        instrumentation: typing.Optional[Instrumentation] = None
     ):
         _defaulted_timeout = timeout if timeout is not None else 60 if httpx_client is None else None
         if api_key is None:
             raise ApiError(
                 body="The client must be instantiated be either passing in api_key or setting LABEL_STUDIO_API_KEY"
             )
+        _limits = (
+            _get_pool_limits(
+                pool_limits=pool_limits,
+                max_connections_per_host=max_connections_per_host,
+                keepalive_expiry=keepalive_expiry,
+            )
+            if httpx_client is None
+            else None
+        )
         self._client_wrapper = AsyncClientWrapper(
             base_url=_get_base_url(base_url=base_url, environment=environment),
             api_key=api_key,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout),
+            else httpx.AsyncClient(
+                **_get_httpx_client_kwargs(
+                    timeout=_defaulted_timeout, follow_redirects=follow_redirects, limits=_limits, http2=http2
+                )
+            ),
             timeout=_defaulted_timeout,
+            limits=_limits,
+            rate_limiter=rate_limiter,
+            response_mode=response_mode,
+            json_codec=get_json_codec(json_codec),
+            instrumentation=instrumentation,
         )
-        self.annotations = AsyncAnnotationsClient(client_wrapper=self._client_wrapper)
-        self.users = AsyncUsersClient(client_wrapper=self._client_wrapper)
-        self.actions = AsyncActionsClient(client_wrapper=self._client_wrapper)
-        self.views = AsyncViewsClient(client_wrapper=self._client_wrapper)
-        self.files = AsyncFilesClient(client_wrapper=self._client_wrapper)
-        self.projects = AsyncProjectsClient(client_wrapper=self._client_wrapper)
-        self.ml = AsyncMlClient(client_wrapper=self._client_wrapper)
-        self.predictions = AsyncPredictionsClient(client_wrapper=self._client_wrapper)
-        self.tasks = AsyncTasksClient(client_wrapper=self._client_wrapper)
-        self.import_storage = AsyncImportStorageClient(client_wrapper=self._client_wrapper)
-        self.export_storage = AsyncExportStorageClient(client_wrapper=self._client_wrapper)
-        self.webhooks = AsyncWebhooksClient(client_wrapper=self._client_wrapper)
-        self.prompts = AsyncPromptsClient(client_wrapper=self._client_wrapper)
-        self.model_providers = AsyncModelProvidersClient(client_wrapper=self._client_wrapper)
-        self.comments = AsyncCommentsClient(client_wrapper=self._client_wrapper)
-        self.workspaces = AsyncWorkspacesClient(client_wrapper=self._client_wrapper)
 
 
 def _get_base_url(*, base_url: typing.Optional[str] = None, environment: LabelStudioEnvironment) -> str:
@@ -193,3 +366,43 @@ def _get_base_url(*, base_url: typing.Optional[str] = None, environment: LabelSt
         return environment.value
     else:
         raise Exception("Please pass in either base_url or environment to construct the client")
+
+
+def _get_pool_limits(
+    *,
+    pool_limits: typing.Optional[httpx.Limits] = None,
+    max_connections_per_host: typing.Optional[int] = None,
+    keepalive_expiry: typing.Optional[float] = None,
+) -> typing.Optional[httpx.Limits]:
+    if pool_limits is None and max_connections_per_host is None and keepalive_expiry is None:
+        return None
+    limits = pool_limits if pool_limits is not None else DEFAULT_POOL_LIMITS
+    max_connections = limits.max_connections
+    max_keepalive_connections = limits.max_keepalive_connections
+    if max_connections_per_host is not None:
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be a positive integer")
+        # all the connections go to the same Label Studio host, keeping them alive avoids reconnecting under load
+        max_connections = max_keepalive_connections = max_connections_per_host
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else limits.keepalive_expiry,
+    )
+
+
+def _get_httpx_client_kwargs(
+    *,
+    timeout: typing.Optional[float],
+    follow_redirects: typing.Optional[bool],
+    limits: typing.Optional[httpx.Limits],
+    http2: typing.Optional[bool],
+) -> typing.Dict[str, typing.Any]:
+    kwargs: typing.Dict[str, typing.Any] = {"timeout": timeout}
+    if follow_redirects is not None:
+        kwargs["follow_redirects"] = follow_redirects
+    if limits is not None:
+        kwargs["limits"] = limits
+    if http2:
+        kwargs["http2"] = True
+    return kwargs
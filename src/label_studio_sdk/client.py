@@ -1,25 +1,136 @@
-from .base_client import LabelStudioBase, AsyncLabelStudioBase
-from .tasks.client_ext import TasksClientExt, AsyncTasksClientExt
-from .projects.client_ext import ProjectsClientExt, AsyncProjectsClientExt
+import typing
+
+from .base_client import LabelStudioBase, AsyncLabelStudioBase, LazySubClient
+from ._extensions.batch import AsyncBatchExecutor, BatchExecutor, BatchProgress
+
+if typing.TYPE_CHECKING:
+    from .tasks.client_ext import TasksClientExt, AsyncTasksClientExt
+    from .projects.client_ext import ProjectsClientExt, AsyncProjectsClientExt
+    from .predictions.client_ext import PredictionsClientExt, AsyncPredictionsClientExt
+    from .actions.client_ext import ActionsClientExt, AsyncActionsClientExt
 
 
 class LabelStudio(LabelStudioBase):
     """"""
+
     __doc__ += LabelStudioBase.__doc__
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    tasks: LazySubClient["TasksClientExt"] = LazySubClient(
+        "label_studio_sdk.tasks.client_ext", "TasksClientExt"
+    )
+    projects: LazySubClient["ProjectsClientExt"] = LazySubClient(
+        "label_studio_sdk.projects.client_ext", "ProjectsClientExt"
+    )
+    predictions: LazySubClient["PredictionsClientExt"] = LazySubClient(
+        "label_studio_sdk.predictions.client_ext", "PredictionsClientExt"
+    )
+    actions: LazySubClient["ActionsClientExt"] = LazySubClient(
+        "label_studio_sdk.actions.client_ext", "ActionsClientExt"
+    )
+
+    def batch(
+        self,
+        *,
+        concurrency: int = 8,
+        max_pending: typing.Optional[int] = None,
+        max_retries: int = 2,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+    ) -> BatchExecutor:
+        """
+        Run many independent calls of this client in a thread pool, e.g. `predictions.create` for every task.
+
+        Parameters
+        ----------
+        concurrency : int
+            The number of calls running at the same time, keep it below the connection pool size.
+
+        max_pending : typing.Optional[int]
+            The number of calls queued or running before `submit()` blocks, twice the concurrency by default.
+
+        max_retries : int
+            Passed as `request_options["max_retries"]` to the calls that don't set it, so that 429 and 5xx responses
+            are retried. Connection errors and timeouts are retried as many times by the batch.
+
+        on_progress : typing.Optional[typing.Callable[[BatchProgress], None]]
+            Called from the worker threads after every call with the submitted, completed and failed counts.
 
-        self.tasks = TasksClientExt(client_wrapper=self._client_wrapper)
-        self.projects = ProjectsClientExt(client_wrapper=self._client_wrapper)
+        Returns
+        -------
+        BatchExecutor
+
+        Examples
+        --------
+        with client.batch(concurrency=16) as batch:
+            for task in tasks:
+                batch.submit(client.predictions.create, task=task.id, result=[...], model_version="v1")
+        failed = [result for result in batch.results if not result.ok]
+        """
+        return BatchExecutor(
+            concurrency=concurrency,
+            max_pending=max_pending,
+            max_retries=max_retries,
+            on_progress=on_progress,
+        )
 
 
 class AsyncLabelStudio(AsyncLabelStudioBase):
     """"""
+
     __doc__ += AsyncLabelStudioBase.__doc__
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    tasks: LazySubClient["AsyncTasksClientExt"] = LazySubClient(
+        "label_studio_sdk.tasks.client_ext", "AsyncTasksClientExt"
+    )
+    projects: LazySubClient["AsyncProjectsClientExt"] = LazySubClient(
+        "label_studio_sdk.projects.client_ext", "AsyncProjectsClientExt"
+    )
+    predictions: LazySubClient["AsyncPredictionsClientExt"] = LazySubClient(
+        "label_studio_sdk.predictions.client_ext", "AsyncPredictionsClientExt"
+    )
+    actions: LazySubClient["AsyncActionsClientExt"] = LazySubClient(
+        "label_studio_sdk.actions.client_ext", "AsyncActionsClientExt"
+    )
+
+    def batch(
+        self,
+        *,
+        concurrency: int = 8,
+        max_pending: typing.Optional[int] = None,
+        max_retries: int = 2,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+    ) -> AsyncBatchExecutor:
+        """
+        Run many independent calls of this client concurrently, e.g. `predictions.create` for every task.
+
+        Parameters
+        ----------
+        concurrency : int
+            The number of calls running at the same time, keep it below the connection pool size.
+
+        max_pending : typing.Optional[int]
+            The number of calls scheduled before `await submit()` waits, twice the concurrency by default.
+
+        max_retries : int
+            Passed as `request_options["max_retries"]` to the calls that don't set it, so that 429 and 5xx responses
+            are retried. Connection errors and timeouts are retried as many times by the batch.
+
+        on_progress : typing.Optional[typing.Callable[[BatchProgress], None]]
+            Called after every call with the submitted, completed and failed counts.
+
+        Returns
+        -------
+        AsyncBatchExecutor
 
-        self.tasks = AsyncTasksClientExt(client_wrapper=self._client_wrapper)
-        self.projects = AsyncProjectsClientExt(client_wrapper=self._client_wrapper)
+        Examples
+        --------
+        async with client.batch(concurrency=16) as batch:
+            for task in tasks:
+                await batch.submit(client.predictions.create, task=task.id, result=[...], model_version="v1")
+        failed = [result for result in batch.results if not result.ok]
+        """
+        return AsyncBatchExecutor(
+            concurrency=concurrency,
+            max_pending=max_pending,
+            max_retries=max_retries,
+            on_progress=on_progress,
+        )
@@ -5,12 +5,16 @@ from .client_wrapper import AsyncClientWrapper, BaseClientWrapper, SyncClientWra
 from .datetime_utils import serialize_datetime
 from .file import File, convert_file_dict_to_httpx_tuples
 from .http_client import AsyncHttpClient, HttpClient
+from .instrumentation import Instrumentation, MetricsAggregator, ProjectionEvent, RequestEvent
+from .json_codec import JsonCodec, OrjsonCodec, StdlibJsonCodec, UjsonCodec
 from .jsonable_encoder import jsonable_encoder
 from .pagination import AsyncPager, SyncPager
 from .pydantic_utilities import deep_union_pydantic_dicts, pydantic_v1
 from .query_encoder import encode_query
+from .rate_limiter import RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
 from .request_options import RequestOptions
+from .response_mode import ResponseMode
 
 __all__ = [
     "ApiError",
@@ -20,9 +24,19 @@ __all__ = [
     "BaseClientWrapper",
     "File",
     "HttpClient",
+    "Instrumentation",
+    "JsonCodec",
+    "MetricsAggregator",
+    "OrjsonCodec",
+    "ProjectionEvent",
+    "RateLimiter",
+    "RequestEvent",
     "RequestOptions",
+    "ResponseMode",
+    "StdlibJsonCodec",
     "SyncClientWrapper",
     "SyncPager",
+    "UjsonCodec",
     "convert_file_dict_to_httpx_tuples",
     "deep_union_pydantic_dicts",
     "encode_query",
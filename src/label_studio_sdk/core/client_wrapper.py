@@ -5,13 +5,28 @@ import typing
 import httpx
 
 from .http_client import AsyncHttpClient, HttpClient
+from .instrumentation import Instrumentation
+from .json_codec import JsonCodec
+from .rate_limiter import RateLimiter
+from .request_options import RequestOptions
+from .response_mode import ResponseMode, check_response_mode, parse_obj_as
 
 
 class BaseClientWrapper:
-    def __init__(self, *, api_key: str, base_url: str, timeout: typing.Optional[float] = None):
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        base_url: str,
+        timeout: typing.Optional[float] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: typing.Optional[JsonCodec] = None,
+    ):
         self.api_key = api_key
         self._base_url = base_url
         self._timeout = timeout
+        self._response_mode = check_response_mode(response_mode)
+        self._json_codec = json_codec
 
     def get_headers(self) -> typing.Dict[str, str]:
         headers: typing.Dict[str, str] = {
@@ -28,28 +43,75 @@ class BaseClientWrapper:
     def get_timeout(self) -> typing.Optional[float]:
         return self._timeout
 
+    def get_response_mode(self, request_options: typing.Optional[RequestOptions] = None) -> ResponseMode:
+        if request_options is not None and request_options.get("response_mode") is not None:
+            return check_response_mode(request_options["response_mode"])
+        return self._response_mode
+
+    def parse_response(
+        self, type_: typing.Any, response: httpx.Response, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.Any:
+        return parse_obj_as(type_, self.decode_response(response), mode=self.get_response_mode(request_options))
+
+    def decode_response(self, response: httpx.Response) -> typing.Any:
+        return response.json() if self._json_codec is None else self._json_codec.loads(response.content)
+
 
 class SyncClientWrapper(BaseClientWrapper):
     def __init__(
-        self, *, api_key: str, base_url: str, timeout: typing.Optional[float] = None, httpx_client: httpx.Client
+        self,
+        *,
+        api_key: str,
+        base_url: str,
+        timeout: typing.Optional[float] = None,
+        httpx_client: httpx.Client,
+        limits: typing.Optional[httpx.Limits] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: typing.Optional[JsonCodec] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
     ):
-        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_key=api_key, base_url=base_url, timeout=timeout, response_mode=response_mode, json_codec=json_codec
+        )
         self.httpx_client = HttpClient(
             httpx_client=httpx_client,
             base_headers=self.get_headers(),
             base_timeout=self.get_timeout(),
             base_url=self.get_base_url(),
+            limits=limits,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            response_mode=self._response_mode,
         )
 
 
 class AsyncClientWrapper(BaseClientWrapper):
     def __init__(
-        self, *, api_key: str, base_url: str, timeout: typing.Optional[float] = None, httpx_client: httpx.AsyncClient
+        self,
+        *,
+        api_key: str,
+        base_url: str,
+        timeout: typing.Optional[float] = None,
+        httpx_client: httpx.AsyncClient,
+        limits: typing.Optional[httpx.Limits] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: typing.Optional[JsonCodec] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
     ):
-        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_key=api_key, base_url=base_url, timeout=timeout, response_mode=response_mode, json_codec=json_codec
+        )
         self.httpx_client = AsyncHttpClient(
             httpx_client=httpx_client,
             base_headers=self.get_headers(),
             base_timeout=self.get_timeout(),
             base_url=self.get_base_url(),
+            limits=limits,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            response_mode=self._response_mode,
         )
@@ -2,6 +2,7 @@
 
 import asyncio
 import email.utils
+import functools
 import json
 import re
 import time
@@ -13,10 +14,15 @@ from random import random
 import httpx
 
 from .file import File, convert_file_dict_to_httpx_tuples
+from .instrumentation import Instrumentation, instrumented
+from .json_codec import JsonCodec
 from .jsonable_encoder import jsonable_encoder
 from .query_encoder import encode_query
+from .rate_limiter import RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
 from .request_options import RequestOptions
+from .pydantic_utilities import parse_decoded_in_mode
+from .response_mode import ResponseMode, check_response_mode
 
 INITIAL_RETRY_DELAY_SECONDS = 0.5
 MAX_RETRY_DELAY_SECONDS = 10
@@ -32,7 +38,8 @@ def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float
     retry_after_ms = response_headers.get("retry-after-ms")
     if retry_after_ms is not None:
         try:
-            return int(retry_after_ms) / 1000 if retry_after_ms > 0 else 0
+            retry_after_ms_value = int(retry_after_ms)
+            return retry_after_ms_value / 1000 if retry_after_ms_value > 0 else 0
         except Exception:
             pass
 
@@ -89,6 +96,85 @@ def _should_retry(response: httpx.Response) -> bool:
     return response.status_code >= 500 or response.status_code in retriable_400s
 
 
+def _record_response(rate_limiter: RateLimiter, started: float) -> typing.Callable[[httpx.Response], None]:
+    def record_response(response: httpx.Response) -> None:
+        rate_limiter.record(
+            status_code=response.status_code,
+            retry_after=_parse_retry_after(response.headers),
+            latency=time.monotonic() - started,
+        )
+
+    return record_response
+
+
+def _ignore_response(response: httpx.Response) -> None:
+    pass
+
+
+@contextmanager
+def _rate_limited(
+    rate_limiter: typing.Optional[RateLimiter],
+) -> typing.Iterator[typing.Callable[[httpx.Response], None]]:
+    """
+    Holds a slot of the rate limiter for the duration of a request and yields the callback that reports its response.
+    """
+    if rate_limiter is None:
+        yield _ignore_response
+        return
+    rate_limiter.acquire()
+    try:
+        yield _record_response(rate_limiter, time.monotonic())
+    finally:
+        rate_limiter.release()
+
+
+@asynccontextmanager
+async def _rate_limited_async(
+    rate_limiter: typing.Optional[RateLimiter],
+) -> typing.AsyncIterator[typing.Callable[[httpx.Response], None]]:
+    if rate_limiter is None:
+        yield _ignore_response
+        return
+    await rate_limiter.acquire_async()
+    try:
+        yield _record_response(rate_limiter, time.monotonic())
+    finally:
+        rate_limiter.release()
+
+
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json_body(
+    json_body: typing.Optional[typing.Any], json_codec: typing.Optional[JsonCodec]
+) -> typing.Tuple[typing.Optional[typing.Any], typing.Optional[bytes]]:
+    # returns the body to pass to httpx as `json`, or the body encoded with the client codec to pass as `content`
+    if json_codec is None or json_body is None:
+        return json_body, None
+    return None, json_codec.dumps(json_body)
+
+
+def _prepare_response(
+    response: httpx.Response,
+    request_options: typing.Optional[RequestOptions],
+    response_mode: ResponseMode,
+    json_codec: typing.Optional[JsonCodec],
+) -> httpx.Response:
+    # the generated clients decode the response with `response.json()` and parse it with `pydantic_v1.parse_obj_as`,
+    # both follow the client and request options
+    if request_options is not None and request_options.get("response_mode") is not None:
+        response_mode = check_response_mode(request_options["response_mode"])
+    decode = response.json if json_codec is None else functools.partial(json_codec.loads, response.content)
+    if response_mode != "model":
+        decode = functools.partial(_decode_in_mode, decode, response_mode)
+    response.json = decode  # type: ignore
+    return response
+
+
+def _decode_in_mode(decode: typing.Callable[..., typing.Any], mode: ResponseMode, **kwargs: typing.Any) -> typing.Any:
+    return parse_decoded_in_mode(decode(**kwargs), mode)
+
+
 def remove_omit_from_dict(
     original: typing.Dict[str, typing.Optional[typing.Any]], omit: typing.Optional[typing.Any]
 ) -> typing.Dict[str, typing.Any]:
@@ -101,6 +187,10 @@ def remove_omit_from_dict(
     return new
 
 
+def _as_is(obj: typing.Any) -> typing.Any:
+    return obj
+
+
 def maybe_filter_request_body(
     data: typing.Optional[typing.Any],
     request_options: typing.Optional[RequestOptions],
@@ -112,11 +202,13 @@ def maybe_filter_request_body(
             if request_options is not None
             else None
         )
-    elif not isinstance(data, typing.Mapping):
-        data_content = jsonable_encoder(data)
+    # the caller vouches that the body is already JSON-native, see RequestOptions.encode_body
+    encode = jsonable_encoder if request_options is None or request_options.get("encode_body", True) else _as_is
+    if not isinstance(data, typing.Mapping):
+        data_content = encode(data)
     else:
         data_content = {
-            **(jsonable_encoder(remove_omit_from_dict(data, omit))),  # type: ignore
+            **(encode(remove_omit_from_dict(data, omit))),  # type: ignore
             **(
                 jsonable_encoder(request_options.get("additional_body_parameters", {}))
                 if request_options is not None
@@ -153,11 +245,23 @@ class HttpClient:
         base_timeout: typing.Optional[float],
         base_headers: typing.Dict[str, str],
         base_url: typing.Optional[str] = None,
+        limits: typing.Optional[httpx.Limits] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
+        response_mode: ResponseMode = "model",
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.httpx_client = httpx_client
+        # connection pool limits of the httpx client when the SDK built it, None for custom clients
+        self.limits = limits
+        self.rate_limiter = rate_limiter
+        # None leaves the encoding of json bodies to httpx
+        self.json_codec = json_codec
+        self.instrumentation = instrumentation
+        self.response_mode = response_mode
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = self.base_url if maybe_base_url is None else maybe_base_url
@@ -189,47 +293,60 @@ class HttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        json_body, json_content = _encode_json_body(json_body, self.json_codec)
 
-        response = self.httpx_client.request(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers,
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
+        with _rate_limited(self.rate_limiter) as record_response:
+            with instrumented(self.instrumentation, method, path, retries) as observe_response:
+                response = self.httpx_client.request(
+                    method=method,
+                    url=urllib.parse.urljoin(f"{base_url}/", path),
+                    headers=jsonable_encoder(
+                        remove_none_from_dict(
                             {
-                                **(params if params is not None else {}),
+                                **self.base_headers,
+                                **(JSON_CONTENT_HEADERS if json_content is not None else {}),
+                                **(headers if headers is not None else {}),
                                 **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
+                                    request_options.get("additional_headers", {}) if request_options is not None else {}
                                 ),
-                            },
-                            omit,
+                            }
                         )
-                    )
+                    ),
+                    params=encode_query(
+                        jsonable_encoder(
+                            remove_none_from_dict(
+                                remove_omit_from_dict(
+                                    {
+                                        **(params if params is not None else {}),
+                                        **(
+                                            request_options.get("additional_query_parameters", {})
+                                            if request_options is not None
+                                            else {}
+                                        ),
+                                    },
+                                    omit,
+                                )
+                            )
+                        )
+                    ),
+                    json=json_body,
+                    data=data_body,
+                    content=json_content if json_content is not None else content,
+                    files=(
+                        convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None
+                    ),
+                    timeout=timeout,
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None,
-            timeout=timeout,
-        )
+                record_response(response)
+                observe_response(response)
 
         max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
         if _should_retry(response=response):
             if max_retries > retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
+                delay = _retry_timeout(response=response, retries=retries)
+                if self.instrumentation is not None and observe_response.event is not None:
+                    self.instrumentation.on_retry(observe_response.event, delay=delay)
+                time.sleep(delay)
                 return self.request(
                     path=path,
                     method=method,
@@ -244,7 +361,7 @@ class HttpClient:
                     omit=omit,
                 )
 
-        return response
+        return _prepare_response(response, request_options, self.response_mode, self.json_codec)
 
     @contextmanager
     def stream(
@@ -271,43 +388,53 @@ class HttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        json_body, json_content = _encode_json_body(json_body, self.json_codec)
 
-        with self.httpx_client.stream(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers,
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
+        with _rate_limited(self.rate_limiter) as record_response:
+            with instrumented(self.instrumentation, method, path, retries) as observe_response:
+                with self.httpx_client.stream(
+                    method=method,
+                    url=urllib.parse.urljoin(f"{base_url}/", path),
+                    headers=jsonable_encoder(
+                        remove_none_from_dict(
                             {
-                                **(params if params is not None else {}),
+                                **self.base_headers,
+                                **(JSON_CONTENT_HEADERS if json_content is not None else {}),
+                                **(headers if headers is not None else {}),
                                 **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
+                                    request_options.get("additional_headers", {}) if request_options is not None else {}
                                 ),
-                            },
-                            omit,
+                            }
                         )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None,
-            timeout=timeout,
-        ) as stream:
-            yield stream
+                    ),
+                    params=encode_query(
+                        jsonable_encoder(
+                            remove_none_from_dict(
+                                remove_omit_from_dict(
+                                    {
+                                        **(params if params is not None else {}),
+                                        **(
+                                            request_options.get("additional_query_parameters", {})
+                                            if request_options is not None
+                                            else {}
+                                        ),
+                                    },
+                                    omit,
+                                )
+                            )
+                        )
+                    ),
+                    json=json_body,
+                    data=data_body,
+                    content=json_content if json_content is not None else content,
+                    files=(
+                        convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None
+                    ),
+                    timeout=timeout,
+                ) as stream:
+                    record_response(stream)
+                    observe_response(stream)
+                    yield stream
 
 
 class AsyncHttpClient:
@@ -318,11 +445,23 @@ class AsyncHttpClient:
         base_timeout: typing.Optional[float],
         base_headers: typing.Dict[str, str],
         base_url: typing.Optional[str] = None,
+        limits: typing.Optional[httpx.Limits] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
+        response_mode: ResponseMode = "model",
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.httpx_client = httpx_client
+        # connection pool limits of the httpx client when the SDK built it, None for custom clients
+        self.limits = limits
+        self.rate_limiter = rate_limiter
+        # None leaves the encoding of json bodies to httpx
+        self.json_codec = json_codec
+        self.instrumentation = instrumentation
+        self.response_mode = response_mode
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = self.base_url if maybe_base_url is None else maybe_base_url
@@ -354,48 +493,61 @@ class AsyncHttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        json_body, json_content = _encode_json_body(json_body, self.json_codec)
 
         # Add the input to each of these and do None-safety checks
-        response = await self.httpx_client.request(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers,
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
+        async with _rate_limited_async(self.rate_limiter) as record_response:
+            with instrumented(self.instrumentation, method, path, retries) as observe_response:
+                response = await self.httpx_client.request(
+                    method=method,
+                    url=urllib.parse.urljoin(f"{base_url}/", path),
+                    headers=jsonable_encoder(
+                        remove_none_from_dict(
                             {
-                                **(params if params is not None else {}),
+                                **self.base_headers,
+                                **(JSON_CONTENT_HEADERS if json_content is not None else {}),
+                                **(headers if headers is not None else {}),
                                 **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
+                                    request_options.get("additional_headers", {}) if request_options is not None else {}
                                 ),
-                            },
-                            omit,
+                            }
                         )
-                    )
+                    ),
+                    params=encode_query(
+                        jsonable_encoder(
+                            remove_none_from_dict(
+                                remove_omit_from_dict(
+                                    {
+                                        **(params if params is not None else {}),
+                                        **(
+                                            request_options.get("additional_query_parameters", {})
+                                            if request_options is not None
+                                            else {}
+                                        ),
+                                    },
+                                    omit,
+                                )
+                            )
+                        )
+                    ),
+                    json=json_body,
+                    data=data_body,
+                    content=json_content if json_content is not None else content,
+                    files=(
+                        convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None
+                    ),
+                    timeout=timeout,
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None,
-            timeout=timeout,
-        )
+                record_response(response)
+                observe_response(response)
 
         max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
         if _should_retry(response=response):
             if max_retries > retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
+                delay = _retry_timeout(response=response, retries=retries)
+                if self.instrumentation is not None and observe_response.event is not None:
+                    self.instrumentation.on_retry(observe_response.event, delay=delay)
+                await asyncio.sleep(delay)
                 return await self.request(
                     path=path,
                     method=method,
@@ -409,7 +561,7 @@ class AsyncHttpClient:
                     retries=retries + 1,
                     omit=omit,
                 )
-        return response
+        return _prepare_response(response, request_options, self.response_mode, self.json_codec)
 
     @asynccontextmanager
     async def stream(
@@ -436,40 +588,50 @@ class AsyncHttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        json_body, json_content = _encode_json_body(json_body, self.json_codec)
 
-        async with self.httpx_client.stream(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers,
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
+        async with _rate_limited_async(self.rate_limiter) as record_response:
+            with instrumented(self.instrumentation, method, path, retries) as observe_response:
+                async with self.httpx_client.stream(
+                    method=method,
+                    url=urllib.parse.urljoin(f"{base_url}/", path),
+                    headers=jsonable_encoder(
+                        remove_none_from_dict(
                             {
-                                **(params if params is not None else {}),
+                                **self.base_headers,
+                                **(JSON_CONTENT_HEADERS if json_content is not None else {}),
+                                **(headers if headers is not None else {}),
                                 **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
+                                    request_options.get("additional_headers", {}) if request_options is not None else {}
                                 ),
-                            },
-                            omit=omit,
+                            }
                         )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None,
-            timeout=timeout,
-        ) as stream:
-            yield stream
+                    ),
+                    params=encode_query(
+                        jsonable_encoder(
+                            remove_none_from_dict(
+                                remove_omit_from_dict(
+                                    {
+                                        **(params if params is not None else {}),
+                                        **(
+                                            request_options.get("additional_query_parameters", {})
+                                            if request_options is not None
+                                            else {}
+                                        ),
+                                    },
+                                    omit=omit,
+                                )
+                            )
+                        )
+                    ),
+                    json=json_body,
+                    data=data_body,
+                    content=json_content if json_content is not None else content,
+                    files=(
+                        convert_file_dict_to_httpx_tuples(remove_none_from_dict(files)) if files is not None else None
+                    ),
+                    timeout=timeout,
+                ) as stream:
+                    record_response(stream)
+                    observe_response(stream)
+                    yield stream
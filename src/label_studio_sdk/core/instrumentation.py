@@ -0,0 +1,310 @@
+"""
+Instrumentation of the requests made by the SDK.
+
+Pass an `Instrumentation` to the client to receive an event when each request starts, ends and is retried,
+and when a response is trimmed to the fields selected with `tasks.list(select=...)`.
+`MetricsAggregator` is a built-in implementation that keeps per-endpoint counters and latency histograms.
+Nothing is measured when no instrumentation is set.
+"""
+
+import dataclasses
+import functools
+import json
+import math
+import re
+import threading
+import time
+import typing
+from contextlib import contextmanager
+
+import httpx
+
+_NUMERIC_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)|^\d+(?=/|$)")
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(path: typing.Optional[str]) -> str:
+    """The path of a request with its numeric ids replaced: "api/projects/1/import" -> "api/projects/{id}/import"."""
+    if not path:
+        return ""
+    return _NUMERIC_SEGMENT.sub("{id}", path.split("?", 1)[0])
+
+
+@dataclasses.dataclass(frozen=True)
+class RequestEvent:
+    """
+    A request that ended, with a response or an error.
+
+    `attempt` is 0 for the first try and counts the retries. `elapsed` is measured in seconds until the response
+    was read, or until the stream was closed for streamed responses. The byte counts are those sent and received
+    over the wire, compressed if the server compressed the response.
+    """
+
+    method: str
+    endpoint: str
+    path: str
+    attempt: int
+    status_code: typing.Optional[int]
+    elapsed: float
+    bytes_sent: int
+    bytes_received: int
+    error: typing.Optional[BaseException] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectionEvent:
+    """
+    A response trimmed on the client to the selected fields. `bytes_received` is the size of the response body and
+    `bytes_selected` the size of the JSON that was kept, what the server didn't drop itself.
+    """
+
+    method: str
+    endpoint: str
+    path: str
+    items: int
+    bytes_received: int
+    bytes_selected: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_received - self.bytes_selected
+
+
+class Instrumentation:
+    """
+    Receives the events of the requests made by the SDK, subclass it and override the hooks you need.
+    The hooks are called from the thread or task that makes the request and must be fast.
+    """
+
+    def on_request_start(
+        self, *, method: str, endpoint: str, path: str, attempt: int
+    ) -> None:
+        pass
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        pass
+
+    def on_retry(self, event: RequestEvent, *, delay: float) -> None:
+        pass
+
+    def on_projection(self, event: ProjectionEvent) -> None:
+        pass
+
+
+class _Observation:
+    # the response of the request being instrumented, and its event once the request ended
+
+    __slots__ = ("response", "event")
+
+    def __init__(self) -> None:
+        self.response: typing.Optional[httpx.Response] = None
+        self.event: typing.Optional[RequestEvent] = None
+
+    def __call__(self, response: httpx.Response) -> None:
+        self.response = response
+
+
+_NOT_OBSERVED = _Observation()
+
+
+def _bytes_sent(response: typing.Optional[httpx.Response]) -> int:
+    if response is None:
+        return 0
+    content_length = response.request.headers.get("content-length")
+    return int(content_length) if content_length is not None else 0
+
+
+def _bytes_received(response: typing.Optional[httpx.Response]) -> int:
+    if response is None:
+        return 0
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    # responses that were not downloaded, e.g. built in memory by a mock transport
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
+
+
+@contextmanager
+def instrumented(
+    instrumentation: typing.Optional[Instrumentation],
+    method: str,
+    path: typing.Optional[str],
+    attempt: int,
+) -> typing.Iterator[_Observation]:
+    """
+    Reports the request made in the block, which passes the response to the yielded callback.
+    """
+    if instrumentation is None:
+        yield _NOT_OBSERVED
+        return
+    path = path or ""
+    endpoint = endpoint_template(path)
+    instrumentation.on_request_start(
+        method=method, endpoint=endpoint, path=path, attempt=attempt
+    )
+    observation = _Observation()
+    error: typing.Optional[BaseException] = None
+    started = time.perf_counter()
+    try:
+        yield observation
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        response = observation.response
+        observation.event = RequestEvent(
+            method=method,
+            endpoint=endpoint,
+            path=path,
+            attempt=attempt,
+            status_code=response.status_code if response is not None else None,
+            elapsed=time.perf_counter() - started,
+            bytes_sent=_bytes_sent(response),
+            bytes_received=_bytes_received(response),
+            error=error,
+        )
+        instrumentation.on_request_end(observation.event)
+
+
+class LatencyHistogram:
+    """
+    Log-scale histogram of durations in seconds. Percentiles are accurate within `growth` (5% by default)
+    and the memory does not depend on the number of samples.
+    """
+
+    def __init__(self, min_value: float = 1e-4, growth: float = 1.05) -> None:
+        self.min_value = min_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.buckets: typing.Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        index = (
+            0
+            if value <= self.min_value
+            else math.ceil(math.log(value / self.min_value) / self._log_growth)
+        )
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """The upper bound of the bucket holding the q-th percentile (0 < q <= 100)."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(q / 100 * self.count)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.min_value * self.growth**index, self.max)
+        return self.max
+
+
+@dataclasses.dataclass
+class EndpointMetrics:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    bytes_trimmed: int = 0
+    status_codes: typing.Dict[int, int] = dataclasses.field(default_factory=dict)
+    latency: LatencyHistogram = dataclasses.field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "bytes_trimmed": self.bytes_trimmed,
+            "status_codes": {
+                str(code): count for code, count in sorted(self.status_codes.items())
+            },
+            "latency_ms": {
+                "mean": (
+                    round(self.latency.total / self.latency.count * 1000, 3)
+                    if self.latency.count
+                    else 0.0
+                ),
+                "p50": round(self.latency.percentile(50) * 1000, 3),
+                "p95": round(self.latency.percentile(95) * 1000, 3),
+                "p99": round(self.latency.percentile(99) * 1000, 3),
+                "max": round(self.latency.max * 1000, 3),
+            },
+        }
+
+
+class MetricsAggregator(Instrumentation):
+    """
+    Aggregates the requests per endpoint ("METHOD template"), it can be shared by several clients.
+
+    Examples
+    --------
+    from label_studio_sdk.client import LabelStudio
+    from label_studio_sdk.core import MetricsAggregator
+
+    metrics = MetricsAggregator()
+    client = LabelStudio(api_key="YOUR_API_KEY", instrumentation=metrics)
+    ...
+    print(metrics.to_json(indent=2))
+    """
+
+    def __init__(self) -> None:
+        self.endpoints: typing.Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _metrics(self, method: str, endpoint: str) -> EndpointMetrics:
+        key = f"{method} {endpoint}"
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints.setdefault(key, EndpointMetrics())
+        return metrics
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event.method, event.endpoint)
+            metrics.requests += 1
+            metrics.bytes_sent += event.bytes_sent
+            metrics.bytes_received += event.bytes_received
+            metrics.latency.add(event.elapsed)
+            if event.status_code is not None:
+                metrics.status_codes[event.status_code] = (
+                    metrics.status_codes.get(event.status_code, 0) + 1
+                )
+            if event.error is not None or (
+                event.status_code is not None and event.status_code >= 400
+            ):
+                metrics.errors += 1
+
+    def on_retry(self, event: RequestEvent, *, delay: float) -> None:
+        with self._lock:
+            self._metrics(event.method, event.endpoint).retries += 1
+
+    def on_projection(self, event: ProjectionEvent) -> None:
+        with self._lock:
+            self._metrics(
+                event.method, event.endpoint
+            ).bytes_trimmed += event.bytes_saved
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints = {}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        with self._lock:
+            return {
+                key: metrics.to_dict()
+                for key, metrics in sorted(self.endpoints.items())
+            }
+
+    def to_json(self, **kwargs: typing.Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
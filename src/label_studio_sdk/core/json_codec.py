@@ -0,0 +1,120 @@
+"""
+JSON codecs used to encode request bodies and decode responses.
+
+The stdlib codec is the default, `ujson` is a dependency of the SDK and `orjson` is used when installed.
+"""
+
+import json
+import typing
+
+
+def _decode_error(
+    error: Exception, data: typing.Union[bytes, str]
+) -> json.JSONDecodeError:
+    # the error of the stdlib decoder, that the generated clients catch to return the body as text
+    doc = data.decode("utf-8", "replace") if isinstance(data, bytes) else data
+    return json.JSONDecodeError(str(error), doc, 0)
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes responses, subclass it and override `dumps` and `decode`
+    to plug in another JSON library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return self.decode(data)
+
+    def decode(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return json.loads(data)
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        try:
+            return self._ujson.dumps(
+                obj,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                allow_nan=False,
+                reject_bytes=True,
+            ).encode("utf-8")
+        except (TypeError, OverflowError):
+            # e.g. integers above 64 bits
+            return super().dumps(obj)
+
+    def decode(self, data: typing.Union[bytes, str]) -> typing.Any:
+        try:
+            return self._ujson.loads(data)
+        except ValueError as error:
+            # ujson.JSONDecodeError, a plain ValueError before ujson 5
+            raise _decode_error(error, data) from error
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError, e.g. integers above 64 bits or a subclass of str with a custom __str__
+            return super().dumps(obj)
+
+    def decode(self, data: typing.Union[bytes, str]) -> typing.Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError as error:
+            raise _decode_error(error, data) from error
+
+
+JSON_CODECS: typing.Dict[str, typing.Type[JsonCodec]] = {
+    "json": StdlibJsonCodec,
+    "ujson": UjsonCodec,
+    "orjson": OrjsonCodec,
+}
+
+
+def get_json_codec(
+    codec: typing.Optional[typing.Union[str, JsonCodec]],
+) -> typing.Optional[JsonCodec]:
+    """
+    Resolve the `json_codec` client option: None keeps the httpx defaults, "auto" picks the fastest codec installed.
+    """
+    if codec is None or isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        for name in ("orjson", "ujson"):
+            try:
+                return JSON_CODECS[name]()
+            except ImportError:
+                continue
+        return StdlibJsonCodec()
+    if codec not in JSON_CODECS:
+        raise ValueError(
+            f"json_codec must be a JsonCodec or one of auto, {', '.join(JSON_CODECS)}, got {codec!r}"
+        )
+    return JSON_CODECS[codec]()
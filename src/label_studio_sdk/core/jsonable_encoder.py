@@ -35,65 +35,129 @@ def generate_encoders_by_class_tuples(
 encoders_by_class_tuples = generate_encoders_by_class_tuples(pydantic_v1.json.ENCODERS_BY_TYPE)
 
 
+# types jsonable_encoder returns as is, checked with `type(obj) in ...` so that subclasses (e.g. str enums) are converted
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+_JSON_CONTAINER_TYPES = frozenset((dict, list))
+
+
+def is_json_native(obj: Any) -> bool:
+    """
+    Whether obj only holds dicts, lists, str, int, float, bool and None, in which case jsonable_encoder has nothing to convert.
+    """
+    scalar_types = _JSON_SCALAR_TYPES
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            for key, item in value.items():
+                if type(key) not in scalar_types:
+                    return False
+                if type(item) not in scalar_types:
+                    stack.append(item)
+        elif value_type is list:
+            for item in value:
+                if type(item) not in scalar_types:
+                    stack.append(item)
+        elif value_type not in scalar_types:
+            return False
+    return True
+
+
 def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]] = None) -> Any:
     custom_encoder = custom_encoder or {}
-    if custom_encoder:
-        if type(obj) in custom_encoder:
-            return custom_encoder[type(obj)](obj)
+    if not custom_encoder and is_json_native(obj):
+        # already JSON-native, returned without copying it
+        return obj
+
+    # Containers are walked with an explicit stack instead of recursion, so that deep structures
+    # don't hit the recursion limit. Each entry is (value, custom encoder, parent container, key in parent).
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Dict[Any, Callable[[Any], Any]], Any, Any]] = [(obj, custom_encoder, root, 0)]
+    scalar_types = _JSON_SCALAR_TYPES
+    while stack:
+        value, encoder, parent, key = stack.pop()
+        value, encoder, is_container = _encode_value(value, encoder)
+        if not is_container:
+            parent[key] = value
+            continue
+        children = []
+        if isinstance(value, dict):
+            encoded: Any = {}
+            for item_key, item in value.items():
+                encoded_key = item_key if not encoder and type(item_key) is str else jsonable_encoder(item_key, encoder)
+                if not encoder and type(item) in scalar_types:
+                    encoded[encoded_key] = item
+                else:
+                    # reserve the position of the key to keep the order of the dict
+                    encoded[encoded_key] = None
+                    children.append((item, encoder, encoded, encoded_key))
         else:
-            for encoder_type, encoder_instance in custom_encoder.items():
-                if isinstance(obj, encoder_type):
-                    return encoder_instance(obj)
-    if isinstance(obj, pydantic_v1.BaseModel):
-        encoder = getattr(obj.__config__, "json_encoders", {})
+            encoded = list(value)
+            for index, item in enumerate(encoded):
+                if encoder or type(item) not in scalar_types:
+                    children.append((item, encoder, encoded, index))
+        parent[key] = encoded
+        # reversed so that the children are encoded in order
+        stack.extend(reversed(children))
+    return root[0]
+
+
+def _encode_value(
+    obj: Any, custom_encoder: Dict[Any, Callable[[Any], Any]]
+) -> Tuple[Any, Dict[Any, Callable[[Any], Any]], bool]:
+    """
+    Encodes a single value, returns (encoded value, custom encoder for its children, whether it's a container to walk).
+    """
+    if not custom_encoder and type(obj) in _JSON_CONTAINER_TYPES:
+        return obj, custom_encoder, True
+    while True:
         if custom_encoder:
-            encoder.update(custom_encoder)
-        obj_dict = obj.dict(by_alias=True)
-        if "__root__" in obj_dict:
-            obj_dict = obj_dict["__root__"]
-        return jsonable_encoder(obj_dict, custom_encoder=encoder)
-    if dataclasses.is_dataclass(obj):
-        obj_dict = dataclasses.asdict(obj)
-        return jsonable_encoder(obj_dict, custom_encoder=custom_encoder)
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
-    if isinstance(obj, dt.datetime):
-        return serialize_datetime(obj)
-    if isinstance(obj, dt.date):
-        return str(obj)
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        allowed_keys = set(obj.keys())
-        for key, value in obj.items():
-            if key in allowed_keys:
-                encoded_key = jsonable_encoder(key, custom_encoder=custom_encoder)
-                encoded_value = jsonable_encoder(value, custom_encoder=custom_encoder)
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(jsonable_encoder(item, custom_encoder=custom_encoder))
-        return encoded_list
-
-    if type(obj) in pydantic_v1.json.ENCODERS_BY_TYPE:
-        return pydantic_v1.json.ENCODERS_BY_TYPE[type(obj)](obj)
-    for encoder, classes_tuple in encoders_by_class_tuples.items():
-        if isinstance(obj, classes_tuple):
-            return encoder(obj)
-
-    try:
-        data = dict(obj)
-    except Exception as e:
-        errors: List[Exception] = []
-        errors.append(e)
+            if type(obj) in custom_encoder:
+                return custom_encoder[type(obj)](obj), custom_encoder, False
+            else:
+                for encoder_type, encoder_instance in custom_encoder.items():
+                    if isinstance(obj, encoder_type):
+                        return encoder_instance(obj), custom_encoder, False
+        if isinstance(obj, pydantic_v1.BaseModel):
+            encoder = getattr(obj.__config__, "json_encoders", {})
+            if custom_encoder:
+                encoder = {**encoder, **custom_encoder}
+            obj_dict = obj.dict(by_alias=True)
+            if "__root__" in obj_dict:
+                obj_dict = obj_dict["__root__"]
+            obj, custom_encoder = obj_dict, encoder
+            continue
+        if dataclasses.is_dataclass(obj):
+            obj = dataclasses.asdict(obj)
+            continue
+        if isinstance(obj, Enum):
+            return obj.value, custom_encoder, False
+        if isinstance(obj, PurePath):
+            return str(obj), custom_encoder, False
+        if isinstance(obj, (str, int, float, type(None))):
+            return obj, custom_encoder, False
+        if isinstance(obj, dt.datetime):
+            return serialize_datetime(obj), custom_encoder, False
+        if isinstance(obj, dt.date):
+            return str(obj), custom_encoder, False
+        if isinstance(obj, (dict, list, set, frozenset, GeneratorType, tuple)):
+            return obj, custom_encoder, True
+
+        if type(obj) in pydantic_v1.json.ENCODERS_BY_TYPE:
+            return pydantic_v1.json.ENCODERS_BY_TYPE[type(obj)](obj), custom_encoder, False
+        for encoder, classes_tuple in encoders_by_class_tuples.items():
+            if isinstance(obj, classes_tuple):
+                return encoder(obj), custom_encoder, False
+
         try:
-            data = vars(obj)
+            data = dict(obj)
         except Exception as e:
+            errors: List[Exception] = []
             errors.append(e)
-            raise ValueError(errors) from e
-    return jsonable_encoder(data, custom_encoder=custom_encoder)
+            try:
+                data = vars(obj)
+            except Exception as e:
+                errors.append(e)
+                raise ValueError(errors) from e
+        obj = data
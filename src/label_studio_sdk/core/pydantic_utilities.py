@@ -1,5 +1,7 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextvars
+import functools
 import typing
 
 import pydantic
@@ -11,6 +13,47 @@ if IS_PYDANTIC_V2:
 else:
     import pydantic as pydantic_v1  # type: ignore  # nopycln: import
 
+# pydantic's own parse_obj_as, it always validates
+validate_obj_as = pydantic_v1.parse_obj_as
+
+# A response decoded in "construct" or "raw" response mode, with its mode. The generated clients pass the decoded JSON
+# to `pydantic_v1.parse_obj_as` right after decoding it: that object, and only that object, is parsed in the mode of
+# its request, once. Any other call validates as pydantic does, so no mode outlives its response.
+_pending_parse: "contextvars.ContextVar[typing.Optional[typing.Tuple[str, typing.Any]]]" = contextvars.ContextVar(
+    "pending_parse", default=None
+)
+
+
+def parse_decoded_in_mode(obj: typing.Any, mode: str) -> typing.Any:
+    """Have the next `pydantic_v1.parse_obj_as` of `obj`, a decoded response, follow `mode`, and return `obj`."""
+    if isinstance(obj, (dict, list)):
+        _pending_parse.set((mode, obj))
+    return obj
+
+
+def take_parse_mode(obj: typing.Any) -> typing.Optional[str]:
+    """The response mode `obj` was decoded in, if it wasn't parsed yet, see `parse_decoded_in_mode`."""
+    pending = _pending_parse.get()
+    if pending is None or pending[1] is not obj:
+        return None
+    _pending_parse.set(None)
+    return pending[0]
+
+
+@functools.wraps(validate_obj_as)
+def _parse_obj_as(type_: typing.Any, obj: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+    mode = take_parse_mode(obj)
+    if mode is None or mode == "model":
+        return validate_obj_as(type_, obj, *args, **kwargs)
+    from .response_mode import parse_obj_as
+
+    return parse_obj_as(type_, obj, mode=mode)  # type: ignore
+
+
+# The generated clients parse every response with `pydantic_v1.parse_obj_as`, it follows the response mode of the
+# objects decoded with `parse_decoded_in_mode` and is pydantic's own for everything else.
+pydantic_v1.parse_obj_as = _parse_obj_as
+
 
 def deep_union_pydantic_dicts(
     source: typing.Dict[str, typing.Any], destination: typing.Dict[str, typing.Any]
@@ -0,0 +1,284 @@
+"""
+Client-level rate limiting shared by every request made through an HttpClient or AsyncHttpClient.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+import typing
+
+# status codes the server uses to tell clients to slow down
+THROTTLE_STATUS_CODES = (429, 503)
+# pause applied to all the callers on throttling when the response has no Retry-After header
+DEFAULT_THROTTLE_PAUSE_SECONDS = 1.0
+MAX_THROTTLE_PAUSE_SECONDS = 60.0
+
+
+class RateLimiter:
+    """
+    A token bucket shared by all the threads and asyncio tasks that use a client (or several clients).
+
+    The bucket refills at the current rate and `max_concurrency` caps the number of requests in flight.
+    When the server throttles a request (429 or 503) every caller pauses for the `Retry-After` /
+    `retry-after-ms` duration and the rate is halved. Successful responses raise the rate back additively,
+    up to `requests_per_second`. Without `requests_per_second` the rate is only limited after throttling,
+    and becomes unlimited again once it is back to the rate that was throttled. With `latency_tolerance`,
+    a latency far above the best one observed is treated as an early sign of server overload and lowers
+    the rate as well.
+
+    Parameters
+    ----------
+    requests_per_second : typing.Optional[float]
+        Upper bound of the request rate. By default requests are not rate limited until the server throttles them.
+
+    max_concurrency : typing.Optional[int]
+        Maximum number of requests in flight, unlimited by default.
+
+    burst : float
+        Number of requests that can be sent back to back after an idle period.
+
+    adaptive : bool
+        Whether the rate adapts to throttling and latency. When disabled, `Retry-After` pauses are still honored.
+
+    min_requests_per_second : float
+        Lower bound of the adapted rate.
+
+    additive_increase : float
+        Requests per second gained for every second of successful requests.
+
+    latency_tolerance : typing.Optional[float]
+        Multiple of the best observed latency above which the rate is lowered, latency is ignored by default.
+        The latencies of all the endpoints are compared, only use it with requests of similar cost.
+
+    Examples
+    --------
+    from label_studio_sdk.client import LabelStudio
+    from label_studio_sdk.core import RateLimiter
+
+    client = LabelStudio(
+        api_key="YOUR_API_KEY",
+        rate_limiter=RateLimiter(requests_per_second=50, max_concurrency=16),
+    )
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: typing.Optional[float] = None,
+        max_concurrency: typing.Optional[int] = None,
+        burst: float = 1.0,
+        adaptive: bool = True,
+        min_requests_per_second: float = 0.5,
+        additive_increase: float = 1.0,
+        latency_tolerance: typing.Optional[float] = None,
+    ):
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        self.max_requests_per_second = requests_per_second
+        self.max_concurrency = max_concurrency
+        self.burst = max(burst, 1.0)
+        self.adaptive = adaptive
+        self.min_requests_per_second = min_requests_per_second
+        self.additive_increase = additive_increase
+        self.latency_tolerance = latency_tolerance
+
+        self._lock = threading.Lock()
+        self._rate = requests_per_second
+        # rate above which an unlimited rate lowered by throttling becomes unlimited again
+        self._ceiling: typing.Optional[float] = None
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._latency_best: typing.Optional[float] = None
+        self._latency_avg: typing.Optional[float] = None
+        self._recent: typing.Deque[float] = collections.deque(maxlen=64)
+        self._in_flight = 0
+        self._waiters: typing.Deque[typing.Any] = collections.deque()
+
+    @property
+    def requests_per_second(self) -> typing.Optional[float]:
+        """The current rate, None while it is unlimited."""
+        return self._rate
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request can be sent, `release()` must be called once it is done."""
+        self._acquire_slot()
+        try:
+            delay = self._reserve()
+            while delay > 0:
+                time.sleep(delay)
+                delay = self._blocked_for()
+        except BaseException:
+            self.release()
+            raise
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request can be sent, `release()` must be called once it is done."""
+        await self._acquire_slot_async()
+        try:
+            delay = self._reserve()
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self._blocked_for()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        if self.max_concurrency is None:
+            return
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    # the slot is handed over to the waiting thread as is
+                    waiter.set()
+                    return
+                loop, future = waiter
+                try:
+                    loop.call_soon_threadsafe(self._wake, future)
+                    return
+                except RuntimeError:
+                    # the event loop of this waiter is closed
+                    continue
+            self._in_flight -= 1
+
+    def record(
+        self,
+        *,
+        status_code: int,
+        retry_after: typing.Optional[float] = None,
+        latency: typing.Optional[float] = None,
+    ) -> None:
+        """Feed the outcome of a request back into the limiter."""
+        with self._lock:
+            now = time.monotonic()
+            if status_code in THROTTLE_STATUS_CODES:
+                pause = (
+                    retry_after
+                    if retry_after is not None
+                    else DEFAULT_THROTTLE_PAUSE_SECONDS
+                )
+                self._blocked_until = max(
+                    self._blocked_until, now + min(pause, MAX_THROTTLE_PAUSE_SECONDS)
+                )
+                if self.adaptive:
+                    self._decrease(now, 0.5, cooldown=max(pause, 1.0))
+                return
+            if not self.adaptive or status_code >= 400:
+                return
+            if latency is not None and self.latency_tolerance is not None:
+                self._latency_avg = (
+                    latency
+                    if self._latency_avg is None
+                    else 0.8 * self._latency_avg + 0.2 * latency
+                )
+                self._latency_best = (
+                    self._latency_avg
+                    if self._latency_best is None
+                    else min(self._latency_best, self._latency_avg)
+                )
+                if self._latency_avg > self._latency_best * self.latency_tolerance:
+                    self._decrease(now, 0.9, cooldown=1.0)
+                    return
+            self._increase()
+
+    # -- internals, all called with self._lock held unless noted otherwise
+
+    def _decrease(self, now: float, factor: float, *, cooldown: float) -> None:
+        # many requests in flight are throttled at once, react to them as to a single signal
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        rate = self._rate
+        if rate is None:
+            rate = self._ceiling = self._observed_rate(now)
+        self._rate = max(self.min_requests_per_second, rate * factor)
+        self._tokens = min(self._tokens, self.burst)
+
+    def _increase(self) -> None:
+        if self._rate is None:
+            return
+        self._rate += self.additive_increase / self._rate
+        if self.max_requests_per_second is not None:
+            self._rate = min(self._rate, self.max_requests_per_second)
+        elif self._ceiling is not None and self._rate >= self._ceiling:
+            self._rate = self._ceiling = None
+
+    def _observed_rate(self, now: float) -> float:
+        if len(self._recent) < 2 or now <= self._recent[0]:
+            return float(self.max_concurrency or self.min_requests_per_second)
+        return len(self._recent) / (now - self._recent[0])
+
+    def _reserve(self) -> float:
+        # takes a token (possibly in advance) and returns how long the caller has to wait for it, lock not held
+        with self._lock:
+            now = time.monotonic()
+            self._recent.append(now)
+            wait = self._blocked_until - now
+            if self._rate is not None:
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last_refill) * self._rate
+                )
+                self._last_refill = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            return max(wait, 0.0)
+
+    def _blocked_for(self) -> float:
+        # lock not held
+        return max(self._blocked_until - time.monotonic(), 0.0)
+
+    def _acquire_slot(self) -> None:
+        # lock not held
+        if self.max_concurrency is None:
+            return
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not self._waiters:
+                self._in_flight += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def _acquire_slot_async(self) -> None:
+        # lock not held
+        if self.max_concurrency is None:
+            return
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not self._waiters:
+                self._in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    handed_over = False
+                except ValueError:
+                    handed_over = True
+            # if the slot was handed over and the future resolved, give it back, otherwise `_wake` does it
+            if handed_over and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def _wake(self, future: "asyncio.Future[None]") -> None:
+        # runs in the event loop of the waiter, lock not held
+        if future.done():
+            self.release()
+        else:
+            future.set_result(None)
@@ -2,6 +2,8 @@
 
 import typing
 
+from .response_mode import ResponseMode
+
 try:
     from typing import NotRequired  # type: ignore
 except ImportError:
@@ -23,6 +25,10 @@ class RequestOptions(typing.TypedDict, total=False):
         - additional_query_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's query parameters dict
 
         - additional_body_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's body parameters dict
+
+        - response_mode: ResponseMode. "model" to validate responses into pydantic models (default), "construct" to build the models without validation, "raw" to return the decoded JSON. Overrides the client setting.
+
+        - encode_body: bool. Set to False to send the request body without converting it with jsonable_encoder, when it only holds dicts, lists, str, int, float, bool and None.
     """
 
     timeout_in_seconds: NotRequired[int]
@@ -30,3 +36,5 @@ class RequestOptions(typing.TypedDict, total=False):
     additional_headers: NotRequired[typing.Dict[str, typing.Any]]
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
+    response_mode: NotRequired[ResponseMode]
+    encode_body: NotRequired[bool]
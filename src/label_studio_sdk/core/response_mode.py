@@ -0,0 +1,104 @@
+"""
+How API responses are turned into Python objects:
+
+- "model": validated pydantic models (the default)
+- "construct": pydantic models built without validation, values are kept as decoded from JSON
+  (e.g. datetimes stay strings)
+- "raw": the decoded JSON as is, dicts and lists
+"""
+
+import collections.abc
+import functools
+import typing
+
+import typing_extensions
+
+from .pydantic_utilities import pydantic_v1, take_parse_mode, validate_obj_as
+
+ResponseMode = typing_extensions.Literal["model", "construct", "raw"]
+RESPONSE_MODES = ("model", "construct", "raw")
+
+_SEQUENCE_ORIGINS = (
+    list,
+    tuple,
+    set,
+    frozenset,
+    collections.abc.Sequence,
+    collections.abc.Set,
+)
+
+
+def check_response_mode(mode: str) -> ResponseMode:
+    if mode not in RESPONSE_MODES:
+        raise ValueError(
+            f"response_mode must be one of {', '.join(RESPONSE_MODES)}, got {mode!r}"
+        )
+    return typing.cast(ResponseMode, mode)
+
+
+def parse_obj_as(
+    type_: typing.Any, obj: typing.Any, mode: ResponseMode = "model"
+) -> typing.Any:
+    # the response is parsed here, not by the generated client
+    take_parse_mode(obj)
+    if mode == "raw":
+        return obj
+    if mode == "construct":
+        return construct_obj_as(type_, obj)
+    return validate_obj_as(type_, obj)
+
+
+def _is_model(type_: typing.Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, pydantic_v1.BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def _contains_model(type_: typing.Any) -> bool:
+    if _is_model(type_):
+        return True
+    return any(_contains_model(arg) for arg in typing_extensions.get_args(type_))
+
+
+@functools.lru_cache(maxsize=None)
+def _nested_model_fields(
+    model: typing.Type[pydantic_v1.BaseModel],
+) -> typing.Tuple[typing.Tuple[str, typing.Any], ...]:
+    # (alias, type) of the fields that hold other models, the only ones that need to be constructed recursively
+    return tuple(
+        (field.alias, field.outer_type_)
+        for field in model.__fields__.values()
+        if _contains_model(field.outer_type_)
+    )
+
+
+def construct_obj_as(type_: typing.Any, obj: typing.Any) -> typing.Any:
+    """
+    Build `type_` from decoded JSON like `pydantic_v1.parse_obj_as` does, but without any validation or coercion.
+    """
+    if obj is None or not _contains_model(type_):
+        return obj
+    if _is_model(type_):
+        if not isinstance(obj, dict):
+            return obj
+        values = dict(obj)
+        for alias, field_type in _nested_model_fields(type_):
+            if alias in values:
+                values[alias] = construct_obj_as(field_type, values[alias])
+        return type_.construct(**values)
+    origin = typing_extensions.get_origin(type_)
+    args = typing_extensions.get_args(type_)
+    if origin is typing.Union:
+        for arg in args:
+            if _is_model(arg) and isinstance(obj, dict):
+                return construct_obj_as(arg, obj)
+            if (
+                isinstance(obj, list)
+                and typing_extensions.get_origin(arg) in _SEQUENCE_ORIGINS
+            ):
+                return construct_obj_as(arg, obj)
+        return obj
+    if isinstance(obj, dict) and args:
+        return {key: construct_obj_as(args[-1], value) for key, value in obj.items()}
+    if isinstance(obj, list) and args:
+        return [construct_obj_as(args[0], item) for item in obj]
+    return obj
@@ -2,5 +2,6 @@
 
 from .bad_request_error import BadRequestError
 from .internal_server_error import InternalServerError
+from .not_found_error import NotFoundError
 
-__all__ = ["BadRequestError", "InternalServerError"]
+__all__ = ["BadRequestError", "InternalServerError", "NotFoundError"]
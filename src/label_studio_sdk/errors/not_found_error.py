@@ -0,0 +1,8 @@
+import typing
+
+from ..core.api_error import ApiError
+
+
+class NotFoundError(ApiError):
+    def __init__(self, body: typing.Any):
+        super().__init__(status_code=404, body=body)
@@ -0,0 +1,62 @@
+import typing
+
+from .client import PredictionsClient, AsyncPredictionsClient
+from label_studio_sdk._extensions.streaming import stream_json_items, astream_json_items
+from label_studio_sdk.core.request_options import RequestOptions
+from label_studio_sdk.core.response_mode import parse_obj_as
+from label_studio_sdk.types.prediction import Prediction
+
+
+class PredictionsClientExt(PredictionsClient):
+
+    def stream(
+        self,
+        *,
+        task: typing.Optional[int] = None,
+        project: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[Prediction]:
+        """
+        Same as `list()`, but predictions are decoded and yielded one at a time while the response is downloaded.
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+
+        client = LabelStudio(
+            api_key="YOUR_API_KEY",
+        )
+        for prediction in client.predictions.stream(project=1):
+            print(prediction.id)
+        """
+        mode = self._client_wrapper.get_response_mode(request_options)
+        for item in stream_json_items(
+            self._client_wrapper.httpx_client,
+            "api/predictions/",
+            prefix="item",
+            params={"task": task, "project": project},
+            request_options=request_options,
+        ):
+            yield parse_obj_as(Prediction, item, mode=mode)
+
+
+class AsyncPredictionsClientExt(AsyncPredictionsClient):
+
+    async def stream(
+        self,
+        *,
+        task: typing.Optional[int] = None,
+        project: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[Prediction]:
+        mode = self._client_wrapper.get_response_mode(request_options)
+        async for item in astream_json_items(
+            self._client_wrapper.httpx_client,
+            "api/predictions/",
+            prefix="item",
+            params={"task": task, "project": project},
+            request_options=request_options,
+        ):
+            yield parse_obj_as(Prediction, item, mode=mode)
+
+    stream.__doc__ = PredictionsClientExt.stream.__doc__
@@ -1,4 +1,5 @@
 import typing
+from json.decoder import JSONDecodeError
 from typing_extensions import Annotated
 from .client import ProjectsClient, AsyncProjectsClient
 from pydantic import model_validator, validator, Field, ConfigDict
@@ -7,6 +8,31 @@ from label_studio_sdk.types.project import Project
 from label_studio_sdk.label_interface import LabelInterface
 
 from ..core import RequestOptions
+from ..core.api_error import ApiError
+from ..core.pagination import AsyncPager, SyncPager
+from .types.projects_list_response import ProjectsListResponse
+
+
+def _list_response(
+    client_wrapper: typing.Any,
+    response: typing.Any,
+    request_options: typing.Optional[RequestOptions],
+) -> typing.List[typing.Any]:
+    try:
+        if 200 <= response.status_code < 300:
+            parsed = client_wrapper.parse_response(
+                ProjectsListResponse, response, request_options
+            )
+            return parsed.get("results") or []
+        response_json = response.json()
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, body=response.text)
+    raise ApiError(status_code=response.status_code, body=response_json)
+
+
+def _is_raw(client_wrapper: typing.Any, kwargs: typing.Dict[str, typing.Any]) -> bool:
+    # the generated pager reads the page as a model, raw pages are read by the client
+    return client_wrapper.get_response_mode(kwargs.get("request_options")) == "raw"
 
 
 class ProjectExt(Project):
@@ -17,18 +43,80 @@ class ProjectExt(Project):
 
 class ProjectsClientExt(ProjectsClient):
 
-    def list(self, **kwargs) -> SyncPagerExt[T]:
-        return SyncPagerExt.from_sync_pager(super().list(**kwargs))
+    def list(self, *, prefetch: int = 0, **kwargs) -> SyncPagerExt[T]:
+        pager = (
+            self._list_raw(**kwargs)
+            if _is_raw(self._client_wrapper, kwargs)
+            else super().list(**kwargs)
+        )
+        return SyncPagerExt.from_sync_pager(pager, prefetch=prefetch)
 
     list.__doc__ = ProjectsClient.list.__doc__
 
-    def get(self, id: int, *, request_options: typing.Optional[RequestOptions] = None) -> ProjectExt:
-        return ProjectExt(**dict(super().get(id, request_options=request_options)))
+    def _list_raw(
+        self,
+        *,
+        page: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> SyncPager[typing.Dict[str, typing.Any]]:
+        page = page or 1
+        response = self._client_wrapper.httpx_client.request(
+            "api/projects/",
+            method="GET",
+            params={**params, "page": page},
+            request_options=request_options,
+        )
+        return SyncPager(
+            has_next=True,
+            items=_list_response(self._client_wrapper, response, request_options),
+            get_next=lambda: self._list_raw(
+                page=page + 1, request_options=request_options, **params
+            ),
+        )
+
+    def get(
+        self, id: int, *, request_options: typing.Optional[RequestOptions] = None
+    ) -> ProjectExt:
+        project = super().get(id, request_options=request_options)
+        mode = self._client_wrapper.get_response_mode(request_options)
+        if mode == "raw":
+            return project
+        if mode == "construct":
+            return ProjectExt.construct(**dict(project))
+        return ProjectExt(**dict(project))
 
 
 class AsyncProjectsClientExt(AsyncProjectsClient):
 
-    async def list(self, **kwargs):
-        return await AsyncPagerExt.from_async_pager(await super().list(**kwargs))
+    async def list(self, *, prefetch: int = 0, **kwargs):
+        pager = (
+            await self._list_raw(**kwargs)
+            if _is_raw(self._client_wrapper, kwargs)
+            else await super().list(**kwargs)
+        )
+        return await AsyncPagerExt.from_async_pager(pager, prefetch=prefetch)
 
     list.__doc__ = AsyncProjectsClient.list.__doc__
+
+    async def _list_raw(
+        self,
+        *,
+        page: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> AsyncPager[typing.Dict[str, typing.Any]]:
+        page = page or 1
+        response = await self._client_wrapper.httpx_client.request(
+            "api/projects/",
+            method="GET",
+            params={**params, "page": page},
+            request_options=request_options,
+        )
+        return AsyncPager(
+            has_next=True,
+            items=_list_response(self._client_wrapper, response, request_options),
+            get_next=lambda: self._list_raw(
+                page=page + 1, request_options=request_options, **params
+            ),
+        )
@@ -1,22 +1,1376 @@
+import dataclasses
+import datetime
+import functools
+import json
+import threading
+import time
+import typing
+from json.decoder import JSONDecodeError
+
+import httpx
+
 from .client import TasksClient, AsyncTasksClient
+from .types.tasks_list_response import TasksListResponse
+from label_studio_sdk._extensions.checkpoint import (
+    ADAPTIVE,
+    KEYSET,
+    PAGE,
+    Checkpoint,
+    Checkpointer,
+    CheckpointStore,
+    params_key,
+)
+from label_studio_sdk._extensions.batch import (
+    AsyncBatchExecutor,
+    BatchExecutor,
+    BatchProgress,
+    BatchResult,
+)
+from label_studio_sdk._extensions.adaptive_pager import (
+    AdaptivePager,
+    AsyncAdaptivePager,
+    FetchedPage,
+    PageSizer,
+)
+from label_studio_sdk._extensions.keyset_pager import KeysetPager, AsyncKeysetPager
 from label_studio_sdk._extensions.pager_ext import SyncPagerExt, AsyncPagerExt, T
+from label_studio_sdk._extensions.parallel_pager import (
+    ParallelPager,
+    AsyncParallelPager,
+)
+from label_studio_sdk._extensions.projection import Projection
+from label_studio_sdk._extensions.streaming import stream_json_items, astream_json_items
+from label_studio_sdk._extensions.task_watch import AsyncTaskWatch, TaskWatch
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.client_wrapper import BaseClientWrapper
+from label_studio_sdk.core.instrumentation import ProjectionEvent, endpoint_template
+from label_studio_sdk.core.jsonable_encoder import jsonable_encoder
+from label_studio_sdk.core.pagination import AsyncPager, SyncPager
+from label_studio_sdk.core.request_options import RequestOptions
+from label_studio_sdk.core.response_mode import parse_obj_as
+from label_studio_sdk.errors import NotFoundError
+from label_studio_sdk.types.task import Task
+
+if typing.TYPE_CHECKING:
+    from label_studio_sdk._extensions.id_sets import IdArray
+
+
+def _stream_params(
+    page: int, kwargs: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    return {**kwargs, "page": page, "fields": kwargs.get("fields", "all")}
+
+
+# the pages fetched in parallel retry 429 and 5xx responses unless request_options say otherwise
+PARALLEL_MAX_RETRIES = 2
+
+
+def _parallel_request_options(
+    request_options: typing.Optional[RequestOptions],
+) -> RequestOptions:
+    return typing.cast(
+        RequestOptions, {"max_retries": PARALLEL_MAX_RETRIES, **(request_options or {})}
+    )
+
+
+def _check_modes(
+    prefetch: int,
+    parallel: typing.Optional[int],
+    keyset: bool,
+    adaptive: typing.Union[bool, PageSizer],
+    params: typing.Dict[str, typing.Any],
+) -> None:
+    modes = [
+        name
+        for name, enabled in (
+            ("prefetch", prefetch),
+            ("parallel", parallel is not None),
+            ("keyset", keyset),
+            ("adaptive", adaptive),
+        )
+        if enabled
+    ]
+    if len(modes) > 1:
+        raise ValueError(f"{' and '.join(modes)} can't be combined")
+    if keyset:
+        for name in ("page", "view"):
+            # a view overrides the filters of the query, and with them the keyset filter
+            if params.get(name) is not None:
+                raise ValueError(f"keyset can't be combined with {name}")
+
+
+def _checkpointer(
+    mode: str,
+    params: typing.Dict[str, typing.Any],
+    resume_from: typing.Union[Checkpoint, str, None],
+    store: typing.Optional[CheckpointStore],
+) -> Checkpointer:
+    # the checkpoint starts at the position of the list, `resume_from` replaces it in `params`
+    key = params_key(params)
+    if resume_from is None:
+        if mode == KEYSET:
+            start = Checkpoint(mode=mode, key=key, last_id=params.get("after_id"))
+        else:
+            start = Checkpoint(
+                mode=mode,
+                key=key,
+                page=params.get("page") or 1,
+                page_size=params.get("page_size"),
+            )
+        return Checkpointer(start, store)
+    start = Checkpoint.from_token(resume_from).check(mode, key)
+    if mode == KEYSET:
+        params["after_id"] = start.last_id
+        return Checkpointer(start, store)
+    if mode == PAGE and params.get("page_size") not in (None, start.page_size):
+        raise ValueError(
+            f"The checkpoint was made with page_size={start.page_size}, got {params['page_size']}"
+        )
+    params["page"] = start.page
+    params["page_size"] = start.page_size
+    return Checkpointer(start, store)
+
+
+def _list_checkpointer(
+    parallel: typing.Optional[int],
+    keyset: bool,
+    adaptive: typing.Union[bool, PageSizer],
+    params: typing.Dict[str, typing.Any],
+    resume_from: typing.Union[Checkpoint, str, None],
+    store: typing.Optional[CheckpointStore],
+) -> typing.Optional[Checkpointer]:
+    if parallel is not None:
+        if resume_from is not None or store is not None:
+            raise ValueError(
+                "parallel can't be checkpointed, its pages complete out of order"
+            )
+        return None
+    return _checkpointer(
+        KEYSET if keyset else ADAPTIVE if adaptive else PAGE, params, resume_from, store
+    )
+
+
+def _page_sizer(
+    adaptive: typing.Union[bool, PageSizer], page_size: typing.Optional[int]
+) -> PageSizer:
+    if isinstance(adaptive, PageSizer):
+        # a page size resumes the sizer of a checkpoint where it was
+        if page_size is not None:
+            adaptive.page_size = page_size
+        return adaptive
+    if page_size is None:
+        return PageSizer()
+    return PageSizer(
+        page_size=page_size,
+        min_page_size=min(page_size, 10),
+        max_page_size=max(page_size, 1000),
+    )
+
+
+def _projection(
+    select: typing.Optional[typing.Sequence[str]], params: typing.Dict[str, typing.Any]
+) -> typing.Optional[Projection]:
+    # `select` sets `include` and `fields` for the selected fields
+    if select is None:
+        return None
+    for name in ("fields", "include"):
+        if params.get(name) is not None:
+            raise ValueError(f"select can't be combined with {name}")
+    projection = Projection(select)
+    params.update(projection.params())
+    return projection
+
+
+def _select_tasks(
+    client_wrapper: BaseClientWrapper, response: httpx.Response, projection: Projection
+) -> typing.Dict[str, typing.Any]:
+    data = client_wrapper.decode_response(response)
+    data["tasks"] = [projection.apply(task) for task in data.get("tasks") or []]
+    instrumentation = client_wrapper.httpx_client.instrumentation
+    if instrumentation is not None:
+        path = response.request.url.path.lstrip("/")
+        selected = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False, default=str
+        ).encode()
+        instrumentation.on_projection(
+            ProjectionEvent(
+                method=response.request.method,
+                endpoint=endpoint_template(path),
+                path=path,
+                items=len(data["tasks"]),
+                bytes_received=len(response.content),
+                bytes_selected=len(selected),
+            )
+        )
+    return data
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskTotals:
+    """The totals reported for the tasks matching a list query."""
+
+    tasks: int
+    annotations: typing.Optional[int] = None
+    predictions: typing.Optional[int] = None
+
+
+# one task with its id only, the totals are computed by the server on the whole query
+_TOTALS_PARAMS = {"page": 1, "page_size": 1, "fields": "task_only", "include": "id"}
+# the parameters of `list()` that select the tasks
+_QUERY_PARAMS = ("project", "view", "query", "review")
+
+
+def _totals_params(
+    query: typing.Union[str, typing.Dict[str, typing.Any], None],
+    params: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    return {
+        **params,
+        "query": json.dumps(query) if isinstance(query, dict) else query,
+        **_TOTALS_PARAMS,
+    }
+
+
+def _parse_totals(
+    client_wrapper: BaseClientWrapper, response: httpx.Response
+) -> TaskTotals:
+    try:
+        if 200 <= response.status_code < 300:
+            data = client_wrapper.decode_response(response)
+            return TaskTotals(
+                tasks=data.get("total") or 0,
+                annotations=data.get("total_annotations"),
+                predictions=data.get("total_predictions"),
+            )
+        response_json = response.json()
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, body=response.text)
+    # the first page is never past the end, a 404 is a missing project or view
+    if response.status_code == 404:
+        raise NotFoundError(body=response_json)
+    raise ApiError(status_code=response.status_code, body=response_json)
+
+
+def _raw(params: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    # the ids are read from the JSON of the tasks, they aren't validated as models
+    request_options = {**(params.get("request_options") or {}), "response_mode": "raw"}
+    return {**params, "request_options": request_options}
+
+
+def _counter_params(
+    params: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    return {name: params.get(name) for name in (*_QUERY_PARAMS, "request_options")}
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskUpdateFailure:
+    """An update of `update_many()` that failed, after its retries."""
+
+    task_id: int
+    exception: Exception
+    attempts: int = 1
+
+
+@dataclasses.dataclass
+class TaskUpdateReport:
+    """The outcome of `update_many()`: the number of tasks updated, the updates that failed and the time taken."""
+
+    updated: int = 0
+    failures: typing.List[TaskUpdateFailure] = dataclasses.field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def per_second(self) -> float:
+        """The updates completed per second."""
+        return (self.updated + self.failed) / self.seconds if self.seconds else 0.0
+
+
+class _UpdateTracker:
+    # the results of a batch of updates are counted and dropped, only the failures are kept
+    def __init__(self) -> None:
+        self.report = TaskUpdateReport()
+        # the task ids of the updates queued or running, by index in the batch
+        self._pending: typing.Dict[int, int] = {}
+        self._submitted = 0
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def submitting(self, task_id: int) -> None:
+        with self._lock:
+            self._pending[self._submitted] = task_id
+            self._submitted += 1
+
+    def on_result(self, result: BatchResult) -> None:
+        with self._lock:
+            task_id = self._pending.pop(result.index)
+            if result.ok:
+                self.report.updated += 1
+            else:
+                self.report.failures.append(
+                    TaskUpdateFailure(
+                        task_id=task_id,
+                        exception=result.exception,
+                        attempts=result.attempts,
+                    )
+                )
+
+    def finish(self) -> TaskUpdateReport:
+        self.report.seconds = time.perf_counter() - self._started
+        return self.report
+
+
+def _check_updated(response: httpx.Response) -> None:
+    # the updated task isn't parsed, update_many() doesn't return it
+    if 200 <= response.status_code < 300:
+        return
+    try:
+        response_json = response.json()
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, body=response.text)
+    raise ApiError(status_code=response.status_code, body=response_json)
+
+
+def _parse_tasks_page(
+    client_wrapper: BaseClientWrapper,
+    response: httpx.Response,
+    request_options: typing.Optional[RequestOptions],
+    projection: typing.Optional[Projection] = None,
+) -> typing.Tuple[typing.List[Task], typing.Optional[int]]:
+    try:
+        if 200 <= response.status_code < 300:
+            if projection is None:
+                parsed = client_wrapper.parse_response(
+                    TasksListResponse, response, request_options
+                )
+            else:
+                parsed = parse_obj_as(
+                    TasksListResponse,
+                    _select_tasks(client_wrapper, response, projection),
+                    mode=client_wrapper.get_response_mode(request_options),
+                )
+            if isinstance(parsed, dict):
+                return parsed.get("tasks") or [], parsed.get("total")
+            return parsed.tasks or [], parsed.total
+        response_json = response.json()
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, body=response.text)
+    raise ApiError(status_code=response.status_code, body=response_json)
 
 
 class TasksClientExt(TasksClient):
 
-    def list(self, **kwargs) -> SyncPagerExt[T]:
+    def list(
+        self,
+        *,
+        prefetch: int = 0,
+        parallel: typing.Optional[int] = None,
+        ordered: bool = True,
+        keyset: bool = False,
+        adaptive: typing.Union[bool, PageSizer] = False,
+        resume_from: typing.Union[Checkpoint, str, None] = None,
+        checkpoint: typing.Optional[CheckpointStore] = None,
+        select: typing.Optional[typing.Sequence[str]] = None,
+        **kwargs,
+    ) -> typing.Union[
+        SyncPagerExt[T], ParallelPager[Task], KeysetPager[Task], AdaptivePager[Task]
+    ]:
+        """
+        Retrieve the tasks of a project or view, page by page, with `fields="all"` by default.
+
+        The pages are fetched one after the other unless one of `prefetch`, `parallel`, `keyset` or `adaptive` is
+        given, those can't be combined. Every pager can be drained with `drain()` to hold about one page in memory,
+        and the default one turned into columns with `to_dataframe()` or `to_arrow()`.
+
+        Parameters
+        ----------
+        prefetch : int
+            Number of pages fetched ahead in a background thread while the current one is processed.
+
+        parallel : typing.Optional[int]
+            Number of threads fetching the pages after the first one at once, from the total it reports.
+            Can't be checkpointed.
+
+        ordered : bool
+            Whether the pages of `parallel` are yielded in order, rather than as soon as they arrive.
+
+        keyset : bool
+            Page by task id (`id > after_id`) instead of page number, for deep listings. Can't be combined with
+            `page` or `view`.
+
+        adaptive : typing.Union[bool, PageSizer]
+            Size every page from the payload size and latency of the previous one, with a default `PageSizer`
+            when True.
+
+        resume_from : typing.Union[Checkpoint, str, None]
+            A checkpoint of a previous listing with the same parameters, from `pager.checkpoint()` or its token,
+            to continue where it stopped.
+
+        checkpoint : typing.Optional[CheckpointStore]
+            Where the checkpoint is saved after every page, e.g. `FileCheckpoint`. It is cleared once the listing
+            completes.
+
+        select : typing.Optional[typing.Sequence[str]]
+            The only fields to fetch and keep, e.g. `["id", "data.image"]`, see `Projection`. Can't be combined
+            with `fields` or `include`.
+
+        **kwargs
+            The parameters of the generated `list()`: `page`, `page_size`, `view`, `project`, `resolve_uri`,
+            `fields`, `review`, `include`, `query` and `request_options`, and `after_id` with `keyset`.
+
+        Returns
+        -------
+        typing.Union[SyncPagerExt[Task], ParallelPager[Task], KeysetPager[Task], AdaptivePager[Task]]
+            A `SyncPagerExt` by default or with `prefetch`, whose total is `pager.total`, otherwise the pager
+            of the mode.
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+
+        client = LabelStudio(api_key="YOUR_API_KEY")
+        pager = client.tasks.list(project=1, select=["id", "data.image"], prefetch=2)
+        for task in pager:
+            print(task.id)
+        """
+        # `select` fetches only the listed fields, e.g. ["id", "data.image"], see `Projection`
+        projection = _projection(select, kwargs)
         # use `fields: all` by default and return the full data
-        kwargs['fields'] = kwargs.get('fields', 'all')
-        return SyncPagerExt.from_sync_pager(super().list(**kwargs))
+        kwargs["fields"] = kwargs.get("fields", "all")
+        _check_modes(prefetch, parallel, keyset, adaptive, kwargs)
+        # `resume_from` continues from `pager.checkpoint()`, `checkpoint` saves it after every page, see `FileCheckpoint`
+        checkpointer = _list_checkpointer(
+            parallel, keyset, adaptive, kwargs, resume_from, checkpoint
+        )
+        # `keyset` pages by task id instead of page number, see `KeysetPager`
+        if keyset:
+            return self._list_keyset(
+                checkpointer=checkpointer, projection=projection, **kwargs
+            )
+        # `adaptive` sizes every page from the size and latency of the previous one, see `PageSizer`
+        if adaptive:
+            return self._list_adaptive(
+                adaptive=adaptive,
+                checkpointer=checkpointer,
+                projection=projection,
+                **kwargs,
+            )
+        # `parallel` fetches the pages after the first one with that many threads, see `ParallelPager`
+        if parallel is not None:
+            return self._list_parallel(
+                parallel=parallel, ordered=ordered, projection=projection, **kwargs
+            )
+        # `prefetch` fetches up to that many pages ahead in a background thread
+        # the pages are read here rather than by the generated pager, which drops the total of the first one
+        pager, total = self._list_selected(projection=projection, **kwargs)
+        return SyncPagerExt.from_sync_pager(
+            pager,
+            prefetch=prefetch,
+            checkpointer=checkpointer,
+            total=total,
+            counter=functools.partial(self.count, **_counter_params(kwargs)),
+        )
+
+    def _get_page(
+        self,
+        page: int,
+        params: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions],
+        projection: typing.Optional[Projection] = None,
+    ) -> typing.Tuple[typing.List[Task], typing.Optional[int]]:
+        response = self._client_wrapper.httpx_client.request(
+            "api/tasks/",
+            method="GET",
+            params={**params, "page": page},
+            request_options=request_options,
+        )
+        return _parse_tasks_page(
+            self._client_wrapper, response, request_options, projection
+        )
+
+    def _get_sized_page(
+        self,
+        page: int,
+        page_size: int,
+        params: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions],
+        projection: typing.Optional[Projection] = None,
+    ) -> FetchedPage:
+        started = time.perf_counter()
+        response = self._client_wrapper.httpx_client.request(
+            "api/tasks/",
+            method="GET",
+            params={**params, "page": page, "page_size": page_size},
+            request_options=request_options,
+        )
+        seconds = time.perf_counter() - started
+        items, total = _parse_tasks_page(
+            self._client_wrapper, response, request_options, projection
+        )
+        return items, len(response.content), seconds, total
+
+    def _list_selected(
+        self,
+        *,
+        projection: typing.Optional[Projection],
+        page: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> typing.Tuple[SyncPager[Task], typing.Optional[int]]:
+        # the pages of `list()`, trimmed to the selected fields, if any, before they are parsed,
+        # and the total number of tasks reported with them
+        page = page or 1
+        items, total = self._get_page(page, params, request_options, projection)
+        pager = SyncPager(
+            has_next=True,
+            items=items,
+            get_next=lambda: self._list_selected(
+                projection=projection,
+                page=page + 1,
+                request_options=request_options,
+                **params,
+            )[0],
+        )
+        return pager, total
+
+    def _list_adaptive(
+        self,
+        *,
+        adaptive: typing.Union[bool, PageSizer],
+        page: typing.Optional[int] = None,
+        page_size: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        checkpointer: typing.Optional[Checkpointer] = None,
+        projection: typing.Optional[Projection] = None,
+        **params,
+    ) -> AdaptivePager[Task]:
+        return AdaptivePager(
+            fetch_page=lambda page, page_size: self._get_sized_page(
+                page, page_size, params, request_options, projection
+            ),
+            sizer=_page_sizer(adaptive, page_size),
+            page=page or 1,
+            checkpointer=checkpointer,
+        )
+
+    def _list_parallel(
+        self,
+        *,
+        parallel: int,
+        ordered: bool,
+        page: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        projection: typing.Optional[Projection] = None,
+        **params,
+    ) -> ParallelPager[Task]:
+        request_options = _parallel_request_options(request_options)
+        first_page = page or 1
+        try:
+            first_items, total = self._get_page(
+                first_page, params, request_options, projection
+            )
+        except ApiError as exc:
+            # the end of the pagination is reported with 404
+            if exc.status_code != 404:
+                raise
+            first_items, total = [], 0
+        return ParallelPager(
+            fetch_page=lambda page: self._get_page(
+                page, params, request_options, projection
+            )[0],
+            first_page=first_page,
+            first_items=first_items,
+            total=total,
+            page_size=params.get("page_size"),
+            parallel=parallel,
+            ordered=ordered,
+        )
+
+    def _list_keyset(
+        self,
+        *,
+        query: typing.Optional[str] = None,
+        after_id: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        checkpointer: typing.Optional[Checkpointer] = None,
+        projection: typing.Optional[Projection] = None,
+        **params,
+    ) -> KeysetPager[Task]:
+        return KeysetPager(
+            fetch_page=lambda query: self._get_page(
+                1, {**params, "query": query}, request_options, projection
+            )[0],
+            query=query,
+            after_id=after_id,
+            checkpointer=checkpointer,
+        )
+
+    def totals(
+        self,
+        *,
+        project: typing.Optional[int] = None,
+        view: typing.Optional[int] = None,
+        query: typing.Union[str, typing.Dict[str, typing.Any], None] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> TaskTotals:
+        """
+        Count the tasks matching the parameters of `list()`, and their annotations and predictions, with a single
+        request for one task with its id only.
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+
+        client = LabelStudio(api_key="YOUR_API_KEY")
+        totals = client.tasks.totals(project=1, query=query)
+        print(totals.tasks, totals.annotations, totals.predictions)
+        """
+        response = self._client_wrapper.httpx_client.request(
+            "api/tasks/",
+            method="GET",
+            params=_totals_params(query, {"project": project, "view": view, **params}),
+            request_options=request_options,
+        )
+        return _parse_totals(self._client_wrapper, response)
+
+    def count(self, **kwargs) -> int:
+        """The number of tasks matching the parameters of `list()`, see `totals()`."""
+        return self.totals(**kwargs).tasks
+
+    def exists(self, **kwargs) -> bool:
+        """Whether any task matches the parameters of `list()`, see `totals()`."""
+        return self.count(**kwargs) > 0
+
+    def list_ids(self, *, page_size: int = 1000, **kwargs) -> "IdArray":
+        """
+        The ids of the tasks matching the parameters of `list()`, as a sorted int64 NumPy array: an id-only keyset
+        scan whose pages are copied into the array as they arrive, 8 bytes an id instead of a list of Python ints.
+        Use the helpers of `label_studio_sdk._extensions.id_sets` for differences, intersections and samples.
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+        from label_studio_sdk._extensions import id_sets
+
+        client = LabelStudio(api_key="YOUR_API_KEY")
+        unlabeled = id_sets.difference(client.tasks.list_ids(project=1), labeled_ids)
+        """
+        from label_studio_sdk._extensions.id_sets import IdBuffer
+
+        buffer = IdBuffer()
+        pager = self.list(
+            keyset=True, select=["id"], page_size=page_size, **_raw(kwargs)
+        )
+        for page in pager.iter_pages():
+            buffer.extend(task["id"] for task in page)
+        return buffer.ids()
 
-    list.__doc__ = TasksClient.list.__doc__
+    def update_many(
+        self,
+        updates: typing.Iterable[typing.Tuple[int, typing.Dict[str, typing.Any]]],
+        *,
+        concurrency: int = 8,
+        max_pending: typing.Optional[int] = None,
+        max_retries: int = 2,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> TaskUpdateReport:
+        """
+        Update many tasks with bounded concurrency: `updates` yields `(task_id, patch)` pairs, and every patch is
+        sent as is with `PATCH api/tasks/{id}/`, e.g. `(42, {"meta": {"batch": 7}})`. The pairs are read as the
+        updates complete, at most `max_pending` ahead, so the input can be a generator over any number of tasks.
+
+        429 and 5xx responses are retried `max_retries` times, and so are connection errors. A failed update
+        doesn't stop the others, it's reported with its task id in the returned `TaskUpdateReport`.
+
+        Parameters
+        ----------
+        updates : typing.Iterable[typing.Tuple[int, typing.Dict[str, typing.Any]]]
+            The task ids and the fields to change.
+
+        concurrency : int
+            The number of updates running at the same time, keep it below the connection pool size.
+
+        max_pending : typing.Optional[int]
+            The number of updates queued or running before reading more, twice the concurrency by default.
+
+        on_progress : typing.Optional[typing.Callable[[BatchProgress], None]]
+            Called after every update with the submitted, completed and failed counts, and the throughput.
+
+        Returns
+        -------
+        TaskUpdateReport
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+
+        client = LabelStudio(api_key="YOUR_API_KEY")
+        updates = ((task_id, {"meta": {"source": "v2"}}) for task_id in task_ids)
+        report = client.tasks.update_many(updates, concurrency=16)
+        print(report.updated, report.per_second, [failure.task_id for failure in report.failures])
+        """
+        tracker = _UpdateTracker()
+        with BatchExecutor(
+            concurrency=concurrency,
+            max_pending=max_pending,
+            max_retries=max_retries,
+            on_progress=on_progress,
+            on_result=tracker.on_result,
+            keep_results=False,
+        ) as batch:
+            for task_id, patch in updates:
+                tracker.submitting(task_id)
+                batch.submit(
+                    self._patch, task_id, patch, request_options=request_options
+                )
+        return tracker.finish()
+
+    def _patch(
+        self,
+        task_id: int,
+        patch: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> None:
+        response = self._client_wrapper.httpx_client.request(
+            f"api/tasks/{jsonable_encoder(task_id)}/",
+            method="PATCH",
+            json=patch,
+            request_options=request_options,
+        )
+        _check_updated(response)
+
+    def watch(
+        self,
+        *,
+        project: int,
+        since: typing.Union[datetime.datetime, str, None] = None,
+        query: typing.Union[str, typing.Dict[str, typing.Any], None] = None,
+        page_size: int = 100,
+        interval: float = 5.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        seen: typing.Iterable[int] = (),
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> TaskWatch[Task]:
+        """
+        Watch the tasks of a project change: iterate forever over the tasks created or updated after `since`,
+        each change once, ordered by `updated_at`. Without `since`, the changes after the last task updated are
+        yielded. `watch.watermark` is the `updated_at` of the last change, pass it as `since` to resume: the tasks
+        updated at that time are yielded again, unless their ids are passed as `seen`.
+
+        Polls that find no change are followed by a wait of `interval` seconds, multiplied by `backoff` after every
+        idle poll up to `max_interval`. The filters of `query` must be combined with "and".
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+
+        client = LabelStudio(api_key="YOUR_API_KEY")
+        for task in client.tasks.watch(project=1, since="2024-01-01T00:00:00Z", interval=10):
+            print(task.id, task.updated_at)
+        """
+        params = {"fields": "all", **params, "project": project, "page_size": page_size}
+        return TaskWatch(
+            fetch_page=lambda query: self._get_page(
+                1, {**params, "query": query}, request_options
+            )[0],
+            page_size=page_size,
+            query=query,
+            since=since,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            seen=seen,
+        )
+
+    def stream(
+        self,
+        *,
+        page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+        **kwargs,
+    ) -> typing.Iterator[Task]:
+        """
+        Iterate over tasks like `list()` does, but decode every page incrementally while it is downloaded.
+        Tasks are yielded one at a time, so the peak memory is bounded by the largest task instead of a page.
+
+        Parameters
+        ----------
+        page : int
+            The page number to start from.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        **kwargs
+            The query parameters of `list()`: page_size, view, project, resolve_uri, fields, review, include, query.
+
+        Returns
+        -------
+        typing.Iterator[Task]
+
+        Examples
+        --------
+        from label_studio_sdk.client import LabelStudio
+
+        client = LabelStudio(
+            api_key="YOUR_API_KEY",
+        )
+        for task in client.tasks.stream(project=1, page_size=1000):
+            print(task.id)
+        """
+        mode = self._client_wrapper.get_response_mode(request_options)
+        while True:
+            count = 0
+            try:
+                for item in stream_json_items(
+                    self._client_wrapper.httpx_client,
+                    "api/tasks/",
+                    prefix="tasks.item",
+                    params=_stream_params(page, kwargs),
+                    request_options=request_options,
+                ):
+                    count += 1
+                    yield parse_obj_as(Task, item, mode=mode)
+            except ApiError as exc:
+                # the end of the pagination is reported with 404
+                if exc.status_code == 404:
+                    return
+                raise
+            if count == 0:
+                return
+            page += 1
 
 
 class AsyncTasksClientExt(AsyncTasksClient):
 
-    async def list(self, **kwargs):
+    async def list(
+        self,
+        *,
+        prefetch: int = 0,
+        parallel: typing.Optional[int] = None,
+        ordered: bool = True,
+        keyset: bool = False,
+        adaptive: typing.Union[bool, PageSizer] = False,
+        resume_from: typing.Union[Checkpoint, str, None] = None,
+        checkpoint: typing.Optional[CheckpointStore] = None,
+        select: typing.Optional[typing.Sequence[str]] = None,
+        **kwargs,
+    ) -> typing.Union[
+        AsyncPagerExt[T],
+        AsyncParallelPager[Task],
+        AsyncKeysetPager[Task],
+        AsyncAdaptivePager[Task],
+    ]:
+        """
+        Retrieve the tasks of a project or view, page by page, with `fields="all"` by default.
+
+        The pages are fetched one after the other unless one of `prefetch`, `parallel`, `keyset` or `adaptive` is
+        given, those can't be combined. Every pager can be drained with `drain()` to hold about one page in memory,
+        and the default one turned into columns with `to_dataframe()` or `to_arrow()`.
+
+        Parameters
+        ----------
+        prefetch : int
+            Number of pages fetched ahead in a background task while the current one is processed.
+
+        parallel : typing.Optional[int]
+            Number of tasks fetching the pages after the first one at once, from the total it reports.
+            Can't be checkpointed.
+
+        ordered : bool
+            Whether the pages of `parallel` are yielded in order, rather than as soon as they arrive.
+
+        keyset : bool
+            Page by task id (`id > after_id`) instead of page number, for deep listings. Can't be combined with
+            `page` or `view`.
+
+        adaptive : typing.Union[bool, PageSizer]
+            Size every page from the payload size and latency of the previous one, with a default `PageSizer`
+            when True.
+
+        resume_from : typing.Union[Checkpoint, str, None]
+            A checkpoint of a previous listing with the same parameters, from `pager.checkpoint()` or its token,
+            to continue where it stopped.
+
+        checkpoint : typing.Optional[CheckpointStore]
+            Where the checkpoint is saved after every page, e.g. `FileCheckpoint`. It is cleared once the listing
+            completes.
+
+        select : typing.Optional[typing.Sequence[str]]
+            The only fields to fetch and keep, e.g. `["id", "data.image"]`, see `Projection`. Can't be combined
+            with `fields` or `include`.
+
+        **kwargs
+            The parameters of the generated `list()`: `page`, `page_size`, `view`, `project`, `resolve_uri`,
+            `fields`, `review`, `include`, `query` and `request_options`, and `after_id` with `keyset`.
+
+        Returns
+        -------
+        typing.Union[AsyncPagerExt[Task], AsyncParallelPager[Task], AsyncKeysetPager[Task], AsyncAdaptivePager[Task]]
+            An `AsyncPagerExt` by default or with `prefetch`, whose total is `await pager.get_total()`, otherwise
+            the pager of the mode.
+
+        Examples
+        --------
+        from label_studio_sdk.client import AsyncLabelStudio
+
+        client = AsyncLabelStudio(api_key="YOUR_API_KEY")
+        pager = await client.tasks.list(project=1, select=["id", "data.image"], prefetch=2)
+        async for task in pager:
+            print(task.id)
+        """
+        # `select` fetches only the listed fields, e.g. ["id", "data.image"], see `Projection`
+        projection = _projection(select, kwargs)
         # use `fields: all` by default and return the full data
-        kwargs['fields'] = kwargs.get('fields', 'all')
-        return await AsyncPagerExt.from_async_pager(await super().list(**kwargs))
+        kwargs["fields"] = kwargs.get("fields", "all")
+        _check_modes(prefetch, parallel, keyset, adaptive, kwargs)
+        # `resume_from` continues from `pager.checkpoint()`, `checkpoint` saves it after every page, see `FileCheckpoint`
+        checkpointer = _list_checkpointer(
+            parallel, keyset, adaptive, kwargs, resume_from, checkpoint
+        )
+        # `keyset` pages by task id instead of page number, see `AsyncKeysetPager`
+        if keyset:
+            return self._list_keyset(
+                checkpointer=checkpointer, projection=projection, **kwargs
+            )
+        # `adaptive` sizes every page from the size and latency of the previous one, see `PageSizer`
+        if adaptive:
+            return self._list_adaptive(
+                adaptive=adaptive,
+                checkpointer=checkpointer,
+                projection=projection,
+                **kwargs,
+            )
+        # `parallel` fetches the pages after the first one concurrently, see `AsyncParallelPager`
+        if parallel is not None:
+            return await self._list_parallel(
+                parallel=parallel, ordered=ordered, projection=projection, **kwargs
+            )
+        # `prefetch` fetches up to that many pages ahead in a background task
+        # the pages are read here rather than by the generated pager, which drops the total of the first one
+        pager, total = await self._list_selected(projection=projection, **kwargs)
+        return await AsyncPagerExt.from_async_pager(
+            pager,
+            prefetch=prefetch,
+            checkpointer=checkpointer,
+            total=total,
+            counter=functools.partial(self.count, **_counter_params(kwargs)),
+        )
+
+    async def _get_page(
+        self,
+        page: int,
+        params: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions],
+        projection: typing.Optional[Projection] = None,
+    ) -> typing.Tuple[typing.List[Task], typing.Optional[int]]:
+        response = await self._client_wrapper.httpx_client.request(
+            "api/tasks/",
+            method="GET",
+            params={**params, "page": page},
+            request_options=request_options,
+        )
+        return _parse_tasks_page(
+            self._client_wrapper, response, request_options, projection
+        )
+
+    async def _get_sized_page(
+        self,
+        page: int,
+        page_size: int,
+        params: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions],
+        projection: typing.Optional[Projection] = None,
+    ) -> FetchedPage:
+        started = time.perf_counter()
+        response = await self._client_wrapper.httpx_client.request(
+            "api/tasks/",
+            method="GET",
+            params={**params, "page": page, "page_size": page_size},
+            request_options=request_options,
+        )
+        seconds = time.perf_counter() - started
+        items, total = _parse_tasks_page(
+            self._client_wrapper, response, request_options, projection
+        )
+        return items, len(response.content), seconds, total
+
+    async def _list_selected(
+        self,
+        *,
+        projection: typing.Optional[Projection],
+        page: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> typing.Tuple[AsyncPager[Task], typing.Optional[int]]:
+        # the pages of `list()`, trimmed to the selected fields, if any, before they are parsed,
+        # and the total number of tasks reported with them
+        page = page or 1
+        items, total = await self._get_page(page, params, request_options, projection)
+
+        async def get_next() -> AsyncPager[Task]:
+            pager, _ = await self._list_selected(
+                projection=projection,
+                page=page + 1,
+                request_options=request_options,
+                **params,
+            )
+            return pager
+
+        pager = AsyncPager(has_next=True, items=items, get_next=get_next)
+        return pager, total
+
+    def _list_adaptive(
+        self,
+        *,
+        adaptive: typing.Union[bool, PageSizer],
+        page: typing.Optional[int] = None,
+        page_size: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        checkpointer: typing.Optional[Checkpointer] = None,
+        projection: typing.Optional[Projection] = None,
+        **params,
+    ) -> AsyncAdaptivePager[Task]:
+        async def fetch_page(page: int, page_size: int) -> FetchedPage:
+            return await self._get_sized_page(
+                page, page_size, params, request_options, projection
+            )
+
+        return AsyncAdaptivePager(
+            fetch_page=fetch_page,
+            sizer=_page_sizer(adaptive, page_size),
+            page=page or 1,
+            checkpointer=checkpointer,
+        )
+
+    async def _list_parallel(
+        self,
+        *,
+        parallel: int,
+        ordered: bool,
+        page: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        projection: typing.Optional[Projection] = None,
+        **params,
+    ) -> AsyncParallelPager[Task]:
+        request_options = _parallel_request_options(request_options)
+        first_page = page or 1
+        try:
+            first_items, total = await self._get_page(
+                first_page, params, request_options, projection
+            )
+        except ApiError as exc:
+            # the end of the pagination is reported with 404
+            if exc.status_code != 404:
+                raise
+            first_items, total = [], 0
+
+        async def fetch_page(page: int) -> typing.List[Task]:
+            items, _ = await self._get_page(page, params, request_options, projection)
+            return items
+
+        return AsyncParallelPager(
+            fetch_page=fetch_page,
+            first_page=first_page,
+            first_items=first_items,
+            total=total,
+            page_size=params.get("page_size"),
+            parallel=parallel,
+            ordered=ordered,
+        )
+
+    def _list_keyset(
+        self,
+        *,
+        query: typing.Optional[str] = None,
+        after_id: typing.Optional[int] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        checkpointer: typing.Optional[Checkpointer] = None,
+        projection: typing.Optional[Projection] = None,
+        **params,
+    ) -> AsyncKeysetPager[Task]:
+        async def fetch_page(query: str) -> typing.List[Task]:
+            items, _ = await self._get_page(
+                1, {**params, "query": query}, request_options, projection
+            )
+            return items
+
+        return AsyncKeysetPager(
+            fetch_page=fetch_page,
+            query=query,
+            after_id=after_id,
+            checkpointer=checkpointer,
+        )
+
+    async def iter_all_parallel(
+        self, *, parallel: int = 8, ordered: bool = True, **kwargs
+    ) -> typing.AsyncIterator[Task]:
+        """
+        Iterate over all the tasks matching the `list()` parameters, fetching the pages concurrently.
+
+        The first page reports the total number of tasks, then the remaining pages are requested at once,
+        `parallel` at a time. Failed pages are retried individually.
+
+        Parameters
+        ----------
+        parallel : int
+            The number of pages fetched at the same time, keep it below the connection pool size.
+
+        ordered : bool
+            Yield the tasks in page order. With `False`, the pages are yielded as soon as they are fetched.
+
+        **kwargs
+            The parameters of `list()`: page, page_size, view, project, resolve_uri, fields, review, include, query,
+            request_options.
+
+        Returns
+        -------
+        typing.AsyncIterator[Task]
+
+        Examples
+        --------
+        from label_studio_sdk.client import AsyncLabelStudio
+
+        client = AsyncLabelStudio(
+            api_key="YOUR_API_KEY",
+        )
+        async for task in client.tasks.iter_all_parallel(project=1, page_size=1000, parallel=8):
+            print(task.id)
+        """
+        pager = await self.list(parallel=parallel, ordered=ordered, **kwargs)
+        async for task in pager:
+            yield task
+
+    async def totals(
+        self,
+        *,
+        project: typing.Optional[int] = None,
+        view: typing.Optional[int] = None,
+        query: typing.Union[str, typing.Dict[str, typing.Any], None] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> TaskTotals:
+        """
+        Count the tasks matching the parameters of `list()`, and their annotations and predictions, with a single
+        request for one task with its id only.
+
+        Examples
+        --------
+        from label_studio_sdk.client import AsyncLabelStudio
+
+        client = AsyncLabelStudio(api_key="YOUR_API_KEY")
+        totals = await client.tasks.totals(project=1, query=query)
+        print(totals.tasks, totals.annotations, totals.predictions)
+        """
+        response = await self._client_wrapper.httpx_client.request(
+            "api/tasks/",
+            method="GET",
+            params=_totals_params(query, {"project": project, "view": view, **params}),
+            request_options=request_options,
+        )
+        return _parse_totals(self._client_wrapper, response)
+
+    async def count(self, **kwargs) -> int:
+        """The number of tasks matching the parameters of `list()`, see `totals()`."""
+        return (await self.totals(**kwargs)).tasks
+
+    async def exists(self, **kwargs) -> bool:
+        """Whether any task matches the parameters of `list()`, see `totals()`."""
+        return await self.count(**kwargs) > 0
+
+    async def list_ids(self, *, page_size: int = 1000, **kwargs) -> "IdArray":
+        """
+        The ids of the tasks matching the parameters of `list()`, as a sorted int64 NumPy array: an id-only keyset
+        scan whose pages are copied into the array as they arrive, 8 bytes an id instead of a list of Python ints.
+        Use the helpers of `label_studio_sdk._extensions.id_sets` for differences, intersections and samples.
+
+        Examples
+        --------
+        from label_studio_sdk.client import AsyncLabelStudio
+        from label_studio_sdk._extensions import id_sets
+
+        client = AsyncLabelStudio(api_key="YOUR_API_KEY")
+        unlabeled = id_sets.difference(await client.tasks.list_ids(project=1), labeled_ids)
+        """
+        from label_studio_sdk._extensions.id_sets import IdBuffer
+
+        buffer = IdBuffer()
+        pager = await self.list(
+            keyset=True, select=["id"], page_size=page_size, **_raw(kwargs)
+        )
+        async for page in pager.iter_pages():
+            buffer.extend(task["id"] for task in page)
+        return buffer.ids()
+
+    async def update_many(
+        self,
+        updates: typing.Union[
+            typing.Iterable[typing.Tuple[int, typing.Dict[str, typing.Any]]],
+            typing.AsyncIterable[typing.Tuple[int, typing.Dict[str, typing.Any]]],
+        ],
+        *,
+        concurrency: int = 8,
+        max_pending: typing.Optional[int] = None,
+        max_retries: int = 2,
+        on_progress: typing.Optional[typing.Callable[[BatchProgress], None]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> TaskUpdateReport:
+        """
+        Update many tasks with bounded concurrency: `updates` yields `(task_id, patch)` pairs, and every patch is
+        sent as is with `PATCH api/tasks/{id}/`, e.g. `(42, {"meta": {"batch": 7}})`. The pairs are read as the
+        updates complete, at most `max_pending` ahead, so the input can be a generator over any number of tasks.
+
+        429 and 5xx responses are retried `max_retries` times, and so are connection errors. A failed update
+        doesn't stop the others, it's reported with its task id in the returned `TaskUpdateReport`.
+
+        Parameters
+        ----------
+        updates : typing.Iterable[typing.Tuple[int, typing.Dict[str, typing.Any]]]
+            The task ids and the fields to change.
+
+        concurrency : int
+            The number of updates running at the same time, keep it below the connection pool size.
+
+        max_pending : typing.Optional[int]
+            The number of updates queued or running before reading more, twice the concurrency by default.
+
+        on_progress : typing.Optional[typing.Callable[[BatchProgress], None]]
+            Called after every update with the submitted, completed and failed counts, and the throughput.
+
+        Returns
+        -------
+        TaskUpdateReport
+
+        Examples
+        --------
+        from label_studio_sdk.client import AsyncLabelStudio
+
+        client = AsyncLabelStudio(api_key="YOUR_API_KEY")
+        updates = ((task_id, {"meta": {"source": "v2"}}) for task_id in task_ids)
+        report = await client.tasks.update_many(updates, concurrency=16)
+        print(report.updated, report.per_second, [failure.task_id for failure in report.failures])
+        """
+        tracker = _UpdateTracker()
+        async with AsyncBatchExecutor(
+            concurrency=concurrency,
+            max_pending=max_pending,
+            max_retries=max_retries,
+            on_progress=on_progress,
+            on_result=tracker.on_result,
+            keep_results=False,
+        ) as batch:
+            if isinstance(updates, typing.AsyncIterable):
+                async for task_id, patch in updates:
+                    tracker.submitting(task_id)
+                    await batch.submit(
+                        self._patch, task_id, patch, request_options=request_options
+                    )
+            else:
+                for task_id, patch in updates:
+                    tracker.submitting(task_id)
+                    await batch.submit(
+                        self._patch, task_id, patch, request_options=request_options
+                    )
+        return tracker.finish()
+
+    async def _patch(
+        self,
+        task_id: int,
+        patch: typing.Dict[str, typing.Any],
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> None:
+        response = await self._client_wrapper.httpx_client.request(
+            f"api/tasks/{jsonable_encoder(task_id)}/",
+            method="PATCH",
+            json=patch,
+            request_options=request_options,
+        )
+        _check_updated(response)
+
+    def watch(
+        self,
+        *,
+        project: int,
+        since: typing.Union[datetime.datetime, str, None] = None,
+        query: typing.Union[str, typing.Dict[str, typing.Any], None] = None,
+        page_size: int = 100,
+        interval: float = 5.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        seen: typing.Iterable[int] = (),
+        request_options: typing.Optional[RequestOptions] = None,
+        **params,
+    ) -> AsyncTaskWatch[Task]:
+        """
+        Watch the tasks of a project change: iterate forever over the tasks created or updated after `since`,
+        each change once, ordered by `updated_at`. Without `since`, the changes after the last task updated are
+        yielded. `watch.watermark` is the `updated_at` of the last change, pass it as `since` to resume: the tasks
+        updated at that time are yielded again, unless their ids are passed as `seen`.
+
+        Polls that find no change are followed by a wait of `interval` seconds, multiplied by `backoff` after every
+        idle poll up to `max_interval`. The filters of `query` must be combined with "and".
+
+        Examples
+        --------
+        from label_studio_sdk.client import AsyncLabelStudio
+
+        client = AsyncLabelStudio(api_key="YOUR_API_KEY")
+        async for task in client.tasks.watch(project=1, since="2024-01-01T00:00:00Z", interval=10):
+            print(task.id, task.updated_at)
+        """
+        params = {"fields": "all", **params, "project": project, "page_size": page_size}
+
+        async def fetch_page(query: str) -> typing.List[Task]:
+            items, _ = await self._get_page(
+                1, {**params, "query": query}, request_options
+            )
+            return items
+
+        return AsyncTaskWatch(
+            fetch_page=fetch_page,
+            page_size=page_size,
+            query=query,
+            since=since,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            seen=seen,
+        )
+
+    async def stream(
+        self,
+        *,
+        page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+        **kwargs,
+    ) -> typing.AsyncIterator[Task]:
+        mode = self._client_wrapper.get_response_mode(request_options)
+        while True:
+            count = 0
+            try:
+                async for item in astream_json_items(
+                    self._client_wrapper.httpx_client,
+                    "api/tasks/",
+                    prefix="tasks.item",
+                    params=_stream_params(page, kwargs),
+                    request_options=request_options,
+                ):
+                    count += 1
+                    yield parse_obj_as(Task, item, mode=mode)
+            except ApiError as exc:
+                if exc.status_code == 404:
+                    return
+                raise
+            if count == 0:
+                return
+            page += 1
 
-    list.__doc__ = AsyncTasksClient.list.__doc__
+    stream.__doc__ = TasksClientExt.stream.__doc__
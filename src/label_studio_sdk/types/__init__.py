@@ -1,92 +1,203 @@
 # This file was auto-generated by Fern from our API Definition.
 
-from .annotation import Annotation
-from .annotation_filter_options import AnnotationFilterOptions
-from .annotation_last_action import AnnotationLastAction
-from .annotations_dm_field import AnnotationsDmField
-from .annotations_dm_field_last_action import AnnotationsDmFieldLastAction
-from .azure_blob_export_storage import AzureBlobExportStorage
-from .azure_blob_export_storage_status import AzureBlobExportStorageStatus
-from .azure_blob_import_storage import AzureBlobImportStorage
-from .azure_blob_import_storage_status import AzureBlobImportStorageStatus
-from .base_task import BaseTask
-from .base_task_file_upload import BaseTaskFileUpload
-from .base_task_updated_by import BaseTaskUpdatedBy
-from .base_user import BaseUser
-from .comment import Comment
-from .comment_created_by import CommentCreatedBy
-from .converted_format import ConvertedFormat
-from .converted_format_status import ConvertedFormatStatus
-from .data_manager_task_serializer import DataManagerTaskSerializer
-from .data_manager_task_serializer_annotators_item import DataManagerTaskSerializerAnnotatorsItem
-from .data_manager_task_serializer_drafts_item import DataManagerTaskSerializerDraftsItem
-from .data_manager_task_serializer_predictions_item import DataManagerTaskSerializerPredictionsItem
-from .export import Export
-from .export_convert import ExportConvert
-from .export_create import ExportCreate
-from .export_create_status import ExportCreateStatus
-from .export_status import ExportStatus
-from .file_upload import FileUpload
-from .filter import Filter
-from .filter_group import FilterGroup
-from .gcs_export_storage import GcsExportStorage
-from .gcs_export_storage_status import GcsExportStorageStatus
-from .gcs_import_storage import GcsImportStorage
-from .gcs_import_storage_status import GcsImportStorageStatus
-from .inference_run import InferenceRun
-from .inference_run_created_by import InferenceRunCreatedBy
-from .inference_run_organization import InferenceRunOrganization
-from .inference_run_project_subset import InferenceRunProjectSubset
-from .inference_run_status import InferenceRunStatus
-from .local_files_export_storage import LocalFilesExportStorage
-from .local_files_export_storage_status import LocalFilesExportStorageStatus
-from .local_files_import_storage import LocalFilesImportStorage
-from .local_files_import_storage_status import LocalFilesImportStorageStatus
-from .ml_backend import MlBackend
-from .ml_backend_auth_method import MlBackendAuthMethod
-from .ml_backend_state import MlBackendState
-from .model_provider_connection import ModelProviderConnection
-from .model_provider_connection_created_by import ModelProviderConnectionCreatedBy
-from .model_provider_connection_organization import ModelProviderConnectionOrganization
-from .model_provider_connection_provider import ModelProviderConnectionProvider
-from .model_provider_connection_scope import ModelProviderConnectionScope
-from .prediction import Prediction
-from .project import Project
-from .project_import import ProjectImport
-from .project_import_status import ProjectImportStatus
-from .project_label_config import ProjectLabelConfig
-from .project_sampling import ProjectSampling
-from .project_skip_queue import ProjectSkipQueue
-from .prompt import Prompt
-from .prompt_created_by import PromptCreatedBy
-from .prompt_organization import PromptOrganization
-from .prompt_version import PromptVersion
-from .prompt_version_created_by import PromptVersionCreatedBy
-from .prompt_version_organization import PromptVersionOrganization
-from .prompt_version_provider import PromptVersionProvider
-from .redis_export_storage import RedisExportStorage
-from .redis_export_storage_status import RedisExportStorageStatus
-from .redis_import_storage import RedisImportStorage
-from .redis_import_storage_status import RedisImportStorageStatus
-from .s3export_storage import S3ExportStorage
-from .s3export_storage_status import S3ExportStorageStatus
-from .s3import_storage import S3ImportStorage
-from .s3import_storage_status import S3ImportStorageStatus
-from .s3s_export_storage import S3SExportStorage
-from .s3s_import_storage import S3SImportStorage
-from .s3s_import_storage_status import S3SImportStorageStatus
-from .serialization_option import SerializationOption
-from .serialization_options import SerializationOptions
-from .task import Task
-from .task_annotators_item import TaskAnnotatorsItem
-from .task_filter_options import TaskFilterOptions
-from .user_simple import UserSimple
-from .view import View
-from .webhook import Webhook
-from .webhook_actions_item import WebhookActionsItem
-from .webhook_serializer_for_update import WebhookSerializerForUpdate
-from .webhook_serializer_for_update_actions_item import WebhookSerializerForUpdateActionsItem
-from .workspace import Workspace
+# isort: skip_file
+
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from .annotation import Annotation
+    from .annotation_filter_options import AnnotationFilterOptions
+    from .annotation_last_action import AnnotationLastAction
+    from .annotations_dm_field import AnnotationsDmField
+    from .annotations_dm_field_last_action import AnnotationsDmFieldLastAction
+    from .azure_blob_export_storage import AzureBlobExportStorage
+    from .azure_blob_export_storage_status import AzureBlobExportStorageStatus
+    from .azure_blob_import_storage import AzureBlobImportStorage
+    from .azure_blob_import_storage_status import AzureBlobImportStorageStatus
+    from .base_task import BaseTask
+    from .base_task_file_upload import BaseTaskFileUpload
+    from .base_task_updated_by import BaseTaskUpdatedBy
+    from .base_user import BaseUser
+    from .comment import Comment
+    from .comment_created_by import CommentCreatedBy
+    from .converted_format import ConvertedFormat
+    from .converted_format_status import ConvertedFormatStatus
+    from .data_manager_task_serializer import DataManagerTaskSerializer
+    from .data_manager_task_serializer_annotators_item import DataManagerTaskSerializerAnnotatorsItem
+    from .data_manager_task_serializer_drafts_item import DataManagerTaskSerializerDraftsItem
+    from .data_manager_task_serializer_predictions_item import DataManagerTaskSerializerPredictionsItem
+    from .export import Export
+    from .export_convert import ExportConvert
+    from .export_create import ExportCreate
+    from .export_create_status import ExportCreateStatus
+    from .export_status import ExportStatus
+    from .file_upload import FileUpload
+    from .filter import Filter
+    from .filter_group import FilterGroup
+    from .gcs_export_storage import GcsExportStorage
+    from .gcs_export_storage_status import GcsExportStorageStatus
+    from .gcs_import_storage import GcsImportStorage
+    from .gcs_import_storage_status import GcsImportStorageStatus
+    from .inference_run import InferenceRun
+    from .inference_run_created_by import InferenceRunCreatedBy
+    from .inference_run_organization import InferenceRunOrganization
+    from .inference_run_project_subset import InferenceRunProjectSubset
+    from .inference_run_status import InferenceRunStatus
+    from .local_files_export_storage import LocalFilesExportStorage
+    from .local_files_export_storage_status import LocalFilesExportStorageStatus
+    from .local_files_import_storage import LocalFilesImportStorage
+    from .local_files_import_storage_status import LocalFilesImportStorageStatus
+    from .ml_backend import MlBackend
+    from .ml_backend_auth_method import MlBackendAuthMethod
+    from .ml_backend_state import MlBackendState
+    from .model_provider_connection import ModelProviderConnection
+    from .model_provider_connection_created_by import ModelProviderConnectionCreatedBy
+    from .model_provider_connection_organization import ModelProviderConnectionOrganization
+    from .model_provider_connection_provider import ModelProviderConnectionProvider
+    from .model_provider_connection_scope import ModelProviderConnectionScope
+    from .prediction import Prediction
+    from .project import Project
+    from .project_import import ProjectImport
+    from .project_import_status import ProjectImportStatus
+    from .project_label_config import ProjectLabelConfig
+    from .project_sampling import ProjectSampling
+    from .project_skip_queue import ProjectSkipQueue
+    from .prompt import Prompt
+    from .prompt_created_by import PromptCreatedBy
+    from .prompt_organization import PromptOrganization
+    from .prompt_version import PromptVersion
+    from .prompt_version_created_by import PromptVersionCreatedBy
+    from .prompt_version_organization import PromptVersionOrganization
+    from .prompt_version_provider import PromptVersionProvider
+    from .redis_export_storage import RedisExportStorage
+    from .redis_export_storage_status import RedisExportStorageStatus
+    from .redis_import_storage import RedisImportStorage
+    from .redis_import_storage_status import RedisImportStorageStatus
+    from .s3export_storage import S3ExportStorage
+    from .s3export_storage_status import S3ExportStorageStatus
+    from .s3import_storage import S3ImportStorage
+    from .s3import_storage_status import S3ImportStorageStatus
+    from .s3s_export_storage import S3SExportStorage
+    from .s3s_import_storage import S3SImportStorage
+    from .s3s_import_storage_status import S3SImportStorageStatus
+    from .serialization_option import SerializationOption
+    from .serialization_options import SerializationOptions
+    from .task import Task
+    from .task_annotators_item import TaskAnnotatorsItem
+    from .task_filter_options import TaskFilterOptions
+    from .user_simple import UserSimple
+    from .view import View
+    from .webhook import Webhook
+    from .webhook_actions_item import WebhookActionsItem
+    from .webhook_serializer_for_update import WebhookSerializerForUpdate
+    from .webhook_serializer_for_update_actions_item import WebhookSerializerForUpdateActionsItem
+    from .workspace import Workspace
+_dynamic_imports: typing.Dict[str, str] = {
+    "Annotation": ".annotation",
+    "AnnotationFilterOptions": ".annotation_filter_options",
+    "AnnotationLastAction": ".annotation_last_action",
+    "AnnotationsDmField": ".annotations_dm_field",
+    "AnnotationsDmFieldLastAction": ".annotations_dm_field_last_action",
+    "AzureBlobExportStorage": ".azure_blob_export_storage",
+    "AzureBlobExportStorageStatus": ".azure_blob_export_storage_status",
+    "AzureBlobImportStorage": ".azure_blob_import_storage",
+    "AzureBlobImportStorageStatus": ".azure_blob_import_storage_status",
+    "BaseTask": ".base_task",
+    "BaseTaskFileUpload": ".base_task_file_upload",
+    "BaseTaskUpdatedBy": ".base_task_updated_by",
+    "BaseUser": ".base_user",
+    "Comment": ".comment",
+    "CommentCreatedBy": ".comment_created_by",
+    "ConvertedFormat": ".converted_format",
+    "ConvertedFormatStatus": ".converted_format_status",
+    "DataManagerTaskSerializer": ".data_manager_task_serializer",
+    "DataManagerTaskSerializerAnnotatorsItem": ".data_manager_task_serializer_annotators_item",
+    "DataManagerTaskSerializerDraftsItem": ".data_manager_task_serializer_drafts_item",
+    "DataManagerTaskSerializerPredictionsItem": ".data_manager_task_serializer_predictions_item",
+    "Export": ".export",
+    "ExportConvert": ".export_convert",
+    "ExportCreate": ".export_create",
+    "ExportCreateStatus": ".export_create_status",
+    "ExportStatus": ".export_status",
+    "FileUpload": ".file_upload",
+    "Filter": ".filter",
+    "FilterGroup": ".filter_group",
+    "GcsExportStorage": ".gcs_export_storage",
+    "GcsExportStorageStatus": ".gcs_export_storage_status",
+    "GcsImportStorage": ".gcs_import_storage",
+    "GcsImportStorageStatus": ".gcs_import_storage_status",
+    "InferenceRun": ".inference_run",
+    "InferenceRunCreatedBy": ".inference_run_created_by",
+    "InferenceRunOrganization": ".inference_run_organization",
+    "InferenceRunProjectSubset": ".inference_run_project_subset",
+    "InferenceRunStatus": ".inference_run_status",
+    "LocalFilesExportStorage": ".local_files_export_storage",
+    "LocalFilesExportStorageStatus": ".local_files_export_storage_status",
+    "LocalFilesImportStorage": ".local_files_import_storage",
+    "LocalFilesImportStorageStatus": ".local_files_import_storage_status",
+    "MlBackend": ".ml_backend",
+    "MlBackendAuthMethod": ".ml_backend_auth_method",
+    "MlBackendState": ".ml_backend_state",
+    "ModelProviderConnection": ".model_provider_connection",
+    "ModelProviderConnectionCreatedBy": ".model_provider_connection_created_by",
+    "ModelProviderConnectionOrganization": ".model_provider_connection_organization",
+    "ModelProviderConnectionProvider": ".model_provider_connection_provider",
+    "ModelProviderConnectionScope": ".model_provider_connection_scope",
+    "Prediction": ".prediction",
+    "Project": ".project",
+    "ProjectImport": ".project_import",
+    "ProjectImportStatus": ".project_import_status",
+    "ProjectLabelConfig": ".project_label_config",
+    "ProjectSampling": ".project_sampling",
+    "ProjectSkipQueue": ".project_skip_queue",
+    "Prompt": ".prompt",
+    "PromptCreatedBy": ".prompt_created_by",
+    "PromptOrganization": ".prompt_organization",
+    "PromptVersion": ".prompt_version",
+    "PromptVersionCreatedBy": ".prompt_version_created_by",
+    "PromptVersionOrganization": ".prompt_version_organization",
+    "PromptVersionProvider": ".prompt_version_provider",
+    "RedisExportStorage": ".redis_export_storage",
+    "RedisExportStorageStatus": ".redis_export_storage_status",
+    "RedisImportStorage": ".redis_import_storage",
+    "RedisImportStorageStatus": ".redis_import_storage_status",
+    "S3ExportStorage": ".s3export_storage",
+    "S3ExportStorageStatus": ".s3export_storage_status",
+    "S3ImportStorage": ".s3import_storage",
+    "S3ImportStorageStatus": ".s3import_storage_status",
+    "S3SExportStorage": ".s3s_export_storage",
+    "S3SImportStorage": ".s3s_import_storage",
+    "S3SImportStorageStatus": ".s3s_import_storage_status",
+    "SerializationOption": ".serialization_option",
+    "SerializationOptions": ".serialization_options",
+    "Task": ".task",
+    "TaskAnnotatorsItem": ".task_annotators_item",
+    "TaskFilterOptions": ".task_filter_options",
+    "UserSimple": ".user_simple",
+    "View": ".view",
+    "Webhook": ".webhook",
+    "WebhookActionsItem": ".webhook_actions_item",
+    "WebhookSerializerForUpdate": ".webhook_serializer_for_update",
+    "WebhookSerializerForUpdateActionsItem": ".webhook_serializer_for_update_actions_item",
+    "Workspace": ".workspace",
+}
+
+
+def __getattr__(attr_name: str) -> typing.Any:
+    # names are imported on first access, so that `import label_studio_sdk` stays cheap
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
+    module = import_module(module_name, __package__)
+    value = module if module_name == f".{attr_name}" else getattr(module, attr_name)
+    globals()[attr_name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_dynamic_imports))
+
 
 __all__ = [
     "Annotation",
@@ -0,0 +1,34 @@
+import typing
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+
+Backend = typing.Union[FakeLabelStudio, httpx.BaseTransport]
+AsyncBackend = typing.Union[FakeLabelStudio, httpx.AsyncBaseTransport]
+
+
+@pytest.fixture
+def fake_client() -> typing.Callable[..., LabelStudio]:
+    """Builds a client sending its requests to a FakeLabelStudio or to an httpx transport, e.g. a MockTransport."""
+
+    def make(backend: Backend, **kwargs: typing.Any) -> LabelStudio:
+        transport = backend.transport() if isinstance(backend, FakeLabelStudio) else backend
+        return LabelStudio(api_key="fake", base_url="http://fake", httpx_client=httpx.Client(transport=transport), **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def async_fake_client() -> typing.Callable[..., AsyncLabelStudio]:
+    """The async counterpart of `fake_client`."""
+
+    def make(backend: AsyncBackend, **kwargs: typing.Any) -> AsyncLabelStudio:
+        transport = backend.async_transport() if isinstance(backend, FakeLabelStudio) else backend
+        return AsyncLabelStudio(
+            api_key="fake", base_url="http://fake", httpx_client=httpx.AsyncClient(transport=transport), **kwargs
+        )
+
+    return make
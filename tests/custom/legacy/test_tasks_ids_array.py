@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import numpy as np
+import requests_mock
+
+from label_studio_sdk import Client
+
+
+def _project(m):
+    m.get("http://fake.url/api/version", json={"version": "1.0.0"}, status_code=200)
+    m.get("http://fake.url/api/projects/1", json={"id": 1, "title": "fake_project"}, status_code=200)
+    return Client(url="http://fake.url", api_key="fake_key").get_project(1)
+
+
+def test_get_tasks_ids_array():
+    with requests_mock.Mocker() as m:
+        project = _project(m)
+        m.get(
+            "http://fake.url/api/tasks",
+            [
+                {"json": {"tasks": [{"id": 5}, {"id": 2}], "total": 3}, "status_code": 200},
+                {"json": {"tasks": [{"id": 9}], "total": 3}, "status_code": 200},
+                {"json": {"detail": "Invalid page."}, "status_code": 404},
+            ],
+        )
+        ids = project.get_tasks_ids_array(page_size=2)
+    assert ids.dtype == np.int64 and ids.tolist() == [2, 5, 9]
+
+
+def _assign(overlap, fraction=1.0, seed=None):
+    with requests_mock.Mocker() as m:
+        project = _project(m)
+    project.get_tasks_ids_array = lambda view_id=None: np.arange(1, 101)
+    assigned = {}
+
+    def assign_function(users, tasks_ids):
+        assert all(type(task_id) is int for task_id in tasks_ids)
+        assigned.setdefault(users[0].id, []).extend(tasks_ids)
+        return {"assignments": len(tasks_ids)}
+
+    users = [Mock(id=user_id) for user_id in (1, 2, 3)]
+    project._assign_by_sampling(users, assign_function, fraction=fraction, overlap=overlap, seed=seed)
+    return assigned
+
+
+def test_assign_by_sampling_assigns_every_task_once():
+    assigned = _assign(overlap=1)
+    tasks = sorted(task for user_tasks in assigned.values() for task in user_tasks)
+    assert tasks == list(range(1, 101))
+
+
+def test_assign_by_sampling_with_overlap_and_fraction():
+    assigned = _assign(overlap=2, fraction=0.5)
+    tasks = [task for user_tasks in assigned.values() for task in user_tasks]
+    assert len(tasks) == 100 and all(tasks.count(task) == 2 for task in tasks)
+
+
+def test_assign_by_sampling_is_reproducible_with_a_seed():
+    assert _assign(overlap=1, fraction=0.5, seed=7) == _assign(overlap=1, fraction=0.5, seed=7)
+    assert _assign(overlap=2, seed=np.random.default_rng(7)) == _assign(overlap=2, seed=np.random.default_rng(7))
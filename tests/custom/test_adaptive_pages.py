@@ -0,0 +1,81 @@
+import pytest
+
+from label_studio_sdk._extensions.adaptive_pager import PageSizer, PageStats
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio, synthetic_task
+
+
+def _stats(page_size, nbytes, seconds):
+    return PageStats(page=1, page_size=page_size, tasks=page_size, bytes=nbytes, seconds=seconds)
+
+
+def test_page_sizer_shrinks_large_pages():
+    sizer = PageSizer(page_size=400, min_page_size=10, target_bytes=1000)
+    # 100 bytes per task, 10 tasks fit the target
+    assert sizer.record(_stats(400, 40_000, 0.01), offset=400) == 10
+    assert sizer.record(_stats(10, 1_000, 0.01), offset=410) == 10
+
+
+def test_page_sizer_shrinks_from_an_odd_size():
+    sizer = PageSizer(page_size=75, min_page_size=10, target_bytes=1000)
+    # no divisor of 75 meets the target of 10 tasks, 15 is the closest one above it
+    assert sizer.record(_stats(75, 7_500, 0.01), offset=75) == 15
+    assert sizer.record(_stats(15, 1_500, 0.01), offset=90) == 10
+    assert sizer.record(_stats(10, 1_000, 0.01), offset=100) == 10
+
+
+def test_page_sizer_grows_one_step_when_aligned():
+    sizer = PageSizer(page_size=100, max_page_size=1000, target_bytes=10**9, target_seconds=1.0)
+    # fast and small pages: the next page doubles only if page numbers stay aligned
+    assert sizer.record(_stats(100, 1_000, 0.01), offset=100) == 100
+    assert sizer.record(_stats(100, 1_000, 0.01), offset=200) == 200
+    assert sizer.record(_stats(200, 2_000, 0.02), offset=400) == 400
+    assert sizer.record(_stats(400, 4_000, 0.04), offset=800) == 800
+    assert sizer.record(_stats(800, 8_000, 0.08), offset=1600) == 800
+
+
+def test_page_sizer_targets_latency():
+    sizer = PageSizer(page_size=200, target_seconds=0.5, target_bytes=10**9)
+    assert sizer.record(_stats(200, 1_000, 2.0), offset=200) == 50
+
+
+def test_page_sizer_bounds():
+    with pytest.raises(ValueError):
+        PageSizer(page_size=5, min_page_size=10)
+
+
+def test_adaptive_list_shrinks_pages_of_large_tasks(fake_client):
+    def large_task(task_id, project):
+        task = synthetic_task(task_id, project)
+        task["data"]["rle"] = "x" * 20_000
+        return task
+
+    fake = FakeLabelStudio(tasks=300, make_task=large_task)
+    pager = fake_client(fake).tasks.list(
+        project=1, adaptive=PageSizer(page_size=128, min_page_size=8, target_bytes=200_000)
+    )
+    assert [task.id for task in pager] == list(range(1, 301))
+    assert pager.page_sizes[:3] == [128, 8, 8]
+
+
+def test_adaptive_list_grows_pages_of_small_tasks(fake_client):
+    fake = FakeLabelStudio(tasks=1000)
+    fake.record_requests = True
+    pager = fake_client(fake).tasks.list(project=1, fields="task_only", page_size=50, adaptive=True)
+    assert [task.id for task in pager] == list(range(1, 1001))
+    assert pager.page_sizes == [50, 50, 100, 200, 400, 800]
+    # the pagination ends with the total, without requesting an empty page
+    assert len(fake.requests) == 6
+
+
+def test_adaptive_and_parallel_are_exclusive(fake_client):
+    with pytest.raises(ValueError):
+        fake_client(FakeLabelStudio(tasks=1)).tasks.list(adaptive=True, parallel=2)
+
+
+@pytest.mark.asyncio
+async def test_async_adaptive_list(async_fake_client):
+    fake = FakeLabelStudio(tasks=250)
+    ls = async_fake_client(fake)
+    pager = await ls.tasks.list(project=1, page_size=25, adaptive=True)
+    assert [task.id async for task in pager] == list(range(1, 251))
+    assert pager.page_sizes[0] == 25
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions import batch as batch_module
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.http_client import INITIAL_RETRY_DELAY_SECONDS
+
+# the fixture below replaces it in the module
+retry_delay = batch_module._retry_delay
+
+
+def _prediction_handler(request):
+    body = json.loads(request.content)
+    if body["task"] == 3:
+        return httpx.Response(400, json={"task": ["invalid"]})
+    return httpx.Response(201, json={"id": body["task"] * 10, "task": body["task"], "result": []})
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(batch_module, "_retry_delay", lambda retries: 0)
+
+
+def test_retry_delay_backs_off_with_jitter():
+    for retries in range(3):
+        delay = retry_delay(retries)
+        assert 0.75 * INITIAL_RETRY_DELAY_SECONDS * 2**retries <= delay <= INITIAL_RETRY_DELAY_SECONDS * 2**retries
+
+
+def test_sync_batch_collects_results_and_errors():
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_prediction_handler)),
+    )
+    progress = []
+    with ls.batch(concurrency=4, on_progress=progress.append) as batch:
+        for task in range(1, 11):
+            batch.submit(ls.predictions.create, task=task, result=[])
+
+    results = batch.results
+    assert [result.index for result in results] == list(range(10))
+    assert [result.value.id for result in results if result.ok] == [10, 20, 40, 50, 60, 70, 80, 90, 100]
+    assert isinstance(results[2].exception, ApiError)
+    assert batch.progress.completed == 10 and batch.progress.failed == 1
+    assert len(progress) == 10
+
+
+def test_sync_batch_backpressure():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def call(i):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        release.wait(5)
+        with lock:
+            running -= 1
+        return i
+
+    with LabelStudio(api_key="api_key").batch(concurrency=2, max_pending=3) as batch:
+        for i in range(3):
+            batch.submit(call, i)
+        submitted = threading.Thread(target=batch.submit, args=(call, 3))
+        submitted.start()
+        submitted.join(0.1)
+        # the fourth call waits for a free slot
+        assert submitted.is_alive()
+        release.set()
+        submitted.join(5)
+    assert [result.value for result in batch.wait()] == [0, 1, 2, 3]
+    assert max_running == 2
+
+
+def test_sync_batch_retries():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused")
+        if len(attempts) == 2:
+            return httpx.Response(503, json={})
+        return httpx.Response(200, json={"id": 1, "task": 1, "result": []})
+
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    with ls.batch(concurrency=1, max_retries=2) as batch:
+        batch.submit(ls.predictions.get, id=1, request_options={"timeout_in_seconds": 5})
+    (result,) = batch.results
+    assert result.ok and result.attempts == 2
+    assert len(attempts) == 3
+
+
+async def test_async_batch():
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_prediction_handler)),
+    )
+    async with ls.batch(concurrency=3) as batch:
+        results = await batch.map(ls.predictions.create, ({"task": task, "result": []} for task in range(1, 6)))
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    assert results[4].value.task == 5
+
+
+async def test_async_batch_concurrency():
+    running = 0
+    max_running = 0
+
+    async def call(i):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    async with AsyncLabelStudio(api_key="api_key").batch(concurrency=3) as batch:
+        for i in range(10):
+            await batch.submit(call, i)
+    assert [result.value for result in batch.results] == list(range(10))
+    assert max_running == 3
@@ -0,0 +1,133 @@
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.adaptive_pager import PageSizer
+from label_studio_sdk._extensions.checkpoint import Checkpoint, FileCheckpoint
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.core.api_error import ApiError
+
+MODES = [{}, {"prefetch": 2}, {"keyset": True}, {"adaptive": True}]
+
+
+def async_fake_client(fake):
+    return async_fake_client(fake)
+
+
+class FailingFake(FakeLabelStudio):
+    # fails every request after `fail_after` requests to the task list
+    def __init__(self, fail_after, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_after = fail_after
+        self.list_requests = 0
+
+    def handle(self, request):
+        if request.url.path.endswith("/api/tasks/"):
+            self.list_requests += 1
+            if self.list_requests > self.fail_after:
+                return httpx.Response(500, json={"detail": "Server error"})
+        return super().handle(request)
+
+
+def test_token_round_trip():
+    checkpoint = Checkpoint(mode="page", key="abc", page=3, page_size=100)
+    assert Checkpoint.from_token(checkpoint.to_token()) == checkpoint
+    assert Checkpoint.from_token(checkpoint) is checkpoint
+    with pytest.raises(ValueError, match="Invalid checkpoint token"):
+        Checkpoint.from_token("{not json")
+
+
+def test_file_checkpoint(tmp_path):
+    store = FileCheckpoint(tmp_path / "scan.json")
+    assert store.load() is None
+    checkpoint = Checkpoint(mode="keyset", key="abc", last_id=42)
+    store.save(checkpoint)
+    assert store.load() == checkpoint
+    assert [path.name for path in tmp_path.iterdir()] == ["scan.json"]
+    store.clear()
+    store.clear()
+    assert store.load() is None
+
+
+@pytest.mark.parametrize("options", MODES)
+def test_resume_after_failure(tmp_path, options, fake_client):
+    store = FileCheckpoint(tmp_path / "scan.json")
+    fake = FailingFake(fail_after=3, tasks=45)
+    ls = fake_client(fake)
+    seen = []
+    with pytest.raises(ApiError):
+        for task in ls.tasks.list(project=1, page_size=10, resume_from=store.load(), checkpoint=store, **options):
+            seen.append(task.id)
+    # adaptive pages grow, every full page before the failure was processed
+    assert seen == list(range(1, len(seen) + 1)) and len(seen) >= 30
+    assert store.load() is not None
+
+    fake.fail_after = float("inf")
+    resumed = [
+        task.id
+        for task in ls.tasks.list(project=1, page_size=10, resume_from=store.load(), checkpoint=store, **options)
+    ]
+    assert resumed == list(range(len(seen) + 1, 46))
+    # the scan completed, the next one starts over
+    assert store.load() is None
+
+
+@pytest.mark.parametrize("options", MODES)
+def test_checkpoint_points_at_the_unfinished_page(options, fake_client):
+    ls = fake_client(FakeLabelStudio(tasks=45))
+    pager = ls.tasks.list(project=1, page_size=10, **options)
+    ids = []
+    for task in pager.drain():
+        ids.append(task.id)
+        if task.id == 25:
+            break
+    token = pager.checkpoint().to_token()
+    # the page that was interrupted is processed again
+    resumed = [task.id for task in ls.tasks.list(project=1, page_size=10, resume_from=token, **options)]
+    assert resumed == list(range(21, 46))
+
+
+def test_resume_checks_the_parameters(fake_client):
+    ls = fake_client(FakeLabelStudio(tasks=45))
+    token = ls.tasks.list(project=1, page_size=10).checkpoint()
+    with pytest.raises(ValueError, match="other list parameters"):
+        ls.tasks.list(project=2, page_size=10, resume_from=token)
+    with pytest.raises(ValueError, match="page mode"):
+        ls.tasks.list(project=1, page_size=10, keyset=True, resume_from=token)
+    with pytest.raises(ValueError, match="page_size=10"):
+        ls.tasks.list(project=1, page_size=20, resume_from=token)
+    with pytest.raises(ValueError, match="parallel"):
+        ls.tasks.list(project=1, parallel=2, resume_from=token)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options", MODES)
+async def test_async_resume(tmp_path, options, async_fake_client):
+    store = FileCheckpoint(tmp_path / "scan.json")
+    fake = FailingFake(fail_after=2, tasks=45)
+    ls = async_fake_client(fake)
+    seen = []
+    with pytest.raises(ApiError):
+        pager = await ls.tasks.list(project=1, page_size=10, checkpoint=store, **options)
+        async for task in pager:
+            seen.append(task.id)
+    assert seen == list(range(1, len(seen) + 1)) and len(seen) >= 20
+
+    fake.fail_after = float("inf")
+    pager = await ls.tasks.list(project=1, page_size=10, resume_from=store.load(), checkpoint=store, **options)
+    assert [task.id async for task in pager.drain()] == list(range(len(seen) + 1, 46))
+    assert store.load() is None
+
+
+def test_adaptive_resumes_the_page_size(fake_client):
+    ls = fake_client(FakeLabelStudio(tasks=100))
+    # the pages double as long as the responses are small and fast
+    pager = ls.tasks.list(project=1, adaptive=PageSizer(page_size=10, min_page_size=10))
+    for task in pager:
+        if task.id == 30:
+            break
+    checkpoint = pager.checkpoint()
+    assert (checkpoint.page, checkpoint.page_size) == (2, 20)
+    sizer = PageSizer(page_size=10, min_page_size=10)
+    resumed = ls.tasks.list(project=1, adaptive=sizer, resume_from=checkpoint)
+    assert [task.id for task in resumed] == list(range(21, 101))
+    assert resumed.page_sizes[0] == 20
@@ -0,0 +1,84 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions import batch as batch_module
+from label_studio_sdk._extensions.checkpoint import FileCheckpoint
+from label_studio_sdk._extensions.chunked_actions import ChunkedActionError
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.core.api_error import ApiError
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(batch_module, "_retry_delay", lambda retries: 0)
+
+
+def test_run_chunked_splits_the_selection(fake_client):
+    fake = FakeLabelStudio(tasks=300)
+    ls = fake_client(fake)
+    progress = []
+    result = ls.actions.run_chunked(
+        id="delete_tasks", project=1, ids=range(1, 251), chunk_size=100, concurrency=2, on_progress=progress.append
+    )
+    assert result.chunks == 3 and result.processed_items == 250
+    assert [len(action["task_ids"]) for action in fake.actions] == [100, 100, 50]
+    assert [task["id"] for task in fake.tasks[1]] == list(range(251, 301))
+    assert progress[-1].completed == 3
+    # an empty selection is never sent, it would select all the tasks
+    assert ls.actions.run_chunked(id="delete_tasks", project=1, ids=[]).chunks == 0
+    assert len(fake.actions) == 3
+
+
+def test_run_chunked_sends_the_action_parameters(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    fake.record_requests = True
+    ls = fake_client(fake)
+    ls.actions.run_chunked(id="predictions_to_annotations", project=1, ids=[1, 2], model_version="v1")
+    [request] = fake.requests
+    assert request.url.params["id"] == "predictions_to_annotations"
+    assert json.loads(request.content) == {"model_version": "v1", "selectedItems": {"all": False, "included": [1, 2]}}
+
+
+def test_run_chunked_resumes_after_a_failed_chunk(tmp_path, fake_client):
+    fake = FakeLabelStudio(tasks=100)
+    failing = {30}
+
+    def handle(request):
+        if failing & set(json.loads(request.content)["selectedItems"]["included"]):
+            return httpx.Response(400, json={"detail": "invalid"})
+        return fake.handle(request)
+
+    ls = fake_client(httpx.MockTransport(handle))
+    store = FileCheckpoint(tmp_path / "checkpoint.json")
+    ids = list(range(1, 101))
+    with pytest.raises(ChunkedActionError) as error:
+        ls.actions.run_chunked(id="delete_tasks", project=1, ids=ids, chunk_size=10, concurrency=1, checkpoint=store)
+    assert isinstance(error.value.__cause__, ApiError) and error.value.chunk == 2
+    # the chunk queued behind the failed one still ran
+    assert error.value.result.processed_items == 20 and len(fake.tasks[1]) == 70
+    assert store.load() == error.value.checkpoint
+
+    with pytest.raises(ValueError, match="other ids"):
+        ls.actions.run_chunked(id="delete_tasks", project=1, ids=ids[1:], chunk_size=10, resume_from=store.load())
+    with pytest.raises(ValueError, match="chunk_size"):
+        ls.actions.run_chunked(id="delete_tasks", project=1, ids=ids, chunk_size=20, resume_from=store.load())
+
+    failing.clear()
+    result = ls.actions.run_chunked(
+        id="delete_tasks", project=1, ids=ids, chunk_size=10, resume_from=store.load(), checkpoint=store
+    )
+    assert result.chunks == 8 and result.processed_items == 70
+    assert fake.tasks[1] == [] and store.load() is None
+
+
+@pytest.mark.asyncio
+async def test_async_run_chunked(async_fake_client):
+    fake = FakeLabelStudio(tasks=50)
+    ls = async_fake_client(fake)
+    result = await ls.actions.run_chunked(
+        id="delete_tasks_annotations", project=1, ids=range(1, 51), chunk_size=15, concurrency=3
+    )
+    assert result.chunks == 4 and result.processed_items == 50
+    assert all(task["total_annotations"] == 0 for task in fake.tasks[1])
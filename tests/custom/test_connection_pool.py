@@ -0,0 +1,72 @@
+import sys
+import types
+
+import httpx
+import pytest
+
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+
+
+def _pool(client):
+    # httpcore connection pool behind the default httpx transport
+    return client._client_wrapper.httpx_client.httpx_client._transport._pool
+
+
+def test_default_client_keeps_httpx_defaults():
+    ls = LabelStudio(api_key="api_key", base_url="http://localhost:8080")
+    assert ls._client_wrapper.httpx_client.limits is None
+    assert ls._client_wrapper.httpx_client.base_timeout == 60
+
+
+def test_max_connections_per_host():
+    ls = LabelStudio(
+        api_key="api_key", base_url="http://localhost:8080", max_connections_per_host=64, keepalive_expiry=30
+    )
+    limits = ls._client_wrapper.httpx_client.limits
+    assert limits.max_connections == 64
+    assert limits.max_keepalive_connections == 64
+    assert limits.keepalive_expiry == 30
+    pool = _pool(ls)
+    assert pool._max_connections == 64
+    assert pool._max_keepalive_connections == 64
+    # the default timeout is still applied
+    assert ls._client_wrapper.httpx_client.base_timeout == 60
+
+
+def test_pool_limits_are_merged_with_overrides():
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        pool_limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=1),
+        keepalive_expiry=15,
+    )
+    limits = ls._client_wrapper.httpx_client.limits
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (10, 5, 15)
+    assert _pool(ls)._max_connections == 10
+
+
+def test_pool_options_ignored_for_custom_httpx_client():
+    custom = httpx.Client()
+    ls = LabelStudio(api_key="api_key", base_url="http://localhost:8080", httpx_client=custom, pool_limits=httpx.Limits())
+    assert ls._client_wrapper.httpx_client.httpx_client is custom
+    assert ls._client_wrapper.httpx_client.limits is None
+
+
+def test_invalid_max_connections_per_host():
+    with pytest.raises(ValueError):
+        LabelStudio(api_key="api_key", base_url="http://localhost:8080", max_connections_per_host=0)
+
+
+@pytest.mark.parametrize("client_class", [LabelStudio, AsyncLabelStudio])
+def test_http2(monkeypatch, client_class):
+    # httpx only checks that h2 is importable when the transport is built, httpcore imports it on the first request
+    monkeypatch.setitem(sys.modules, "h2", types.ModuleType("h2"))
+    ls = client_class(api_key="api_key", base_url="http://localhost:8080", http2=True)
+    assert _pool(ls)._http2 is True
+    assert _pool(client_class(api_key="api_key", base_url="http://localhost:8080"))._http2 is False
+
+
+def test_http2_without_h2(monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.raises(ImportError, match=r"httpx\[http2\]"):
+        LabelStudio(api_key="api_key", base_url="http://localhost:8080", http2=True)
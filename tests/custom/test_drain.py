@@ -0,0 +1,43 @@
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.pager_ext import drain_items
+
+
+def test_drain_items_empties_the_pages():
+    pages = [[1, 2, 3], [], None, [4]]
+    assert list(drain_items(pages)) == [1, 2, 3, 4]
+    assert pages == [[], [], None, []]
+
+
+@pytest.mark.parametrize("options", [{}, {"prefetch": 2}, {"parallel": 2}, {"keyset": True}])
+def test_drain_releases_consumed_tasks(options, fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    pager = fake_client(fake).tasks.list(project=1, page_size=10, **options)
+    ids = []
+    for task in pager.drain():
+        ids.append(task.id)
+        if task.id == 11:
+            # the first page is no longer held by the pager, keyset pagers don't keep one
+            assert not getattr(pager, "items", None)
+    assert ids == list(range(1, 26))
+
+
+def test_drain_stops_at_404(fake_client):
+    def handler(request):
+        if request.url.params["page"] == "1":
+            return httpx.Response(200, json={"tasks": [{"id": 1, "data": {}}], "total": 1})
+        return httpx.Response(404, json={"detail": "Invalid page."})
+
+    ls = fake_client(httpx.MockTransport(handler))
+    assert [task.id for task in ls.tasks.list(project=1).drain()] == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options", [{}, {"prefetch": 2}, {"parallel": 2}, {"keyset": True}])
+async def test_async_drain(options, async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    pager = await ls.tasks.list(project=1, page_size=10, **options)
+    assert [task.id async for task in pager.drain()] == list(range(1, 26))
@@ -0,0 +1,106 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.record_replay import RecordingTransport, ReplayTransport
+from label_studio_sdk.client import LabelStudio
+
+
+def test_tasks_list_pages_until_404(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    tasks = list(fake_client(fake).tasks.list(project=1, page_size=10))
+    assert [task.id for task in tasks] == list(range(1, 26))
+    assert tasks[0].annotations[0]["result"][0]["value"]["rectanglelabels"] == ["cat"]
+    assert [request.url.params["page"] for request in fake.requests] == ["1", "2", "3", "4"]
+
+
+def test_tasks_list_filters_and_fields(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    query = {
+        "filters": {
+            "conjunction": "and",
+            "items": [{"filter": "filter:tasks:id", "operator": "greater", "type": "Number", "value": 2}],
+        },
+        "ordering": ["-tasks:id"],
+    }
+    tasks = list(fake_client(fake).tasks.list(project=1, query=json.dumps(query), fields="task_only"))
+    assert [task.id for task in tasks] == [5, 4, 3]
+    assert not tasks[0].annotations
+
+
+def test_latency_is_injected(monkeypatch, fake_client):
+    delays = []
+    monkeypatch.setattr("label_studio_sdk._extensions.fake_label_studio.time.sleep", delays.append)
+    fake = FakeLabelStudio(tasks=3, latency=lambda request: 0.5 if request.url.path.endswith("tasks/") else 0.0)
+    list(fake_client(fake).tasks.list(project=1, page_size=2))
+    assert delays == [0.5, 0.5, 0.5]
+
+
+def test_import_tasks(fake_client):
+    fake = FakeLabelStudio()
+    response = fake_client(fake).projects.import_tasks(id=1, request=[{"text": "a"}, {"text": "b"}], return_task_ids=True)
+    assert response.task_count == 2
+    assert [task["data"] for task in fake.tasks[1]] == [{"text": "a"}, {"text": "b"}]
+
+
+def test_async_import_status_is_polled(fake_client):
+    fake = FakeLabelStudio(async_import=True, pending_polls=1)
+    ls = fake_client(fake)
+    response = ls.projects.import_tasks(id=1, request=[{"text": "a"}])
+    import_id = getattr(response, "import")
+    assert ls.tasks.create_many_status(id=1, import_pk=str(import_id)).status == "in_progress"
+    status = ls.tasks.create_many_status(id=1, import_pk=str(import_id))
+    assert status.status == "completed"
+    assert status.task_count == 1
+
+
+def test_export_is_polled_then_downloaded(fake_client):
+    fake = FakeLabelStudio(tasks=3, pending_polls=1)
+    ls = fake_client(fake)
+    export = ls.projects.exports.create(id_=1, title="snapshot")
+    assert ls.projects.exports.get(id=1, export_pk=str(export.id)).status == "in_progress"
+    assert ls.projects.exports.get(id=1, export_pk=str(export.id)).status == "completed"
+    with ls._client_wrapper.httpx_client.stream(f"api/projects/1/exports/{export.id}/download", method="GET") as r:
+        assert [task["id"] for task in json.loads(r.read())] == [1, 2, 3]
+
+
+def test_actions_delete_tasks(fake_client):
+    fake = FakeLabelStudio(tasks=4)
+    ls = fake_client(fake)
+    ls.actions.create(id="delete_tasks", project=1, selected_items={"all": False, "included": [2, 3]})
+    assert [task.id for task in ls.tasks.list(project=1)] == [1, 4]
+    assert fake.actions == [{"id": "delete_tasks", "project": 1, "task_ids": [2, 3]}]
+
+
+def test_serve():
+    fake = FakeLabelStudio(tasks=3)
+    with fake.serve() as base_url:
+        ls = LabelStudio(api_key="fake", base_url=base_url)
+        assert [task.id for task in ls.tasks.list(project=1, page_size=2)] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_async_transport(async_fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    ls = async_fake_client(fake)
+    assert [task.id async for task in await ls.tasks.list(project=1, page_size=2)] == [1, 2, 3, 4, 5]
+
+
+def test_record_and_replay(tmp_path):
+    recorder = RecordingTransport(FakeLabelStudio(tasks=3).transport())
+    ls = LabelStudio(api_key="secret", base_url="http://fake", httpx_client=httpx.Client(transport=recorder))
+    recorded = [task.id for task in ls.tasks.list(project=1, page_size=2)]
+    ls.tasks.delete(id="1")
+    cassette = tmp_path / "cassette.json"
+    recorder.save(str(cassette))
+    assert "secret" not in cassette.read_text()
+
+    replay = ReplayTransport(str(cassette))
+    ls = LabelStudio(api_key="other", base_url="http://fake", httpx_client=httpx.Client(transport=replay))
+    assert [task.id for task in ls.tasks.list(project=1, page_size=2)] == recorded
+    ls.tasks.delete(id="1")
+    with pytest.raises(LookupError):
+        ls.tasks.get(id="2")
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from label_studio_sdk._extensions import id_sets
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+
+
+def test_id_buffer_grows_and_returns_an_id_set():
+    buffer = id_sets.IdBuffer(capacity=2)
+    buffer.extend(task_id for task_id in (7, 3, 5))
+    buffer.extend(np.array([3, 11]))
+    buffer.extend([])
+    assert len(buffer) == 5
+    ids = buffer.ids()
+    assert ids.dtype == np.int64 and ids.tolist() == [3, 5, 7, 11]
+
+
+def test_set_operations_match_python_sets():
+    rng = np.random.default_rng(0)
+    ids = id_sets.id_set(rng.integers(0, 5000, 3000))
+    other = id_sets.id_set(rng.integers(2000, 9000, 2000))
+    assert id_sets.difference(ids, other).tolist() == sorted(set(ids.tolist()) - set(other.tolist()))
+    assert id_sets.intersection(ids, other).tolist() == sorted(set(ids.tolist()) & set(other.tolist()))
+    assert id_sets.intersection(other, ids).tolist() == id_sets.intersection(ids, other).tolist()
+    empty = id_sets.id_set([])
+    assert id_sets.difference(ids, empty).tolist() == ids.tolist()
+    assert len(id_sets.intersection(empty, ids)) == 0 and len(id_sets.difference(empty, ids)) == 0
+
+
+def test_sample():
+    ids = id_sets.id_set(range(10, 1010))
+    sample = id_sets.sample(ids, 100, rng=1)
+    assert len(set(sample.tolist())) == 100 and id_sets.contains(ids, sample).all()
+    assert sample.tolist() == sorted(sample.tolist())
+    assert id_sets.sample(ids, 100, rng=1).tolist() == sample.tolist()
+    assert len(id_sets.difference(ids, sample)) == 900
+    with pytest.raises(ValueError):
+        id_sets.sample(ids, 1001)
+
+
+def test_list_ids(fake_client):
+    fake = FakeLabelStudio(tasks=250)
+    ls = fake_client(fake)
+    ids = ls.tasks.list_ids(project=1, page_size=100)
+    assert ids.dtype == np.int64 and ids.tolist() == list(range(1, 251))
+    filters = Filters.create(Filters.AND, [Filters.item(Column.id, Operator.GREATER, Type.Number, Filters.value(200))])
+    assert ls.tasks.list_ids(project=1, query={"filters": filters}).tolist() == list(range(201, 251))
+
+
+@pytest.mark.asyncio
+async def test_async_list_ids(async_fake_client):
+    fake = FakeLabelStudio(tasks=30)
+    ls = async_fake_client(fake)
+    assert (await ls.tasks.list_ids(project=1, page_size=7)).tolist() == list(range(1, 31))
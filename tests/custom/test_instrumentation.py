@@ -0,0 +1,135 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.core import Instrumentation, MetricsAggregator
+from label_studio_sdk.core.instrumentation import LatencyHistogram, endpoint_template
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+        self.retries = []
+
+    def on_request_start(self, *, method, endpoint, path, attempt):
+        self.started.append((method, endpoint, attempt))
+
+    def on_request_end(self, event):
+        self.ended.append(event)
+
+    def on_retry(self, event, *, delay):
+        self.retries.append((event.status_code, delay))
+
+
+def _handler(request):
+    if request.url.path == "/api/tasks/":
+        if request.url.params["page"] == "2":
+            return httpx.Response(404, json={"detail": "Invalid page."})
+        return httpx.Response(200, json={"tasks": [{"id": 1, "data": {}}], "total": 1})
+    if request.url.path == "/api/projects/7/import":
+        return httpx.Response(201, json={"task_count": 1})
+    return httpx.Response(200, json={"id": 7})
+
+
+def _client(handler=_handler, **kwargs):
+    return LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def test_endpoint_template():
+    assert endpoint_template("api/projects/1/import") == "api/projects/{id}/import"
+    assert endpoint_template("api/tasks/") == "api/tasks/"
+    assert endpoint_template("api/projects/12/exports/3/download") == "api/projects/{id}/exports/{id}/download"
+    assert endpoint_template("api/ml/v2/") == "api/ml/v2/"
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.add(ms / 1000)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.percentile(100) == 1.0
+
+
+def test_hooks_receive_request_events():
+    instrumentation = RecordingInstrumentation()
+    ls = _client(instrumentation=instrumentation)
+    ls.projects.import_tasks(id=7, request=[{"data": {"text": "a"}}])
+    assert instrumentation.started == [("POST", "api/projects/{id}/import", 0)]
+    (event,) = instrumentation.ended
+    assert event.path == "api/projects/7/import"
+    assert event.status_code == 201
+    assert event.bytes_sent > 0 and event.bytes_received == len(b'{"task_count":1}')
+    assert event.elapsed >= 0 and event.error is None
+
+
+def test_streamed_requests_are_measured_when_closed():
+    instrumentation = RecordingInstrumentation()
+    ls = _client(instrumentation=instrumentation)
+    assert [task.id for task in ls.tasks.stream(project=1)] == [1]
+    assert [(event.endpoint, event.status_code) for event in instrumentation.ended] == [
+        ("api/tasks/", 200),
+        ("api/tasks/", 404),
+    ]
+    assert instrumentation.ended[0].bytes_received > 0
+
+
+def test_retries_and_transport_errors():
+    statuses = iter([503, 200])
+
+    def handler(request):
+        if request.url.path == "/api/projects/1/":
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(next(statuses), json={"id": 2}, headers={"retry-after-ms": "1"})
+
+    instrumentation = RecordingInstrumentation()
+    ls = _client(handler, instrumentation=instrumentation)
+    ls.projects.get(id=2, request_options={"max_retries": 1})
+    assert instrumentation.retries == [(503, 0.001)]
+    assert [event.attempt for event in instrumentation.ended] == [0, 1]
+
+    with pytest.raises(httpx.ConnectError):
+        ls.projects.get(id=1)
+    assert isinstance(instrumentation.ended[-1].error, httpx.ConnectError)
+    assert instrumentation.ended[-1].status_code is None
+
+
+def test_metrics_aggregator():
+    metrics = MetricsAggregator()
+    ls = _client(instrumentation=metrics)
+    list(ls.tasks.list(project=1))
+    ls.projects.import_tasks(id=7, request=[{"data": {"text": "a"}}])
+    ls.projects.import_tasks(id=8, request=[{"data": {"text": "b"}}])
+
+    dump = json.loads(metrics.to_json())
+    assert set(dump) == {"GET api/tasks/", "POST api/projects/{id}/import"}
+    assert dump["GET api/tasks/"]["requests"] == 2
+    assert dump["GET api/tasks/"]["status_codes"] == {"200": 1, "404": 1}
+    assert dump["GET api/tasks/"]["errors"] == 1
+    imports = dump["POST api/projects/{id}/import"]
+    assert imports["requests"] == 2 and imports["errors"] == 0
+    assert imports["bytes_sent"] > 0 and imports["bytes_received"] > 0
+    assert set(imports["latency_ms"]) == {"mean", "p50", "p95", "p99", "max"}
+
+    metrics.reset()
+    assert metrics.to_dict() == {}
+
+
+async def test_async_metrics_aggregator():
+    metrics = MetricsAggregator()
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        instrumentation=metrics,
+    )
+    await ls.projects.get(id=7)
+    assert metrics.to_dict()["GET api/projects/{id}/"]["requests"] == 1
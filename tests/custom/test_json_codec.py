@@ -0,0 +1,113 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.core import JsonCodec, StdlibJsonCodec, UjsonCodec
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.json_codec import get_json_codec
+
+PAYLOAD = {"text": "héllo / wörld", "n": 1, "f": 0.5, "nested": [{"a": None, "b": True}], 7: "int key"}
+
+
+@pytest.mark.parametrize("name", ["json", "ujson", "orjson"])
+def test_codecs_round_trip(name):
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    codec = get_json_codec(name)
+    assert codec.name == name
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == json.loads(json.dumps(PAYLOAD))
+    # integers above 64 bits fall back to the stdlib encoder
+    assert codec.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+
+
+@pytest.mark.parametrize("name", ["json", "ujson", "orjson"])
+def test_codecs_raise_json_decode_error_on_malformed_bodies(name):
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    codec = get_json_codec(name)
+    for body in (b"<html>Bad Gateway</html>", '{"id": 1', b""):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(body)
+
+
+def test_get_json_codec():
+    assert get_json_codec(None) is None
+    codec = UjsonCodec()
+    assert get_json_codec(codec) is codec
+    assert isinstance(get_json_codec("auto"), JsonCodec)
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
+
+
+class CountingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.dumped = 0
+        self.loaded = 0
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return super().dumps(obj)
+
+    def decode(self, data):
+        self.loaded += 1
+        return super().decode(data)
+
+
+def test_client_encodes_and_decodes_with_codec():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201, json={"task_count": 2})
+
+    codec = CountingCodec()
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        json_codec=codec,
+    )
+    response = ls.projects.import_tasks(id=1, request=[{"text": "a"}, {"text": "b"}])
+    assert response.task_count == 2
+    assert (codec.dumped, codec.loaded) == (1, 1)
+    assert requests[0].headers["content-type"] == "application/json"
+    assert json.loads(requests[0].content) == [{"text": "a"}, {"text": "b"}]
+
+
+@pytest.mark.parametrize("name", ["json", "ujson", "orjson"])
+def test_client_reports_malformed_bodies_as_api_errors(name):
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(502, text="<html>Bad Gateway</html>"))
+        ),
+        json_codec=name,
+    )
+    with pytest.raises(ApiError) as error:
+        ls.users.whoami()
+    assert error.value.status_code == 502 and error.value.body == "<html>Bad Gateway</html>"
+
+
+async def test_async_client_codec():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201, json={"id": 1, "data": {"text": "a"}})
+
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        json_codec="ujson",
+    )
+    task = await ls.tasks.create(data={"text": "a"}, project=1)
+    assert task.id == 1
+    assert json.loads(requests[0].content) == {"data": {"text": "a"}, "project": 1}
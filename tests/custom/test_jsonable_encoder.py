@@ -0,0 +1,115 @@
+import dataclasses
+import datetime as dt
+import enum
+import json
+import pathlib
+import typing
+import uuid
+
+import httpx
+
+from label_studio_sdk.client import LabelStudio
+from label_studio_sdk.core import http_client
+from label_studio_sdk.core.jsonable_encoder import is_json_native, jsonable_encoder
+from label_studio_sdk.core.pydantic_utilities import pydantic_v1
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Item(pydantic_v1.BaseModel):
+    item_id: int = pydantic_v1.Field(alias="itemId")
+    created_at: dt.datetime
+    tags: typing.List[str]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+def test_is_json_native():
+    assert is_json_native({"a": [1, 2.5, None, True, {"b": "c"}], 1: "x"})
+    assert not is_json_native({"a": [1, (2, 3)]})
+    assert not is_json_native({"a": Color.RED})
+    assert not is_json_native([dt.date(2024, 1, 1)])
+    assert not is_json_native({(1, 2): 1})
+
+
+def test_json_native_payload_is_returned_as_is():
+    payload = [{"data": {"text": "a", "meta": {"score": 0.5, "ok": True}}, "predictions": []}]
+    assert jsonable_encoder(payload) is payload
+
+
+def test_converts_nested_values():
+    created_at = dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.timezone.utc)
+    uid = uuid.UUID(int=1)
+    obj = {
+        "items": [Item(item_id=1, created_at=created_at, tags=["a"])],
+        "color": Color.RED,
+        "path": pathlib.PurePosixPath("/data/1.jpg"),
+        "point": Point(1, 2),
+        "ids": (1, 2),
+        "set": {3},
+        "gen": (i for i in range(2)),
+        "day": dt.date(2024, 1, 2),
+        "uid": uid,
+    }
+    assert jsonable_encoder(obj) == {
+        "items": [{"itemId": 1, "created_at": "2024-01-02T03:04:05Z", "tags": ["a"]}],
+        "color": "red",
+        "path": "/data/1.jpg",
+        "point": {"x": 1, "y": 2},
+        "ids": [1, 2],
+        "set": [3],
+        "gen": [0, 1],
+        "day": "2024-01-02",
+        "uid": str(uid),
+    }
+
+
+def test_keeps_key_order_and_custom_encoder():
+    obj = {"b": dt.date(2024, 1, 1), "a": 1, "c": [dt.date(2024, 1, 2)]}
+    encoded = jsonable_encoder(obj, custom_encoder={dt.date: lambda d: d.day})
+    assert list(encoded) == ["b", "a", "c"]
+    assert encoded == {"b": 1, "a": 1, "c": [2]}
+
+
+def test_deep_structures_do_not_hit_the_recursion_limit():
+    obj: typing.Any = dt.date(2024, 1, 1)
+    for _ in range(5000):
+        obj = {"child": [obj]}
+    encoded = jsonable_encoder(obj)
+    for _ in range(5000):
+        encoded = encoded["child"][0]
+    assert encoded == "2024-01-01"
+
+
+def test_encode_body_request_option(monkeypatch):
+    encoded = []
+
+    def spy(obj, *args, **kwargs):
+        encoded.append(obj)
+        return jsonable_encoder(obj, *args, **kwargs)
+
+    monkeypatch.setattr(http_client, "jsonable_encoder", spy)
+    request = [{"data": {"text": "a"}}]
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(201, json={"task_count": 1})
+
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    ls.projects.import_tasks(id=1, request=request, request_options={"encode_body": False})
+    assert [json.loads(body) for body in bodies] == [request]
+    assert all(obj is not request for obj in encoded)
@@ -0,0 +1,91 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.keyset_pager import keyset_query
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+
+
+def test_keyset_query_adds_the_id_filter_and_ordering():
+    user_filter = Filters.item(Column.data("text"), Operator.CONTAINS, Type.String, Filters.value("cat"))
+    query = json.loads(keyset_query(json.dumps({"filters": Filters.create(Filters.AND, [user_filter])}), 42))
+    assert query["ordering"] == ["tasks:id"]
+    assert query["filters"] == {
+        "conjunction": "and",
+        "items": [
+            user_filter,
+            {"filter": "filter:tasks:id", "operator": "greater", "type": "Number", "value": 42},
+        ],
+    }
+    assert json.loads(keyset_query(None, None)) == {
+        "ordering": ["tasks:id"],
+        "filters": {"conjunction": "and", "items": []},
+    }
+
+
+def test_keyset_query_rejects_what_cannot_be_paged_by_id():
+    items = [Filters.item(Column.id, Operator.GREATER, Type.Number, 1)] * 2
+    with pytest.raises(ValueError):
+        keyset_query({"filters": Filters.create(Filters.OR, items)}, None)
+    with pytest.raises(ValueError):
+        keyset_query({"ordering": ["tasks:created_at"]}, None)
+
+
+def test_keyset_iterates_over_all_tasks(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    pager = fake_client(fake).tasks.list(project=1, page_size=10, keyset=True)
+    assert [task.id for task in pager] == list(range(1, 26))
+    assert pager.last_id == 25
+    assert all(request.url.params["page"] == "1" for request in fake.requests)
+
+
+def test_keyset_keeps_user_filters(fake_client):
+    fake = FakeLabelStudio(tasks=30)
+    query = {"filters": Filters.create(Filters.AND, [Filters.item(Column.id, Operator.LESS, Type.Number, 16)])}
+    tasks = fake_client(fake).tasks.list(project=1, page_size=4, keyset=True, query=json.dumps(query))
+    assert [task.id for task in tasks] == list(range(1, 16))
+
+
+def test_keyset_is_stable_under_concurrent_writes(fake_client):
+    fake = FakeLabelStudio(tasks=30)
+    ls = fake_client(fake)
+    seen = []
+    for task in ls.tasks.list(project=1, page_size=10, keyset=True):
+        seen.append(task.id)
+        if task.id == 12:
+            # tasks deleted before the current position would shift the next page numbers
+            ls.tasks.delete(id="1")
+            ls.tasks.delete(id="2")
+            ls.tasks.create(project=1, data={"text": "new"})
+    assert seen == list(range(1, 31)) + [31]
+
+
+def test_keyset_resumes_after_an_id(fake_client):
+    fake = FakeLabelStudio(tasks=10)
+    tasks = fake_client(fake).tasks.list(project=1, page_size=3, keyset=True, after_id=6)
+    assert [task.id for task in tasks] == [7, 8, 9, 10]
+
+
+def test_keyset_fails_if_the_server_ignores_the_filter(fake_client):
+    def handler(request):
+        return httpx.Response(200, json={"tasks": [{"id": 1, "data": {}}], "total": 1})
+
+    ls = fake_client(httpx.MockTransport(handler))
+    with pytest.raises(RuntimeError):
+        list(ls.tasks.list(project=1, keyset=True))
+
+
+def test_keyset_cannot_be_combined_with_a_view(fake_client):
+    with pytest.raises(ValueError):
+        fake_client(FakeLabelStudio(tasks=1)).tasks.list(project=1, view=3, keyset=True)
+
+
+@pytest.mark.asyncio
+async def test_async_keyset(async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    pager = await ls.tasks.list(project=1, page_size=10, keyset=True)
+    assert [task.id async for task in pager] == list(range(1, 26))
@@ -0,0 +1,91 @@
+import ast
+import json
+import pathlib
+import subprocess
+import sys
+
+import httpx
+
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.tasks.client_ext import AsyncTasksClientExt, TasksClientExt
+
+# modules that must not be imported by creating a client, they're only needed by the endpoints or helpers using them
+HEAVY_MODULES = ["lxml", "jsonschema", "requests", "pandas", "numpy", "nltk", "PIL", "ijson"]
+# label_studio_sdk modules imported by `LabelStudio(...)`: the client, the environment and core
+MODULE_BUDGET = 25
+
+
+def _imported_modules(code):
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_package_is_cheap():
+    modules = _imported_modules("import label_studio_sdk")
+    assert [m for m in modules if m.startswith("label_studio_sdk.")] == []
+    assert "httpx" not in modules and "pydantic" not in modules
+
+
+def test_client_import_budget():
+    modules = _imported_modules("from label_studio_sdk.client import LabelStudio\nLabelStudio(api_key='api_key')")
+    sdk_modules = [m for m in modules if m.startswith("label_studio_sdk.")]
+    assert len(sdk_modules) <= MODULE_BUDGET, sdk_modules
+    assert not [m for m in sdk_modules if m.startswith(("label_studio_sdk.types.", "label_studio_sdk._legacy"))]
+    assert not [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+
+
+def test_lazy_names():
+    import label_studio_sdk
+
+    assert label_studio_sdk.Task.__name__ == "Task"
+    assert label_studio_sdk.Client.__name__ == "Client"
+    assert label_studio_sdk.tasks.TasksListResponse is label_studio_sdk.TasksListResponse
+    assert "Task" in dir(label_studio_sdk)
+
+
+def _defined_types(path):
+    # the public names a generated type module defines: its model or enum class and its type aliases
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, ast.ClassDef):
+            yield node.name
+        elif isinstance(node, ast.Assign):
+            yield from (target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            yield node.target.id
+
+
+def test_lazy_type_map_matches_the_types_modules():
+    # the lazy maps are kept by hand in .fernignore, a type added or removed by Fern must show up here
+    import label_studio_sdk
+    import label_studio_sdk.types
+
+    types_dir = pathlib.Path(label_studio_sdk.types.__file__).parent
+    expected = {
+        name: f".{path.stem}"
+        for path in types_dir.glob("*.py")
+        if path.stem != "__init__"
+        for name in _defined_types(path)
+        if name[0].isupper() and not name.isupper()
+    }
+    assert label_studio_sdk.types._dynamic_imports == expected
+    assert sorted(label_studio_sdk.types.__all__) == sorted(expected)
+
+    package_map = label_studio_sdk._dynamic_imports
+    assert {name: module for name, module in package_map.items() if module == ".types"} == {
+        name: ".types" for name in expected
+    }
+    assert sorted(label_studio_sdk.__all__) == sorted(package_map)
+    for name in package_map:
+        assert getattr(label_studio_sdk, name) is not None, name
+
+
+def test_sub_clients_are_built_on_first_access():
+    ls = LabelStudio(api_key="api_key", httpx_client=httpx.Client())
+    assert "tasks" not in vars(ls)
+    assert isinstance(ls.tasks, TasksClientExt)
+    assert ls.tasks is ls.tasks
+    assert ls.users._client_wrapper is ls._client_wrapper
+
+    async_ls = AsyncLabelStudio(api_key="api_key", httpx_client=httpx.AsyncClient())
+    assert isinstance(async_ls.tasks, AsyncTasksClientExt)
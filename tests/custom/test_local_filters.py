@@ -0,0 +1,157 @@
+import datetime
+import json
+
+import pandas as pd
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.local_filters import compile_filters, filter_tasks, parse_datetime
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+
+TASKS = [
+    {
+        "id": 1,
+        "data": {"text": "A black Cat", "score": "0.5"},
+        "total_annotations": 2,
+        "updated_at": "2024-01-15T09:30:00Z",
+        "is_labeled": True,
+        "annotators": [3, 7],
+    },
+    {
+        "id": 2,
+        "data": {"text": "a dog", "score": 0.9},
+        "total_annotations": 0,
+        "updated_at": "2024-01-16T10:00:00.123Z",
+        "is_labeled": False,
+        "annotators": [],
+    },
+    {
+        "id": 3,
+        "data": {"text": "", "score": None},
+        "total_annotations": 1,
+        "updated_at": "2024-02-01T00:00:00+02:00",
+        "is_labeled": "true",
+        "annotators": [7],
+    },
+    {"id": 4, "data": {}, "total_annotations": 5, "updated_at": None, "is_labeled": None, "annotators": None},
+]
+
+
+def _frame():
+    rows = [{key: value for key, value in task.items() if key != "data"} for task in TASKS]
+    for row, task in zip(rows, TASKS):
+        row.update({f"data.{key}": value for key, value in task["data"].items()})
+    return pd.DataFrame(rows)
+
+
+def _item(column, operator, column_type, value, maximum=None):
+    return Filters.create(Filters.AND, [Filters.item(column, operator, column_type, Filters.value(value, maximum))])
+
+
+CASES = [
+    (_item(Column.id, Operator.GREATER, Type.Number, 2), [3, 4]),
+    (_item(Column.id, Operator.NOT_EQUAL, Type.Number, 2), [1, 3, 4]),
+    (_item(Column.data("score"), Operator.GREATER_OR_EQUAL, Type.Number, 0.5), [1, 2]),
+    (_item(Column.data("score"), Operator.NOT_EQUAL, Type.Number, 0.5), [2, 3, 4]),
+    (_item(Column.total_annotations, Operator.IN, Type.Number, 1, 2), [1, 3]),
+    (_item(Column.total_annotations, Operator.NOT_IN, Type.Number, 1, 2), [2, 4]),
+    (_item(Column.total_annotations, Operator.IN_LIST, Type.Number, [0, 5]), [2, 4]),
+    (_item(Column.data("text"), Operator.CONTAINS, Type.String, "cat"), [1]),
+    (_item(Column.data("text"), Operator.NOT_CONTAINS, Type.String, "cat"), [2, 3]),
+    (_item(Column.data("text"), Operator.EQUAL, Type.String, "a dog"), [2]),
+    (_item(Column.data("text"), Operator.REGEX, Type.String, "^[Aa] "), [1, 2]),
+    (_item(Column.data("text"), Operator.EMPTY, Type.String, True), [3, 4]),
+    (_item(Column.data("text"), Operator.EMPTY, Type.String, False), [1, 2]),
+    (_item(Column.updated_at, Operator.GREATER, Type.Datetime, datetime.datetime(2024, 1, 16)), [2, 3]),
+    (_item(Column.updated_at, Operator.IN, Type.Datetime, "2024-01-01", "2024-01-31T22:00:00Z"), [1, 2, 3]),
+    (_item(Column.updated_at, Operator.LESS, Type.Datetime, "2024-01-16T10:00:00.123000Z"), [1]),
+    (_item("tasks:is_labeled", Operator.EQUAL, Type.Boolean, True), [1, 3]),
+    (_item(Column.annotators, Operator.CONTAINS, Type.List, 7), [1, 3]),
+    (_item(Column.annotators, Operator.EMPTY, Type.List, True), [2, 4]),
+]
+
+
+@pytest.mark.parametrize("filters,expected", CASES)
+def test_tasks_and_dataframes_match_the_same(filters, expected):
+    assert [task["id"] for task in filter_tasks(filters, TASKS)] == expected
+    assert list(filter_tasks(filters, _frame())["id"]) == expected
+
+
+def test_conjunctions_and_queries():
+    items = [
+        Filters.item(Column.id, Operator.LESS, Type.Number, 2),
+        Filters.item(Column.total_annotations, Operator.GREATER, Type.Number, 4),
+    ]
+    assert [task["id"] for task in filter_tasks(Filters.create(Filters.OR, items), TASKS)] == [1, 4]
+    assert filter_tasks(Filters.create(Filters.AND, items), TASKS) == []
+    assert len(filter_tasks(json.dumps({"filters": Filters.create(Filters.AND, [])}), TASKS)) == 4
+    assert compile_filters({"filters": Filters.create(Filters.OR, items)}).mask(_frame()).tolist() == [
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_invalid_filters():
+    with pytest.raises(ValueError, match="operator"):
+        compile_filters(_item(Column.id, "between", Type.Number, 1))
+    with pytest.raises(ValueError, match="column"):
+        filter_tasks(_item(Column.data("missing"), Operator.EQUAL, Type.String, "a"), _frame())
+
+
+@pytest.mark.parametrize(
+    "operator,value,maximum",
+    [
+        (Operator.GREATER, "2024-01-15T09:30:00.250Z", None),
+        (Operator.EQUAL, "2024-01-15T09:30:00.250Z", None),
+        # more precise than the values, compared as datetimes
+        (Operator.GREATER_OR_EQUAL, "2024-01-15T09:30:00.2501Z", None),
+        (Operator.IN, "2024-01-15T09:30", "2024-01-16"),
+    ],
+)
+def test_uniform_utc_datetimes_are_compared_as_text(operator, value, maximum):
+    times = ["2024-01-15T09:30:00.000Z", "2024-01-15T09:30:00.250Z", "2024-01-15T09:30:00.251Z", None]
+    tasks = [{"id": task_id, "updated_at": time} for task_id, time in enumerate(times, 1)]
+    frame = pd.DataFrame({"id": [1, 2, 3, 4], "updated_at": pd.Series(times, dtype="string")})
+    filters = _item(Column.updated_at, operator, Type.Datetime, value, maximum)
+    assert list(filter_tasks(filters, frame)["id"]) == [task["id"] for task in filter_tasks(filters, tasks)]
+
+
+def test_parse_datetime():
+    utc = datetime.timezone.utc
+    assert parse_datetime("2024-01-15T09:30:00.1Z") == datetime.datetime(2024, 1, 15, 9, 30, 0, 100000, tzinfo=utc)
+    assert parse_datetime(datetime.datetime(2024, 1, 15)) == datetime.datetime(2024, 1, 15, tzinfo=utc)
+    assert parse_datetime("yesterday") is None
+
+
+def test_same_tasks_as_the_server_filters(fake_client):
+    fake = FakeLabelStudio(tasks=30)
+    ls = fake_client(fake)
+    filters = Filters.create(
+        Filters.OR,
+        [
+            Filters.item(Column.id, Operator.IN, Type.Number, Filters.value(5, 9)),
+            Filters.item(Column.data("image"), Operator.CONTAINS, Type.String, Filters.value("/2")),
+        ],
+    )
+    listed = [task.id for task in ls.tasks.list(project=1, query=json.dumps({"filters": filters}))]
+    assert listed == [2, 5, 6, 7, 8, 9, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29]
+    assert list(filter_tasks(filters, ls.tasks.list(project=1).to_dataframe())["id"]) == listed
+
+
+def test_dataframe_counts_filter_as_totals(fake_client):
+    fake = FakeLabelStudio(tasks=6)
+    for task in fake.tasks[1][:2]:
+        task["annotations"], task["total_annotations"] = [], 0
+    ls = fake_client(fake)
+    filters = Filters.create(
+        Filters.AND,
+        [
+            Filters.item(Column.total_annotations, Operator.GREATER, Type.Number, Filters.value(0)),
+            Filters.item(Column.total_predictions, Operator.EQUAL, Type.Number, Filters.value(1)),
+        ],
+    )
+    frame = ls.tasks.list(project=1, fields="all").to_dataframe()
+    assert list(filter_tasks(filters, frame)["id"]) == [3, 4, 5, 6]
+    assert [task.id for task in filter_tasks(filters, ls.tasks.list(project=1, fields="all"))] == [3, 4, 5, 6]
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.parallel_pager import ParallelPager
+from label_studio_sdk.core.api_error import ApiError
+
+
+def async_fake_client(transport):
+    return async_fake_client(transport)
+
+
+class Concurrency:
+    """Latency for FakeLabelStudio that records how many requests were in flight at the same time."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.delay)
+        with self._lock:
+            self.current -= 1
+        return 0.0
+
+
+def test_parallel_returns_tasks_in_order(fake_client):
+    concurrency = Concurrency()
+    fake = FakeLabelStudio(tasks=95, latency=concurrency)
+    pager = fake_client(fake).tasks.list(project=1, page_size=10, parallel=4)
+    assert pager.total == 95
+    assert [task.id for task in pager] == list(range(1, 96))
+    assert concurrency.peak == 4
+
+
+def test_parallel_out_of_order_returns_every_task(fake_client):
+    delays = {"3": 0.05}
+    fake = FakeLabelStudio(tasks=50, latency=lambda request: delays.get(request.url.params.get("page"), 0.0))
+    pages = list(fake_client(fake).tasks.list(project=1, page_size=10, parallel=4, ordered=False).iter_pages())
+    assert sorted(task.id for page in pages for task in page) == list(range(1, 51))
+    # the slow page doesn't hold back the others
+    assert pages[-1][0].id == 21
+
+
+def test_parallel_without_page_size_uses_the_size_of_the_first_page(fake_client):
+    fake = FakeLabelStudio(tasks=250)
+    assert len(list(fake_client(fake).tasks.list(project=1, parallel=2))) == 250
+
+
+def test_parallel_empty_project(fake_client):
+    fake = FakeLabelStudio()
+    assert list(fake_client(fake).tasks.list(project=1, parallel=2)) == []
+
+
+def test_parallel_retries_failed_pages(fake_client):
+    fake = FakeLabelStudio(tasks=30)
+    failures = {"2": 1, "3": 1}
+
+    def handler(request):
+        page = request.url.params.get("page")
+        if failures.get(page):
+            failures[page] -= 1
+            if page == "2":
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(503, json={"detail": "unavailable"})
+        return fake.handle(request)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("label_studio_sdk._extensions.parallel_pager.time.sleep", lambda _: None)
+        monkeypatch.setattr("label_studio_sdk.core.http_client.time.sleep", lambda _: None)
+        tasks = list(fake_client(httpx.MockTransport(handler)).tasks.list(project=1, page_size=10, parallel=2))
+    assert [task.id for task in tasks] == list(range(1, 31))
+
+
+def test_parallel_raises_errors(fake_client):
+    def handler(request):
+        if request.url.params.get("page") == "2":
+            return httpx.Response(403, json={"detail": "forbidden"})
+        return httpx.Response(200, json={"tasks": [{"id": 1, "data": {}}], "total": 3})
+
+    with pytest.raises(ApiError) as exc_info:
+        list(fake_client(httpx.MockTransport(handler)).tasks.list(project=1, page_size=1, parallel=2))
+    assert exc_info.value.status_code == 403
+
+
+def test_parallel_and_prefetch_are_exclusive(fake_client):
+    with pytest.raises(ValueError):
+        fake_client(FakeLabelStudio(tasks=1).transport()).tasks.list(parallel=2, prefetch=2)
+
+
+def test_parallel_pager_last_page():
+    pager = ParallelPager(
+        fetch_page=lambda page: [], first_page=3, first_items=[1, 2], total=7, page_size=2, parallel=1
+    )
+    assert pager.last_page == 4
+
+
+@pytest.mark.asyncio
+async def test_async_iter_all_parallel(async_fake_client):
+    fake = FakeLabelStudio(tasks=45)
+    ls = async_fake_client(fake)
+    assert [task.id async for task in ls.tasks.iter_all_parallel(project=1, page_size=10, parallel=3)] == list(
+        range(1, 46)
+    )
+    pager = await ls.tasks.list(project=1, page_size=10, parallel=3, ordered=False)
+    assert sorted([task.id async for task in pager]) == list(range(1, 46))
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.core.api_error import ApiError
+
+
+class PageRequests:
+    """Records the requested pages of api/tasks/ and lets tests wait for one of them."""
+
+    def __init__(self):
+        self.pages = []
+        self._condition = threading.Condition()
+
+    def __call__(self, request):
+        if request.url.path.endswith("api/tasks/"):
+            with self._condition:
+                self.pages.append(int(request.url.params["page"]))
+                self._condition.notify_all()
+        return 0.0
+
+    def wait_for(self, page, timeout=2.0):
+        with self._condition:
+            return self._condition.wait_for(lambda: page in self.pages, timeout=timeout)
+
+
+def test_prefetch_returns_all_tasks_and_stops_at_404(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    assert [task.id for task in fake_client(fake).tasks.list(project=1, page_size=10, prefetch=2)] == list(range(1, 26))
+
+
+def test_prefetch_fetches_ahead_of_the_caller(fake_client):
+    requests = PageRequests()
+    fake = FakeLabelStudio(tasks=50, latency=requests)
+    tasks = iter(fake_client(fake).tasks.list(project=1, page_size=10, prefetch=2))
+    next(tasks)
+    assert requests.wait_for(3)
+    time.sleep(0.05)
+    # at most two pages ahead of the one being consumed
+    assert requests.pages == [1, 2, 3]
+    assert [task.id for task in tasks] == list(range(2, 51))
+
+
+def test_prefetch_thread_stops_when_the_caller_does(fake_client):
+    requests = PageRequests()
+    fake = FakeLabelStudio(tasks=100, latency=requests)
+    for task in fake_client(fake).tasks.list(project=1, page_size=10, prefetch=1):
+        if task.id == 5:
+            break
+    time.sleep(0.05)
+    assert requests.pages == [1, 2]
+
+
+def test_prefetch_raises_errors(fake_client):
+    def handler(request):
+        if request.url.params["page"] == "2":
+            return httpx.Response(500, json={"detail": "error"})
+        return httpx.Response(200, json={"tasks": [{"id": 1, "data": {}}], "total": 2})
+
+    ls = fake_client(httpx.MockTransport(handler))
+    with pytest.raises(ApiError) as exc_info:
+        list(ls.tasks.list(project=1, prefetch=2))
+    assert exc_info.value.status_code == 500
+
+
+def test_prefetch_must_not_be_negative(fake_client):
+    with pytest.raises(ValueError):
+        fake_client(FakeLabelStudio(tasks=1)).tasks.list(project=1, prefetch=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch(async_fake_client):
+    requests = PageRequests()
+    fake = FakeLabelStudio(tasks=25, latency=requests)
+    ls = async_fake_client(fake)
+    pager = await ls.tasks.list(project=1, page_size=10, prefetch=2)
+    assert [task.id async for task in pager] == list(range(1, 26))
+    assert requests.pages == [1, 2, 3, 4]
@@ -0,0 +1,112 @@
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.project_mirror import AsyncProjectMirror, ProjectMirror, _labels
+
+
+def _annotation(label, user=1):
+    return {"completed_by": user, "result": [{"type": "choices", "value": {"choices": [label]}}]}
+
+
+def test_refresh_mirrors_tasks_in_the_api_shape(tmp_path, fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    with ProjectMirror(fake_client(fake), project=1, path=str(tmp_path / "mirror.sqlite"), page_size=10) as mirror:
+        assert mirror.refresh() == 25
+        assert mirror.count() == 25
+        assert mirror.get_task(3) == fake.tasks[1][2]
+        assert [task["id"] for task in mirror.tasks(limit=3)] == [1, 2, 3]
+        assert [annotation["id"] for annotation in mirror.annotations(task=3)] == [30]
+        assert [prediction["task"] for prediction in mirror.predictions(model_version="v1")] == list(range(1, 26))
+        assert mirror.count(label="cat") == 25 and mirror.count(label="dog") == 0
+
+
+def test_labels_are_read_from_label_and_choice_values_only():
+    annotation = {
+        "result": [
+            {"type": "rectanglelabels", "value": {"x": 1, "rectanglelabels": ["car"]}},
+            {"type": "labels", "value": {"start": 0, "end": 3, "text": "cat", "labels": ["animal"]}},
+            {"type": "textarea", "value": {"text": ["a free text answer"]}},
+            {"type": "taxonomy", "value": {"taxonomy": [["Animal", "Cat"]]}},
+            {"type": "choices", "value": {"choices": ["yes"]}},
+        ]
+    }
+    assert _labels(annotation) == {"car", "animal", "Animal", "Cat", "yes"}
+
+
+def test_refresh_is_incremental(tmp_path, fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    fake.record_requests = True
+    ls = fake_client(fake)
+    path = str(tmp_path / "mirror.sqlite")
+    with ProjectMirror(ls, project=1, path=path) as mirror:
+        mirror.refresh()
+        ls.projects.import_tasks(id=1, request=[{"data": {"text": "new"}, "annotations": [_annotation("dog", user=7)]}])
+        ls.tasks.update(id=2, data={"text": "changed"})
+        ls.tasks.delete(id=4)
+    # the watermark is kept in the file
+    with ProjectMirror(ls, project=1, path=path) as mirror:
+        requests = len(fake.requests)
+        assert mirror.refresh() == 2
+        assert [task["id"] for task in mirror.tasks()] == [1, 2, 3, 5, 6]
+        assert mirror.get_task(2)["data"] == {"text": "changed"}
+        assert [task["id"] for task in mirror.tasks(annotator=7, label="dog")] == [6]
+        assert [task["id"] for task in mirror.tasks(updated_since=mirror.get_task(6)["updated_at"])] == [2, 6]
+        # the changes, the count of tasks, and two pages of ids to find the deleted task
+        assert len(fake.requests) - requests == 4
+        assert mirror.refresh() == 0
+        assert mirror.refresh(full=True) == 5
+
+
+def test_deleted_tasks_hidden_by_new_ones_are_pruned(tmp_path, fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    create_on_count = []
+
+    def handle(request):
+        # a task created after the refresh fetched the changes, before it counts the tasks
+        if create_on_count and request.url.params.get("page_size") == "1":
+            fake.add_project(1, tasks=create_on_count.pop())
+        return fake.handle(request)
+
+    ls = fake_client(httpx.MockTransport(handle))
+    with ProjectMirror(ls, project=1, path=str(tmp_path / "mirror.sqlite"), prune_every=3) as mirror:
+        mirror.refresh()
+        ls.tasks.delete(id=2)
+        create_on_count.append(1)
+        # as many tasks as the project, the deleted one is found by the next comparison of the ids
+        assert mirror.refresh() == 0 and mirror.count() == 5
+        assert mirror.refresh() == 1
+        assert [task["id"] for task in mirror.tasks()] == [1, 3, 4, 5, 6]
+        ls.tasks.delete(id=3)
+        assert mirror.refresh(full=True) == 4
+        assert [task["id"] for task in mirror.tasks()] == [1, 4, 5, 6]
+
+
+def test_queries_of_many_ids(tmp_path, fake_client):
+    fake = FakeLabelStudio(tasks=1200)
+    with ProjectMirror(fake_client(fake), project=1, path=str(tmp_path / "mirror.sqlite")) as mirror:
+        mirror.refresh()
+        # more ids than SQLite variables are queried in chunks, in id order
+        ids = list(range(1500, 0, -1))
+        assert mirror.count(ids=ids) == 1200
+        assert [task["id"] for task in mirror.tasks(ids=ids)] == list(range(1, 1201))
+        assert [task["id"] for task in mirror.tasks(ids=ids, limit=700)] == list(range(1, 701))
+
+
+def test_mirror_of_another_project(tmp_path, fake_client):
+    path = str(tmp_path / "mirror.sqlite")
+    ls = fake_client(FakeLabelStudio(tasks=1))
+    ProjectMirror(ls, project=1, path=path).close()
+    with pytest.raises(ValueError, match="project 1"):
+        ProjectMirror(ls, project=2, path=path)
+
+
+@pytest.mark.asyncio
+async def test_async_refresh(tmp_path, async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    with AsyncProjectMirror(ls, project=1, path=str(tmp_path / "mirror.sqlite"), page_size=10) as mirror:
+        assert await mirror.refresh() == 25
+        await ls.tasks.delete(id=1)
+        assert await mirror.refresh() == 0
+        assert mirror.count() == 24
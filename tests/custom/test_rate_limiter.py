@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.core import RateLimiter
+from label_studio_sdk.core.http_client import _parse_retry_after
+
+
+def test_parse_retry_after_ms():
+    assert _parse_retry_after(httpx.Headers({"retry-after-ms": "1500"})) == 1.5
+    assert _parse_retry_after(httpx.Headers({"retry-after": "2"})) == 2
+    assert _parse_retry_after(httpx.Headers({})) is None
+
+
+def test_token_bucket_rate():
+    limiter = RateLimiter(requests_per_second=50)
+    started = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+        limiter.release()
+    # the first token is available immediately, the next ten are spaced by 20ms
+    assert time.monotonic() - started >= 0.18
+
+
+def test_max_concurrency_across_threads():
+    limiter = RateLimiter(max_concurrency=3)
+    lock = threading.Lock()
+    current, peak = [0], [0]
+
+    def worker():
+        limiter.acquire()
+        try:
+            with lock:
+                current[0] += 1
+                peak[0] = max(peak[0], current[0])
+            time.sleep(0.01)
+            with lock:
+                current[0] -= 1
+        finally:
+            limiter.release()
+
+    threads = [threading.Thread(target=worker) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 3
+    assert limiter.in_flight == 0
+
+
+async def test_max_concurrency_async():
+    limiter = RateLimiter(max_concurrency=2)
+    current, peak = [0], [0]
+
+    async def worker():
+        await limiter.acquire_async()
+        try:
+            current[0] += 1
+            peak[0] = max(peak[0], current[0])
+            await asyncio.sleep(0.01)
+            current[0] -= 1
+        finally:
+            limiter.release()
+
+    await asyncio.gather(*[worker() for _ in range(8)])
+    assert peak[0] == 2
+    assert limiter.in_flight == 0
+
+
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = RateLimiter(max_concurrency=1)
+    await limiter.acquire_async()
+    waiter = asyncio.ensure_future(limiter.acquire_async())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+    await asyncio.wait_for(limiter.acquire_async(), timeout=1)
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+def test_throttling_pauses_everyone_and_lowers_rate():
+    limiter = RateLimiter(requests_per_second=100)
+    limiter.record(status_code=429, retry_after=0.2)
+    assert limiter.requests_per_second == 50
+    started = time.monotonic()
+    limiter.acquire()
+    limiter.release()
+    assert time.monotonic() - started >= 0.15
+    # a burst of throttled responses counts as a single signal
+    limiter.record(status_code=429, retry_after=0)
+    assert limiter.requests_per_second == 50
+
+
+def test_rate_recovers_up_to_the_maximum():
+    limiter = RateLimiter(requests_per_second=10, additive_increase=100)
+    limiter.record(status_code=429, retry_after=0)
+    assert limiter.requests_per_second == 5
+    for _ in range(10):
+        limiter.record(status_code=200, latency=0.01)
+    assert limiter.requests_per_second == 10
+
+
+def test_unlimited_rate_until_throttled():
+    limiter = RateLimiter(min_requests_per_second=1)
+    assert limiter.requests_per_second is None
+    limiter.record(status_code=503, retry_after=0)
+    throttled = limiter.requests_per_second
+    assert throttled is not None
+    for _ in range(1000):
+        if limiter.requests_per_second is None:
+            break
+        limiter.record(status_code=200)
+    # back to the throttled rate, the limit is lifted
+    assert limiter.requests_per_second is None
+
+
+def test_latency_is_ignored_by_default():
+    limiter = RateLimiter(requests_per_second=10)
+    limiter.record(status_code=200, latency=0.01)
+    for _ in range(20):
+        limiter.record(status_code=200, latency=1.0)
+    assert limiter.requests_per_second == 10
+
+
+def test_latency_spike_lowers_rate():
+    limiter = RateLimiter(requests_per_second=10, latency_tolerance=2)
+    limiter.record(status_code=200, latency=0.01)
+    for _ in range(20):
+        limiter.record(status_code=200, latency=1.0)
+    assert limiter.requests_per_second < 10
+
+
+def test_client_requests_go_through_the_limiter():
+    statuses = iter([429, 200])
+    seen = []
+
+    def handler(request):
+        status_code = next(statuses)
+        seen.append(status_code)
+        return httpx.Response(status_code, json={"id": 1}, headers={"retry-after-ms": "10"})
+
+    limiter = RateLimiter(requests_per_second=100)
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    )
+    project = ls.projects.get(id=1, request_options={"max_retries": 1})
+    assert project.id == 1
+    assert seen == [429, 200]
+    assert limiter.requests_per_second < 100
+    assert limiter.in_flight == 0
+
+
+async def test_async_client_requests_go_through_the_limiter():
+    limiter = RateLimiter(max_concurrency=2)
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 1}))),
+        rate_limiter=limiter,
+    )
+    projects = await asyncio.gather(*[ls.projects.get(id=1) for _ in range(5)])
+    assert [project.id for project in projects] == [1] * 5
+    assert limiter.in_flight == 0
+
+
+def test_streamed_responses_are_reported_to_the_limiter():
+    limiter = RateLimiter(requests_per_second=100)
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(429, json={}))),
+        rate_limiter=limiter,
+    )
+    with pytest.raises(Exception):
+        list(ls.tasks.stream(project=1))
+    assert limiter.requests_per_second < 100
@@ -0,0 +1,143 @@
+import datetime
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.core.pydantic_utilities import pydantic_v1
+from label_studio_sdk.core.response_mode import construct_obj_as, parse_obj_as
+from label_studio_sdk.types.converted_format import ConvertedFormat
+from label_studio_sdk.types.export import Export
+from label_studio_sdk.types.project import Project
+from label_studio_sdk.types.task import Task
+from label_studio_sdk.types.user_simple import UserSimple
+
+TASK = {
+    "id": 1,
+    "data": {"text": "hello"},
+    "annotations": [{"id": 10, "result": []}],
+    "created_at": "2024-01-15T09:30:00Z",
+    "unknown_field": 42,
+}
+
+
+def _tasks_handler(request):
+    if request.url.params["page"] != "1":
+        return httpx.Response(404, json={"detail": "Invalid page."})
+    return httpx.Response(200, json={"tasks": [TASK, {**TASK, "id": 2}], "total": 2})
+
+
+def _client(response_mode="model"):
+    return LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_tasks_handler)),
+        response_mode=response_mode,
+    )
+
+
+def test_parse_obj_as_modes():
+    model = parse_obj_as(Task, TASK, mode="model")
+    assert isinstance(model.created_at, datetime.datetime)
+    constructed = parse_obj_as(Task, TASK, mode="construct")
+    assert isinstance(constructed, Task)
+    assert constructed.created_at == "2024-01-15T09:30:00Z"
+    assert constructed.unknown_field == 42
+    assert parse_obj_as(Task, TASK, mode="raw") is TASK
+
+
+def test_construct_nested_models():
+    export = construct_obj_as(
+        Export,
+        {"id": 1, "created_by": {"id": 7, "email": "a@b.c"}, "converted_formats": [{"id": 2, "status": "completed"}]},
+    )
+    assert isinstance(export, Export)
+    assert isinstance(export.created_by, UserSimple)
+    assert export.created_by.email == "a@b.c"
+    assert isinstance(export.converted_formats[0], ConvertedFormat)
+    projects = construct_obj_as(typing.List[Project], [{"id": 1, "title": "a"}, {"id": 2}])
+    assert [project.id for project in projects] == [1, 2]
+    assert all(isinstance(project, Project) for project in projects)
+
+
+@pytest.mark.parametrize("response_mode, item_type", [("model", Task), ("construct", Task), ("raw", dict)])
+def test_client_response_mode(response_mode, item_type):
+    tasks = list(_client(response_mode).tasks.list(project=1))
+    assert len(tasks) == 2
+    assert all(isinstance(task, item_type) for task in tasks)
+
+
+def test_per_call_response_mode_overrides_client():
+    tasks = list(_client("model").tasks.list(project=1, request_options={"response_mode": "raw"}))
+    assert tasks[0]["id"] == 1
+    assert tasks[1]["id"] == 2
+
+
+def test_invalid_response_mode():
+    with pytest.raises(ValueError):
+        _client("fast")
+
+
+def test_raw_project_get():
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 3}))),
+        response_mode="raw",
+    )
+    assert ls.projects.get(id=3) == {"id": 3}
+
+
+def test_generated_endpoints_follow_the_mode_of_each_request():
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"id": 3, "created_at": "2024-01-15T09:30:00Z"})
+            )
+        ),
+    )
+    constructed = ls.projects.get(id=3, request_options={"response_mode": "construct"})
+    assert isinstance(constructed, Project) and constructed.created_at == "2024-01-15T09:30:00Z"
+    raw = ls.projects.get(id=3, request_options={"response_mode": "raw"})
+    assert type(raw) is dict and raw == {"id": 3, "created_at": "2024-01-15T09:30:00Z"}
+    # the mode only applies to the response of its request
+    ls.users.get(id=3, request_options={"response_mode": "raw"})
+    project = pydantic_v1.parse_obj_as(Project, {"id": 3, "created_at": "2024-01-15T09:30:00Z"})
+    assert isinstance(project.created_at, datetime.datetime)
+    assert isinstance(ls.projects.get(id=3).created_at, datetime.datetime)
+    assert pydantic_v1 is (pydantic.v1 if pydantic.VERSION.startswith("2.") else pydantic)
+
+
+def test_raw_lists_are_plain_dicts():
+    def handler(request):
+        if request.url.params["page"] != "1":
+            return httpx.Response(404, json={"detail": "Invalid page."})
+        if request.url.path == "/api/projects/":
+            return httpx.Response(200, json={"results": [{"id": 1, "title": "a"}], "count": 1})
+        return _tasks_handler(request)
+
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        response_mode="raw",
+    )
+    assert list(ls.projects.list()) == [{"id": 1, "title": "a"}]
+    assert [type(task) for task in ls.tasks.list(project=1)] == [dict, dict]
+
+
+async def test_async_client_response_mode():
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_tasks_handler)),
+        response_mode="construct",
+    )
+    pager = await ls.tasks.list(project=1)
+    tasks = [task async for task in pager]
+    assert [task.id for task in tasks] == [1, 2]
+    assert tasks[0].created_at == "2024-01-15T09:30:00Z"
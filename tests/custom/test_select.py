@@ -0,0 +1,93 @@
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk._extensions.projection import Projection
+from label_studio_sdk.core import MetricsAggregator
+
+
+def test_projection_params_and_trim():
+    projection = Projection(["data.image", "annotations.result", "data"])
+    assert projection.params() == {"include": "id,data,annotations", "fields": "all"}
+    assert Projection(["data.image"]).params() == {"include": "id,data", "fields": "task_only"}
+    task = {
+        "id": 1,
+        "data": {"image": "1.jpg", "text": "a"},
+        "annotations": [{"id": 10, "result": [1]}, {"id": 11, "result": [2]}],
+        "meta": {},
+    }
+    assert projection.apply(task) == {
+        "id": 1,
+        "data": {"image": "1.jpg", "text": "a"},
+        "annotations": [{"result": [1]}, {"result": [2]}],
+    }
+    assert Projection(["data.image", "data.missing"]).apply(task) == {"id": 1, "data": {"image": "1.jpg"}}
+
+
+@pytest.mark.parametrize("select", [["data."], "id,data"])
+def test_projection_rejects_invalid_paths(select):
+    with pytest.raises((TypeError, ValueError)):
+        Projection(select)
+
+
+@pytest.mark.parametrize("options", [{}, {"prefetch": 2}, {"parallel": 2}, {"keyset": True}, {"adaptive": True}])
+def test_list_select(options, fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    ls = fake_client(fake, response_mode="raw")
+    tasks = list(ls.tasks.list(project=1, page_size=10, select=["data.image", "annotations.result"], **options))
+    assert [task["id"] for task in tasks] == list(range(1, 26))
+    assert tasks[0] == {
+        "id": 1,
+        "data": {"image": "s3://bucket/images/1.jpg"},
+        "annotations": [{"result": fake.tasks[1][0]["annotations"][0]["result"]}],
+    }
+    params = fake.requests[0].url.params
+    assert (params["include"], params["fields"]) == ("id,data,annotations", "all")
+
+
+def test_list_select_parses_models(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    tasks = list(fake_client(fake).tasks.list(project=1, select=["data.image"]))
+    assert tasks[0].data == {"image": "s3://bucket/images/1.jpg"}
+    assert tasks[0].annotations is None and tasks[0].created_at is None
+
+
+def test_list_select_conflicts(fake_client):
+    ls = fake_client(FakeLabelStudio(tasks=5))
+    with pytest.raises(ValueError, match="include"):
+        ls.tasks.list(project=1, select=["id"], include="id")
+    with pytest.raises(ValueError, match="fields"):
+        ls.tasks.list(project=1, select=["id"], fields="all")
+
+
+class RecordingMetrics(MetricsAggregator):
+    def __init__(self):
+        super().__init__()
+        self.projections = []
+
+    def on_projection(self, event):
+        self.projections.append(event)
+        super().on_projection(event)
+
+
+def test_select_reports_bytes_saved(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    metrics = RecordingMetrics()
+    ls = fake_client(fake, instrumentation=metrics)
+    list(ls.tasks.list(project=1, page_size=10, select=["data.image"]))
+    events = metrics.projections
+    assert [event.items for event in events] == [10, 10, 5]
+    # the fake applies `include`, the client trims the other keys of the data
+    assert all(event.bytes_saved > 0 for event in events)
+    assert metrics.to_dict()["GET api/tasks/"]["bytes_trimmed"] == sum(event.bytes_saved for event in events)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options", [{}, {"parallel": 2}, {"keyset": True}])
+async def test_async_list_select(options, async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    pager = await ls.tasks.list(project=1, page_size=10, select=["data.image"], **options)
+    tasks = [task async for task in pager]
+    assert [task.id for task in tasks] == list(range(1, 26))
+    assert tasks[-1].data == {"image": "s3://bucket/images/25.jpg"}
@@ -0,0 +1,92 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.streaming import iter_json_items
+from label_studio_sdk.client import AsyncLabelStudio, LabelStudio
+from label_studio_sdk.core.api_error import ApiError
+
+PAGES = {
+    1: [{"id": 1, "data": {"text": "a"}, "annotations": [{"id": 10, "result": [{"value": {"score": 0.5}}]}]}],
+    2: [{"id": 2, "data": {"text": "b"}}, {"id": 3, "data": {"text": "c"}}],
+}
+
+
+def _chunked(body, size=7):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def _tasks_handler(request):
+    page = int(request.url.params["page"])
+    if page not in PAGES:
+        return httpx.Response(404, json={"detail": "Invalid page."})
+    return httpx.Response(200, json={"tasks": PAGES[page], "total": 3})
+
+
+def _chunked_tasks_handler(request):
+    response = _tasks_handler(request)
+    return httpx.Response(response.status_code, content=_chunked(response.content))
+
+
+def test_iter_json_items_across_chunk_boundaries():
+    body = json.dumps({"total": 2, "tasks": [{"id": 1, "v": 1.25}, {"id": 2, "v": "x"}]}).encode()
+    items = list(iter_json_items(_chunked(body, size=3), "tasks.item"))
+    assert items == [{"id": 1, "v": 1.25}, {"id": 2, "v": "x"}]
+    assert isinstance(items[0]["v"], float)
+
+
+def test_tasks_stream_pages_until_404():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return _chunked_tasks_handler(request)
+
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    tasks = list(ls.tasks.stream(project=1, page_size=2))
+    assert [task.id for task in tasks] == [1, 2, 3]
+    assert tasks[0].annotations[0]["result"][0]["value"]["score"] == 0.5
+    assert requests[0].url.params["fields"] == "all"
+    assert requests[0].url.params["project"] == "1"
+    assert len(requests) == 3
+
+
+def test_tasks_stream_raises_api_errors():
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(400, json={"a": 1}))),
+    )
+    with pytest.raises(ApiError) as exc:
+        list(ls.tasks.stream(project=1))
+    assert exc.value.status_code == 400
+    assert exc.value.body == {"a": 1}
+
+
+def test_predictions_stream():
+    predictions = [{"id": i, "task": 1, "result": [], "score": 0.1 * i} for i in range(5)]
+    ls = LabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=_chunked(json.dumps(predictions).encode()))
+            )
+        ),
+    )
+    assert [prediction.id for prediction in ls.predictions.stream(project=1)] == [0, 1, 2, 3, 4]
+
+
+async def test_async_tasks_stream():
+    ls = AsyncLabelStudio(
+        api_key="api_key",
+        base_url="http://localhost:8080",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_tasks_handler)),
+    )
+    assert [task.id async for task in ls.tasks.stream(project=1)] == [1, 2, 3]
@@ -0,0 +1,83 @@
+import json
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.errors import NotFoundError
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+from label_studio_sdk.tasks.client_ext import TaskTotals
+
+
+def _query(min_id):
+    item = Filters.item(Column.id, Operator.GREATER, Type.Number, Filters.value(min_id))
+    return {"filters": Filters.create(Filters.AND, [item])}
+
+
+def test_totals_with_one_id_only_request(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    ls = fake_client(fake)
+    assert ls.tasks.totals(project=1) == TaskTotals(tasks=25, annotations=25, predictions=25)
+    assert len(fake.requests) == 1
+    params = fake.requests[0].url.params
+    assert (params["page"], params["page_size"], params["fields"], params["include"]) == ("1", "1", "task_only", "id")
+
+
+def test_count_and_exists_with_a_query(fake_client):
+    ls = fake_client(FakeLabelStudio(tasks=25))
+    assert ls.tasks.count(project=1, query=_query(20)) == 5
+    assert ls.tasks.count(project=1, query=json.dumps(_query(20))) == 5
+    assert ls.tasks.exists(project=1, query=_query(24))
+    assert not ls.tasks.exists(project=1, query=_query(25))
+
+
+def test_count_of_a_missing_project_raises(fake_client):
+    def handler(request):
+        return httpx.Response(404, json={"detail": "Not found."})
+
+    ls = fake_client(httpx.MockTransport(handler))
+    with pytest.raises(NotFoundError):
+        ls.tasks.count(project=1)
+
+
+def test_count_of_an_empty_project(fake_client):
+    ls = fake_client(FakeLabelStudio(tasks=0))
+    assert ls.tasks.count(project=1) == 0
+    assert not ls.tasks.exists(project=1)
+
+
+def test_pager_total_is_read_from_the_first_page(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    ls = fake_client(fake)
+    pager = ls.tasks.list(project=1, page_size=10, query=json.dumps(_query(5)))
+    requests = len(fake.requests)
+    assert pager.total == 20
+    assert len(fake.requests) == requests
+
+
+def test_pager_total_is_counted_once_when_not_reported(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    ls = fake_client(fake)
+    pager = ls.tasks.list(project=1, page_size=10)
+    pager._total = None
+    requests = len(fake.requests)
+    assert pager.total == 25
+    assert pager.total == 25
+    assert len(fake.requests) == requests + 1
+    assert fake.requests[-1].url.params["page_size"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_async_totals(async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    assert await ls.tasks.count(project=1, query=_query(20)) == 5
+    assert await ls.tasks.exists(project=1)
+    fake.record_requests = True
+    pager = await ls.tasks.list(project=1, page_size=10)
+    requests = len(fake.requests)
+    assert await pager.get_total() == 25
+    assert len(fake.requests) == requests
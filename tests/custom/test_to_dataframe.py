@@ -0,0 +1,78 @@
+import pytest
+
+from label_studio_sdk._extensions.columnar import TaskColumns, tasks_to_dataframe
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio, synthetic_task
+
+
+def test_columns_pad_missing_data_keys():
+    columns = TaskColumns(fields=["id", "is_labeled"]).extend(
+        [
+            {"id": 1, "data": {"text": "a"}, "annotations": [{}, {}], "is_labeled": True},
+            {"id": 2, "data": {"image": "b.png"}, "total_annotations": 3},
+            {"id": 3, "data": {"text": "c"}},
+        ]
+    )
+    assert columns.columns == {
+        "id": [1, 2, 3],
+        "annotation_count": [2, 3, None],
+        "prediction_count": [None, None, None],
+        "is_labeled": [True, None, None],
+        "data.text": ["a", None, "c"],
+        "data.image": [None, "b.png", None],
+    }
+    frame = columns.to_dataframe()
+    assert list(frame.columns) == [
+        "id",
+        "annotation_count",
+        "prediction_count",
+        "is_labeled",
+        "data.text",
+        "data.image",
+    ]
+    assert frame["id"].tolist() == [1, 2, 3]
+    # the buffers are handed over to the DataFrame
+    assert columns.columns == {} and columns.rows == 0
+
+
+def test_to_dataframe_matches_records(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    pager = fake_client(fake).tasks.list(project=1, page_size=10)
+    frame = pager.to_dataframe(fields=["is_labeled"])
+    expected = [synthetic_task(task_id) for task_id in range(1, 26)]
+    assert frame["id"].tolist() == list(range(1, 26))
+    assert frame["is_labeled"].tolist() == [task["is_labeled"] for task in expected]
+    assert frame["annotation_count"].tolist() == [len(task["annotations"]) for task in expected]
+    for key in expected[0]["data"]:
+        assert frame[f"data.{key}"].tolist() == [task["data"][key] for task in expected]
+    # the pager is drained
+    assert not pager.items
+
+
+def test_to_dataframe_without_data_with_raw_responses(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    pager = fake_client(fake, response_mode="raw").tasks.list(project=1)
+    frame = pager.to_dataframe(data=False)
+    assert list(frame.columns) == ["id", "annotation_count", "prediction_count"]
+    assert frame["id"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_tasks_to_dataframe_of_other_pagers(fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    frame = tasks_to_dataframe(fake_client(fake).tasks.list(project=1, page_size=10, keyset=True).drain())
+    assert frame["id"].tolist() == list(range(1, 26))
+
+
+def test_to_arrow(fake_client):
+    pytest.importorskip("pyarrow")
+    fake = FakeLabelStudio(tasks=25)
+    table = fake_client(fake).tasks.list(project=1, page_size=10).to_arrow()
+    assert table.num_rows == 25
+    assert table.column("id").to_pylist() == list(range(1, 26))
+
+
+@pytest.mark.asyncio
+async def test_async_to_dataframe(async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    frame = await (await ls.tasks.list(project=1, page_size=10)).to_dataframe()
+    assert frame["id"].tolist() == list(range(1, 26))
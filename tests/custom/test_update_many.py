@@ -0,0 +1,72 @@
+import httpx
+import pytest
+
+from label_studio_sdk._extensions import batch as batch_module
+from label_studio_sdk._extensions.fake_label_studio import FakeLabelStudio
+from label_studio_sdk.core.api_error import ApiError
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(batch_module, "_retry_delay", lambda retries: 0)
+
+
+def test_update_many_reports_failures_and_throughput(fake_client):
+    fake = FakeLabelStudio(tasks=20)
+    ls = fake_client(fake)
+    progress = []
+    updates = ((task_id, {"meta": {"batch": 7}}) for task_id in [*range(1, 21), 99])
+    report = ls.tasks.update_many(updates, concurrency=4, on_progress=progress.append)
+    assert report.updated == 20 and report.failed == 1
+    [failure] = report.failures
+    assert failure.task_id == 99 and isinstance(failure.exception, ApiError) and failure.exception.status_code == 404
+    assert report.seconds > 0 and report.per_second > 0
+    assert all(task["meta"] == {"batch": 7} for task in fake.tasks[1])
+    assert progress[-1].completed == 21 and progress[-1].failed == 1
+
+
+def test_update_many_streams_the_updates(fake_client):
+    fake = FakeLabelStudio(tasks=50, latency=0.002)
+    ls = fake_client(fake)
+    ahead = []
+    progress = []
+
+    def updates():
+        for task_id in range(1, 51):
+            # the updates read but not completed yet
+            ahead.append(task_id - (progress[-1].completed if progress else 0))
+            yield task_id, {"data": {"n": task_id}}
+
+    report = ls.tasks.update_many(updates(), concurrency=2, max_pending=4, on_progress=progress.append)
+    assert report.updated == 50
+    assert max(ahead) <= 5
+    assert fake.tasks[1][9]["data"] == {"n": 10}
+
+
+def test_update_many_retries_server_errors(fake_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(503, json={"detail": "unavailable"})
+        return httpx.Response(200, json={"id": 1})
+
+    ls = fake_client(httpx.MockTransport(handler))
+    report = ls.tasks.update_many([(1, {"is_labeled": True})], max_retries=1)
+    assert report.updated == 1 and calls == ["/api/tasks/1/", "/api/tasks/1/"]
+
+
+@pytest.mark.asyncio
+async def test_async_update_many(async_fake_client):
+    fake = FakeLabelStudio(tasks=10)
+    ls = async_fake_client(fake)
+
+    async def updates():
+        for task_id in [*range(1, 11), 0]:
+            yield task_id, {"meta": {"checked": True}}
+
+    report = await ls.tasks.update_many(updates(), concurrency=3)
+    assert report.updated == 10 and [failure.task_id for failure in report.failures] == [0]
+    report = await ls.tasks.update_many([(1, {"meta": {}})])
+    assert report.updated == 1 and fake.tasks[1][0]["meta"] == {}
@@ -0,0 +1,118 @@
+import itertools
+
+import pytest
+
+from label_studio_sdk._extensions.fake_label_studio import SYNTHETIC_TIMESTAMP, FakeLabelStudio
+from label_studio_sdk._extensions.task_watch import timestamp
+from label_studio_sdk.data_manager import Column, Filters, Operator, Type
+
+
+class Sleep:
+    """Records the delays and runs `on_sleep` instead of waiting."""
+
+    def __init__(self, on_sleep=None):
+        self.delays = []
+        self.on_sleep = on_sleep
+
+    def __call__(self, delay):
+        self.delays.append(delay)
+        if self.on_sleep is not None:
+            self.on_sleep(len(self.delays))
+
+
+def test_timestamp():
+    assert timestamp("2024-01-15T09:30:00Z") == "2024-01-15T09:30:00.000000Z"
+    assert timestamp("2024-01-15T11:30:00.5+02:00") == "2024-01-15T09:30:00.500000Z"
+
+
+def test_watch_since_pages_ties_by_id(fake_client):
+    # the 25 synthetic tasks are updated at the same time, more than fit in a page
+    fake = FakeLabelStudio(tasks=25)
+    fake.record_requests = True
+    watch = fake_client(fake).tasks.watch(project=1, since=SYNTHETIC_TIMESTAMP, page_size=10)
+    watch._sleep = Sleep()
+    tasks = list(itertools.islice(watch, 25))
+    assert [task.id for task in tasks] == list(range(1, 26))
+    assert watch.watermark == timestamp(SYNTHETIC_TIMESTAMP)
+
+
+def test_watch_yields_each_change_once_with_backoff(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    ls = fake_client(fake)
+
+    def on_sleep(count):
+        # nothing changes for 4 polls, then two tasks are updated
+        if count == 4:
+            ls.tasks.update(id=2, data={"reviewed": True})
+            ls.tasks.update(id=4, data={"reviewed": True})
+
+    sleep = Sleep(on_sleep)
+    watch = ls.tasks.watch(project=1, interval=1, max_interval=5, backoff=2)
+    watch._sleep = sleep
+    changes = iter(watch)
+    assert [next(changes).id, next(changes).id] == [2, 4]
+    assert sleep.delays == [1, 2, 4, 5]
+    ls.tasks.update(id=2, data={"reviewed": False})
+    assert next(changes).id == 2
+    # a poll that found changes is followed by `interval`, the delay is reset
+    assert sleep.delays == [1, 2, 4, 5, 1]
+
+
+def test_watch_waits_the_interval_after_changes(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    ls = fake_client(fake)
+
+    def on_sleep(count):
+        # every poll finds a change
+        ls.tasks.update(id=count % 5 + 1, data={"count": count})
+
+    sleep = Sleep(on_sleep)
+    watch = ls.tasks.watch(project=1, interval=2, max_interval=10, backoff=2)
+    watch._sleep = sleep
+    ls.tasks.update(id=1, data={"count": 0})
+    list(itertools.islice(watch, 4))
+    assert len(sleep.delays) >= 3
+    assert all(delay >= 2 for delay in sleep.delays)
+
+
+def test_watch_with_filters_and_resume(fake_client):
+    fake = FakeLabelStudio(tasks=5)
+    ls = fake_client(fake)
+    ls.tasks.update(id=1, data={})
+    ls.tasks.update(id=5, data={})
+    query = {"filters": Filters.create(Filters.AND, [Filters.item(Column.id, Operator.GREATER, Type.Number, 3)])}
+    watch = ls.tasks.watch(project=1, since=SYNTHETIC_TIMESTAMP, query=query)
+    watch._sleep = Sleep()
+    assert [task.id for task in itertools.islice(watch, 2)] == [4, 5]
+    resumed = ls.tasks.watch(project=1, since=watch.watermark, query=query)
+    resumed._sleep = Sleep()
+    ls.tasks.update(id=4, data={})
+    # the tasks updated at the watermark are yielded again
+    assert [task.id for task in itertools.islice(resumed, 2)] == [5, 4]
+
+
+def test_watch_rejects_or_filters(fake_client):
+    items = [Filters.item(Column.id, Operator.GREATER, Type.Number, 3)] * 2
+    with pytest.raises(ValueError, match='"and"'):
+        fake_client(FakeLabelStudio(tasks=1)).tasks.watch(project=1, query={"filters": Filters.create(Filters.OR, items)})
+
+
+@pytest.mark.asyncio
+async def test_async_watch(async_fake_client):
+    fake = FakeLabelStudio(tasks=25)
+    ls = async_fake_client(fake)
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+        await ls.tasks.update(id=7, data={})
+
+    watch = ls.tasks.watch(project=1, since=SYNTHETIC_TIMESTAMP, page_size=10, interval=0.5)
+    watch._sleep = sleep
+    ids = []
+    async for task in watch:
+        ids.append(task.id)
+        if len(ids) == 26:
+            break
+    assert ids == [*range(1, 26), 7]
+    assert delays == [0.5]